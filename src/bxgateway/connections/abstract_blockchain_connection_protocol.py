@@ -228,7 +228,9 @@ class AbstractBlockchainConnectionProtocol:
         )
         gateway_bdn_performance_stats_service.log_block_message_from_blockchain_node(True)
         if block_hash in self.node.blocks_seen.contents:
-            self.node.on_block_seen_by_blockchain_node(block_hash, block_number=block_number)
+            self.node.on_block_seen_by_blockchain_node(
+                block_hash, block_number=block_number, connection=self.connection
+            )
             block_stats.add_block_event_by_block_hash(
                 block_hash,
                 BlockStatEventType.BLOCK_RECEIVED_FROM_BLOCKCHAIN_NODE_IGNORE_SEEN,
@@ -243,12 +245,14 @@ class AbstractBlockchainConnectionProtocol:
         if not self.is_valid_block_timestamp(msg):
             return
 
-        canceled_recovery = self.node.on_block_seen_by_blockchain_node(block_hash, msg)
+        canceled_recovery = self.node.on_block_seen_by_blockchain_node(block_hash, msg, connection=self.connection)
         if canceled_recovery:
             return
 
         self.node.track_block_from_node_handling_started(block_hash)
-        self.node.on_block_seen_by_blockchain_node(block_hash, msg, block_number=block_number)
+        self.node.on_block_seen_by_blockchain_node(
+            block_hash, msg, block_number=block_number, connection=self.connection
+        )
         self.node.block_processing_service.queue_block_for_processing(msg, self.connection)
         gateway_bdn_performance_stats_service.log_block_from_blockchain_node()
         self.node.block_queuing_service.store_block_data(block_hash, msg)
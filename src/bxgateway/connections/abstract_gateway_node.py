@@ -17,7 +17,7 @@ except ImportError:
 import time
 from abc import ABCMeta, abstractmethod
 from concurrent.futures import Future
-from typing import Tuple, Optional, ClassVar, Type, Set, List, Iterable, Union, cast, Dict, Deque
+from typing import Tuple, Optional, ClassVar, Type, Set, List, Iterable, Union, cast, Dict, Deque, Any
 from prometheus_client import Gauge
 
 from bxcommon import constants
@@ -62,6 +62,7 @@ from bxgateway.rpc.https.gateway_http_rpc_server import GatewayHttpRpcServer
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
 from bxgateway.services.abstract_block_queuing_service import AbstractBlockQueuingService
 from bxgateway.services.block_processing_service import BlockProcessingService
+from bxgateway.services.block_crypto_service import BlockCryptoService
 from bxgateway.services.block_recovery_service import BlockRecoveryService, RecoveredTxsSource
 from bxgateway.services.gateway_broadcast_service import GatewayBroadcastService
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService
@@ -110,6 +111,7 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
     blocks_seen: ExpiringSet
     in_progress_blocks: BlockEncryptedCache
     block_recovery_service: BlockRecoveryService
+    block_crypto_service: BlockCryptoService
     block_queuing_service: AbstractBlockQueuingService
     block_processing_service: BlockProcessingService
     block_cleanup_service: AbstractBlockCleanupService
@@ -171,6 +173,7 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
             "gateway_blocks_seen"
         )
         self.in_progress_blocks = BlockEncryptedCache(self.alarm_queue)
+        self.block_crypto_service = BlockCryptoService(opts.block_crypto_threads)
         self.block_recovery_service = BlockRecoveryService(self.alarm_queue)
         self.neutrality_service = NeutralityService(self)
         self.block_queuing_service = self.build_block_queuing_service()
@@ -511,6 +514,7 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
         except (Exception, CancelledError) as e:
             logger.error(log_messages.IPC_CLOSE_FAIL, e, exc_info=True)
 
+        self.block_crypto_service.close()
         await super(AbstractGatewayNode, self).close()
 
     def send_request_for_remote_blockchain_peer(self):
@@ -745,7 +749,8 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
         self,
         block_hash: Sha256Hash,
         block_message: Optional[AbstractBlockMessage] = None,
-        block_number: Optional[int] = None
+        block_number: Optional[int] = None,
+        connection: Optional[AbstractGatewayBlockchainConnection] = None
     ) -> bool:
         self.blocks_seen.add(block_hash)
         recovery_canceled = self.block_recovery_service.cancel_recovery_for_block(block_hash)
@@ -764,7 +769,8 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
         self.block_queuing_service.mark_block_seen_by_blockchain_node(
             block_hash,
             block_message,
-            block_number
+            block_number,
+            connection
         )
         self.publish_block(
             block_number, block_hash, block_message, FeedSource.BLOCKCHAIN_SOCKET
@@ -798,6 +804,14 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
     ) -> None:
         pass
 
+    def on_transaction_contents_added(self, transaction_hash: Sha256Hash) -> None:
+        """hook for transactions added to transaction service, override method to implement"""
+        pass
+
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """node specific memory information for memory RPC, override method to implement"""
+        return {}
+
     def post_block_cleanup_tasks(
         self,
         block_hash: Sha256Hash,
@@ -266,6 +266,8 @@ class AbstractRelayConnection(InternalNodeConnection["AbstractGatewayNode"]):
                                 )
         )
 
+        self.node.block_recovery_service.on_short_ids_received(transaction.short_id for transaction in transactions)
+
         for (short_id, transaction_hash) in missing_txs:
             self.node.block_recovery_service.check_missing_sid(short_id, recovered_txs_source)
             self.node.block_recovery_service.check_missing_tx_hash(transaction_hash, recovered_txs_source)
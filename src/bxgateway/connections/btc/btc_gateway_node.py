@@ -1,4 +1,8 @@
+from typing import Any, Dict, Optional
+
 import bxgateway.messages.btc.btc_message_converter_factory as converter_factory
+from bxcommon.utils.object_hash import Sha256Hash
+from bxcommon.utils.stats import stats_format
 from bxcommon.network.abstract_socket_connection_protocol import AbstractSocketConnectionProtocol
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
@@ -13,11 +17,20 @@ from bxgateway.services.btc.btc_normal_block_cleanup_service import BtcNormalBlo
 from bxgateway.services.push_block_queuing_service import PushBlockQueuingService
 from bxgateway.testing.btc_lossy_relay_connection import BtcLossyRelayConnection
 from bxgateway.testing.test_modes import TestModes
+from bxgateway.utils.btc.btc_short_id_index import BtcShortIdIndex
 from bxutils.services.node_ssl_service import NodeSSLService
 
 
 class BtcGatewayNode(AbstractGatewayNode):
+    short_id_index: Optional[BtcShortIdIndex]
+
     def __init__(self, opts, node_ssl_service: NodeSSLService):
+        # extensions match compact block short ids natively, so the index is only used by the normal converter
+        if opts.btc_short_id_index and not opts.use_extensions:
+            self.short_id_index = BtcShortIdIndex()
+        else:
+            self.short_id_index = None
+
         super(BtcGatewayNode, self).__init__(opts, node_ssl_service)
 
         self.block_processing_service = BtcBlockProcessingService(self)
@@ -27,6 +40,10 @@ class BtcGatewayNode(AbstractGatewayNode):
             self.opts
         )
 
+        if self.short_id_index is not None:
+            self.short_id_index.rebuild(self._tx_service.iter_transaction_hashes())
+            self.message_converter.short_id_index = self.short_id_index
+
     def build_blockchain_connection(
         self, socket_connection: AbstractSocketConnectionProtocol
     ) -> AbstractGatewayBlockchainConnection:
@@ -54,5 +71,18 @@ class BtcGatewayNode(AbstractGatewayNode):
             from bxgateway.services.btc.btc_extension_block_cleanup_service import BtcExtensionBlockCleanupService
             block_cleanup_service = BtcExtensionBlockCleanupService(self, self.network_num)
         else:
-            block_cleanup_service = BtcNormalBlockCleanupService(self, self.network_num)
+            block_cleanup_service = BtcNormalBlockCleanupService(self, self.network_num, self.short_id_index)
         return block_cleanup_service
+
+    def on_transaction_contents_added(self, transaction_hash: Sha256Hash) -> None:
+        if self.short_id_index is not None:
+            self.short_id_index.add(transaction_hash)
+
+    def get_memory_stats(self) -> Dict[str, Any]:
+        short_id_index = self.short_id_index
+        if short_id_index is None:
+            return {}
+        return {
+            "short_id_index_transactions": len(short_id_index),
+            "short_id_index_size": stats_format.byte_count(short_id_index.get_size_bytes())
+        }
@@ -1,5 +1,5 @@
 import time
-from typing import List, TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 
 from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.messages.abstract_message import AbstractMessage
@@ -23,6 +23,7 @@ from bxgateway.messages.btc.send_compact_btc_message import SendCompactBtcMessag
 from bxgateway.messages.btc.ver_ack_btc_message import VerAckBtcMessage
 from bxgateway.messages.btc.version_btc_message import VersionBtcMessage
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
+from bxgateway.utils.inventory_request_aggregator import InventoryRequestAggregator
 
 if TYPE_CHECKING:
     from bxgateway.connections.btc.btc_node_connection import BtcNodeConnection
@@ -52,6 +53,7 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
             f"{str(self)}_compact_btc_recoveries"
         )
         self.ping_interval_s: int = gateway_constants.BLOCKCHAIN_PING_INTERVAL_S
+        self.tx_inventory_aggregator = InventoryRequestAggregator(self.node, self._request_tx_inventory)
         self.connection.node.alarm_queue.register_alarm(
             self.block_cleanup_poll_interval_s,
             self._request_blocks_confirmation
@@ -89,12 +91,14 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
         """
         Handle an inventory message.
 
-        Requests all transactions and blocks that haven't been previously seen.
+        Requests all blocks that haven't been previously seen. Transactions that are not known or already requested
+        are requested in batches, or along with blocks.
         :param msg: INV message
         """
         contains_block = False
         inventory_requests = []
         block_hashes = []
+        tx_inventory_aggregator = self.tx_inventory_aggregator
         for inventory_type, item_hash in msg:
             if InventoryType.is_block(inventory_type):
                 if not self.node.should_process_block_hash(item_hash):
@@ -104,10 +108,16 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
                     contains_block = True
                     inventory_requests.append((inventory_type, item_hash))
             else:
-                inventory_requests.append((inventory_type, item_hash))
+                tx_inventory_aggregator.add(inventory_type, item_hash)
 
         self.node.block_cleanup_service.mark_blocks_and_request_cleanup(block_hashes)
 
+        if inventory_requests or not tx_inventory_aggregator.is_batching():
+            inventory_requests = tx_inventory_aggregator.take_pending(
+                max(gateway_constants.INVENTORY_REQUEST_MAX_BATCH_SIZE - len(inventory_requests), 0)
+            ) + inventory_requests
+        tx_inventory_aggregator.schedule_request()
+
         if inventory_requests:
             get_data = GetDataBtcMessage(
                 magic=msg.magic(),
@@ -116,7 +126,17 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
             )
             self.connection.enqueue_msg(get_data, prepend=contains_block)
 
-        self.node.block_queuing_service.mark_blocks_seen_by_blockchain_node(block_hashes)
+        self.node.block_queuing_service.mark_blocks_seen_by_blockchain_node(block_hashes, self.connection)
+
+    def _request_tx_inventory(self, inventory_requests: List[Tuple[int, Sha256Hash]]) -> None:
+        if not self.connection.is_alive():
+            return
+        get_data = GetDataBtcMessage(
+            magic=self.magic,
+            inv_vects=inventory_requests,
+            request_witness_data=self.request_witness_data
+        )
+        self.connection.enqueue_msg(get_data)
 
     def msg_get_data(self, msg: GetDataBtcMessage) -> None:
         """
@@ -124,7 +144,15 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
         :param msg: GETDATA message
         """
 
+        block_processing_service = self.node.block_processing_service
+        inv_vects = []
         for inv_type, object_hash in msg:
+            # blocks from the BDN announced with headers are answered from the block queue
+            if InventoryType.is_block(inv_type) and \
+                    block_processing_service.try_send_announced_block(object_hash, self.connection):
+                continue
+
+            inv_vects.append((inv_type, object_hash))
             if InventoryType.is_block(inv_type):
                 block_stats.add_block_event_by_block_hash(
                     object_hash,
@@ -139,6 +167,11 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
                 magic=self.magic, inv_vects=[(InventoryType.MSG_BLOCK, object_hash)]
             )
             self.connection.enqueue_msg(inv_msg)
+
+        if not inv_vects:
+            return
+        if len(inv_vects) < msg.count():
+            msg = GetDataBtcMessage(magic=self.magic, inv_vects=inv_vects)
         return self.msg_proxy_request(msg, self.connection)
 
     def msg_get_blocks(self, msg):
@@ -181,7 +214,7 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
         )
 
         if block_hash in self.node.blocks_seen.contents:
-            self.node.on_block_seen_by_blockchain_node(block_hash)
+            self.node.on_block_seen_by_blockchain_node(block_hash, connection=self.connection)
             block_stats.add_block_event_by_block_hash(
                 block_hash,
                 BlockStatEventType.COMPACT_BLOCK_RECEIVED_FROM_BLOCKCHAIN_NODE_IGNORE_SEEN,
@@ -222,7 +255,7 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
             return
 
         self.node.block_cleanup_service.on_new_block_received(msg.block_hash(), msg.prev_block_hash())
-        self.node.on_block_seen_by_blockchain_node(block_hash)
+        self.node.on_block_seen_by_blockchain_node(block_hash, connection=self.connection)
 
         self.connection.log_info(
             "Processing compact block {} from local Bitcoin node.",
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from bxcommon.messages.abstract_message import AbstractMessage
 from bxgateway.messages.eth.protocol.ping_eth_protocol_message import PingEthProtocolMessage
+from bxgateway.messages.eth.protocol.raw_eth_protocol_message import RawEthProtocolMessage
 from bxutils import logging
 
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
@@ -23,8 +24,13 @@ class EthBaseConnection(AbstractGatewayBlockchainConnection["EthGatewayNode"]):
 
         self._log_message(msg.log_level(), "Enqueued message: {}", msg)
 
-        full_message_bytes = bytearray()
-        for message_bytes in self.connection_protocol.get_message_bytes(msg):
-            full_message_bytes.extend(message_bytes)
+        message_bytes_list = list(self.connection_protocol.get_message_bytes(msg))
+        if len(message_bytes_list) == 1 and not isinstance(msg, RawEthProtocolMessage):
+            # encrypted frames are written into a single buffer owned by this message
+            full_message_bytes = message_bytes_list[0]
+        else:
+            full_message_bytes = bytearray()
+            for message_bytes in message_bytes_list:
+                full_message_bytes.extend(message_bytes)
 
         self.enqueue_msg_bytes(full_message_bytes, prepend, full_message=msg)
@@ -1,14 +1,15 @@
 import time
 from abc import ABCMeta
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, cast, Optional
+from typing import TYPE_CHECKING, cast, Optional, List, Tuple
 
 from bxcommon.utils import convert
-from bxgateway import gateway_constants
+from bxgateway import gateway_constants, log_messages
 from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxgateway.connections.abstract_blockchain_connection_protocol import AbstractBlockchainConnectionProtocol
 from bxgateway.messages.eth.protocol.block_headers_eth_protocol_message import BlockHeadersEthProtocolMessage
 from bxgateway.messages.eth.protocol.disconnect_eth_protocol_message import DisconnectEthProtocolMessage
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
 from bxgateway.messages.eth.protocol.eth_protocol_message_factory import EthProtocolMessageFactory
 from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
 from bxgateway.messages.eth.protocol.hello_eth_protocol_message import HelloEthProtocolMessage
@@ -16,7 +17,9 @@ from bxgateway.messages.eth.protocol.ping_eth_protocol_message import PingEthPro
 from bxgateway.messages.eth.protocol.pong_eth_protocol_message import PongEthProtocolMessage
 from bxgateway.messages.eth.protocol.raw_eth_protocol_message import RawEthProtocolMessage
 from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
-from bxgateway.utils.eth import frame_utils
+from bxgateway.messages.eth.protocol.status_v64_eth_protocol_message import StatusV64EthProtocolMessage
+from bxgateway.services.eth.eth_handshake_crypto_service import HandshakeCryptoTaskResult
+from bxgateway.utils.eth import frame_utils, snappy_compression
 from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
 from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
 from bxutils import logging
@@ -54,10 +57,20 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
 
         self.rlpx_cipher = RLPxCipher(is_handshake_initiator, private_key, public_key)
 
+        # RLPx has no frame size negotiation and nodes accept frame bodies up to the size of the frame-size field
+        self.frame_size = self.node.opts.eth_frame_size or gateway_constants.ETH_MAX_FRAME_SIZE
+
         self.connection_status = EthConnectionProtocolStatus()
 
+        self._snappy_supported = self.node.opts.eth_snappy_compression and snappy_compression.is_available()
+        self._snappy_enabled = False
+        # eth protocol version negotiated in Hello messages
+        self.eth_version = eth_common_constants.ETH_PROTOCOL_VERSION
+
         self._last_ping_pong_time: Optional[float] = None
         self._handshake_complete = False
+        self._handshake_start_time = time.time()
+        self._handshake_crypto_time = 0.0
 
         connection.hello_messages = [EthProtocolMessageType.AUTH,
                                      EthProtocolMessageType.AUTH_ACK,
@@ -95,27 +108,16 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
     def msg_auth(self, msg):
         self.connection.log_trace("Beginning processing of auth message.")
         self.connection_status.auth_message_received = True
-        msg_bytes = msg.rawbytes()
-        decrypted_auth_msg, size = self.rlpx_cipher.decrypt_auth_message(bytes(msg_bytes))
-        if decrypted_auth_msg is None:
-            self.connection.log_trace("Auth message is incomplete. Waiting for more bytes.")
-            return
-
-        self.rlpx_cipher.parse_auth_message(decrypted_auth_msg)
-
-        self._enqueue_auth_ack_message()
-        self._finalize_handshake()
-        self._enqueue_hello_message()
-        self.connection.message_factory.reset_expected_msg_type()
+        msg_bytes = bytes(msg.rawbytes())
+        self._submit_handshake_crypto_task(self._on_auth_message_processed, self._process_auth_message, msg_bytes)
 
     def msg_auth_ack(self, msg):
         self.connection.log_trace("Beginning processing of auth ack message.")
         self.connection_status.auth_ack_message_received = True
-        auth_ack_msg_bytes = msg.rawbytes()
-        self.rlpx_cipher.decrypt_auth_ack_message(bytes(auth_ack_msg_bytes))
-        self._finalize_handshake()
-        self._enqueue_hello_message()
-        self.connection.message_factory.reset_expected_msg_type()
+        auth_ack_msg_bytes = bytes(msg.rawbytes())
+        self._submit_handshake_crypto_task(
+            self._on_auth_ack_message_processed, self._process_auth_ack_message, auth_ack_msg_bytes
+        )
 
     def msg_ping(self, msg):
         self.connection.msg_ping(msg)
@@ -132,6 +134,14 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
                                  client_version_string, version)
         self.connection_status.hello_message_received = True
 
+        self.eth_version = self._get_shared_eth_version(msg.get_capabilities())
+        self.connection.message_factory.set_eth_version(self.eth_version)
+
+        if self._snappy_supported and version >= gateway_constants.ETH_SNAPPY_P2P_PROTOCOL_VERSION:
+            self.connection.log_debug("Enabling snappy compression of messages.")
+            self._snappy_enabled = True
+            self.connection.message_factory.set_snappy_enabled(True)
+
     def msg_status(self, msg: StatusEthProtocolMessage):
         self.connection.log_trace("Status message received.")
         self.connection_status.status_message_received = True
@@ -139,7 +149,10 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
         chain_difficulty = int(self.node.opts.chain_difficulty, 16)
         if isinstance(chain_difficulty_from_status_msg, int) and chain_difficulty_from_status_msg > chain_difficulty:
             chain_difficulty = chain_difficulty_from_status_msg
-        self._enqueue_status_message(chain_difficulty)
+
+        # gateway follows the chain of the node, so it announces the fork identifier received from the node
+        fork_id = msg.get_fork_id() if isinstance(msg, StatusV64EthProtocolMessage) else None
+        self._enqueue_status_message(chain_difficulty, fork_id)
 
     def msg_disconnect(self, msg):
         self.connection_status.disconnect_message_received = True
@@ -160,28 +173,45 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
             yield msg.rawbytes()
         else:
             serialization_start_time = time.time()
+            if self._snappy_enabled and msg.msg_type != EthProtocolMessageType.HELLO:
+                payload = self._get_compressed_payload(msg)
+            else:
+                payload = msg.rawbytes()
             frames = frame_utils.get_frames(msg.msg_type,
-                                            msg.rawbytes(),
+                                            payload,
                                             eth_common_constants.DEFAULT_FRAME_PROTOCOL_ID,
-                                            eth_common_constants.DEFAULT_FRAME_SIZE)
+                                            self.frame_size)
             eth_gateway_stats_service.log_serialized_message(time.time() - serialization_start_time)
 
             assert frames
             self.connection.log_trace("Broke message into {} frames", len(frames))
 
             encryption_start_time = time.time()
-            for frame in frames:
-                yield self.rlpx_cipher.encrypt_frame(frame)
-            eth_gateway_stats_service.log_encrypted_message(time.time() - encryption_start_time)
+            frames_bytes = self.rlpx_cipher.encrypt_frames(frames)
+            eth_gateway_stats_service.log_encrypted_message(time.time() - encryption_start_time, len(frames))
+            yield frames_bytes
+
+    def _get_compressed_payload(self, msg: EthProtocolMessage) -> bytes:
+        cache_hit = msg.has_compressed_rawbytes()
+        compression_start_time = time.time()
+        compressed_payload = msg.compressed_rawbytes()
+        eth_gateway_stats_service.log_compressed_message(
+            time.time() - compression_start_time, len(msg.rawbytes()), len(compressed_payload), cache_hit
+        )
+        return compressed_payload
 
     def _enqueue_auth_message(self):
-        auth_msg_bytes = self._get_auth_msg_bytes()
+        self.node.handshake_crypto_service.submit(self._on_auth_message_created, self._get_auth_msg_bytes)
+
+    def _on_auth_message_created(self, task_result: HandshakeCryptoTaskResult):
+        if not self._on_handshake_crypto_task_completed(task_result):
+            return
+
         self.connection.log_debug("Enqueued auth bytes.")
-        self.connection.enqueue_msg_bytes(auth_msg_bytes)
+        self.connection.enqueue_msg_bytes(task_result.result)
         self.connection_status.auth_message_sent = True
 
-    def _enqueue_auth_ack_message(self):
-        auth_ack_msg_bytes = self._get_auth_ack_msg_bytes()
+    def _enqueue_auth_ack_message(self, auth_ack_msg_bytes: bytearray):
         self.connection.log_debug("Enqueued auth ack bytes.")
         self.connection.enqueue_msg_bytes(auth_ack_msg_bytes)
         self.connection_status.auth_ack_message_sent = True
@@ -189,30 +219,62 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
     def _enqueue_hello_message(self):
         public_key = self.node.get_public_key()
 
+        if self._snappy_supported:
+            version = gateway_constants.ETH_SNAPPY_P2P_PROTOCOL_VERSION
+        else:
+            version = eth_common_constants.P2P_PROTOCOL_VERSION
+
         hello_msg = HelloEthProtocolMessage(None,
-                                            eth_common_constants.P2P_PROTOCOL_VERSION,
+                                            version,
                                             f"{gateway_constants.GATEWAY_PEER_NAME} {self.node.opts.source_version}",
-                                            eth_common_constants.CAPABILITIES,
+                                            self._get_capabilities(),
                                             self.connection.external_port,
                                             public_key)
         self.connection.enqueue_msg(hello_msg)
         self.connection_status.hello_message_sent = True
 
-    def _enqueue_status_message(self, chain_difficulty: int):
+    def _enqueue_status_message(self, chain_difficulty: int, fork_id: Optional[List] = None):
         network_id = self.node.opts.network_id
         chain_head_hash = convert.hex_to_bytes(self.node.opts.genesis_hash)
         genesis_hash = convert.hex_to_bytes(self.node.opts.genesis_hash)
 
-        status_msg = StatusEthProtocolMessage(None,
-                                              eth_common_constants.ETH_PROTOCOL_VERSION,
-                                              network_id,
-                                              chain_difficulty,
-                                              chain_head_hash,
-                                              genesis_hash)
+        if fork_id is None:
+            status_msg = StatusEthProtocolMessage(None,
+                                                  self.eth_version,
+                                                  network_id,
+                                                  chain_difficulty,
+                                                  chain_head_hash,
+                                                  genesis_hash)
+        else:
+            status_msg = StatusV64EthProtocolMessage(None,
+                                                     self.eth_version,
+                                                     network_id,
+                                                     chain_difficulty,
+                                                     chain_head_hash,
+                                                     genesis_hash,
+                                                     fork_id)
 
         self.connection.enqueue_msg(status_msg)
         self.connection_status.status_message_sent = True
 
+    def _get_capabilities(self) -> List[Tuple[bytes, int]]:
+        return list(eth_common_constants.CAPABILITIES)
+
+    def _get_shared_eth_version(self, remote_capabilities) -> int:
+        """
+        Returns highest version of eth protocol supported by both the gateway and the node
+        """
+        local_versions = {
+            version for name, version in self._get_capabilities() if name == gateway_constants.ETH_CAPABILITY_NAME
+        }
+        shared_versions = [
+            version for name, version in remote_capabilities
+            if name == gateway_constants.ETH_CAPABILITY_NAME and version in local_versions
+        ]
+        if shared_versions:
+            return max(shared_versions)
+        return eth_common_constants.ETH_PROTOCOL_VERSION
+
     def _enqueue_disconnect_message(self, disconnect_reason):
         disconnect_msg = DisconnectEthProtocolMessage(None, [disconnect_reason])
         self.connection.enqueue_msg(disconnect_msg)
@@ -229,15 +291,80 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
 
         return bytearray(auth_ack_msg_bytes_encrypted)
 
-    def _finalize_handshake(self):
-        self._handshake_complete = True
+    def _process_auth_message(self, msg_bytes: bytes) -> Optional[bytearray]:
+        """
+        Runs in handshake crypto executor
+        :return: encrypted auth ack message, or None if auth message is incomplete
+        """
+        decrypted_auth_msg, _size = self.rlpx_cipher.decrypt_auth_message(msg_bytes)
+        if decrypted_auth_msg is None:
+            return None
+
+        self.rlpx_cipher.parse_auth_message(decrypted_auth_msg)
+        auth_ack_msg_bytes = self._get_auth_ack_msg_bytes()
+        self.rlpx_cipher.setup_cipher()
+        return auth_ack_msg_bytes
 
-        self.connection.log_trace("Setting up cipher.")
+    def _process_auth_ack_message(self, auth_ack_msg_bytes: bytes) -> None:
+        """
+        Runs in handshake crypto executor
+        """
+        self.rlpx_cipher.decrypt_auth_ack_message(auth_ack_msg_bytes)
         self.rlpx_cipher.setup_cipher()
 
+    def _on_auth_message_processed(self, task_result: HandshakeCryptoTaskResult):
+        if not self._on_handshake_crypto_task_completed(task_result):
+            return
+
+        auth_ack_msg_bytes = task_result.result
+        if auth_ack_msg_bytes is None:
+            self.connection.log_trace("Auth message is incomplete. Waiting for more bytes.")
+            return
+
+        self._enqueue_auth_ack_message(auth_ack_msg_bytes)
+        self._finalize_handshake()
+
+    def _on_auth_ack_message_processed(self, task_result: HandshakeCryptoTaskResult):
+        if not self._on_handshake_crypto_task_completed(task_result):
+            return
+
+        self._finalize_handshake()
+
+    def _submit_handshake_crypto_task(self, callback, fn, *args):
+        """
+        Pauses reading of messages until handshake task completes, since cipher is not ready to decrypt frames
+        """
+        self.connection.message_factory.set_handshake_pending(True)
+        self.node.handshake_crypto_service.submit(callback, fn, *args)
+
+    def _on_handshake_crypto_task_completed(self, task_result: HandshakeCryptoTaskResult) -> bool:
+        self.connection.message_factory.set_handshake_pending(False)
+        if not self.connection.is_alive():
+            return False
+
+        self._handshake_crypto_time += task_result.crypto_duration_s
+        if task_result.error is not None:
+            self.connection.log_warning(log_messages.ETH_HANDSHAKE_CRYPTO_FAILED, task_result.error)
+            self.connection.mark_for_close()
+            return False
+        return True
+
+    def _finalize_handshake(self):
+        self._handshake_complete = True
+        eth_gateway_stats_service.log_handshake(
+            time.time() - self._handshake_start_time, self._handshake_crypto_time
+        )
+
         self._last_ping_pong_time = time.time()
         self.node.alarm_queue.register_alarm(eth_common_constants.PING_PONG_INTERVAL_SEC, self._ping_timeout)
 
+        self._enqueue_hello_message()
+        self.connection.message_factory.reset_expected_msg_type()
+
+        # messages received while handshake cryptography was running on the executor were not processed
+        if self.node.handshake_crypto_service.is_enabled() and self.connection.inputbuf.length > 0:
+            self.connection.process_message()
+
     def _handshake_timeout(self):
         if not self._handshake_complete:
             self.connection.log_debug("Handshake was not completed within defined timeout. Closing connection.")
@@ -8,7 +8,6 @@ from bxcommon.connections.connection_state import ConnectionState
 from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
 from bxcommon.messages.abstract_message import AbstractMessage
-from bxcommon.messages.eth.serializers.transaction import Transaction
 from bxcommon.network.abstract_socket_connection_protocol import AbstractSocketConnectionProtocol
 from bxcommon.network.ip_endpoint import IpEndpoint
 from bxcommon.network.peer_info import ConnectionPeerInfo
@@ -45,9 +44,13 @@ from bxgateway.rpc.external.eth_ws_proxy_publisher import EthWsProxyPublisher
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
 from bxgateway.services.eth.eth_block_processing_service import EthBlockProcessingService
 from bxgateway.services.eth.eth_block_queuing_service import EthBlockQueuingService
+from bxgateway.services.eth.eth_handshake_crypto_service import EthHandshakeCryptoService, \
+    HandshakeCryptoTaskResult
 from bxgateway.services.eth.eth_normal_block_cleanup_service import EthNormalBlockCleanupService
+from bxgateway.services.eth.eth_remote_response_cache_service import EthRemoteResponseCacheService
 from bxgateway.testing.eth_lossy_relay_connection import EthLossyRelayConnection
 from bxgateway.testing.test_modes import TestModes
+from bxgateway.utils.eth import eccx
 from bxgateway.utils.interval_minimum import IntervalMinimum
 from bxgateway.utils.running_average import RunningAverage
 from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
@@ -102,6 +105,13 @@ class EthGatewayNode(AbstractGatewayNode):
 
         self.block_processing_service: EthBlockProcessingService = EthBlockProcessingService(self)
         self.block_queuing_service: EthBlockQueuingService = EthBlockQueuingService(self)
+        self.handshake_crypto_service = EthHandshakeCryptoService(opts.eth_handshake_crypto_threads)
+        self.remote_response_cache_service = EthRemoteResponseCacheService(
+            opts.eth_remote_response_cache_max_size_mb * 1024 * 1024,
+            gateway_constants.ETH_REMOTE_RESPONSE_CACHE_MAX_HEIGHTS,
+            self._get_best_accepted_block_number,
+            self.block_queuing_service.get_block_receipts_root
+        )
 
         # List of know total difficulties, tuples of values (block hash, total difficulty)
         self._last_known_difficulties = deque(maxlen=eth_common_constants.LAST_KNOWN_TOTAL_DIFFICULTIES_MAX_COUNT)
@@ -372,9 +382,13 @@ class EthGatewayNode(AbstractGatewayNode):
         if self.opts.eth_ws_uri and not self.eth_ws_proxy_publisher.running:
             asyncio.create_task(self.eth_ws_proxy_publisher.revive())
 
-    def on_transactions_in_block(self, transactions: List[Transaction]) -> None:
-        for transaction in transactions:
-            self.average_block_gas_price.add_value(transaction.gas_price)
+    def on_remote_blockchain_connection_destroyed(self, connection: AbstractGatewayBlockchainConnection) -> None:
+        super(EthGatewayNode, self).on_remote_blockchain_connection_destroyed(connection)
+        self.remote_response_cache_service.on_remote_connection_closed()
+
+    def on_transactions_in_block(self, gas_prices: List[int]) -> None:
+        for gas_price in gas_prices:
+            self.average_block_gas_price.add_value(gas_price)
 
     def broadcast_transactions_to_node(
         self, msg: AbstractMessage, broadcasting_conn: Optional[AbstractConnection]
@@ -390,21 +404,24 @@ class EthGatewayNode(AbstractGatewayNode):
         gas_price_filter = max(average_block_gas_filter, min_gas_price_from_node)
 
         if gas_price_filter > 0:
-            assert len(msg.get_transactions()) == 1
-            transaction = msg.get_transactions()[0]
+            raw_transactions = list(msg.raw_transactions())
+            assert len(raw_transactions) == 1
+            tx_offset, tx_length = raw_transactions[0]
+            msg_bytes = memoryview(msg.rawbytes())
 
-            gas_price = float(transaction.gas_price)
+            gas_price = float(eth_common_utils.raw_tx_gas_price(msg_bytes, tx_offset))
 
             if gas_price < gas_price_filter:
+                tx_hash = Sha256Hash(eth_common_utils.keccak_hash(msg_bytes[tx_offset:tx_offset + tx_length]))
                 logger.trace(
                     "Skipping sending transaction {} with gas price: {}. Average was {}. Minimum from node was {}.",
-                    transaction.hash(),
-                    float(transaction.gas_price),
+                    tx_hash,
+                    gas_price,
                     average_block_gas_filter,
                     min_gas_price_from_node
                 )
                 tx_stats.add_tx_by_hash_event(
-                    transaction.hash(),
+                    tx_hash,
                     TransactionStatEventType.TX_FROM_BDN_IGNORE_LOW_GAS_PRICE,
                     self.network_num,
                     peers=[broadcasting_conn],
@@ -455,6 +472,7 @@ class EthGatewayNode(AbstractGatewayNode):
             self._publish_block_to_new_block_feed(raw_block)
 
     async def init(self) -> None:
+        self._precompute_static_ecdh_keys()
         await super().init()
         try:
             await asyncio.wait_for(
@@ -472,8 +490,32 @@ class EthGatewayNode(AbstractGatewayNode):
             )
         except Exception as e:
             logger.error(log_messages.ETH_WS_CLOSE_FAIL, e, exc_info=True)
+        self.handshake_crypto_service.close()
         await super().close()
 
+    def _get_best_accepted_block_number(self) -> int:
+        best_accepted_height, _ = self.block_queuing_service.best_accepted_block
+        return best_accepted_height
+
+    def _precompute_static_ecdh_keys(self) -> None:
+        """
+        Computes ECDH keys with static public keys of known Ethereum nodes ahead of RLPx handshakes
+        """
+        public_keys = [self._node_public_key, self._remote_public_key]
+        for blockchain_peer in self.blockchain_peers:
+            if blockchain_peer.node_public_key:
+                public_keys.append(convert.hex_to_bytes(blockchain_peer.node_public_key))
+
+        private_key = self.get_private_key()
+        for public_key in set(bytes(public_key) for public_key in public_keys if public_key):
+            self.handshake_crypto_service.submit(
+                self._on_static_ecdh_key_precomputed, eccx.precompute_static_ecdh_key, private_key, public_key
+            )
+
+    def _on_static_ecdh_key_precomputed(self, task_result: HandshakeCryptoTaskResult) -> None:
+        if task_result.error is not None:
+            logger.debug("Failed to precompute ECDH key for Ethereum node public key: {}", task_result.error)
+
     def _is_in_local_discovery(self) -> bool:
         return not self.opts.no_discovery and self._node_public_key is None
 
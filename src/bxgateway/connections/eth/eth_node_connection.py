@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from bxcommon.network.abstract_socket_connection_protocol import AbstractSocketConnectionProtocol
 from bxgateway.connections.eth.eth_base_connection import EthBaseConnection
 from bxgateway.connections.eth.eth_node_connection_protocol import EthNodeConnectionProtocol
+from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
 
 if TYPE_CHECKING:
     from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
@@ -19,6 +20,14 @@ class EthNodeConnection(EthBaseConnection):
             self, is_handshake_initiator, private_key, node_public_key
         )
 
+    def enqueue_msg(self, msg, prepend=False):
+        # transactions from BDN that an eth/65 node already has are not sent again
+        if isinstance(msg, TransactionsEthProtocolMessage):
+            msg = self.connection_protocol.filter_known_transactions(msg)
+            if msg is None:
+                return
+        super(EthNodeConnection, self).enqueue_msg(msg, prepend)
+
     def get_connection_state_details(self):
         """
         Returns details of the current connection state. Used to submit details to SDN on disconnect.
@@ -1,15 +1,17 @@
 import time
 from collections import deque
-from typing import List, Deque
+from typing import List, Deque, Optional, Tuple
 
 from bxcommon.messages.abstract_message import AbstractMessage
 from bxcommon.utils import convert
 from bxcommon.utils.blockchain_utils.eth import eth_common_utils, eth_common_constants
+from bxcommon.utils.alarm_queue import AlarmId
 from bxcommon.utils.expiring_dict import ExpiringDict
+from bxcommon.utils.expiring_set import ExpiringSet
 from bxcommon.utils.object_hash import Sha256Hash, NULL_SHA256_HASH
 from bxcommon.utils.stats.block_stat_event_type import BlockStatEventType
 from bxcommon.utils.stats.block_statistics_service import block_stats
-from bxgateway import log_messages
+from bxgateway import log_messages, gateway_constants
 from bxgateway.connections.eth.eth_base_connection_protocol import EthBaseConnectionProtocol
 from bxgateway.eth_exceptions import CipherNotInitializedError
 from bxgateway.feed.eth.eth_new_transaction_feed import EthNewTransactionFeed
@@ -23,14 +25,22 @@ from bxgateway.messages.eth.protocol.block_headers_eth_protocol_message import B
 from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
 from bxgateway.messages.eth.protocol.get_block_bodies_eth_protocol_message import GetBlockBodiesEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_block_headers_eth_protocol_message import GetBlockHeadersEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_pooled_transactions_eth_protocol_message import \
+    GetPooledTransactionsEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_node_data_eth_protocol_message import GetNodeDataEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_receipts_eth_protocol_message import GetReceiptsEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message import NewBlockHashesEthProtocolMessage
+from bxgateway.messages.eth.protocol.new_pooled_transaction_hashes_eth_protocol_message import \
+    NewPooledTransactionHashesEthProtocolMessage
+from bxgateway.messages.eth.protocol.pooled_transactions_eth_protocol_message import \
+    PooledTransactionsEthProtocolMessage
 from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
 from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import \
     TransactionsEthProtocolMessage
 from bxgateway.services.gateway_transaction_service import ProcessTransactionMessageFromNodeResult
 from bxgateway.utils.eth import eth_utils
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
 from bxgateway.utils.stats.gateway_bdn_performance_stats_service import \
     gateway_bdn_performance_stats_service
 from bxgateway.utils.stats.gateway_transaction_stats_service import gateway_transaction_stats_service
@@ -49,12 +59,15 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             EthProtocolMessageType.TRANSACTIONS: self.msg_tx,
             EthProtocolMessageType.GET_BLOCK_HEADERS: self.msg_get_block_headers,
             EthProtocolMessageType.GET_BLOCK_BODIES: self.msg_get_block_bodies,
-            EthProtocolMessageType.GET_NODE_DATA: self.msg_proxy_request,
+            EthProtocolMessageType.GET_NODE_DATA: self.msg_get_node_data,
             EthProtocolMessageType.GET_RECEIPTS: self.msg_get_receipts,
             EthProtocolMessageType.BLOCK_HEADERS: self.msg_block_headers,
             EthProtocolMessageType.NEW_BLOCK: self.msg_block,
             EthProtocolMessageType.NEW_BLOCK_HASHES: self.msg_new_block_hashes,
-            EthProtocolMessageType.BLOCK_BODIES: self.msg_block_bodies
+            EthProtocolMessageType.BLOCK_BODIES: self.msg_block_bodies,
+            EthProtocolMessageType.NEW_POOLED_TRANSACTION_HASHES: self.msg_new_pooled_transaction_hashes,
+            EthProtocolMessageType.GET_POOLED_TRANSACTIONS: self.msg_get_pooled_transactions,
+            EthProtocolMessageType.POOLED_TRANSACTIONS: self.msg_pooled_transactions,
         })
 
         self.waiting_checkpoint_headers_request = True
@@ -90,6 +103,22 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
         )
         self._connection_established_time = 0.0
 
+        # hashes of transactions that the node has, or has been sent, which are not sent to the node again
+        self._known_tx_hashes: ExpiringSet[Sha256Hash] = ExpiringSet(
+            self.node.alarm_queue,
+            gateway_constants.ETH_KNOWN_TX_HASHES_EXPIRATION_TIME_S,
+            f"{str(self)}_eth_known_tx_hashes"
+        )
+        # hashes of transactions announced by the node that are requested from it, and not requested again meanwhile
+        self._requested_tx_hashes: ExpiringSet[Sha256Hash] = ExpiringSet(
+            self.node.alarm_queue,
+            gateway_constants.ETH_POOLED_TX_REQUEST_TIMEOUT_S,
+            f"{str(self)}_eth_requested_tx_hashes"
+        )
+        # transactions from BDN waiting to be announced to the node, as tuples of (hash, size)
+        self._pending_tx_announcements: List[Tuple[Sha256Hash, int]] = []
+        self._tx_announcements_alarm_id: Optional[AlarmId] = None
+
     def msg_status(self, msg: StatusEthProtocolMessage):
         super(EthNodeConnectionProtocol, self).msg_status(msg)
 
@@ -114,6 +143,10 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             super().msg_tx(msg)
 
     def msg_tx_after_tx_service_process_complete(self, process_result: List[ProcessTransactionMessageFromNodeResult]):
+        if self.is_pooled_tx_announcements_enabled():
+            for result in process_result:
+                self._known_tx_hashes.add(result.transaction_hash)
+
         # calculate minimal tx gas price only if transaction validation is enabled
         if not self.node.opts.transaction_validation:
             return
@@ -134,7 +167,7 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
         self.process_msg_block(internal_new_block_msg, msg.number())
 
         if self.node.opts.filter_txs_factor > 0:
-            self.node.on_transactions_in_block(msg.txns())
+            self.node.on_transactions_in_block(msg.get_gas_prices())
 
     def msg_new_block_hashes(self, msg: NewBlockHashesEthProtocolMessage):
         if not self.node.should_process_block_hash(msg.block_hash()):
@@ -156,7 +189,9 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             gateway_bdn_performance_stats_service.log_block_message_from_blockchain_node(False)
 
             if block_hash in self.node.blocks_seen.contents:
-                self.node.on_block_seen_by_blockchain_node(block_hash, block_number=block_number)
+                self.node.on_block_seen_by_blockchain_node(
+                    block_hash, block_number=block_number, connection=self.connection
+                )
                 block_stats.add_block_event_by_block_hash(
                     block_hash,
                     BlockStatEventType.BLOCK_RECEIVED_FROM_BLOCKCHAIN_NODE_IGNORE_SEEN,
@@ -170,7 +205,7 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
                 continue
 
             recovery_cancelled = self.node.on_block_seen_by_blockchain_node(
-                block_hash, block_number=block_number
+                block_hash, block_number=block_number, connection=self.connection
             )
             if recovery_cancelled:
                 continue
@@ -246,7 +281,7 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
 
         for block_header in block_headers:
             self.node.block_queuing_service.mark_block_seen_by_blockchain_node(
-                block_header.hash_object(), None, block_header.number
+                block_header.hash_object(), None, block_header.number, self.connection
             )
 
             if block_header.number > latest_block_number:
@@ -297,10 +332,148 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
 
             self._process_ready_new_blocks()
 
+    def msg_new_pooled_transaction_hashes(self, msg: NewPooledTransactionHashesEthProtocolMessage) -> None:
+        """
+        Requests bodies of announced transactions that are not known to the gateway yet,
+        unless a request for them is already in flight
+        """
+        requested_tx_hashes = []
+        in_flight_count = 0
+        for tx_hash in msg.get_transaction_hashes():
+            self._known_tx_hashes.add(tx_hash)
+            if self.tx_service.has_transaction_contents(tx_hash):
+                continue
+            if tx_hash in self._requested_tx_hashes:
+                in_flight_count += 1
+                continue
+            self._requested_tx_hashes.add(tx_hash)
+            requested_tx_hashes.append(bytes(tx_hash.binary))
+
+        eth_gateway_stats_service.log_pooled_txs_fetch(len(requested_tx_hashes), in_flight_count)
+        for start in range(0, len(requested_tx_hashes), gateway_constants.ETH_MAX_POOLED_TX_HASHES_PER_MSG):
+            self.connection.enqueue_msg(
+                GetPooledTransactionsEthProtocolMessage(
+                    None,
+                    requested_tx_hashes[start:start + gateway_constants.ETH_MAX_POOLED_TX_HASHES_PER_MSG]
+                )
+            )
+
+    def msg_get_pooled_transactions(self, msg: GetPooledTransactionsEthProtocolMessage) -> None:
+        """
+        Serves bodies of transactions announced to the node from transaction service.
+        Transactions missing from transaction service are omitted from response.
+        """
+        tx_hashes = msg.get_transaction_hashes()[:gateway_constants.ETH_MAX_POOLED_TX_HASHES_PER_MSG]
+        txs_bytes = []
+        for tx_hash in tx_hashes:
+            tx_contents = self.tx_service.get_transaction_by_hash(tx_hash)
+            if tx_contents is not None:
+                txs_bytes.append(tx_contents)
+
+        response_msg = PooledTransactionsEthProtocolMessage(eth_utils.get_transactions_list_bytes(txs_bytes))
+        eth_gateway_stats_service.log_pooled_txs_request(
+            len(tx_hashes), len(txs_bytes), sum(len(tx_bytes) for tx_bytes in txs_bytes)
+        )
+        self.connection.enqueue_msg(response_msg)
+
+    def msg_pooled_transactions(self, msg: PooledTransactionsEthProtocolMessage) -> None:
+        # pooled transactions are encoded the same way as transactions broadcast by the node
+        self.msg_tx(TransactionsEthProtocolMessage(msg.rawbytes()))
+
+    def is_pooled_tx_announcements_enabled(self) -> bool:
+        return self.eth_version >= gateway_constants.ETH_POOLED_TX_PROTOCOL_VERSION
+
+    def is_bdn_tx_announcements_enabled(self) -> bool:
+        return self.node.opts.eth_bdn_tx_announcements and self.is_pooled_tx_announcements_enabled()
+
+    def filter_known_transactions(
+        self, msg: TransactionsEthProtocolMessage
+    ) -> Optional[TransactionsEthProtocolMessage]:
+        """
+        Removes transactions from BDN that the node already has, or has been sent, from message to the node.
+        If announcements of BDN transactions are enabled, hashes of the remaining transactions are queued for
+        announcement instead, and the node requests the bodies it is missing. Hashes received in one pass of the
+        event loop are announced in a single message.
+        :return: message with transactions to send, or None if there is nothing to send
+        """
+        if not self.is_pooled_tx_announcements_enabled():
+            return msg
+
+        announce_txs = self.is_bdn_tx_announcements_enabled()
+        msg_bytes = memoryview(msg.rawbytes())
+        unknown_txs_bytes = []
+        unknown_tx_hashes = []
+        known_txs_count = 0
+        known_tx_bytes = 0
+        for (tx_offset, tx_length), tx_hash in zip(msg.raw_transactions(), msg.tx_hashes()):
+            if tx_hash in self._known_tx_hashes:
+                known_txs_count += 1
+                known_tx_bytes += tx_length
+                continue
+
+            self._known_tx_hashes.add(tx_hash)
+            if announce_txs:
+                self._pending_tx_announcements.append((tx_hash, tx_length))
+            else:
+                unknown_txs_bytes.append(msg_bytes[tx_offset:tx_offset + tx_length])
+                unknown_tx_hashes.append(tx_hash)
+
+        if known_txs_count:
+            eth_gateway_stats_service.log_known_txs_skipped(known_txs_count, known_tx_bytes)
+
+        if announce_txs:
+            if self._pending_tx_announcements and self._tx_announcements_alarm_id is None:
+                self._tx_announcements_alarm_id = self.node.alarm_queue.register_alarm(
+                    0, self._send_tx_announcements
+                )
+            return None
+
+        if known_txs_count == 0:
+            return msg
+        if not unknown_txs_bytes:
+            return None
+        filtered_msg = TransactionsEthProtocolMessage(eth_utils.get_transactions_list_bytes(unknown_txs_bytes))
+        filtered_msg.set_tx_hashes(unknown_tx_hashes)
+        return filtered_msg
+
+    def _send_tx_announcements(self) -> float:
+        self._tx_announcements_alarm_id = None
+        pending_tx_announcements = self._pending_tx_announcements
+        self._pending_tx_announcements = []
+
+        if not self.connection.is_alive():
+            return 0
+
+        for start in range(0, len(pending_tx_announcements), gateway_constants.ETH_MAX_POOLED_TX_HASHES_PER_MSG):
+            announcements = pending_tx_announcements[start:start + gateway_constants.ETH_MAX_POOLED_TX_HASHES_PER_MSG]
+            announcement_msg = NewPooledTransactionHashesEthProtocolMessage(
+                None, [bytes(tx_hash.binary) for tx_hash, _ in announcements]
+            )
+            self.connection.enqueue_msg(announcement_msg)
+            eth_gateway_stats_service.log_tx_announcement(
+                len(announcements), sum(tx_size for _, tx_size in announcements), len(announcement_msg.rawbytes())
+            )
+        return 0
+
+    def _get_capabilities(self) -> List[Tuple[bytes, int]]:
+        capabilities = super(EthNodeConnectionProtocol, self)._get_capabilities()
+        if self.node.opts.eth_pooled_tx_announcements:
+            capabilities.append(
+                (gateway_constants.ETH_CAPABILITY_NAME, gateway_constants.ETH_POOLED_TX_PROTOCOL_VERSION)
+            )
+        return capabilities
+
     def msg_get_receipts(self, msg: GetReceiptsEthProtocolMessage) -> None:
+        if self.node.remote_response_cache_service.try_process_request(msg, self.connection):
+            return
         self.node.log_requested_remote_blocks(msg.get_block_hashes())
         self.msg_proxy_request(msg, self.connection)
 
+    def msg_get_node_data(self, msg: GetNodeDataEthProtocolMessage) -> None:
+        if self.node.remote_response_cache_service.try_process_request(msg, self.connection):
+            return
+        self.msg_proxy_request(msg, self.connection)
+
     def _stop_waiting_checkpoint_headers_request(self):
         self._waiting_checkpoint_headers_request = False
 
@@ -338,7 +511,7 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
                     block_height=new_block_msg.block_number(),
                 )
                 self.node.block_queuing_service.mark_block_seen_by_blockchain_node(
-                    ready_block_hash, new_block_msg
+                    ready_block_hash, new_block_msg, connection=self.connection
                 )
                 self.node.block_processing_service.queue_block_for_processing(
                     new_block_msg, self.connection
@@ -9,6 +9,7 @@ from bxgateway.connections.eth.eth_base_connection_protocol import EthBaseConnec
 from bxgateway.messages.eth.protocol.block_bodies_eth_protocol_message import BlockBodiesEthProtocolMessage
 from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
 from bxgateway.messages.eth.protocol.get_block_bodies_eth_protocol_message import GetBlockBodiesEthProtocolMessage
+from bxgateway.messages.eth.protocol.node_data_eth_protocol_message import NodeDataEthProtocolMessage
 from bxgateway.messages.eth.protocol.receipts_eth_protocol_message import ReceiptsEthProtocolMessage
 from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
 from bxutils import logging
@@ -25,7 +26,7 @@ class EthRemoteConnectionProtocol(EthBaseConnectionProtocol):
             EthProtocolMessageType.GET_BLOCK_BODIES: self.msg_get_block_bodies,
             EthProtocolMessageType.BLOCK_HEADERS: self.msg_proxy_response,
             EthProtocolMessageType.BLOCK_BODIES: self.msg_block_bodies,
-            EthProtocolMessageType.NODE_DATA: self.msg_proxy_response,
+            EthProtocolMessageType.NODE_DATA: self.msg_node_data,
             EthProtocolMessageType.RECEIPTS: self.msg_block_receipts
         })
 
@@ -43,6 +44,11 @@ class EthRemoteConnectionProtocol(EthBaseConnectionProtocol):
     def msg_block_receipts(self, msg: ReceiptsEthProtocolMessage) -> None:
         self.node.log_received_remote_blocks(len(msg.get_receipts_bytes()))
         self.msg_proxy_response(msg)
+        self.node.remote_response_cache_service.process_response(msg)
+
+    def msg_node_data(self, msg: NodeDataEthProtocolMessage) -> None:
+        self.msg_proxy_response(msg)
+        self.node.remote_response_cache_service.process_response(msg)
 
     def msg_get_block_bodies(self, msg: GetBlockBodiesEthProtocolMessage) -> None:
         block_hashes = msg.get_block_hashes()
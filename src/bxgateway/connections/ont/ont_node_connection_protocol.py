@@ -1,4 +1,4 @@
-from typing import List, TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 
 from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.messages.abstract_message import AbstractMessage
@@ -23,6 +23,7 @@ from bxgateway.messages.ont.pong_ont_message import PongOntMessage
 from bxgateway.messages.ont.ver_ack_ont_message import VerAckOntMessage
 from bxgateway.messages.ont.version_ont_message import VersionOntMessage
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
+from bxgateway.utils.inventory_request_aggregator import InventoryRequestAggregator
 
 if TYPE_CHECKING:
     from bxgateway.connections.ont.ont_node_connection import OntNodeConnection
@@ -45,6 +46,7 @@ class OntNodeConnectionProtocol(OntBaseConnectionProtocol):
         })
 
         self.ping_interval_s = ont_constants.ONT_PING_INTERVAL_S
+        self.tx_inventory_aggregator = InventoryRequestAggregator(self.node, self._request_tx_inventory)
 
         # TODO: re-enable when  block cleanup polling is supported
         # if self.block_cleanup_poll_interval_s > 0:
@@ -78,6 +80,11 @@ class OntNodeConnectionProtocol(OntBaseConnectionProtocol):
                 if item_hash not in self.node.blocks_seen.contents:
                     contains_block = True
                     inventory_requests.append(item_hash)
+        elif inventory_type == InventoryOntType.MSG_TX.value:
+            tx_inventory_aggregator = self.tx_inventory_aggregator
+            for item_hash in item_hashes:
+                tx_inventory_aggregator.add(inventory_type, item_hash)
+            tx_inventory_aggregator.schedule_request()
         else:
             for item_hash in item_hashes:
                 inventory_requests.append(item_hash)
@@ -94,6 +101,17 @@ class OntNodeConnectionProtocol(OntBaseConnectionProtocol):
 
         self.node.block_queuing_service.mark_blocks_seen_by_blockchain_node(block_hashes)
 
+    def _request_tx_inventory(self, inventory_requests: List[Tuple[int, Sha256Hash]]) -> None:
+        if not self.connection.is_alive():
+            return
+        for inventory_type, item_hash in inventory_requests:
+            get_data = GetDataOntMessage(
+                magic=self.magic,
+                inv_type=inventory_type,
+                block=item_hash
+            )
+            self.connection.enqueue_msg(get_data)
+
     def msg_get_data(self, msg: GetDataOntMessage) -> None:
         inventory_type, item_hash = msg.inv_type()
         if inventory_type == InventoryOntType.MSG_BLOCK.value:
@@ -49,7 +49,7 @@ class EthNewBlockFeed(Feed[EthBlockFeedEntry, EthRawBlock]):
     def publish_blocks_from_queue(self, start_block_height, end_block_height) -> Set[int]:
         missing_blocks = set()
         for block_number in range(start_block_height, end_block_height):
-            block_hash = self.node.block_queuing_service.accepted_block_hash_at_height.contents.get(block_number)
+            block_hash = self.node.block_queuing_service.get_accepted_block_hash_at_height(block_number)
             if block_hash:
                 self.publish(
                     EthRawBlock(
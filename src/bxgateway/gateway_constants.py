@@ -2,6 +2,7 @@ from collections import defaultdict
 
 from bxcommon import constants
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
+from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxgateway.messages.gateway.gateway_message_type import GatewayMessageType
 
 GATEWAY_HELLO_MESSAGES = [GatewayMessageType.HELLO, BloxrouteMessageType.ACK]
@@ -17,6 +18,20 @@ BLOCK_RECOVERY_RECOVERY_INTERVAL_S = [0.1, 0.5, 1, 2, 5]
 # BLOCK_RECOVERY_MAX_RETRY_ATTEMPTS = len(BLOCK_RECOVERY_RECOVERY_INTERVAL_S)
 BLOCK_RECOVERY_MAX_RETRY_ATTEMPTS = 1  # for now, since longer retries aren't really worth it
 BLOCK_RECOVERY_MAX_QUEUE_TIME = 15  # slightly more than sum(BLOCK_RECOVERY_RECOVERY_INTERVAL_S)
+# retries of blocks due within this window are merged into the same transactions request
+BLOCK_RECOVERY_RETRY_BATCH_WINDOW_S = 0.05
+BLOCK_RECOVERY_MAX_RETRY_DELAY_S = 5
+BLOCK_RECOVERY_MAX_SHORT_IDS_PER_REQUEST = 10000
+BLOCK_RECOVERY_RTT_RUNNING_AVERAGE_SIZE = 20
+BLOCK_RECOVERY_RTT_TIMEOUT_MULTIPLIER = 2
+
+# block hold timeout is computed from recent durations between holding a block and receiving it from the BDN
+BLOCK_HOLD_DURATION_SAMPLES_PER_PEER = 50
+BLOCK_HOLD_TIMEOUT_MIN_SAMPLES = 10
+BLOCK_HOLD_TIMEOUT_PERCENTILE = 95
+BLOCK_HOLD_TIMEOUT_MARGIN_MULTIPLIER = 1.2
+BLOCK_HOLD_TIMEOUT_MIN_S = 0.1
+
 CHECK_MEMORY_THRESHOLD_INTERVAL_S = 60 * 60
 CHECK_MEMORY_THRESHOLD_LIMIT = 2 * 1024 * 1024 * 1024
 
@@ -36,6 +51,13 @@ NEUTRALITY_POLICY = NeutralityPolicy.RECEIPT_PERCENT
 NEUTRALITY_EXPECTED_RECEIPT_COUNT = 1
 NEUTRALITY_EXPECTED_RECEIPT_PERCENT = 50
 
+BLOCK_CRYPTO_THREAD_POOL_SIZE = 2
+# threads running secp256k1 and ECIES operations of RLPx handshakes with Ethereum nodes
+ETH_HANDSHAKE_CRYPTO_THREAD_POOL_SIZE = 1
+# number of static ECDH shared secrets between the gateway key and Ethereum node keys kept for reconnects
+ETH_STATIC_ECDH_KEY_CACHE_SIZE = 256
+ENCRYPTED_BLOCKS_AWAITING_KEY_EXPIRATION_TIME_S = 5 * 60
+
 # Max duration to wait before releasing a block, even if blockchain node has not indicated receipt of
 # previous block in chain. This value can be set to 0 if a blockchain node implementation is capable of
 # immediately taking block messages without validating previous block.
@@ -43,6 +65,43 @@ NEUTRALITY_EXPECTED_RECEIPT_PERCENT = 50
 MAX_INTERVAL_BETWEEN_BLOCKS_S = 0.6
 NODE_READINESS_FOR_BLOCKS_CHECK_INTERVAL_S = 5
 MAX_BLOCK_CACHE_TIME_S = 20 * 60
+# interval of removing expired blocks and heights from Ethereum block tree
+ETH_BLOCK_TREE_CLEANUP_INTERVAL_S = 60
+ETH_BLOCK_CACHE_MAX_SIZE_MB = 256
+ETH_BLOCK_CACHE_UNCOMPRESSED_HEIGHTS = 8
+# zlib level of Ethereum blocks kept compressed in block cache, favoring speed over ratio
+ETH_BLOCK_CACHE_COMPRESSION_LEVEL = 1
+# memory budget for encoded BlockHeaders/BlockBodies responses to repeated requests of the Ethereum node,
+# which re-requests the same recent headers while syncing after a reorg
+ETH_BLOCK_RESPONSE_CACHE_MAX_SIZE_MB = 16
+# memory budget for receipts and node data received from the remote blockchain node, kept to answer repeated
+# requests of the Ethereum node without a round trip to the remote node
+ETH_REMOTE_RESPONSE_CACHE_MAX_SIZE_MB = 16
+# cached receipts and node data are dropped once the best block advances this many blocks
+ETH_REMOTE_RESPONSE_CACHE_MAX_HEIGHTS = 128
+# requests in flight to the remote blockchain node are dropped if they are not answered within this time,
+# requests identical to a request in flight wait for its response
+ETH_REMOTE_REQUEST_COALESCING_TIMEOUT_S = 10
+# largest RLPx frame window, which fits the 3 byte frame-size field of the frame header. Each frame costs
+# four Keccak MAC updates and one AES-ECB block, so large messages are sent in as few frames as possible.
+ETH_MAX_FRAME_SIZE = eth_common_constants.FRAME_MAX_BODY_SIZE - 1 + eth_common_constants.FRAME_HDR_DATA_LEN + \
+    2 * eth_common_constants.FRAME_MAC_LEN
+# devp2p p2p protocol version from which message payloads are snappy compressed after Hello
+ETH_SNAPPY_P2P_PROTOCOL_VERSION = 5
+# devp2p peers disconnect when a snappy compressed message decompresses to more than 16 MiB
+ETH_MAX_DECOMPRESSED_MESSAGE_SIZE = 16 * 1024 * 1024
+# name of eth sub-protocol in capabilities exchanged in devp2p Hello messages
+ETH_CAPABILITY_NAME = b"eth"
+# eth protocol version from which Status message carries EIP-2124 fork identifier
+ETH_FORK_ID_PROTOCOL_VERSION = 64
+# eth protocol version which announces transaction hashes and serves pooled transactions on request
+ETH_POOLED_TX_PROTOCOL_VERSION = 65
+# Ethereum nodes drop announcements and requests of more transaction hashes
+ETH_MAX_POOLED_TX_HASHES_PER_MSG = 4096
+# how long transactions received from or sent to Ethereum node are not sent to it again
+ETH_KNOWN_TX_HASHES_EXPIRATION_TIME_S = 5 * 60
+# how long transactions requested from Ethereum node after its announcement are not requested again
+ETH_POOLED_TX_REQUEST_TIMEOUT_S = 5
 
 GATEWAY_TRANSACTION_STATS_INTERVAL_S = 1 * 60
 GATEWAY_TRANSACTION_STATS_LOOKBACK = 1
@@ -80,6 +139,28 @@ TRACKED_BLOCK_CLEANUP_INTERVAL_S = 0
 # ignore last confirmed block and request block confirmation since last tracked block instead
 BLOCK_CLEANUP_REQUEST_EXPECTED_ADDITIONAL_TRACKED_BLOCKS = 1
 
+# rebuild BTC short id index after block cleanup once it indexes this many times more transactions than
+# transaction service, since transactions can also leave transaction service without a block cleanup
+BTC_SHORT_ID_INDEX_MAX_STALE_RATIO = 1.5
+
+# transaction ids of compressed BTC blocks are kept until the block is cleaned up, which happens after the
+# network's block confirmations count (about an hour with 6 confirmations), or until this expires
+BTC_COMPRESSED_BLOCK_TX_HASHES_EXPIRATION_TIME_S = 2 * 60 * 60
+
+# confirmed blocks are cleaned up in slices of at most this duration per event loop iteration
+BLOCK_CLEANUP_TIME_BUDGET_MS = 5
+# number of transactions removed between checks of the slice time budget
+BLOCK_CLEANUP_CHUNK_SIZE = 100
+# delay between cleanup slices, so that pending socket events are processed first
+BLOCK_CLEANUP_SLICE_INTERVAL_S = 0.001
+
+# transaction announcements from blockchain nodes are requested in batches once per interval
+INVENTORY_REQUEST_BATCH_INTERVAL_MS = 20
+# maximum number of inventory vectors in a data request
+INVENTORY_REQUEST_MAX_BATCH_SIZE = 50000
+# announced transactions are not requested again within this time after being requested
+INVENTORY_REQUEST_EXPIRATION_TIME_S = 30
+
 REMOTE_BLOCKCHAIN_MAX_CONNECT_RETRIES = 10
 REMOTE_BLOCKCHAIN_SDN_CONTACT_RETRY_SECONDS = 30
 
@@ -85,6 +85,20 @@ class GatewayOpts(CommonOpts):
     filter_txs_factor: float
     min_peer_relays_count: int
     should_restart_on_high_memory: bool
+    block_crypto_threads: int
+    eth_block_cache_max_size_mb: int
+    eth_block_cache_uncompressed_heights: int
+    eth_block_response_cache_max_size_mb: int
+    eth_remote_response_cache_max_size_mb: int
+    btc_short_id_index: bool
+    block_cleanup_time_budget_ms: float
+    btc_headers_first_relay: bool
+    inventory_request_batch_interval_ms: float
+    eth_frame_size: int
+    eth_handshake_crypto_threads: int
+    eth_snappy_compression: bool
+    eth_pooled_tx_announcements: bool
+    eth_bdn_tx_announcements: bool
 
     # IPC
     ipc: bool
@@ -206,6 +220,17 @@ class GatewayOpts(CommonOpts):
                 sys.exit(1)
             validate_pub_key(self.remote_public_key)
 
+        if self.eth_frame_size != 0 and not \
+                eth_common_constants.DEFAULT_FRAME_SIZE <= self.eth_frame_size <= gateway_constants.ETH_MAX_FRAME_SIZE:
+            logger.fatal(
+                log_messages.ETH_INVALID_FRAME_SIZE,
+                eth_common_constants.DEFAULT_FRAME_SIZE,
+                gateway_constants.ETH_MAX_FRAME_SIZE,
+                self.eth_frame_size,
+                exc_info=False
+            )
+            sys.exit(1)
+
     def set_account_options(self, account_model: BdnAccountModelBase) -> None:
         super().set_account_options(account_model)
         self.account_model = account_model
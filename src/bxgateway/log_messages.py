@@ -491,4 +491,19 @@ NODE_EXCEEDS_MEMORY = LogMessage(
     "G-000091",
     MEMORY_CATEGORY,
     "Gateway exceeded allowed memory, restarting"
-)
\ No newline at end of file
+)
+THREAD_POOL_TASK_FAILED = LogMessage(
+    "G-000092",
+    PROCESSING_FAILED_CATEGORY,
+    "Task of {} thread pool failed: {}"
+)
+ETH_INVALID_FRAME_SIZE = LogMessage(
+    "G-000093",
+    GENERAL_CATEGORY,
+    "--eth-frame-size must be between {} and {} bytes, or 0 to use the largest frame size. Provided: {}"
+)
+ETH_HANDSHAKE_CRYPTO_FAILED = LogMessage(
+    "G-000094",
+    GENERAL_CATEGORY,
+    "RLPx handshake with Ethereum node failed: {}. Closing connection."
+)
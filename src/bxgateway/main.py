@@ -326,6 +326,117 @@ def get_argument_parser() -> argparse.ArgumentParser:
         type=float,
         default=0
     )
+    arg_parser.add_argument(
+        "--block-crypto-threads",
+        help="Number of threads used to encrypt, decrypt and verify blocks off the event loop. "
+             "0 runs block cryptography on the event loop "
+             f"(default: {gateway_constants.BLOCK_CRYPTO_THREAD_POOL_SIZE})",
+        type=int,
+        default=gateway_constants.BLOCK_CRYPTO_THREAD_POOL_SIZE
+    )
+    arg_parser.add_argument(
+        "--eth-block-cache-max-size-mb",
+        help="Memory budget for recent Ethereum blocks kept to answer node requests. Least recently used blocks "
+             f"are evicted beyond it (default: {gateway_constants.ETH_BLOCK_CACHE_MAX_SIZE_MB})",
+        type=int,
+        default=gateway_constants.ETH_BLOCK_CACHE_MAX_SIZE_MB
+    )
+    arg_parser.add_argument(
+        "--eth-block-cache-uncompressed-heights",
+        help="Number of most recent heights of Ethereum blocks kept uncompressed. Older blocks are kept "
+             "compressed and inflated on demand. 0 keeps all blocks uncompressed "
+             f"(default: {gateway_constants.ETH_BLOCK_CACHE_UNCOMPRESSED_HEIGHTS})",
+        type=int,
+        default=gateway_constants.ETH_BLOCK_CACHE_UNCOMPRESSED_HEIGHTS
+    )
+    arg_parser.add_argument(
+        "--eth-block-response-cache-max-size-mb",
+        help="Memory budget for headers and bodies responses kept to answer repeated requests of the Ethereum "
+             "node. 0 disables the cache "
+             f"(default: {gateway_constants.ETH_BLOCK_RESPONSE_CACHE_MAX_SIZE_MB})",
+        type=int,
+        default=gateway_constants.ETH_BLOCK_RESPONSE_CACHE_MAX_SIZE_MB
+    )
+    arg_parser.add_argument(
+        "--eth-remote-response-cache-max-size-mb",
+        help="Memory budget for receipts and node data received from the remote blockchain node, kept to answer "
+             "repeated requests of the Ethereum node. Identical requests in flight share one remote request. "
+             f"0 disables the cache (default: {gateway_constants.ETH_REMOTE_RESPONSE_CACHE_MAX_SIZE_MB})",
+        type=int,
+        default=gateway_constants.ETH_REMOTE_RESPONSE_CACHE_MAX_SIZE_MB
+    )
+    arg_parser.add_argument(
+        "--btc-short-id-index",
+        help="If gateway should keep an index of transaction ids for matching compact block short ids, "
+             "instead of scanning all transactions for each compact block. Ignored with extensions.",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--block-cleanup-time-budget-ms",
+        help="Maximum duration of block cleanup work per event loop iteration. Confirmed blocks are cleaned up "
+             "in slices within this budget, so that relaying is not stalled. 0 cleans up blocks synchronously "
+             f"(default: {gateway_constants.BLOCK_CLEANUP_TIME_BUDGET_MS})",
+        type=float,
+        default=gateway_constants.BLOCK_CLEANUP_TIME_BUDGET_MS
+    )
+    arg_parser.add_argument(
+        "--inventory-request-batch-interval-ms",
+        help="Interval of batching requests for transactions announced by the blockchain node. "
+             "Transactions that are known or were already requested are not requested again. 0 requests "
+             f"transactions as they are announced (default: {gateway_constants.INVENTORY_REQUEST_BATCH_INTERVAL_MS})",
+        type=float,
+        default=gateway_constants.INVENTORY_REQUEST_BATCH_INTERVAL_MS
+    )
+    arg_parser.add_argument(
+        "--eth-frame-size",
+        help="RLPx frame window used for messages sent to Ethereum nodes. Messages larger than the window are "
+             "split into chunked frames. 0 uses the largest frame size accepted by the node "
+             f"({gateway_constants.ETH_MAX_FRAME_SIZE} bytes) (default: 0)",
+        type=int,
+        default=0
+    )
+    arg_parser.add_argument(
+        "--eth-handshake-crypto-threads",
+        help="Number of threads used for the key agreement and ECIES cryptography of RLPx handshakes with "
+             "Ethereum nodes. 0 runs handshake cryptography on the event loop "
+             f"(default: {gateway_constants.ETH_HANDSHAKE_CRYPTO_THREAD_POOL_SIZE})",
+        type=int,
+        default=gateway_constants.ETH_HANDSHAKE_CRYPTO_THREAD_POOL_SIZE
+    )
+    arg_parser.add_argument(
+        "--eth-snappy-compression",
+        help="If gateway should negotiate devp2p p2p protocol version "
+             f"{gateway_constants.ETH_SNAPPY_P2P_PROTOCOL_VERSION} with Ethereum nodes and exchange snappy "
+             "compressed messages. Requires python-snappy (default: True)",
+        type=convert.str_to_bool,
+        default=True
+    )
+    arg_parser.add_argument(
+        "--eth-pooled-tx-announcements",
+        help="If gateway should negotiate eth/"
+             f"{gateway_constants.ETH_POOLED_TX_PROTOCOL_VERSION} with the Ethereum node, requesting transactions "
+             "the node announces by hash and not sending transactions from BDN that the node already has. "
+             "Transactions from BDN are sent in full, unless --eth-bdn-tx-announcements is set (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--eth-bdn-tx-announcements",
+        help="If gateway should announce hashes of transactions from BDN to Ethereum nodes that negotiated eth/"
+             f"{gateway_constants.ETH_POOLED_TX_PROTOCOL_VERSION}, sending transaction bodies only when the node "
+             "requests them. Saves bandwidth, but nodes wait before requesting announced transactions, which delays "
+             "propagation. Requires --eth-pooled-tx-announcements (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
+    arg_parser.add_argument(
+        "--btc-headers-first-relay",
+        help="If gateway should announce headers of blocks from the BDN to the Bitcoin node before they are "
+             "decompressed, and answer requests of the node for these blocks from the block queue (default: False)",
+        type=convert.str_to_bool,
+        default=False
+    )
 
     return arg_parser
 
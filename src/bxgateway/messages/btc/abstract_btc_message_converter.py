@@ -43,6 +43,7 @@ class CompactBlockRecoveryData(NamedTuple):
     block_header: memoryview
     magic: int
     tx_service: TransactionService
+    block_tx_hashes: List[Optional[Sha256Hash]]
 
 
 def get_block_info(
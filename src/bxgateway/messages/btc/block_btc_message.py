@@ -1,10 +1,11 @@
 import struct
-from typing import Optional
+from typing import Optional, List
 
 from bxutils.logging.log_level import LogLevel
 
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
 from bxcommon.utils import crypto
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
 from bxcommon.utils.blockchain_utils.btc.btc_common_utils import btc_varint_to_int
 from bxcommon.utils.blockchain_utils.btc.btc_object_hash import BtcObjectHash
 
@@ -47,6 +48,7 @@ class BlockBtcMessage(BtcMessage, AbstractBlockMessage):
         self._bits = self._nonce = self._txn_count = self._txns = self._hash_val = None
         self._header = self._tx_offset = None
         self._timestamp = 0
+        self._tx_hashes: Optional[List[BtcObjectHash]] = None
 
     def log_level(self):
         return LogLevel.DEBUG
@@ -129,6 +131,18 @@ class BlockBtcMessage(BtcMessage, AbstractBlockMessage):
 
         return self._txns
 
+    def tx_hashes(self) -> List[BtcObjectHash]:
+        """
+        Transaction ids of the block transactions, computed once per message.
+        """
+        if self._tx_hashes is None:
+            self._tx_hashes = [btc_common_utils.get_txid(tx) for tx in self.txns()]
+        # pyre-fixme[7]: Expected `List[BtcObjectHash]` but got `Optional[List[BtcObjectHash]]`.
+        return self._tx_hashes
+
+    def has_tx_hashes(self) -> bool:
+        return self._tx_hashes is not None
+
     def block_hash(self) -> BtcObjectHash:
         if self._hash_val is None:
             header = self._memoryview[BTC_HDR_COMMON_OFF:BTC_HDR_COMMON_OFF + BTC_BLOCK_HDR_SIZE]
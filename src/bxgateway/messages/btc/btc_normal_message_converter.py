@@ -28,6 +28,8 @@ from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMess
 from bxgateway.utils.block_info import BlockInfo
 from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 from bxgateway.utils.block_header_info import BlockHeaderInfo
+from bxgateway.utils.btc import btc_short_id_matcher
+from bxgateway.utils.btc.btc_short_id_index import BtcShortIdIndex
 from bxgateway.messages.btc import btc_messages_util
 from bxgateway.abstract_message_converter import BlockDecompressionResult
 
@@ -40,6 +42,8 @@ class CompactBlockRecoveryData(NamedTuple):
     block_header: memoryview
     magic: int
     tx_service: TransactionService
+    # hashes of transactions matched in transaction service, None for pre-filled and missing transactions
+    block_tx_hashes: List[Optional[Sha256Hash]]
 
 
 def parse_bx_block_header(
@@ -134,6 +138,8 @@ def compute_short_id(key: bytes, tx_hash_binary: Union[bytearray, memoryview]) -
 
 
 class BtcNormalMessageConverter(AbstractBtcMessageConverter):
+    # optional index of transaction service hashes maintained by the gateway node
+    short_id_index: Optional[BtcShortIdIndex] = None
 
     def block_to_bx_block(
         self, block_msg, tx_service, enable_block_compression: bool, min_tx_age_seconds: float
@@ -155,8 +161,7 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
 
         max_timestamp_for_compression = time.time() - min_tx_age_seconds
 
-        for tx in block_msg.txns():
-            tx_hash = btc_common_utils.get_txid(tx)
+        for tx, tx_hash in zip(block_msg.txns(), block_msg.tx_hashes()):
             short_id = tx_service.get_short_id(tx_hash)
 
             short_id_assign_time = 0
@@ -273,20 +278,24 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
         short_ids = compact_block.short_ids()
 
         short_id_to_tx_contents = {}
+        short_id_to_tx_hash = {}
 
-        for tx_hash in transaction_service.iter_transaction_hashes():
-            tx_hash_binary = tx_hash.binary[::-1]
-            tx_short_id = compute_short_id(key, tx_hash_binary)
-            if tx_short_id in short_ids:
-                tx_content = transaction_service.get_transaction_by_hash(tx_hash)
-                if tx_content is None:
-                    logger.debug("Hash {} is known by transactions service but content is missing.", tx_hash)
-                else:
-                    short_id_to_tx_contents[tx_short_id] = tx_content
-            if len(short_id_to_tx_contents) == len(short_ids):
-                break
+        short_id_index = self.short_id_index
+        if short_id_index is not None:
+            matched_tx_hashes = short_id_index.match_short_ids(key, short_ids)
+        else:
+            tx_hashes = list(transaction_service.iter_transaction_hashes())
+            matched_tx_hashes = btc_short_id_matcher.match_short_ids(key, tx_hashes, short_ids)
+        for tx_short_id, tx_hash in matched_tx_hashes.items():
+            tx_content = transaction_service.get_transaction_by_hash(tx_hash)
+            if tx_content is None:
+                logger.debug("Hash {} is known by transactions service but content is missing.", tx_hash)
+            else:
+                short_id_to_tx_contents[tx_short_id] = tx_content
+                short_id_to_tx_hash[tx_short_id] = tx_hash
 
         block_transactions = []
+        block_tx_hashes = []
         missing_transactions_indices = []
         pre_filled_transactions = compact_block.pre_filled_transactions()
         total_txs_count = len(pre_filled_transactions) + len(short_ids)
@@ -313,18 +322,21 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
                     short_tx = short_id_to_tx_contents[short_id]
                     block_msg_parts.append(short_tx)
                     block_transactions.append(short_tx)
+                    block_tx_hashes.append(short_id_to_tx_hash[short_id])
                     size += len(short_tx)
                 else:
                     missing_transactions_indices.append(index)
                     block_transactions.append(None)
+                    block_tx_hashes.append(None)
             else:
                 pre_filled_transaction = pre_filled_transactions[index]
                 block_msg_parts.append(pre_filled_transaction)
                 block_transactions.append(pre_filled_transaction)
+                block_tx_hashes.append(None)
                 size += len(pre_filled_transaction)
 
         recovered_item = CompactBlockRecoveryData(
-            block_transactions, block_header, compact_block.magic(), transaction_service
+            block_transactions, block_header, compact_block.magic(), transaction_service, block_tx_hashes
         )
 
         block_info = BlockInfo(
@@ -408,56 +420,86 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
             missing_index = missing_indices[i]
             block_transactions[missing_index] = recovered_transactions[i]
 
-        size = 0
+        bx_block, block_info = self._compact_block_transactions_to_bx_block(recovery_item)
+        return CompactBlockCompressionResult(True, block_info, bx_block, None, [], [])
+
+    def _compact_block_transactions_to_bx_block(
+        self,
+        recovery_item: CompactBlockRecoveryData
+    ) -> Tuple[memoryview, BlockInfo]:
+        """
+        Packs transactions of a reconstructed compact block directly into a bloXroute block.
+
+        Short ids of transactions matched from transaction service are looked up by their known hashes, so only
+        pre-filled and recovered transactions are hashed. The Bitcoin message checksum is computed incrementally
+        over the block pieces without assembling the full block.
+        """
+        compress_start_datetime = datetime.utcnow()
+        tx_service = recovery_item.tx_service
+        block_transactions = recovery_item.block_transactions
+        block_tx_hashes = recovery_item.block_tx_hashes
         total_txs_count = len(block_transactions)
-        block_msg_parts = deque()
+
+        buf = deque()
+        short_ids = []
+
+        msg_header = bytearray(btc_constants.BTC_HDR_COMMON_OFF)
+        buf.append(msg_header)
+        size = btc_constants.BTC_HDR_COMMON_OFF
 
         block_header = recovery_item.block_header
-        block_msg_parts.append(block_header)
-        size += len(block_header)
+        buf.append(block_header)
+        payload_size = len(block_header)
 
         tx_count_size = btc_messages_util.get_sizeof_btc_varint(total_txs_count)
         tx_count_buf = bytearray(tx_count_size)
         btc_messages_util.pack_int_to_btc_varint(total_txs_count, tx_count_buf, 0)
-        block_msg_parts.append(tx_count_buf)
-        size += tx_count_size
+        buf.append(tx_count_buf)
+        payload_size += tx_count_size
+        size += payload_size
 
-        for transaction in block_transactions:
-            block_msg_parts.append(transaction)
-            size += len(transaction)  # pyre-ignore
+        checksum_hash = hashlib.sha256()
+        checksum_hash.update(block_header)
+        checksum_hash.update(tx_count_buf)
 
-        msg_header = bytearray(btc_constants.BTC_HDR_COMMON_OFF)
-        struct.pack_into("<L12sL", msg_header, 0, recovery_item.magic, BtcMessageType.BLOCK, size)
-        block_msg_parts.appendleft(msg_header)
-        size += btc_constants.BTC_HDR_COMMON_OFF
-
-        block_msg_bytes = bytearray(size)
-        off = 0
-        for blob in block_msg_parts:
-            next_off = off + len(blob)
-            block_msg_bytes[off:next_off] = blob
-            off = next_off
-
-        checksum = crypto.bitcoin_hash(block_msg_bytes[btc_constants.BTC_HDR_COMMON_OFF:size])
-        block_msg_bytes[btc_constants.BTC_HEADER_MINUS_CHECKSUM:btc_constants.BTC_HDR_COMMON_OFF] = checksum[0:4]
-        bx_block, compression_block_info = self.block_to_bx_block(
-            BlockBtcMessage(buf=block_msg_bytes), recovery_item.tx_service, True, 0
-        ) # TODO need to think about a better algorithm
-        compress_start_datetime = compression_block_info.start_datetime
+        for index, transaction in enumerate(block_transactions):
+            checksum_hash.update(transaction)  # pyre-ignore
+            payload_size += len(transaction)  # pyre-ignore
+
+            tx_hash = block_tx_hashes[index]
+            if tx_hash is None:
+                tx_hash = btc_common_utils.get_txid(transaction)
+            short_id = tx_service.get_short_id(tx_hash)
+
+            if short_id == constants.NULL_TX_SID:
+                buf.append(transaction)
+                size += len(transaction)  # pyre-ignore
+            else:
+                short_ids.append(short_id)
+                buf.append(btc_constants.BTC_SHORT_ID_INDICATOR_AS_BYTEARRAY)
+                size += 1
+
+        checksum = hashlib.sha256(checksum_hash.digest()).digest()
+        struct.pack_into(
+            "<L12sL4s", msg_header, 0, recovery_item.magic, BtcMessageType.BLOCK, payload_size, checksum[0:4]
+        )
+        block = finalize_block_bytes(buf, size, short_ids)
+
+        original_size = btc_constants.BTC_HDR_COMMON_OFF + payload_size
         compress_end_datetime = datetime.utcnow()
         block_info = BlockInfo(
-            compression_block_info.block_hash,
-            compression_block_info.short_ids,
+            BtcObjectHash(buf=crypto.bitcoin_hash(block_header), length=btc_constants.BTC_SHA_HASH_LEN),
+            short_ids,
             compress_start_datetime,
             compress_end_datetime,
             (compress_end_datetime - compress_start_datetime).total_seconds() * 1000,
-            compression_block_info.txn_count,
-            compression_block_info.compressed_block_hash,
-            compression_block_info.prev_block_hash,
-            compression_block_info.original_size,
-            compression_block_info.compressed_size,
-            compression_block_info.compression_rate,
-            compression_block_info.ignored_short_ids
+            total_txs_count,
+            convert.bytes_to_hex(crypto.double_sha256(block)),
+            convert.bytes_to_hex(BtcObjectHash(block_header, 4, btc_constants.BTC_SHA_HASH_LEN).binary),
+            original_size,
+            size,
+            100 - float(size) / original_size * 100,
+            []
         )
-        return CompactBlockCompressionResult(True, block_info, bx_block, None, [], [])
+        return memoryview(block), block_info
 
@@ -113,7 +113,10 @@ class EthAbstractMessageConverter(AbstractMessageConverter):
             raise TypeError("Type TxMessage is expected for bx_tx_msg arg but was {0}"
                             .format(type(bx_tx_msg)))
 
-        return parse_transaction_bytes(bx_tx_msg.tx_val())
+        tx_msg = parse_transaction_bytes(bx_tx_msg.tx_val())
+        # hash of BDN transaction is reused when the message is sent to the blockchain node
+        tx_msg.set_tx_hashes([bx_tx_msg.tx_hash()])
+        return tx_msg
 
     def block_to_bx_block(
         self, block_msg: InternalEthBlockInfo, tx_service, enable_block_compression: bool, min_tx_age_seconds: float
@@ -11,6 +11,7 @@ from bxcommon.messages.eth.serializers.transaction import Transaction
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxcommon.messages.eth.serializers.block_header import BlockHeader
 from bxcommon.utils.blockchain_utils.eth import rlp_utils, eth_common_utils
+from bxgateway.utils.eth import raw_tx_utils
 
 
 class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
@@ -389,3 +390,11 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
 
     def txns(self) -> List[Transaction]:
         return self.get_field_value("transactions")
+
+    def get_gas_prices(self) -> List[int]:
+        """
+        Reads gas prices of block transactions without deserializing the block
+        """
+        _, _msg_itm_len, msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
+        _, header_len, header_start = rlp_utils.consume_length_prefix(self._memory_view, msg_itm_start)
+        return raw_tx_utils.get_gas_prices(self._memory_view, header_start + header_len)
@@ -41,3 +41,20 @@ class NewBlockParts:
         block_difficulty, _ = rlp_utils.decode_int(header_items_bytes, BlockHeader.FIXED_LENGTH_FIELD_OFFSET)
 
         return block_difficulty
+
+    def get_receipts_root(self) -> Optional[bytes]:
+        if self.block_header_bytes is None:
+            return None
+
+        _, _, header_item_start = rlp_utils.consume_length_prefix(self.block_header_bytes, 0)
+        # previous block hash, uncles hash, coinbase, state root and transactions root precede receipts root
+        for _ in range(5):
+            _, header_item_len, header_item_start = rlp_utils.consume_length_prefix(
+                self.block_header_bytes, header_item_start
+            )
+            header_item_start += header_item_len
+
+        _, receipts_root_len, receipts_root_start = rlp_utils.consume_length_prefix(
+            self.block_header_bytes, header_item_start
+        )
+        return bytes(self.block_header_bytes[receipts_root_start:receipts_root_start + receipts_root_len])
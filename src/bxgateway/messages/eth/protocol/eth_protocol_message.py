@@ -1,7 +1,11 @@
 from bxgateway.messages.eth.abstract_eth_message import AbstractEthMessage
+from bxgateway.utils.eth import snappy_compression
 
 
 class EthProtocolMessage(AbstractEthMessage):
+    # snappy compressed payload, reused when the message is sent to several nodes
+    _compressed_msg_bytes = None
+
     def __init__(self, msg_bytes, *args, **kwargs):
         super(EthProtocolMessage, self).__init__(msg_bytes, *args, **kwargs)
 
@@ -16,3 +20,16 @@ class EthProtocolMessage(AbstractEthMessage):
     def validate_payload(cls, buf, unpacked_args):
         pass
 
+    def compressed_rawbytes(self) -> bytes:
+        compressed_msg_bytes = self._compressed_msg_bytes
+        if compressed_msg_bytes is None:
+            compressed_msg_bytes = snappy_compression.compress(self.rawbytes())
+            self._compressed_msg_bytes = compressed_msg_bytes
+        return compressed_msg_bytes
+
+    def has_compressed_rawbytes(self) -> bool:
+        return self._compressed_msg_bytes is not None
+
+    def _set_raw_bytes(self, msg_bytes):
+        super(EthProtocolMessage, self)._set_raw_bytes(msg_bytes)
+        self._compressed_msg_bytes = None
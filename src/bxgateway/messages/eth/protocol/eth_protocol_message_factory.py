@@ -1,11 +1,13 @@
 import time
-from typing import Type
+from collections import deque
+from typing import Deque, Tuple, Type
 
 from bxcommon.exceptions import ParseError
 from bxcommon.messages.abstract_message import AbstractMessage
 from bxcommon.messages.abstract_message_factory import AbstractMessageFactory, MessagePreview
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxcommon.utils.blockchain_utils.eth import eth_common_constants
+from bxgateway import gateway_constants
 from bxgateway.messages.eth.protocol.block_bodies_eth_protocol_message import BlockBodiesEthProtocolMessage
 from bxgateway.messages.eth.protocol.block_headers_eth_protocol_message import BlockHeadersEthProtocolMessage
 from bxgateway.messages.eth.protocol.disconnect_eth_protocol_message import DisconnectEthProtocolMessage
@@ -14,17 +16,25 @@ from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtoco
 from bxgateway.messages.eth.protocol.get_block_bodies_eth_protocol_message import GetBlockBodiesEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_block_headers_eth_protocol_message import GetBlockHeadersEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_node_data_eth_protocol_message import GetNodeDataEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_pooled_transactions_eth_protocol_message import \
+    GetPooledTransactionsEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_receipts_eth_protocol_message import GetReceiptsEthProtocolMessage
 from bxgateway.messages.eth.protocol.hello_eth_protocol_message import HelloEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message import NewBlockHashesEthProtocolMessage
+from bxgateway.messages.eth.protocol.new_pooled_transaction_hashes_eth_protocol_message import \
+    NewPooledTransactionHashesEthProtocolMessage
 from bxgateway.messages.eth.protocol.node_data_eth_protocol_message import NodeDataEthProtocolMessage
 from bxgateway.messages.eth.protocol.ping_eth_protocol_message import PingEthProtocolMessage
 from bxgateway.messages.eth.protocol.pong_eth_protocol_message import PongEthProtocolMessage
+from bxgateway.messages.eth.protocol.pooled_transactions_eth_protocol_message import \
+    PooledTransactionsEthProtocolMessage
 from bxgateway.messages.eth.protocol.raw_eth_protocol_message import RawEthProtocolMessage
 from bxgateway.messages.eth.protocol.receipts_eth_protocol_message import ReceiptsEthProtocolMessage
 from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
+from bxgateway.messages.eth.protocol.status_v64_eth_protocol_message import StatusV64EthProtocolMessage
 from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
+from bxgateway.utils.eth import snappy_compression
 from bxgateway.utils.eth.framed_input_buffer import FramedInputBuffer
 from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
 from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
@@ -48,6 +58,9 @@ class EthProtocolMessageFactory(AbstractMessageFactory):
         EthProtocolMessageType.NODE_DATA: NodeDataEthProtocolMessage,
         EthProtocolMessageType.GET_RECEIPTS: GetReceiptsEthProtocolMessage,
         EthProtocolMessageType.RECEIPTS: ReceiptsEthProtocolMessage,
+        EthProtocolMessageType.NEW_POOLED_TRANSACTION_HASHES: NewPooledTransactionHashesEthProtocolMessage,
+        EthProtocolMessageType.GET_POOLED_TRANSACTIONS: GetPooledTransactionsEthProtocolMessage,
+        EthProtocolMessageType.POOLED_TRANSACTIONS: PooledTransactionsEthProtocolMessage,
     }
 
     def __init__(self, rlpx_cipher):
@@ -60,6 +73,14 @@ class EthProtocolMessageFactory(AbstractMessageFactory):
         self.message_type_mapping = self._MESSAGE_TYPE_MAPPING
         self._framed_input_buffer = FramedInputBuffer(rlpx_cipher)
         self._expected_msg_type = None
+        # set while handshake cryptography runs off the event loop, since frames cannot be decrypted until it completes
+        self._handshake_pending = False
+        # set once devp2p v5 is negotiated in Hello messages
+        self._snappy_enabled = False
+        # messages decoded from input buffer in one pass, waiting to be handled
+        self._decoded_messages: Deque[Tuple[int, bytearray]] = deque()
+        # decryption time of frames of messages that are not complete yet
+        self._pending_decryption_time = 0.0
 
     def get_base_message_type(self) -> Type[AbstractMessage]:
         return EthProtocolMessage
@@ -73,23 +94,43 @@ class EthProtocolMessageFactory(AbstractMessageFactory):
     def reset_expected_msg_type(self):
         self._expected_msg_type = None
 
+    def set_handshake_pending(self, handshake_pending: bool) -> None:
+        self._handshake_pending = handshake_pending
+
+    def set_snappy_enabled(self, snappy_enabled: bool) -> None:
+        self._snappy_enabled = snappy_enabled
+
+    def set_eth_version(self, eth_version: int) -> None:
+        """
+        Sets eth protocol version negotiated in Hello messages, which determines format of Status message
+        """
+        if eth_version >= gateway_constants.ETH_FORK_ID_PROTOCOL_VERSION:
+            message_type_mapping = dict(self._MESSAGE_TYPE_MAPPING)
+            message_type_mapping[EthProtocolMessageType.STATUS] = StatusV64EthProtocolMessage
+            self.message_type_mapping = message_type_mapping
+        else:
+            self.message_type_mapping = self._MESSAGE_TYPE_MAPPING
+
     def get_message_header_preview_from_input_buffer(self, input_buffer: InputBuffer) -> MessagePreview:
         """
         Peeks at a message, determining if its full.
         Returns (is_full_message, command, payload_length)
         """
+        if self._handshake_pending:
+            return MessagePreview(False, None, None)
+
         if self._expected_msg_type == EthProtocolMessageType.AUTH:
             return MessagePreview(True, EthProtocolMessageType.AUTH, input_buffer.length)
         elif self._expected_msg_type == EthProtocolMessageType.AUTH_ACK and \
                 input_buffer.length >= eth_common_constants.ENC_AUTH_ACK_MSG_LEN:
             return MessagePreview(True, EthProtocolMessageType.AUTH_ACK, eth_common_constants.ENC_AUTH_ACK_MSG_LEN)
         elif self._expected_msg_type is None:
-            decryption_start_time = time.time()
-            is_full_msg, command = self._framed_input_buffer.peek_message(input_buffer)
-            eth_gateway_stats_service.log_decrypted_message(time.time() - decryption_start_time)
+            decoded_messages = self._decoded_messages
+            if not decoded_messages:
+                self._drain_input_buffer(input_buffer)
 
-            if is_full_msg:
-                return MessagePreview(True, command, 0)
+            if decoded_messages:
+                return MessagePreview(True, decoded_messages[0][0], 0)
 
         return MessagePreview(False, None, None)
 
@@ -104,6 +145,41 @@ class EthProtocolMessageFactory(AbstractMessageFactory):
         if len(buf) != 0:
             raise ParseError("All bytes are expected to be already read by self._framed_input_buffer")
 
-        message_bytes, command = self._framed_input_buffer.get_full_message()
+        command, message_bytes = self._decoded_messages.popleft()
+
+        # decompressed when the message is handled, since messages following Hello in the same socket read are
+        # decoded before Hello negotiates compression
+        if self._snappy_enabled and command != EthProtocolMessageType.HELLO:
+            decompression_start_time = time.time()
+            compressed_size = len(message_bytes)
+            message_bytes = snappy_compression.decompress(message_bytes)
+            eth_gateway_stats_service.log_decompressed_message(
+                time.time() - decompression_start_time, compressed_size, len(message_bytes)
+            )
 
         return self.create_message(command, message_bytes)
+
+    def _drain_input_buffer(self, input_buffer: InputBuffer) -> None:
+        """
+        Decodes all complete frames of input buffer at once, so that the per message overhead of
+        small messages received in one socket read is paid once per read
+        """
+        framed_input_buffer = self._framed_input_buffer
+        frames_decoded_before = framed_input_buffer.frames_decoded
+
+        decryption_start_time = time.time()
+        messages = framed_input_buffer.drain_messages(input_buffer)
+        decryption_time = time.time() - decryption_start_time
+
+        frames_decoded = framed_input_buffer.frames_decoded - frames_decoded_before
+        if frames_decoded > 0:
+            self._pending_decryption_time += decryption_time
+            eth_gateway_stats_service.log_input_read(len(messages), frames_decoded)
+
+        if messages:
+            # decryption stats stay per message, with the time of the pass shared by the messages it completed
+            msg_decryption_time = self._pending_decryption_time / len(messages)
+            for _ in messages:
+                eth_gateway_stats_service.log_decrypted_message(msg_decryption_time)
+            self._pending_decryption_time = 0.0
+        self._decoded_messages.extend(messages)
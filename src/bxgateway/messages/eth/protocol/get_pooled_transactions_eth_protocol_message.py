@@ -0,0 +1,23 @@
+from typing import List
+
+import rlp
+
+from bxcommon.utils.blockchain_utils.eth import rlp_utils
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
+from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
+
+
+class GetPooledTransactionsEthProtocolMessage(EthProtocolMessage):
+    msg_type = EthProtocolMessageType.GET_POOLED_TRANSACTIONS
+
+    fields = [("transaction_hashes", rlp.sedes.CountableList(rlp.sedes.binary))]
+
+    def __repr__(self):
+        return f"GetPooledTransactionsEthProtocolMessage<message_len: {len(self.rawbytes())}>"
+
+    def get_transaction_hashes(self) -> List[Sha256Hash]:
+        return [
+            Sha256Hash(tx_hash) for tx_hash in
+            rlp_utils.get_first_list_field_items_bytes(memoryview(self.rawbytes()), remove_items_length_prefix=True)
+        ]
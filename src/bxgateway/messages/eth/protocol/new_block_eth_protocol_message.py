@@ -13,6 +13,7 @@ from bxcommon.messages.eth.serializers.block import Block
 from bxcommon.messages.eth.serializers.transaction import Transaction
 from bxcommon.messages.eth.serializers.block_header import BlockHeader
 from bxcommon.utils.blockchain_utils.eth import rlp_utils, eth_common_utils
+from bxgateway.utils.eth import raw_tx_utils
 
 
 class NewBlockEthProtocolMessage(EthProtocolMessage, AbstractBlockMessage):
@@ -196,3 +197,14 @@ class NewBlockEthProtocolMessage(EthProtocolMessage, AbstractBlockMessage):
         txns = self.get_block().transactions
         assert txns is not None
         return txns
+
+    def get_gas_prices(self) -> List[int]:
+        """
+        Reads gas prices of block transactions without deserializing the block
+        """
+        _, _block_msg_itm_len, block_msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
+        _, _block_itm_len, block_itm_start = rlp_utils.consume_length_prefix(self._memory_view, block_msg_itm_start)
+        _, block_hdr_itm_len, block_hdr_itm_start = rlp_utils.consume_length_prefix(
+            self._memory_view, block_itm_start
+        )
+        return raw_tx_utils.get_gas_prices(self._memory_view, block_hdr_itm_start + block_hdr_itm_len)
@@ -0,0 +1,19 @@
+from typing import List
+
+import rlp
+
+from bxcommon.messages.eth.serializers.transaction import Transaction
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
+from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
+
+
+class PooledTransactionsEthProtocolMessage(EthProtocolMessage):
+    msg_type = EthProtocolMessageType.POOLED_TRANSACTIONS
+
+    fields = [("transactions", rlp.sedes.CountableList(Transaction))]
+
+    def __repr__(self):
+        return f"PooledTransactionsEthProtocolMessage<message_len: {len(self.rawbytes())}>"
+
+    def get_transactions(self) -> List[Transaction]:
+        return self.get_field_value("transactions")
@@ -0,0 +1,18 @@
+import rlp
+
+from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
+
+
+class StatusV64EthProtocolMessage(StatusEthProtocolMessage):
+    """
+    Status message of eth/64 and later protocol versions, which adds EIP-2124 fork identifier
+    """
+
+    fields = StatusEthProtocolMessage.fields + [
+        ("fork_id", rlp.sedes.List([rlp.sedes.binary, rlp.sedes.big_endian_int]))
+    ]
+    # serializer of parent class is not reused, since fields differ
+    _serializer = None
+
+    def get_fork_id(self):
+        return self.get_field_value("fork_id")
@@ -1,10 +1,13 @@
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 import rlp
 
+from bxcommon.utils.blockchain_utils.eth import eth_common_utils
+from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
 from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
 from bxcommon.messages.eth.serializers.transaction import Transaction
+from bxgateway.utils.eth import raw_tx_utils
 
 
 class TransactionsEthProtocolMessage(EthProtocolMessage):
@@ -12,6 +15,9 @@ class TransactionsEthProtocolMessage(EthProtocolMessage):
 
     fields = [("transactions", rlp.sedes.CountableList(Transaction))]
 
+    # hashes of the transactions, set when they are already known or computed once per message
+    _tx_hashes: Optional[List[Sha256Hash]] = None
+
     def __repr__(self):
         # Calling get_transactions here causes transactions message to be deserialized in Python code and impacts
         # performance. Print only length of the message instead.
@@ -19,3 +25,37 @@ class TransactionsEthProtocolMessage(EthProtocolMessage):
 
     def get_transactions(self) -> List[Transaction]:
         return self.get_field_value("transactions")
+
+    def raw_transactions(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterates over transactions without deserializing them
+        :return: offset and length of each transaction in message bytes
+        """
+        return raw_tx_utils.iter_transactions(self.rawbytes())
+
+    def get_gas_prices(self) -> List[int]:
+        return raw_tx_utils.get_gas_prices(self.rawbytes())
+
+    def tx_hashes(self) -> List[Sha256Hash]:
+        """
+        Hashes of the transactions in message order, computed without deserializing the transactions
+        """
+        tx_hashes = self._tx_hashes
+        if tx_hashes is None:
+            msg_bytes = memoryview(self.rawbytes())
+            tx_hashes = [
+                Sha256Hash(eth_common_utils.keccak_hash(msg_bytes[tx_offset:tx_offset + tx_length]))
+                for tx_offset, tx_length in self.raw_transactions()
+            ]
+            self._tx_hashes = tx_hashes
+        return tx_hashes
+
+    def set_tx_hashes(self, tx_hashes: List[Sha256Hash]) -> None:
+        """
+        Sets already known hashes of the transactions in message order, so they are not computed again
+        """
+        self._tx_hashes = tx_hashes
+
+    def _set_raw_bytes(self, msg_bytes):
+        super(TransactionsEthProtocolMessage, self)._set_raw_bytes(msg_bytes)
+        self._tx_hashes = None
@@ -104,6 +104,7 @@ class BlockOntMessage(OntMessage, AbstractBlockMessage):
         self._hash_val = self._bookkeepers_length = self._sig_data_length = None
         self._txn_count = self._tx_offset = self._txn_header = None
         self._merkle_root_memoryview = None
+        self._tx_hashes: Optional[List[OntObjectHash]] = None
         self._timestamp = 0
         self._parsed = False
 
@@ -206,8 +207,11 @@ class BlockOntMessage(OntMessage, AbstractBlockMessage):
             assert self._tx_offset is not None
             start = self._tx_offset
             self._txns = []
+            self._tx_hashes = []
             for _ in range(self.txn_count()):
-                _, off = get_txid(self._memoryview[start:])
+                tx_hash, off = get_txid(self._memoryview[start:])
+                # pyre-fixme[16]: Optional type has no attribute `append`.
+                self._tx_hashes.append(tx_hash)
                 sig_length, size = ont_varint_to_int(self._memoryview[start:], off)
                 off += size
                 for _ in range(sig_length):
@@ -224,6 +228,16 @@ class BlockOntMessage(OntMessage, AbstractBlockMessage):
         assert isinstance(txns, list)
         return txns
 
+    def tx_hashes(self) -> List[OntObjectHash]:
+        """
+        :return: hashes of block transactions, computed while parsing transactions
+        """
+        if self._tx_hashes is None:
+            self.txns()
+        tx_hashes = self._tx_hashes
+        assert isinstance(tx_hashes, list)
+        return tx_hashes
+
     def block_header_offset(self) -> int:
         if not self._parsed:
             self.parse_message()
@@ -56,7 +56,8 @@ class OntConsensusMessage(OntMessage, AbstractBlockMessage):
         self._version = self._consensus_payload = self._consensus_payload_header = self._owner_and_signature = None
         self._consensus_data = self._consensus_data_type = self._consensus_data_len = None
         self._consensus_data_full_len = self._consensus_data_str = self._consensus_data_json = None
-        self._block_start_txns = self._block_start_len_memoryview = self._empty_block_offset = None
+        self._block_start_txns = self._block_start_tx_hashes = None
+        self._block_start_len_memoryview = self._empty_block_offset = None
         self._prev_block = self._decoded_payload = self._payload_tail = self._message_tail = None
         self._tx_offset = self._txn_header = self._txn_count = self._hash_val = self._header_offset = None
         self._parsed = False
@@ -126,11 +127,13 @@ class OntConsensusMessage(OntMessage, AbstractBlockMessage):
         self._tx_offset = off
         self._txn_header = buf[:off]
         txns = []
+        tx_hashes = []
         start = self._tx_offset
         txn_count = self._txn_count
         assert isinstance(txn_count, int)
         for _ in range(txn_count):
-            _, off = get_txid(buf[start:])
+            tx_hash, off = get_txid(buf[start:])
+            tx_hashes.append(tx_hash)
             sig_length, size = ont_varint_to_int(buf[start:], off)
             off += size
             for i in range(sig_length):
@@ -141,6 +144,7 @@ class OntConsensusMessage(OntMessage, AbstractBlockMessage):
             txns.append(buf[start:start + off])
             start += off
 
+        self._block_start_tx_hashes = tx_hashes
         return txns
 
     def block_start_len_memoryview(self) -> memoryview:
@@ -192,6 +196,16 @@ class OntConsensusMessage(OntMessage, AbstractBlockMessage):
         assert isinstance(block_start_txns, list)
         return block_start_txns
 
+    def tx_hashes(self) -> List[OntObjectHash]:
+        """
+        :return: hashes of block transactions, computed while parsing transactions
+        """
+        if not self._parsed:
+            self.parse_message()
+        block_start_tx_hashes = self._block_start_tx_hashes
+        assert isinstance(block_start_tx_hashes, list)
+        return block_start_tx_hashes
+
     def payload_tail(self) -> memoryview:
         if self._payload_tail is None:
             self.parse_message()
@@ -1,4 +1,5 @@
 import base64
+import itertools
 import json
 import struct
 import time
@@ -109,21 +110,41 @@ def parse_bx_block_transactions_and_msg_tail(block_hash: Sha256Hash, bx_block: m
 
 
 def build_ont_block(block_pieces: Deque[Union[bytearray, memoryview]]) -> OntConsensusMessage:
-    ont_block = bytearray()
-    ont_block += block_pieces[0]
-    # Construct base 64 encoded data and then add it to ont_block
+    """
+    Assembles a consensus message from block pieces.
+
+    Consensus data pieces are joined with a single copy and the base64 encoded consensus data is written
+    directly into the message buffer instead of being copied through the JSON string of the consensus payload.
+    """
+    consensus_payload_header = block_pieces[0]
+    owner_and_signature = block_pieces[len(block_pieces) - 1]
     consensus_data_type, = struct.unpack_from("<B", block_pieces[1], 0)
     consensus_data_len, = struct.unpack_from("<L", block_pieces[2], 0)
-    consensus_data_payload = bytearray(block_pieces[3])
-    for i in range(4, len(block_pieces) - 1):
-        consensus_data_payload += block_pieces[i]
-    consensus_data = ConsensusMsgPayload(consensus_data_type, consensus_data_len,
-                                         base64.b64encode(
-                                             bytes(consensus_data_payload)
-                                         ).decode(constants.DEFAULT_TEXT_ENCODING))
-    consensus_msg_payload = json.dumps(consensus_data, cls=EnhancedJSONEncoder, separators=(",", ":"))
-    ont_block += bytearray(consensus_msg_payload.encode(constants.DEFAULT_TEXT_ENCODING))
-    ont_block += block_pieces[len(block_pieces) - 1]
+    consensus_data_payload = b"".join(itertools.islice(block_pieces, 3, len(block_pieces) - 1))
+    encoded_consensus_data = base64.b64encode(consensus_data_payload)
+
+    # base64 encoded data does not need escaping in JSON, so it is placed between the JSON serialized fields
+    # of a consensus payload with empty data
+    consensus_msg_payload = json.dumps(
+        ConsensusMsgPayload(consensus_data_type, consensus_data_len, ""), cls=EnhancedJSONEncoder, separators=(",", ":")
+    ).encode(constants.DEFAULT_TEXT_ENCODING)
+    encoded_consensus_data_offset = consensus_msg_payload.rindex(b'""') + 1
+
+    ont_block = bytearray(
+        len(consensus_payload_header) + len(consensus_msg_payload) + len(encoded_consensus_data)
+        + len(owner_and_signature)
+    )
+    off = 0
+    for piece in (
+        consensus_payload_header,
+        memoryview(consensus_msg_payload)[:encoded_consensus_data_offset],
+        encoded_consensus_data,
+        memoryview(consensus_msg_payload)[encoded_consensus_data_offset:],
+        owner_and_signature
+    ):
+        next_off = off + len(piece)
+        ont_block[off:next_off] = piece
+        off = next_off
     return OntConsensusMessage(buf=ont_block)
 
 
@@ -175,8 +196,7 @@ class OntNormalConsensusMessageConverter(AbstractOntMessageConverter):
         buf.append(txn_header)
         max_timestamp_for_compression = time.time() - min_tx_age_seconds
 
-        for tx in consensus_msg.txns():
-            tx_hash, _ = ont_messages_util.get_txid(tx)
+        for tx, tx_hash in zip(consensus_msg.txns(), consensus_msg.tx_hashes()):
             short_id = tx_service.get_short_id(tx_hash)
             short_id_assign_time = 0
 
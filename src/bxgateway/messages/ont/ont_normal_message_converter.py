@@ -12,7 +12,7 @@ from bxcommon.utils import convert, crypto
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import log_messages
 from bxgateway import ont_constants
-from bxgateway.abstract_message_converter import BlockDecompressionResult
+from bxgateway.abstract_message_converter import BlockDecompressionResult, finalize_block_bytes
 from bxgateway.messages.ont import ont_messages_util
 from bxgateway.messages.ont.abstract_ont_message_converter import AbstractOntMessageConverter, get_block_info
 from bxgateway.messages.ont.block_ont_message import BlockOntMessage
@@ -115,8 +115,7 @@ class OntNormalMessageConverter(AbstractOntMessageConverter):
         max_timestamp_for_compression = time.time() - min_tx_age_seconds
         ignored_sids = []
 
-        for tx in block_msg.txns():
-            tx_hash, _ = ont_messages_util.get_txid(tx)
+        for tx, tx_hash in zip(block_msg.txns(), block_msg.tx_hashes()):
             short_id = tx_service.get_short_id(tx_hash)
             short_id_assign_time = 0
 
@@ -127,7 +126,7 @@ class OntNormalMessageConverter(AbstractOntMessageConverter):
                     not enable_block_compression or \
                     short_id_assign_time > max_timestamp_for_compression:
                 if short_id != constants.NULL_TX_SIDS:
-                    ignored_sids.append(ignored_sids)
+                    ignored_sids.append(short_id)
                 buf.append(tx)
                 size += len(tx)
             else:
@@ -135,10 +134,6 @@ class OntNormalMessageConverter(AbstractOntMessageConverter):
                 buf.append(ont_constants.ONT_SHORT_ID_INDICATOR_AS_BYTEARRAY)
                 size += 1
 
-        serialized_short_ids = compact_block_short_ids_serializer.serialize_short_ids_into_bytes(short_ids)
-        buf.append(serialized_short_ids)
-        size += constants.UL_ULL_SIZE_IN_BYTES
-
         merkle_root = block_msg.merkle_root()
         buf.appendleft(merkle_root)
         size += ont_constants.ONT_HASH_LEN
@@ -147,16 +142,8 @@ class OntNormalMessageConverter(AbstractOntMessageConverter):
         buf.appendleft(is_consensus_msg_buf)
         size += 1
 
-        offset_buf = struct.pack("<Q", size)
-        buf.appendleft(offset_buf)
-        size += len(serialized_short_ids)
-
-        block = bytearray(size)
-        off = 0
-        for blob in buf:
-            next_off = off + len(blob)
-            block[off:next_off] = blob
-            off = next_off
+        block = finalize_block_bytes(buf, size, short_ids)
+        size = len(block)
 
         prev_block_hash = convert.bytes_to_hex(block_msg.prev_block_hash().binary)
         bx_block_hash = convert.bytes_to_hex(crypto.double_sha256(block))
@@ -176,7 +163,7 @@ class OntNormalMessageConverter(AbstractOntMessageConverter):
             ignored_sids
         )
 
-        return memoryview(block), block_info
+        return block, block_info
 
     def bx_block_to_block(self, bx_block_msg: memoryview, tx_service: TransactionService) -> BlockDecompressionResult:
         """
@@ -28,9 +28,11 @@ class GatewayMemoryRpcRequest(AbstractRpcRequest["AbstractGatewayNode"]):
     async def process_request(self) -> JsonRpcResponse:
         tx_service = self.node.get_tx_service()
         cache_state = tx_service.get_cache_state_json()
-        return self.ok({
+        memory_stats = {
             TOTAL_MEM_USAGE: stats_format.byte_count(memory_utils.get_app_memory_usage()),
             TOTAL_CACHED_TX: cache_state["tx_hash_to_contents_len"],
             TOTAL_CACHED_TX_SIZE: stats_format.byte_count(cache_state["total_tx_contents_size"])
-        })
+        }
+        memory_stats.update(self.node.get_memory_stats())
+        return self.ok(memory_stats)
 
@@ -1,12 +1,14 @@
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Set, List, Optional, TYPE_CHECKING
+from typing import Set, List, Optional, Iterable, TYPE_CHECKING
 
 from bxcommon.messages.bloxroute.abstract_cleanup_message import AbstractCleanupMessage
 from bxcommon.messages.bloxroute.bloxroute_message_type import BloxrouteMessageType
-from bxcommon.services.transaction_service import TransactionService
 from bxcommon.utils.blockchain_utils.btc.btc_object_hash import Sha256Hash
 from bxcommon.utils.memory_utils import SpecialMemoryProperties, SpecialTuple
 from bxcommon import constants
+from bxgateway.services.block_cleanup_executor import BlockCleanupExecutor, BlockCleanupTask
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 
 from bxutils import logging
 from bxutils.logging.log_record_type import LogRecordType
@@ -34,6 +36,7 @@ class AbstractBlockCleanupService(SpecialMemoryProperties, metaclass=ABCMeta):
 
         self._block_hash_marked_for_cleanup: Set[Sha256Hash] = set()
         self.last_confirmed_block: Optional[Sha256Hash] = None
+        self.cleanup_executor = BlockCleanupExecutor(node)
 
     def is_marked_for_cleanup(self, block_hash: Sha256Hash) -> bool:
         return block_hash in self._block_hash_marked_for_cleanup
@@ -86,6 +89,14 @@ class AbstractBlockCleanupService(SpecialMemoryProperties, metaclass=ABCMeta):
                             logger.debug("Tracked block does not exist: {}", tracked_block)
                             tx_service.on_block_cleaned_up(tracked_block)
 
+    def on_block_compressed(self, block_msg) -> None:
+        """
+        Called after a block from the blockchain node was compressed, so that its cleanup can reuse
+        work done during compression.
+        :param block_msg: compressed block message
+        """
+        pass
+
     def on_new_block_received(self, block_hash: Sha256Hash, prev_block_hash: Sha256Hash) -> None:
         """
         checks if there are no confirmed blocks for cleanup.
@@ -106,10 +117,72 @@ class AbstractBlockCleanupService(SpecialMemoryProperties, metaclass=ABCMeta):
     def clean_block_transactions(
             self,
             block_msg,
-            transaction_service: TransactionService
+            transaction_service: GatewayTransactionService
     ) -> None:
         pass
 
+    def _clean_block_transactions_by_hashes(
+        self,
+        block_hash: Sha256Hash,
+        tx_hashes: Iterable[Sha256Hash],
+        transaction_service: GatewayTransactionService
+    ) -> None:
+        """
+        Removes block transactions from transaction service, in slices if block cleanup is time-sliced.
+        `tx_hashes` is consumed lazily, so hashes are computed within cleanup slices.
+        """
+        self.cleanup_executor.submit(
+            BlockCleanupTask(block_hash, tx_hashes, transaction_service, self._on_block_transactions_cleaned_up)
+        )
+
+    def _on_block_transactions_cleaned_up(self, task: BlockCleanupTask) -> None:
+        block_hash = task.block_hash
+        transaction_service = task.transaction_service
+        transaction_service.on_block_cleaned_up(block_hash)
+        tx_hash_to_contents_len_after_cleanup = transaction_service.get_tx_hash_to_contents_len()
+        short_id_count_after_cleanup = transaction_service.get_short_id_count()
+
+        logger.debug(
+            "Finished cleaning up block {}. Processed {} hashes, {} of which were unknown, and cleaned up {} "
+            "short ids. Took {:.3f}s in {} chunks over {:.3f}s.",
+            block_hash, task.transactions_processed, len(task.unknown_tx_hashes), len(task.short_ids),
+            task.processing_duration_s, task.chunks, time.time() - task.start_time
+        )
+
+        transaction_service.log_block_transaction_cleanup_stats(block_hash, task.transactions_processed,
+                                                                task.tx_hash_to_contents_len_before_cleanup,
+                                                                tx_hash_to_contents_len_after_cleanup,
+                                                                task.short_id_count_before_cleanup,
+                                                                short_id_count_after_cleanup)
+
+        self._block_hash_marked_for_cleanup.discard(block_hash)
+        self.node.post_block_cleanup_tasks(
+            block_hash=block_hash,
+            short_ids=task.short_ids,
+            unknown_tx_hashes=task.unknown_tx_hashes
+        )
+
+    def _remove_confirmed_block_contents(
+        self,
+        transaction_service: GatewayTransactionService,
+        block_confirmation_message: AbstractCleanupMessage
+    ) -> None:
+        """
+        Removes transactions of a block confirmed by the BDN with a single transaction service call.
+        """
+        start_time = time.time()
+        block_hash = block_confirmation_message.message_hash()
+        result = transaction_service.remove_block_transactions(
+            block_confirmation_message.transaction_hashes(), block_confirmation_message.short_ids()
+        )
+        transaction_service.on_block_cleaned_up(block_hash)
+        logger.debug(
+            "Finished cleaning up confirmed block {}. Processed {} hashes and {} short ids, removed {} short ids. "
+            "Took {:.3f}s.",
+            block_hash, result.tx_hashes_count, result.short_ids_count, len(result.short_ids),
+            time.time() - start_time
+        )
+
     def block_cleanup_request(self, block_hash: Sha256Hash) -> None:
         if not self.is_marked_for_cleanup(block_hash):
             self._block_hash_marked_for_cleanup.add(block_hash)
@@ -133,7 +206,7 @@ class AbstractBlockCleanupService(SpecialMemoryProperties, metaclass=ABCMeta):
 
     @abstractmethod
     def contents_cleanup(self,
-                         transaction_service: TransactionService,
+                         transaction_service: GatewayTransactionService,
                          block_confirmation_message: AbstractCleanupMessage
                          ):
         pass
@@ -26,6 +26,7 @@ from bxutils import logging
 
 if TYPE_CHECKING:
     from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+    from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 
 logger = logging.get_logger(__name__)
 
@@ -119,16 +120,25 @@ class AbstractBlockQueuingService(
         """
         return block_hash in self._blocks
 
+    def get_block_message(self, block_hash: Sha256Hash) -> Optional[TBlockMessage]:
+        """
+        Returns stored block message, or None if the block is unknown or waiting for recovery
+        :param block_hash: block hash
+        """
+        return self._blocks.contents.get(block_hash)
+
     def mark_block_seen_by_blockchain_node(
         self,
         block_hash: Sha256Hash,
         block_message: Optional[TBlockMessage],
         block_number: Optional[int] = None,
+        connection: Optional["AbstractGatewayBlockchainConnection"] = None,
     ):
         """
         Marks a block as seen by the blockchain node.
 
         Currently, block_number is only used for Ethereum.
+        connection is the blockchain node connection that sent or announced the block, if known.
         """
         if block_message is not None:
             self.store_block_data(block_hash, block_message)
@@ -200,8 +210,7 @@ class AbstractBlockQueuingService(
         logger.info("Forwarding block {} to blockchain node.", block_hash)
 
         assert block_msg is not None
-        # TODO add queueing service per node (https://bloxroute.atlassian.net/browse/BX-1922)
-        self.node.broadcast(block_msg, connection_types=[ConnectionType.BLOCKCHAIN_NODE])
+        self._broadcast_block_to_nodes(block_hash, block_msg)
         (
             handling_time,
             relay_desc,
@@ -222,6 +231,9 @@ class AbstractBlockQueuingService(
                 ),
             )
 
+    def _broadcast_block_to_nodes(self, _block_hash: Sha256Hash, block_msg: TBlockMessage) -> None:
+        self.node.broadcast(block_msg, connection_types=[ConnectionType.BLOCKCHAIN_NODE])
+
     def try_send_header_to_node(self, block_hash: Sha256Hash) -> bool:
         if block_hash not in self._blocks:
             return False
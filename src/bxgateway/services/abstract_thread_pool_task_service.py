@@ -0,0 +1,73 @@
+import asyncio
+import time
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+from bxgateway import log_messages
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+TTaskResult = TypeVar("TTaskResult")
+
+
+class AbstractThreadPoolTaskService(Generic[TTaskResult], metaclass=ABCMeta):
+    """
+    Base class for services that run CPU heavy tasks on a thread pool, so that they do not stall the event loop.
+    The pool is created on the first submitted task. Callbacks are always executed on the event loop thread.
+
+    If the pool size is 0, tasks are executed inline and callbacks are called immediately.
+    """
+
+    def __init__(self, thread_count: int, thread_name_prefix: str) -> None:
+        self._thread_count = thread_count
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def is_enabled(self) -> bool:
+        return self._thread_count > 0
+
+    def close(self) -> None:
+        executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._executor = None
+
+    @abstractmethod
+    def _run_task(self, fn: Callable, args: Tuple, queue_duration_s: float) -> TTaskResult:
+        """
+        Runs the task on a pool thread, or inline if the pool is disabled, and wraps its result
+        """
+        pass
+
+    def _submit(self, callback: Callable[[TTaskResult], None], fn: Callable, *args) -> None:
+        submit_time = time.time()
+
+        def run_task() -> TTaskResult:
+            return self._run_task(fn, args, time.time() - submit_time)
+
+        if not self.is_enabled():
+            callback(run_task())
+            return
+
+        executor = self._executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=self._thread_count, thread_name_prefix=self._thread_name_prefix)
+            self._executor = executor
+
+        loop = asyncio.get_event_loop()
+        future = executor.submit(run_task)
+        future.add_done_callback(
+            lambda completed_future: loop.call_soon_threadsafe(self._on_task_completed, completed_future, callback)
+        )
+
+    def _on_task_completed(self, future: Future, callback: Callable[[TTaskResult], None]) -> None:
+        if future.cancelled():
+            return
+        try:
+            task_result = future.result()
+        except Exception as e:
+            logger.error(log_messages.THREAD_POOL_TASK_FAILED, self._thread_name_prefix, e, exc_info=True)
+            return
+        callback(task_result)
@@ -0,0 +1,163 @@
+import itertools
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Set, TYPE_CHECKING
+
+from prometheus_client import Counter, Gauge
+
+from bxcommon import constants
+from bxcommon.utils.alarm_queue import AlarmId
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
+from bxutils import logging
+from bxutils.logging.log_record_type import LogRecordType
+
+if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+
+logger = logging.get_logger(LogRecordType.BlockCleanup, __name__)
+
+block_cleanup_transactions_processed = Counter(
+    "block_cleanup_transactions_processed", "Number of block transactions removed by block cleanup"
+)
+block_cleanup_blocks_completed = Counter("block_cleanup_blocks_completed", "Number of blocks cleaned up")
+block_cleanup_slices = Counter("block_cleanup_slices", "Number of event loop iterations spent on block cleanup")
+block_cleanup_pending_blocks = Gauge("block_cleanup_pending_blocks", "Number of blocks waiting for cleanup")
+
+
+class BlockCleanupTask:
+    """
+    Removal of a confirmed block's transactions from transaction service, which can be processed in chunks.
+    """
+
+    block_hash: Sha256Hash
+    transaction_service: GatewayTransactionService
+    short_ids: List[int]
+    unknown_tx_hashes: List[Sha256Hash]
+    transactions_processed: int
+    tx_hash_to_contents_len_before_cleanup: int
+    short_id_count_before_cleanup: int
+    start_time: float
+    processing_duration_s: float
+    chunks: int
+
+    def __init__(
+        self,
+        block_hash: Sha256Hash,
+        tx_hashes: Iterable[Sha256Hash],
+        transaction_service: GatewayTransactionService,
+        on_completed: Callable[["BlockCleanupTask"], None]
+    ) -> None:
+        self.block_hash = block_hash
+        self.transaction_service = transaction_service
+        self._tx_hashes: Iterator[Sha256Hash] = iter(tx_hashes)
+        self._on_completed = on_completed
+
+        self.short_ids = []
+        self.unknown_tx_hashes = []
+        self.transactions_processed = 0
+        self.tx_hash_to_contents_len_before_cleanup = transaction_service.get_tx_hash_to_contents_len()
+        self.short_id_count_before_cleanup = transaction_service.get_short_id_count()
+        self.start_time = time.time()
+        self.processing_duration_s = 0
+        self.chunks = 0
+
+    def process(self, max_transactions: Optional[int] = None) -> bool:
+        """
+        Removes up to `max_transactions` of the block's transactions from transaction service.
+        :return: if all transactions of the block were processed
+        """
+        start_time = time.time()
+        result = self.transaction_service.remove_block_transactions(
+            itertools.islice(self._tx_hashes, max_transactions)
+        )
+        processed = result.tx_hashes_count
+        self.short_ids.extend(result.short_ids)
+        self.unknown_tx_hashes.extend(result.unknown_tx_hashes)
+
+        self.transactions_processed += processed
+        self.processing_duration_s += time.time() - start_time
+        self.chunks += 1
+        block_cleanup_transactions_processed.inc(processed)
+        return max_transactions is None or processed < max_transactions
+
+    def complete(self) -> None:
+        self._on_completed(self)
+
+
+class BlockCleanupExecutor:
+    """
+    Runs block cleanup tasks in time-sliced chunks on the node's alarm queue.
+
+    Each slice removes transactions in chunks of `BLOCK_CLEANUP_CHUNK_SIZE` until the configured time budget
+    is used up, then yields to the event loop so that relay traffic is handled before the next slice.
+    A time budget of 0 cleans up each block synchronously when it is submitted.
+    """
+
+    node: "AbstractGatewayNode"
+
+    def __init__(self, node: "AbstractGatewayNode") -> None:
+        self.node = node
+        self._tasks: Deque[BlockCleanupTask] = deque()
+        self._queued_block_hashes: Set[Sha256Hash] = set()
+        self._alarm_id: Optional[AlarmId] = None
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def is_queued(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._queued_block_hashes
+
+    def submit(self, task: BlockCleanupTask) -> None:
+        block_hash = task.block_hash
+        if block_hash in self._queued_block_hashes:
+            logger.trace("Cleanup of block {} is already in progress. Skipping.", block_hash)
+            return
+
+        if self._get_time_budget_s() <= 0:
+            task.process()
+            self._complete(task)
+            return
+
+        self._tasks.append(task)
+        self._queued_block_hashes.add(block_hash)
+        block_cleanup_pending_blocks.set(len(self._tasks))
+        if self._alarm_id is None:
+            self._alarm_id = self.node.alarm_queue.register_alarm(
+                gateway_constants.BLOCK_CLEANUP_SLICE_INTERVAL_S, self._process_tasks
+            )
+
+    def _process_tasks(self) -> float:
+        start_time = time.time()
+        deadline = start_time + self._get_time_budget_s()
+        tasks = self._tasks
+        while tasks:
+            task = tasks[0]
+            if task.process(gateway_constants.BLOCK_CLEANUP_CHUNK_SIZE):
+                tasks.popleft()
+                self._queued_block_hashes.discard(task.block_hash)
+                self._complete(task)
+            if time.time() >= deadline:
+                break
+
+        block_cleanup_slices.inc()
+        block_cleanup_pending_blocks.set(len(tasks))
+        logger.trace(
+            "Block cleanup slice took {:.3f}s. {} blocks pending cleanup.", time.time() - start_time, len(tasks)
+        )
+
+        if tasks:
+            return gateway_constants.BLOCK_CLEANUP_SLICE_INTERVAL_S
+
+        self._alarm_id = None
+        return constants.CANCEL_ALARMS
+
+    def _complete(self, task: BlockCleanupTask) -> None:
+        block_cleanup_blocks_completed.inc()
+        task.complete()
+
+    def _get_time_budget_s(self) -> float:
+        return self.node.opts.block_cleanup_time_budget_ms / 1000
@@ -0,0 +1,104 @@
+import time
+import zlib
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Union
+
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.services.abstract_thread_pool_task_service import AbstractThreadPoolTaskService
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+
+class BlockCryptoTaskResult(NamedTuple):
+    result: Any
+    queue_duration_s: float
+    crypto_duration_s: float
+
+
+class EncryptedBlock(NamedTuple):
+    key: bytes
+    ciphertext: bytes
+    cipher_hash: Sha256Hash
+
+
+class DecryptedBlock(NamedTuple):
+    block: Optional[memoryview]
+    hash_matches: bool
+
+
+def encrypt_block(payload: Union[bytearray, memoryview]) -> EncryptedBlock:
+    key, ciphertext = crypto.symmetric_encrypt(bytes(payload))
+    return EncryptedBlock(key, ciphertext, Sha256Hash(crypto.double_sha256(ciphertext)))
+
+
+def verify_and_decrypt_block(
+    expected_hash: Optional[Sha256Hash],
+    cipherblob: Union[bytearray, memoryview],
+    key: Optional[bytes]
+) -> DecryptedBlock:
+    """
+    Verifies that the cipherblob matches the expected hash, and decrypts it if the key is provided.
+    :param expected_hash: expected hash of cipherblob, or None to skip verification
+    :param cipherblob: encrypted block
+    :param key: encryption key, or None to only verify the hash
+    :return: decrypted block (None if key was not provided or decryption failed) and hash verification result
+    """
+    if expected_hash is not None and Sha256Hash(crypto.double_sha256(cipherblob)) != expected_hash:
+        return DecryptedBlock(None, False)
+
+    if key is None:
+        return DecryptedBlock(None, True)
+
+    try:
+        block = memoryview(crypto.symmetric_decrypt(key, bytes(cipherblob)))
+    except Exception as e:
+        logger.debug("Failed to decrypt block: {}", e)
+        block = None
+    return DecryptedBlock(block, True)
+
+
+def compress_block(payload: Union[bytearray, memoryview], level: int) -> bytes:
+    return zlib.compress(payload, level)
+
+
+class BlockCryptoService(AbstractThreadPoolTaskService[BlockCryptoTaskResult]):
+    """
+    Runs block encryption, decryption, hash verification and compression on a thread pool, so that multi-MB blocks do
+    not stall the event loop. libsodium (through cffi), hashlib and zlib release the GIL while processing large
+    buffers, so these run in parallel with message handling. Callbacks are always executed on the event loop thread.
+
+    If the pool size is 0, tasks are executed inline and callbacks are called immediately.
+    """
+
+    def __init__(self, thread_count: int):
+        super(BlockCryptoService, self).__init__(thread_count, "block_crypto")
+
+    def encrypt(
+        self,
+        payload: Union[bytearray, memoryview],
+        callback: Callable[[BlockCryptoTaskResult], None]
+    ) -> None:
+        self._submit(callback, encrypt_block, payload)
+
+    def verify_and_decrypt(
+        self,
+        expected_hash: Optional[Sha256Hash],
+        cipherblob: Union[bytearray, memoryview],
+        key: Optional[bytes],
+        callback: Callable[[BlockCryptoTaskResult], None]
+    ) -> None:
+        self._submit(callback, verify_and_decrypt_block, expected_hash, cipherblob, key)
+
+    def compress(
+        self,
+        payload: Union[bytearray, memoryview],
+        level: int,
+        callback: Callable[[BlockCryptoTaskResult], None]
+    ) -> None:
+        self._submit(callback, compress_block, payload, level)
+
+    def _run_task(self, fn: Callable, args: Tuple, queue_duration_s: float) -> BlockCryptoTaskResult:
+        start_time = time.time()
+        result = fn(*args)
+        return BlockCryptoTaskResult(result, queue_duration_s, time.time() - start_time)
@@ -1,6 +1,7 @@
 import datetime
 import time
-from typing import Iterable, Optional, TYPE_CHECKING, Union
+from collections import deque
+from typing import Iterable, Optional, TYPE_CHECKING, Union, Dict, List, Deque
 
 from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
@@ -9,6 +10,7 @@ from bxcommon.messages.bloxroute.get_txs_message import GetTxsMessage
 from bxcommon.messages.eth.validation.abstract_block_validator import AbstractBlockValidator, \
     BlockValidationResult
 from bxcommon.utils import convert, crypto, block_content_debug_utils
+from bxcommon.utils.alarm_queue import AlarmId
 from bxcommon.utils.expiring_dict import ExpiringDict
 from bxcommon.utils.object_hash import Sha256Hash
 from bxcommon.utils.stats import stats_format
@@ -23,6 +25,7 @@ from bxgateway.connections.abstract_gateway_blockchain_connection import Abstrac
 from bxgateway.connections.abstract_relay_connection import AbstractRelayConnection
 from bxgateway.feed.feed_source import FeedSource
 from bxgateway.messages.gateway.block_received_message import BlockReceivedMessage
+from bxgateway.services.block_crypto_service import BlockCryptoTaskResult
 from bxgateway.services.block_recovery_service import BlockRecoveryInfo, RecoveredTxsSource
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
 from bxgateway.utils.stats.gateway_bdn_performance_stats_service import gateway_bdn_performance_stats_service
@@ -46,6 +49,7 @@ class BlockHold:
     block_message: message being delayed due to an existing hold
     alarm: reference to alarm object for hold timeout
     connection: connection from which the message is being delayed for
+    block_held_time: time the block message started being delayed
     """
 
     def __init__(self, hold_message_time, holding_connection):
@@ -55,6 +59,7 @@ class BlockHold:
         self.block_message = None
         self.alarm = None
         self.connection = None
+        self.block_held_time = None
 
 
 class BlockProcessingService:
@@ -62,6 +67,7 @@ class BlockProcessingService:
     Service class that process blocks.
     Blocks received from blockchain node are held if gateway receives a `blockhold` message from another gateway to
     prevent duplicate message sending.
+    Hold timeouts are derived from how long held blocks took to arrive from the BDN, tracked per holding peer.
     """
 
     def __init__(self, node):
@@ -72,10 +78,25 @@ class BlockProcessingService:
             f"block_processing_holds"
         )
 
+        # holding peer description => recent durations between holding a block and receiving it from the BDN
+        self._hold_durations_by_peer: Dict[str, Deque[float]] = {}
+
         self._block_validator: Optional[AbstractBlockValidator] = None
         self._last_confirmed_block_number: Optional[int] = None
         self._last_confirmed_block_difficulty: Optional[int] = None
 
+        # block hash => time the next recovery attempt is due
+        self._recovery_retry_due_times: Dict[Sha256Hash, float] = {}
+        self._recovery_retry_alarm: Optional[AlarmId] = None
+        self._recovery_retry_alarm_fire_time: Optional[float] = None
+
+        # encrypted block hash => cipherblob stored while waiting for the key, decrypted off the event loop
+        self._encrypted_blocks_awaiting_key: ExpiringDict[Sha256Hash, Union[bytearray, memoryview]] = ExpiringDict(
+            node.alarm_queue,
+            gateway_constants.ENCRYPTED_BLOCKS_AWAITING_KEY_EXPIRATION_TIME_S,
+            "block_processing_encrypted_blocks_awaiting_key"
+        )
+
     def place_hold(self, block_hash, connection) -> None:
         """
         Places hold on block hash and propagates message.
@@ -141,10 +162,11 @@ class BlockProcessingService:
             )
             if hold.alarm is None:
                 hold.alarm = self._node.alarm_queue.register_alarm(
-                    self._node.opts.blockchain_block_hold_timeout_s, self._holding_timeout, block_hash, hold
+                    self._compute_hold_timeout(block_message), self._holding_timeout, block_hash, hold
                 )
                 hold.block_message = block_message
                 hold.connection = connection
+                hold.block_held_time = time.time()
         else:
             if self._node.opts.encrypt_blocks:
                 # Broadcast holding message if gateway wants to encrypt blocks
@@ -170,12 +192,19 @@ class BlockProcessingService:
         :param connection: connection cancelling hold
         """
         if block_hash in self._holds.contents:
+            hold = self._holds.contents[block_hash]
+            if hold.block_held_time is not None:
+                hold_duration = time.time() - hold.block_held_time
+                self._record_hold_duration(hold.holding_connection, hold_duration)
+                more_info = "held for {}".format(stats_format.duration(hold_duration * 1000))
+            else:
+                more_info = None
             block_stats.add_block_event_by_block_hash(block_hash, BlockStatEventType.BLOCK_HOLD_LIFTED,
                                                       network_num=connection.network_num,
                                                       peers=[connection],
+                                                      more_info=more_info
                                                       )
 
-            hold = self._holds.contents[block_hash]
             if hold.alarm is not None:
                 self._node.alarm_queue.unregister_alarm(hold.alarm)
             del self._holds.contents[block_hash]
@@ -208,6 +237,22 @@ class BlockProcessingService:
             return
 
         cipherblob = msg.blob()
+        block_crypto_service = self._node.block_crypto_service
+        if block_crypto_service.is_enabled():
+            key = None
+            if self._node.in_progress_blocks.has_encryption_key_for_hash(block_hash):
+                key = self._node.in_progress_blocks.get_encryption_key(bytes(block_hash.binary))
+            decrypt_start_datetime = datetime.datetime.utcnow()
+            block_crypto_service.verify_and_decrypt(
+                block_hash,
+                cipherblob,
+                key,
+                lambda task_result: self._on_block_broadcast_verified(
+                    task_result, msg, cipherblob, key is not None, connection, decrypt_start_datetime
+                )
+            )
+            return
+
         expected_hash = Sha256Hash(crypto.double_sha256(cipherblob))
         if block_hash != expected_hash:
             connection.log_warning(log_messages.BLOCK_WITH_INCONSISTENT_HASHES,
@@ -240,15 +285,7 @@ class BlockProcessingService:
                                             network_num=connection.network_num)
         else:
             connection.log_trace("Received encrypted block. Storing.")
-            self._node.in_progress_blocks.add_ciphertext(block_hash, cipherblob)
-            block_received_message = BlockReceivedMessage(block_hash)
-            conns = self._node.broadcast(block_received_message, connection, connection_types=[ConnectionType.GATEWAY])
-            block_stats.add_block_event_by_block_hash(
-                block_hash,
-                BlockStatEventType.ENC_BLOCK_SENT_BLOCK_RECEIPT,
-                network_num=connection.network_num,
-                peers=conns,
-            )
+            self._store_encrypted_block(block_hash, cipherblob, connection)
 
     def process_block_key(self, msg, connection: AbstractRelayConnection) -> None:
         """
@@ -269,7 +306,20 @@ class BlockProcessingService:
         if self._node.in_progress_blocks.has_encryption_key_for_hash(block_hash):
             return
 
-        if self._node.in_progress_blocks.has_ciphertext_for_hash(block_hash):
+        cipherblob = self._encrypted_blocks_awaiting_key.contents.pop(block_hash, None)
+        if cipherblob is not None and self._node.in_progress_blocks.has_ciphertext_for_hash(block_hash):
+            connection.log_trace("Cipher text found. Decrypting off the event loop and sending to node.")
+            self._node.in_progress_blocks.add_key(block_hash, key)
+            decrypt_start_datetime = datetime.datetime.utcnow()
+            self._node.block_crypto_service.verify_and_decrypt(
+                None,
+                cipherblob,
+                key,
+                lambda task_result: self._on_block_decrypted(
+                    task_result, block_hash, connection, decrypt_start_datetime
+                )
+            )
+        elif self._node.in_progress_blocks.has_ciphertext_for_hash(block_hash):
             connection.log_trace("Cipher text found. Decrypting and sending to node.")
             decrypt_start_timestamp = time.time()
             decrypt_start_datetime = datetime.datetime.utcnow()
@@ -308,10 +358,23 @@ class BlockProcessingService:
                                                       peers=conns
                                                       )
 
+    def try_send_announced_block(self, block_hash: Sha256Hash, connection: AbstractGatewayBlockchainConnection) -> bool:
+        """
+        Answers request of the blockchain node for a block from the BDN that was announced to it.
+        :return: if the block was sent
+        """
+        return False
+
     def retry_broadcast_recovered_blocks(self, connection) -> None:
         if self._node.block_recovery_service.recovered_blocks and self._node.opts.has_fully_updated_tx_service:
-            for msg, recovery_source in self._node.block_recovery_service.recovered_blocks:
-                self._handle_decrypted_block(msg, connection, recovered=True, recovered_txs_source=recovery_source)
+            for recovered_block in self._node.block_recovery_service.recovered_blocks:
+                self._handle_decrypted_block(
+                    recovered_block.bx_block,
+                    connection,
+                    recovered=True,
+                    recovered_txs_source=recovered_block.recovered_txs_source,
+                    recovery_duration_s=recovered_block.recovery_duration_s
+                )
 
             self._node.block_recovery_service.clean_up_recovered_blocks()
 
@@ -345,19 +408,53 @@ class BlockProcessingService:
         logger.trace("Updated last confirmed block number to {} and difficulty to {}.",
                      self._last_confirmed_block_number, self._last_confirmed_block_difficulty)
 
-    def _compute_hold_timeout(self, _block_message) -> int:
+    def _compute_hold_timeout(self, block_message) -> float:
         """
         Computes timeout after receiving block message before sending the block anyway if not received from network.
-        TODO: implement algorithm for computing hold timeout
+        Uses a high percentile of how long blocks held for the same holding peer took to arrive from the BDN,
+        capped by `blockchain_block_hold_timeout_s`. Falls back to the cap until enough history is collected.
         :param block_message: block message to hold
         :return: time in seconds to wait
         """
-        return self._node.opts.blockchain_block_hold_timeout_s
+        max_timeout = self._node.opts.blockchain_block_hold_timeout_s
+        hold = self._holds.contents.get(block_message.block_hash())
+        if hold is None:
+            return max_timeout
+
+        hold_durations = self._hold_durations_by_peer.get(self._get_hold_peer_key(hold.holding_connection))
+        if hold_durations is None or len(hold_durations) < gateway_constants.BLOCK_HOLD_TIMEOUT_MIN_SAMPLES:
+            return max_timeout
+
+        sorted_durations = sorted(hold_durations)
+        percentile_index = min(
+            len(sorted_durations) - 1,
+            int(len(sorted_durations) * gateway_constants.BLOCK_HOLD_TIMEOUT_PERCENTILE / 100)
+        )
+        timeout = sorted_durations[percentile_index] * gateway_constants.BLOCK_HOLD_TIMEOUT_MARGIN_MULTIPLIER
+        return min(max_timeout, max(gateway_constants.BLOCK_HOLD_TIMEOUT_MIN_S, timeout))
+
+    def _record_hold_duration(self, holding_connection, hold_duration: float) -> None:
+        peer_key = self._get_hold_peer_key(holding_connection)
+        hold_durations = self._hold_durations_by_peer.get(peer_key)
+        if hold_durations is None:
+            hold_durations = deque(maxlen=gateway_constants.BLOCK_HOLD_DURATION_SAMPLES_PER_PEER)
+            self._hold_durations_by_peer[peer_key] = hold_durations
+        hold_durations.append(hold_duration)
+
+    def _get_hold_peer_key(self, holding_connection) -> str:
+        return holding_connection.peer_desc
 
     def _holding_timeout(self, block_hash, hold):
+        # the BDN block has not arrived yet, so its real arrival time is at least the time held so far;
+        # record that lower bound so that repeated timeouts raise the computed timeout for this peer
+        hold_duration = time.time() - hold.block_held_time
+        self._record_hold_duration(hold.holding_connection, hold_duration)
         block_stats.add_block_event_by_block_hash(block_hash, BlockStatEventType.BLOCK_HOLD_TIMED_OUT,
                                                   network_num=hold.connection.network_num,
-                                                  peers=[hold.connection]
+                                                  peers=[hold.connection],
+                                                  more_info="held for {}".format(
+                                                      stats_format.duration(hold_duration * 1000)
+                                                  )
                                                   )
         self._process_and_broadcast_block(hold.block_message, hold.connection)
 
@@ -387,6 +484,8 @@ class BlockProcessingService:
             connection.log_error(log_messages.BLOCK_COMPRESSION_FAIL, e.msg_hash, e)
             return
 
+        self._node.block_cleanup_service.on_block_compressed(block_message)
+
         if block_info.ignored_short_ids:
             assert block_info.ignored_short_ids is not None
             logger.debug(
@@ -448,13 +547,98 @@ class BlockProcessingService:
         connection.node.neutrality_service.propagate_block_to_network(bx_block, connection, block_info)
         self._node.get_tx_service().track_seen_short_ids_delayed(block_hash, block_info.short_ids)
 
+    def _store_encrypted_block(
+        self, block_hash: Sha256Hash, cipherblob: Union[bytearray, memoryview], connection: AbstractRelayConnection
+    ) -> None:
+        self._node.in_progress_blocks.add_ciphertext(block_hash, cipherblob)
+        if self._node.block_crypto_service.is_enabled():
+            self._encrypted_blocks_awaiting_key.add(block_hash, cipherblob)
+        block_received_message = BlockReceivedMessage(block_hash)
+        conns = self._node.broadcast(block_received_message, connection, connection_types=[ConnectionType.GATEWAY])
+        block_stats.add_block_event_by_block_hash(
+            block_hash,
+            BlockStatEventType.ENC_BLOCK_SENT_BLOCK_RECEIPT,
+            network_num=connection.network_num,
+            peers=conns,
+        )
+
+    def _on_block_broadcast_verified(
+        self,
+        task_result: BlockCryptoTaskResult,
+        msg,
+        cipherblob: Union[bytearray, memoryview],
+        had_key: bool,
+        connection: AbstractRelayConnection,
+        decrypt_start_datetime: datetime.datetime
+    ) -> None:
+        block_hash = msg.block_hash()
+        if not task_result.result.hash_matches:
+            connection.log_warning(log_messages.BLOCK_WITH_INCONSISTENT_HASHES,
+                                   Sha256Hash(crypto.double_sha256(cipherblob)), block_hash)
+            return
+
+        if had_key:
+            connection.log_trace("Already had key for received block. Sending block to node.")
+            self._on_block_decrypted(task_result, block_hash, connection, decrypt_start_datetime)
+            return
+
+        if self._node.in_progress_blocks.has_encryption_key_for_hash(block_hash):
+            # key arrived while the block was being verified
+            key = self._node.in_progress_blocks.get_encryption_key(bytes(block_hash.binary))
+            self._node.block_crypto_service.verify_and_decrypt(
+                None,
+                cipherblob,
+                key,
+                lambda decrypt_task_result: self._on_block_decrypted(
+                    decrypt_task_result, block_hash, connection, decrypt_start_datetime
+                )
+            )
+            return
+
+        connection.log_trace("Received encrypted block. Storing.")
+        self._store_encrypted_block(block_hash, cipherblob, connection)
+
+    def _on_block_decrypted(
+        self,
+        task_result: BlockCryptoTaskResult,
+        block_hash: Sha256Hash,
+        connection: AbstractRelayConnection,
+        decrypt_start_datetime: datetime.datetime
+    ) -> None:
+        block = task_result.result.block
+        if block is None:
+            block_stats.add_block_event_by_block_hash(
+                block_hash,
+                BlockStatEventType.ENC_BLOCK_DECRYPTION_ERROR,
+                network_num=connection.network_num
+            )
+            return
+
+        block_stats.add_block_event_by_block_hash(
+            block_hash,
+            BlockStatEventType.ENC_BLOCK_DECRYPTED_SUCCESS,
+            start_date_time=decrypt_start_datetime,
+            end_date_time=datetime.datetime.utcnow(),
+            network_num=connection.network_num,
+            more_info="Decryption: {}; Queued: {}".format(
+                stats_format.duration(task_result.crypto_duration_s * 1000),
+                stats_format.duration(task_result.queue_duration_s * 1000)
+            )
+        )
+        self._handle_decrypted_block(
+            block,
+            connection,
+            encrypted_block_hash_hex=convert.bytes_to_hex(block_hash.binary)
+        )
+
     def _handle_decrypted_block(
         self,
         bx_block: memoryview,
         connection: AbstractRelayConnection,
         encrypted_block_hash_hex: Optional[str] = None,
         recovered: bool = False,
-        recovered_txs_source: Optional[RecoveredTxsSource] = None
+        recovered_txs_source: Optional[RecoveredTxsSource] = None,
+        recovery_duration_s: Optional[float] = None
     ) -> None:
         transaction_service = self._node.get_tx_service()
         message_converter = self._node.message_converter
@@ -472,6 +656,8 @@ class BlockProcessingService:
             )
             return
 
+        self._on_block_header_validated(bx_block)
+
         # TODO: determine if a real block or test block. Discard if test block.
         if self._node.remote_node_conn or self._node.has_active_blockchain_peer():
             try:
@@ -512,7 +698,7 @@ class BlockProcessingService:
                 block_hash,
                 BlockStatEventType.BLOCK_RECOVERY_COMPLETED,
                 network_num=connection.network_num,
-                more_info=str(recovered_txs_source)
+                more_info=self._get_recovery_completed_info(recovered_txs_source, recovery_duration_s)
             )
 
         if block_hash in self._node.blocks_seen.contents:
@@ -637,11 +823,12 @@ class BlockProcessingService:
             tx_sid = tx_service.get_short_id(tx_hash)
             all_unknown_sids.append(tx_sid)
 
+        if connection is not None:
+            network_num = connection.network_num
+        else:
+            network_num = self._node.network_num
+
         if not self._node.opts.request_recovery:
-            if connection is not None:
-                network_num = connection.network_num
-            else:
-                network_num = self._node.network_num
             # log recovery started to match with recovery completing
             block_stats.add_block_event_by_block_hash(
                 block_hash,
@@ -652,70 +839,177 @@ class BlockProcessingService:
             )
             return
 
-        get_txs_message = GetTxsMessage(short_ids=all_unknown_sids)
-        self._node.broadcast(get_txs_message, connection_types=[ConnectionType.RELAY_TRANSACTION])
+        # short ids already requested for other blocks will be resolved by the pending response
+        sids_to_request = self._node.block_recovery_service.filter_short_ids_awaiting_response(all_unknown_sids)
+        get_txs_messages = self._request_short_ids(sids_to_request)
 
         if connection is not None:
             tx_stats.add_txs_by_short_ids_event(
-                all_unknown_sids,
+                sids_to_request,
                 TransactionStatEventType.TX_UNKNOWN_SHORT_IDS_REQUESTED_BY_GATEWAY_FROM_RELAY,
                 network_num=self._node.network_num,
                 peers=[connection],
                 block_hash=convert.bytes_to_hex(block_hash.binary)
             )
-            block_stats.add_block_event_by_block_hash(
-                block_hash,
-                BlockStatEventType.BLOCK_RECOVERY_STARTED,
-                network_num=connection.network_num,
-                txs_count=len(all_unknown_sids),
-                request_hash=convert.bytes_to_hex(
-                    crypto.double_sha256(get_txs_message.rawbytes())
-                )
-            )
+            block_stat_event_type = BlockStatEventType.BLOCK_RECOVERY_STARTED
         else:
-            block_stats.add_block_event_by_block_hash(
-                block_hash,
-                BlockStatEventType.BLOCK_RECOVERY_REPEATED,
-                network_num=self._node.network_num,
-                txs_count=len(all_unknown_sids),
-                request_hash=convert.bytes_to_hex(
-                    crypto.double_sha256(get_txs_message.rawbytes())
-                )
-            )
+            block_stat_event_type = BlockStatEventType.BLOCK_RECOVERY_REPEATED
+
+        if get_txs_messages:
+            request_hash = convert.bytes_to_hex(crypto.double_sha256(get_txs_messages[0].rawbytes()))
+        else:
+            request_hash = None
+        block_stats.add_block_event_by_block_hash(
+            block_hash,
+            block_stat_event_type,
+            network_num=network_num,
+            txs_count=len(all_unknown_sids),
+            request_hash=request_hash,
+            more_info="{} sids already requested".format(len(all_unknown_sids) - len(sids_to_request))
+        )
 
     def schedule_recovery_retry(self, block_awaiting_recovery: BlockRecoveryInfo) -> None:
         """
         Schedules a block recovery attempt. Repeated block recovery attempts result in longer timeouts,
-        following `gateway_constants.BLOCK_RECOVERY_INTERVAL_S`'s pattern, until giving up.
+        following `gateway_constants.BLOCK_RECOVERY_INTERVAL_S`'s pattern and the observed relay round trip time,
+        until giving up. Retries of all blocks that are due together are merged into a single request.
         :param block_awaiting_recovery: info about recovering block
         :return:
         """
         block_hash = block_awaiting_recovery.block_hash
-        recovery_attempts = self._node.block_recovery_service.recovery_attempts_by_block[block_hash]
+        block_recovery_service = self._node.block_recovery_service
+        recovery_attempts = block_recovery_service.recovery_attempts_by_block[block_hash]
         recovery_timed_out = time.time() - block_awaiting_recovery.recovery_start_time >= \
                              self._node.opts.blockchain_block_recovery_timeout_s
         if recovery_attempts >= gateway_constants.BLOCK_RECOVERY_MAX_RETRY_ATTEMPTS or recovery_timed_out:
             logger.error(log_messages.SHORT_ID_RECOVERY_FAIL, block_hash)
-            self._node.block_recovery_service.cancel_recovery_for_block(block_hash)
+            block_recovery_service.cancel_recovery_for_block(block_hash)
             self._node.block_queuing_service.remove(block_hash)
+            self._recovery_retry_due_times.pop(block_hash, None)
+        elif block_hash not in self._recovery_retry_due_times:
+            delay = block_recovery_service.get_recovery_retry_delay(recovery_attempts)
+            self._recovery_retry_due_times[block_hash] = time.time() + delay
+            self._schedule_recovery_retry_alarm()
+
+    def _schedule_recovery_retry_alarm(self) -> None:
+        if not self._recovery_retry_due_times:
+            return
+
+        next_fire_time = min(self._recovery_retry_due_times.values())
+        scheduled_fire_time = self._recovery_retry_alarm_fire_time
+        if scheduled_fire_time is not None and scheduled_fire_time <= next_fire_time:
+            return
+
+        if self._recovery_retry_alarm is not None:
+            self._node.alarm_queue.unregister_alarm(self._recovery_retry_alarm)
+        self._recovery_retry_alarm = self._node.alarm_queue.register_alarm(
+            max(next_fire_time - time.time(), 0), self._trigger_recovery_retries
+        )
+        self._recovery_retry_alarm_fire_time = next_fire_time
+
+    def _trigger_recovery_retries(self) -> int:
+        self._recovery_retry_alarm = None
+        self._recovery_retry_alarm_fire_time = None
+
+        block_recovery_service = self._node.block_recovery_service
+        batch_deadline = time.time() + gateway_constants.BLOCK_RECOVERY_RETRY_BATCH_WINDOW_S
+        blocks_to_retry: List[BlockRecoveryInfo] = []
+        for block_hash, due_time in list(self._recovery_retry_due_times.items()):
+            if due_time > batch_deadline:
+                continue
+            del self._recovery_retry_due_times[block_hash]
+            block_recovery_info = block_recovery_service.get_block_recovery_info(block_hash)
+            if block_recovery_info is not None:
+                blocks_to_retry.append(block_recovery_info)
+
+        if blocks_to_retry:
+            self._retry_recovery_for_blocks(blocks_to_retry)
+
+        self._schedule_recovery_retry_alarm()
+        return 0
+
+    def _retry_recovery_for_blocks(self, blocks_to_retry: List[BlockRecoveryInfo]) -> None:
+        """
+        Requests missing transactions of several blocks in deduplicated batches, most recent blocks first.
+        :param blocks_to_retry: info about recovering blocks
+        """
+        tx_service = self._node.get_tx_service()
+        block_recovery_service = self._node.block_recovery_service
+        blocks_to_retry.sort(key=lambda info: info.recovery_start_time, reverse=True)
+
+        sid_to_index: Dict[int, int] = {}
+        sids_by_block: Dict[Sha256Hash, List[int]] = {}
+        for block_recovery_info in blocks_to_retry:
+            block_hash = block_recovery_info.block_hash
+            block_recovery_service.recovery_attempts_by_block[block_hash] += 1
+
+            block_sids = list(block_recovery_info.unknown_short_ids)
+            for tx_hash in block_recovery_info.unknown_transaction_hashes:
+                block_sids.append(tx_service.get_short_id(tx_hash))
+            for sid in block_sids:
+                if sid not in sid_to_index:
+                    sid_to_index[sid] = len(sid_to_index)
+            sids_by_block[block_hash] = block_sids
+
+        if self._node.opts.request_recovery:
+            get_txs_messages = self._request_short_ids(list(sid_to_index))
         else:
-            delay = gateway_constants.BLOCK_RECOVERY_RECOVERY_INTERVAL_S[recovery_attempts]
-            self._node.alarm_queue.register_approx_alarm(delay, delay / 2, self._trigger_recovery_retry,
-                                                         block_awaiting_recovery)
+            get_txs_messages = []
 
-    def _trigger_recovery_retry(self, block_awaiting_recovery: BlockRecoveryInfo) -> None:
-        block_hash = block_awaiting_recovery.block_hash
-        if self._node.block_recovery_service.awaiting_recovery(block_hash):
-            self._node.block_recovery_service.recovery_attempts_by_block[block_hash] += 1
-            self.start_transaction_recovery(
-                block_awaiting_recovery.unknown_short_ids,
-                block_awaiting_recovery.unknown_transaction_hashes,
-                block_hash
+        for block_hash, block_sids in sids_by_block.items():
+            request_hash = None
+            if get_txs_messages and block_sids:
+                message_index = (
+                    sid_to_index[block_sids[0]] // gateway_constants.BLOCK_RECOVERY_MAX_SHORT_IDS_PER_REQUEST
+                )
+                request_hash = convert.bytes_to_hex(crypto.double_sha256(get_txs_messages[message_index].rawbytes()))
+            block_stats.add_block_event_by_block_hash(
+                block_hash,
+                BlockStatEventType.BLOCK_RECOVERY_REPEATED,
+                network_num=self._node.network_num,
+                txs_count=len(block_sids),
+                request_hash=request_hash,
+                more_info="merged with {} other blocks, {} sids total".format(
+                    len(sids_by_block) - 1, len(sid_to_index)
+                )
             )
 
+    def _request_short_ids(self, short_ids: List[int]) -> List[GetTxsMessage]:
+        """
+        Requests short ids from transaction relays, split into batches of bounded size.
+        :param short_ids: short ids to request
+        :return: sent request messages
+        """
+        get_txs_messages = []
+        batch_size = gateway_constants.BLOCK_RECOVERY_MAX_SHORT_IDS_PER_REQUEST
+        for batch_start in range(0, len(short_ids), batch_size):
+            get_txs_message = GetTxsMessage(short_ids=short_ids[batch_start:batch_start + batch_size])
+            self._node.broadcast(get_txs_message, connection_types=[ConnectionType.RELAY_TRANSACTION])
+            get_txs_messages.append(get_txs_message)
+
+        self._node.block_recovery_service.on_short_ids_requested(short_ids)
+        return get_txs_messages
+
+    def _get_recovery_completed_info(
+        self,
+        recovered_txs_source: Optional[RecoveredTxsSource],
+        recovery_duration_s: Optional[float]
+    ) -> str:
+        if recovery_duration_s is None:
+            return str(recovered_txs_source)
+        return "{}, recovery time: {}".format(
+            recovered_txs_source, stats_format.duration(recovery_duration_s * 1000)
+        )
+
     def _on_block_decompressed(self, block_msg) -> None:
         pass
 
+    def _on_block_header_validated(self, bx_block: memoryview) -> None:
+        """
+        Called with a compressed block from the BDN once its header passed validation, before decompression.
+        """
+        pass
+
     def _validate_block_header_in_block_message(
         self, block_message: AbstractBlockMessage
     ) -> BlockValidationResult:
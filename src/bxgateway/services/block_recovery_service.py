@@ -1,13 +1,14 @@
 import time
 from collections import defaultdict
 from enum import Enum
-from typing import Dict, Set, List, NamedTuple
+from typing import Dict, Set, List, NamedTuple, Iterable, Optional
 
 from bxcommon.utils import crypto
 from bxcommon.utils.alarm_queue import AlarmQueue
 from bxcommon.utils.expiration_queue import ExpirationQueue
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import gateway_constants
+from bxgateway.utils.running_average import RunningAverage
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -31,6 +32,12 @@ class RecoveredTxsSource(Enum):
         return self.name
 
 
+class RecoveredBlockInfo(NamedTuple):
+    bx_block: memoryview
+    recovered_txs_source: RecoveredTxsSource
+    recovery_duration_s: Optional[float]
+
+
 class BlockRecoveryService:
     """
     Service class that handles blocks gateway receives with unknown transaction short ids are contents.
@@ -47,6 +54,9 @@ class BlockRecoveryService:
     _block_hash_to_bx_block_hashes: map of original block hash to compressed block hashes waiting for recovery
     _sid_to_bx_block_hashes: map of short id to compressed block hashes waiting for recovery
     _tx_hash_to_bx_block_hashes: map of transaction hash to block hashes waiting for recovery
+    _block_hash_to_recovery_start_time: map of original block hash to the time its recovery started
+    _short_id_to_request_time: map of short id to the time it was last requested from the BDN
+    _relay_round_trip_time: running average of time between requesting short ids and receiving them
 
     _cleanup_scheduled: whether block recovery has an alarm scheduled to clean up recovering blocks
     _blocks_expiration_queue: queue to trigger expiration of waiting for block recovery
@@ -61,6 +71,9 @@ class BlockRecoveryService:
     _sid_to_bx_block_hashes: Dict[int, Set[Sha256Hash]]
     _tx_hash_to_bx_block_hashes: Dict[Sha256Hash, Set[Sha256Hash]]
     _blocks_expiration_queue: ExpirationQueue
+    _block_hash_to_recovery_start_time: Dict[Sha256Hash, float]
+    _short_id_to_request_time: Dict[int, float]
+    _relay_round_trip_time: RunningAverage
     _cleanup_scheduled: bool = False
 
     recovery_attempts_by_block: Dict[Sha256Hash, int]
@@ -79,6 +92,9 @@ class BlockRecoveryService:
         self._sid_to_bx_block_hashes = defaultdict(set)
         self._tx_hash_to_bx_block_hashes: Dict[Sha256Hash, Set[Sha256Hash]] = defaultdict(set)
         self._blocks_expiration_queue = ExpirationQueue(gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME)
+        self._block_hash_to_recovery_start_time = {}
+        self._short_id_to_request_time = {}
+        self._relay_round_trip_time = RunningAverage(gateway_constants.BLOCK_RECOVERY_RTT_RUNNING_AVERAGE_SIZE)
 
     def add_block(self, bx_block: memoryview, block_hash: Sha256Hash, unknown_tx_sids: List[int],
                   unknown_tx_hashes: List[Sha256Hash]):
@@ -99,6 +115,8 @@ class BlockRecoveryService:
         self._bx_block_hash_to_tx_hashes[bx_block_hash] = set(unknown_tx_hashes)
 
         self._block_hash_to_bx_block_hashes[block_hash].add(bx_block_hash)
+        if block_hash not in self._block_hash_to_recovery_start_time:
+            self._block_hash_to_recovery_start_time[block_hash] = time.time()
         for sid in unknown_tx_sids:
             self._sid_to_bx_block_hashes[sid].add(bx_block_hash)
         for tx_hash in unknown_tx_hashes:
@@ -109,19 +127,95 @@ class BlockRecoveryService:
 
     def get_blocks_awaiting_recovery(self) -> List[BlockRecoveryInfo]:
         """
-        Fetch all blocks still awaiting recovery and retry.
+        Fetch all blocks still awaiting recovery and retry, most recently received blocks first.
         """
         blocks_awaiting_recovery = []
-        for block_hash, bx_block_hashes in self._block_hash_to_bx_block_hashes.items():
-            unknown_short_ids = set()
-            unknown_transaction_hashes = set()
-            for bx_block_hash in bx_block_hashes:
-                unknown_short_ids.update(self._bx_block_hash_to_sids[bx_block_hash])
-                unknown_transaction_hashes.update(self._bx_block_hash_to_tx_hashes[bx_block_hash])
-            blocks_awaiting_recovery.append(BlockRecoveryInfo(block_hash, unknown_short_ids, unknown_transaction_hashes,
-                                                              time.time()))
+        for block_hash in self._block_hash_to_bx_block_hashes:
+            block_recovery_info = self.get_block_recovery_info(block_hash)
+            assert block_recovery_info is not None
+            blocks_awaiting_recovery.append(block_recovery_info)
+        blocks_awaiting_recovery.sort(key=lambda info: info.recovery_start_time, reverse=True)
         return blocks_awaiting_recovery
 
+    def get_block_recovery_info(self, block_hash: Sha256Hash) -> Optional[BlockRecoveryInfo]:
+        """
+        Fetch current unknown short ids and transaction hashes across all compressed versions of a block.
+        :param block_hash: original ObjectHash of block
+        :return: recovery info, or None if the block is not awaiting recovery
+        """
+        if block_hash not in self._block_hash_to_bx_block_hashes:
+            return None
+
+        unknown_short_ids = set()
+        unknown_transaction_hashes = set()
+        for bx_block_hash in self._block_hash_to_bx_block_hashes[block_hash]:
+            unknown_short_ids.update(self._bx_block_hash_to_sids[bx_block_hash])
+            unknown_transaction_hashes.update(self._bx_block_hash_to_tx_hashes[bx_block_hash])
+        return BlockRecoveryInfo(
+            block_hash,
+            unknown_short_ids,
+            unknown_transaction_hashes,
+            self._block_hash_to_recovery_start_time.get(block_hash, time.time())
+        )
+
+    def get_recovery_retry_delay(self, recovery_attempts: int) -> float:
+        """
+        Computes delay before next recovery attempt. Follows `gateway_constants.BLOCK_RECOVERY_RECOVERY_INTERVAL_S`,
+        but never retries before a response to the previous request could be expected from the relay.
+        :param recovery_attempts: number of recovery attempts already made for block
+        :return: delay in seconds
+        """
+        intervals = gateway_constants.BLOCK_RECOVERY_RECOVERY_INTERVAL_S
+        delay = intervals[min(recovery_attempts, len(intervals) - 1)]
+        relay_round_trip_time = self.get_relay_round_trip_time()
+        if relay_round_trip_time is not None:
+            delay = max(delay, relay_round_trip_time * gateway_constants.BLOCK_RECOVERY_RTT_TIMEOUT_MULTIPLIER)
+        return min(delay, gateway_constants.BLOCK_RECOVERY_MAX_RETRY_DELAY_S)
+
+    def get_relay_round_trip_time(self) -> Optional[float]:
+        """
+        :return: average time between requesting short ids from the BDN and receiving them, or None if unknown yet
+        """
+        if self._relay_round_trip_time.values:
+            return self._relay_round_trip_time.average
+        return None
+
+    def filter_short_ids_awaiting_response(self, short_ids: Iterable[int]) -> List[int]:
+        """
+        Filters out short ids that were requested from the BDN recently enough that a response is still expected.
+        :param short_ids: short ids to request
+        :return: short ids not currently being requested
+        """
+        current_time = time.time()
+        timeout = self.get_recovery_retry_delay(0)
+        requested_short_ids = self._short_id_to_request_time
+        filtered_short_ids = []
+        for short_id in short_ids:
+            request_time = requested_short_ids.get(short_id)
+            if request_time is None or current_time - request_time >= timeout:
+                filtered_short_ids.append(short_id)
+        return filtered_short_ids
+
+    def on_short_ids_requested(self, short_ids: Iterable[int]) -> None:
+        current_time = time.time()
+        for short_id in short_ids:
+            self._short_id_to_request_time[short_id] = current_time
+
+    def on_short_ids_received(self, short_ids: Iterable[int]) -> None:
+        """
+        Tracks relay round trip time from the most recent request among the received short ids.
+        :param short_ids: short ids received in response to a transactions request
+        """
+        current_time = time.time()
+        latest_request_time = None
+        for short_id in short_ids:
+            request_time = self._short_id_to_request_time.pop(short_id, None)
+            if request_time is not None and (latest_request_time is None or request_time > latest_request_time):
+                latest_request_time = request_time
+
+        if latest_request_time is not None:
+            self._relay_round_trip_time.add_value(current_time - latest_request_time)
+
     def check_missing_sid(self, sid: int, recovered_txs_source: RecoveredTxsSource) -> bool:
         """
         Resolves recovering blocks depend on sid.
@@ -139,6 +233,7 @@ class BlockRecoveryService:
                         self._check_if_recovered(bx_block_hash, recovered_txs_source)
 
             del self._sid_to_bx_block_hashes[sid]
+            self._short_id_to_request_time.pop(sid, None)
             return True
         else:
             return False
@@ -192,6 +287,12 @@ class BlockRecoveryService:
         logger.debug("Cleaned up {} blocks awaiting recovery.",
                      num_blocks_awaiting_recovery - len(self._bx_block_hash_to_block))
 
+        current_time = time.time()
+        self._short_id_to_request_time = {
+            short_id: request_time for short_id, request_time in self._short_id_to_request_time.items()
+            if current_time - request_time < gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME
+        }
+
         if self._bx_block_hash_to_block:
             return gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME
 
@@ -217,13 +318,18 @@ class BlockRecoveryService:
         if self._is_block_recovered(bx_block_hash):
             bx_block = self._bx_block_hash_to_block[bx_block_hash]
             block_hash = self._bx_block_hash_to_block_hash[bx_block_hash]
+            recovery_start_time = self._block_hash_to_recovery_start_time.get(block_hash)
+            if recovery_start_time is None:
+                recovery_duration_s = None
+            else:
+                recovery_duration_s = time.time() - recovery_start_time
             logger.debug(
                 "Recovery status for block {}, compress block hash {}: "
-                "Block recovered by gateway. Source of recovered txs is {}.",
-                block_hash, bx_block_hash, recovered_txs_source
+                "Block recovered by gateway in {}s. Source of recovered txs is {}.",
+                block_hash, bx_block_hash, recovery_duration_s, recovered_txs_source
             )
             self._remove_recovered_block_hash(block_hash)
-            self.recovered_blocks.append((bx_block, recovered_txs_source))
+            self.recovered_blocks.append(RecoveredBlockInfo(bx_block, recovered_txs_source, recovery_duration_s))
 
     def _is_block_recovered(self, bx_block_hash: Sha256Hash):
         """
@@ -247,6 +353,8 @@ class BlockRecoveryService:
                     del self._bx_block_hash_to_block[bx_block_hash]
                     del self._bx_block_hash_to_block_hash[bx_block_hash]
             del self._block_hash_to_bx_block_hashes[block_hash]
+            self._block_hash_to_recovery_start_time.pop(block_hash, None)
+            self.recovery_attempts_by_block.pop(block_hash, None)
 
     def _remove_sid_and_tx_mapping_for_bx_block_hash(self, bx_block_hash: Sha256Hash):
         """
@@ -286,6 +394,8 @@ class BlockRecoveryService:
             self._block_hash_to_bx_block_hashes[block_hash].discard(bx_block_hash)
             if len(self._block_hash_to_bx_block_hashes[block_hash]) == 0:
                 del self._block_hash_to_bx_block_hashes[block_hash]
+                self._block_hash_to_recovery_start_time.pop(block_hash, None)
+                self.recovery_attempts_by_block.pop(block_hash, None)
 
     def _schedule_cleanup(self):
         if not self._cleanup_scheduled and self._bx_block_hash_to_block:
@@ -3,7 +3,7 @@ from abc import abstractmethod
 from bxcommon.connections.connection_type import ConnectionType
 from bxutils import logging
 
-from bxcommon.services.transaction_service import TransactionService
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.utils.blockchain_utils.btc.btc_object_hash import Sha256Hash
 
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
@@ -45,7 +45,7 @@ class AbstractBtcBlockCleanupService(AbstractBlockCleanupService):
     def clean_block_transactions(
             self,
             block_msg: BlockBtcMessage,
-            transaction_service: TransactionService
+            transaction_service: GatewayTransactionService
     ) -> None:
         pass
 
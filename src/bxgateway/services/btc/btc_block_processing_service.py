@@ -1,11 +1,15 @@
 import typing
 from datetime import datetime
+from typing import Union
 
 from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
 from bxutils import logging
-from bxgateway import log_messages
+from bxgateway import btc_constants, gateway_constants, log_messages
 
-from bxcommon.utils import convert
+from bxcommon.utils import convert, crypto
+from bxcommon.utils.blockchain_utils.btc.btc_object_hash import BtcObjectHash
+from bxcommon.utils.expiring_set import ExpiringSet
 from bxcommon.utils.object_hash import Sha256Hash
 from bxcommon.utils.stats import stats_format
 from bxcommon.utils.stats.block_stat_event_type import BlockStatEventType
@@ -16,6 +20,7 @@ from bxgateway.messages.btc.abstract_btc_message_converter import CompactBlockCo
 from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 from bxgateway.messages.btc.block_transactions_btc_message import BlockTransactionsBtcMessage
 from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMessage
+from bxgateway.messages.btc.headers_btc_message import HeadersBtcMessage
 from bxgateway.messages.btc.inventory_btc_message import GetDataBtcMessage, InventoryType
 from bxgateway.services.block_processing_service import BlockProcessingService
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
@@ -25,6 +30,15 @@ logger = logging.get_logger(__name__)
 
 class BtcBlockProcessingService(BlockProcessingService):
 
+    def __init__(self, node):
+        super(BtcBlockProcessingService, self).__init__(node)
+        # blocks from the BDN whose headers were announced to the blockchain node
+        self._announced_block_headers = ExpiringSet(
+            node.alarm_queue,
+            gateway_constants.GATEWAY_BLOCKS_SEEN_EXPIRATION_TIME_S,
+            "btc_block_processing_announced_block_headers"
+        )
+
     def process_compact_block(
             self, block_message: CompactBlockBtcMessage, connection: BtcNodeConnection
     ) -> CompactBlockCompressionResult:
@@ -175,6 +189,72 @@ class BtcBlockProcessingService(BlockProcessingService):
             )
             connection.enqueue_msg(get_data_msg)
 
+    def is_block_header_announced(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._announced_block_headers.contents
+
+    def try_send_announced_block(self, block_hash: Sha256Hash, connection: BtcNodeConnection) -> bool:
+        """
+        Answers request of the blockchain node for a block whose header was announced to it from the block queue,
+        without forwarding the request to the remote blockchain node.
+        Requests for blocks already sent to the node are dropped. Requests for blocks that are still being
+        decompressed or recovered, or failed decompression, are left to be forwarded to the remote blockchain node.
+        :return: if the request was handled
+        """
+        if not self.is_block_header_announced(block_hash):
+            return False
+
+        block_queuing_service = self._node.block_queuing_service
+        if block_queuing_service.is_block_sent_to_node(block_hash, connection):
+            logger.trace("Ignoring request for announced block {}, which was already sent to {}.",
+                         block_hash, connection)
+            return True
+
+        block_message = block_queuing_service.get_block_message(block_hash)
+        if block_message is None:
+            return False
+
+        logger.debug("Sending announced block {} requested by blockchain node.", block_hash)
+        connection.enqueue_msg(block_message)
+        block_queuing_service.mark_block_sent_to_node(block_hash, connection)
+        return True
+
     def _on_block_decompressed(self, block_msg):
         msg = typing.cast(BlockBtcMessage, block_msg)
         self._node.block_cleanup_service.on_new_block_received(msg.block_hash(), msg.prev_block_hash())
+
+    def _on_block_header_validated(self, bx_block: memoryview) -> None:
+        """
+        Announces the header of a new block from the BDN to the blockchain node before the block is decompressed,
+        so that the node can start processing it while the block body follows.
+        """
+        if not self._node.opts.btc_headers_first_relay:
+            return
+
+        block_header = self._get_compressed_block_header_bytes(bx_block)
+        block_hash = BtcObjectHash(buf=crypto.bitcoin_hash(block_header), length=btc_constants.BTC_SHA_HASH_LEN)
+        if (
+            block_hash in self._announced_block_headers.contents
+            or block_hash in self._node.blocks_seen.contents
+            or not self._node.should_process_block_hash(block_hash)
+            or not self._node.has_active_blockchain_peer()
+        ):
+            return
+
+        self._announced_block_headers.add(block_hash)
+        # headers messages carry each header followed by a zero transaction count
+        headers_msg = HeadersBtcMessage(
+            magic=self._node.opts.blockchain_net_magic, headers=[bytes(block_header) + b"\x00"]
+        )
+        logger.debug("Announcing header of block {} to blockchain node ahead of the block.", block_hash)
+        self._node.broadcast(headers_msg, connection_types=[ConnectionType.BLOCKCHAIN_NODE])
+
+    def _get_compressed_block_header_bytes(
+        self, compressed_block_bytes: Union[bytearray, memoryview]
+    ) -> Union[bytearray, memoryview]:
+        bx_block = (
+            compressed_block_bytes if isinstance(compressed_block_bytes, memoryview)
+            else memoryview(compressed_block_bytes)
+        )
+        block_offsets = compact_block_short_ids_serializer.get_bx_block_offsets(bx_block)
+        header_offset = block_offsets.block_begin_offset + btc_constants.BTC_HDR_COMMON_OFF
+        return bx_block[header_offset:header_offset + btc_constants.BTC_BLOCK_HDR_SIZE]
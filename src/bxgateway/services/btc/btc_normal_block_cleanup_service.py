@@ -1,16 +1,23 @@
-import time
+from typing import Iterable, Iterator, List, Optional, TYPE_CHECKING
 
 from bxutils import logging
 from bxutils.logging.log_record_type import LogRecordType
 
-from bxcommon.services import normal_cleanup_service_helpers
-from bxcommon.utils import crypto
-from bxcommon.utils.blockchain_utils.btc.btc_object_hash import BtcObjectHash, BTC_SHA_HASH_LEN
-from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
+from bxcommon.utils.blockchain_utils.btc.btc_object_hash import Sha256Hash
+from bxcommon.utils.expiring_dict import ExpiringDict
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.messages.bloxroute.block_confirmation_message import BlockConfirmationMessage
 
+from bxgateway import gateway_constants
 from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.services.block_cleanup_executor import BlockCleanupTask
 from bxgateway.services.btc.abstract_btc_block_cleanup_service import AbstractBtcBlockCleanupService
+from bxgateway.utils.btc.btc_short_id_index import BtcShortIdIndex
+
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.btc.btc_gateway_node import BtcGatewayNode
 
 
 logger = logging.get_logger(LogRecordType.BlockCleanup, __name__)
@@ -21,62 +28,70 @@ class BtcNormalBlockCleanupService(AbstractBtcBlockCleanupService):
     Service for managing block cleanup.
     """
 
+    def __init__(
+        self, node: "BtcGatewayNode", network_num: int, short_id_index: Optional[BtcShortIdIndex] = None
+    ):
+        super().__init__(node, network_num)
+        self.short_id_index = short_id_index
+        # transaction ids computed while compressing blocks from the blockchain node, reused when the block
+        # is cleaned up, since cleanup receives a different message for the block
+        self._compressed_block_tx_hashes: ExpiringDict[Sha256Hash, List[Sha256Hash]] = ExpiringDict(
+            node.alarm_queue,
+            gateway_constants.BTC_COMPRESSED_BLOCK_TX_HASHES_EXPIRATION_TIME_S,
+            "btc_cleanup_compressed_block_tx_hashes"
+        )
+
+    def on_block_compressed(self, block_msg: BlockBtcMessage) -> None:
+        if block_msg.has_tx_hashes():
+            self._compressed_block_tx_hashes.add(block_msg.block_hash(), block_msg.tx_hashes())
+
     def clean_block_transactions(
             self,
             block_msg: BlockBtcMessage,
-            transaction_service: TransactionService
+            transaction_service: GatewayTransactionService
     ) -> None:
-        block_short_ids = []
-        block_unknown_tx_hashes = []
-        start_time = time.time()
-
-        short_ids_count = 0
-        unknown_tx_hashes_count = 0
-        transactions_processed = 0
-
-        tx_hash_to_contents_len_before_cleanup = transaction_service.get_tx_hash_to_contents_len()
-        short_id_count_before_cleanup = transaction_service.get_short_id_count()
+        self._clean_block_transactions_by_hashes(
+            block_msg.block_hash(), self._iter_block_tx_hashes(block_msg), transaction_service
+        )
 
-        for tx in block_msg.txns():
-            tx_hash = BtcObjectHash(buf=crypto.double_sha256(tx), length=BTC_SHA_HASH_LEN)
-            short_ids = transaction_service.remove_transaction_by_tx_hash(tx_hash, force=True)
-            if short_ids is None:
-                unknown_tx_hashes_count += 1
-                block_unknown_tx_hashes.append(tx_hash)
-            else:
-                short_ids_count += len(short_ids)
-                block_short_ids.extend(short_ids)
-            transactions_processed += 1
+    def _iter_block_tx_hashes(self, block_msg: BlockBtcMessage) -> Iterator[Sha256Hash]:
+        # transaction ids, not witness transaction ids, which transaction service is keyed by
         block_hash = block_msg.block_hash()
-        transaction_service.on_block_cleaned_up(block_hash)
-        end_time = time.time()
-        duration = end_time - start_time
-        tx_hash_to_contents_len_after_cleanup = transaction_service.get_tx_hash_to_contents_len()
-        short_id_count_after_cleanup = transaction_service.get_short_id_count()
-
-        logger.debug(
-            "Finished cleaning up block {}. Processed {} hashes, {} of which were unknown, and cleaned up {} "
-            "short ids. Took {:.3f}s.",
-            block_hash, transactions_processed, unknown_tx_hashes_count, short_ids_count, duration
-        )
+        tx_hashes: Optional[Iterable[Sha256Hash]] = self._compressed_block_tx_hashes.contents.get(block_hash)
+        if tx_hashes is not None:
+            self._compressed_block_tx_hashes.remove_item(block_hash)
+        elif block_msg.has_tx_hashes():
+            tx_hashes = block_msg.tx_hashes()
+        else:
+            # computed lazily, so that each cleanup slice only hashes the transactions it removes
+            tx_hashes = (btc_common_utils.get_txid(tx) for tx in block_msg.txns())
+        short_id_index = self.short_id_index
+        for tx_hash in tx_hashes:
+            if short_id_index is not None:
+                short_id_index.remove(tx_hash)
+            yield tx_hash
 
-        transaction_service.log_block_transaction_cleanup_stats(block_hash, block_msg.txn_count(),
-                                                                tx_hash_to_contents_len_before_cleanup,
-                                                                tx_hash_to_contents_len_after_cleanup,
-                                                                short_id_count_before_cleanup,
-                                                                short_id_count_after_cleanup)
+    def _on_block_transactions_cleaned_up(self, task: BlockCleanupTask) -> None:
+        short_id_index = self.short_id_index
+        if short_id_index is not None:
+            self._prune_short_id_index(short_id_index, task.transaction_service)
+        super(BtcNormalBlockCleanupService, self)._on_block_transactions_cleaned_up(task)
 
-        self._block_hash_marked_for_cleanup.discard(block_hash)
-        self.node.post_block_cleanup_tasks(
-            block_hash=block_hash,
-            short_ids=block_short_ids,
-            unknown_tx_hashes=block_unknown_tx_hashes
-        )
+    def _prune_short_id_index(
+        self, short_id_index: BtcShortIdIndex, transaction_service: GatewayTransactionService
+    ) -> None:
+        tx_count = transaction_service.get_tx_hash_to_contents_len()
+        if len(short_id_index) > max(tx_count, 1) * gateway_constants.BTC_SHORT_ID_INDEX_MAX_STALE_RATIO:
+            logger.debug(
+                "Rebuilding short id index with {} transactions. Transaction service has {} transactions.",
+                len(short_id_index), tx_count
+            )
+            short_id_index.rebuild(transaction_service.iter_transaction_hashes())
 
     # pyre-fixme[14]: `contents_cleanup` overrides method defined in
     #  `AbstractBlockCleanupService` inconsistently.
     def contents_cleanup(self,
-                         transaction_service: TransactionService,
+                         transaction_service: GatewayTransactionService,
                          block_confirmation_message: BlockConfirmationMessage
                          ):
-        normal_cleanup_service_helpers.contents_cleanup(transaction_service, block_confirmation_message)
+        self._remove_confirmed_block_contents(transaction_service, block_confirmation_message)
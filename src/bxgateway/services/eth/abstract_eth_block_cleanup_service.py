@@ -3,7 +3,7 @@ from abc import abstractmethod
 from typing import Iterable, TYPE_CHECKING
 
 from bxcommon.connections.connection_type import ConnectionType
-from bxcommon.services.transaction_service import TransactionService
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.utils import convert
 from bxcommon.utils.object_hash import Sha256Hash
 
@@ -37,7 +37,7 @@ class AbstractEthBlockCleanupService(AbstractBlockCleanupService):
     def clean_block_transactions(
         self,
         block_msg: NewBlockEthProtocolMessage,
-        transaction_service: TransactionService
+        transaction_service: GatewayTransactionService
     ) -> None:
         block_hash = block_msg.block_hash()
         transactions_list = block_msg.txns()
@@ -76,7 +76,7 @@ class AbstractEthBlockCleanupService(AbstractBlockCleanupService):
         self,
         block_hash: Sha256Hash,
         transactions_list: Iterable[Sha256Hash],
-        transaction_service: TransactionService
+        transaction_service: GatewayTransactionService
     ) -> None:
         pass
 
@@ -5,6 +5,7 @@ from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
 from bxcommon.messages.eth.validation.eth_block_validator import EthBlockValidator
 from bxcommon.utils.blockchain_utils.eth import rlp_utils
 from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
 from bxgateway.messages.eth.protocol.get_block_bodies_eth_protocol_message import (
     GetBlockBodiesEthProtocolMessage,
 )
@@ -12,6 +13,7 @@ from bxgateway.messages.eth.protocol.get_block_headers_eth_protocol_message impo
     GetBlockHeadersEthProtocolMessage,
 )
 from bxgateway.services.block_processing_service import BlockProcessingService
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -30,6 +32,13 @@ class EthBlockProcessingService(BlockProcessingService):
     ) -> bool:
 
         block_queuing_service = self._node.block_queuing_service
+        request_key = self._get_request_key(msg)
+        if block_queuing_service.is_response_cache_enabled():
+            cache_hit = block_queuing_service.try_send_cached_response_to_node(request_key)
+            eth_gateway_stats_service.log_headers_request(cache_hit)
+            if cache_hit:
+                return True
+
         block_hash = msg.get_block_hash()
 
         if block_hash is not None:
@@ -70,7 +79,9 @@ class EthBlockProcessingService(BlockProcessingService):
 
         if success:
             return block_queuing_service.try_send_headers_to_node(
-                requested_block_hashes
+                requested_block_hashes,
+                request_key,
+                len(requested_block_hashes) == msg.get_amount()
             )
         else:
             logger.trace(
@@ -82,13 +93,25 @@ class EthBlockProcessingService(BlockProcessingService):
     def try_process_get_block_bodies_request(
         self, msg: GetBlockBodiesEthProtocolMessage
     ) -> bool:
+        block_queuing_service = self._node.block_queuing_service
+        request_key = self._get_request_key(msg)
+        if block_queuing_service.is_response_cache_enabled():
+            cache_hit = block_queuing_service.try_send_cached_response_to_node(request_key)
+            eth_gateway_stats_service.log_bodies_request(cache_hit)
+            if cache_hit:
+                return True
+
         block_hashes = msg.get_block_hashes()
         logger.trace("Checking for bodies in local block cache...")
 
-        return self._node.block_queuing_service.try_send_bodies_to_node(
-            block_hashes
+        return block_queuing_service.try_send_bodies_to_node(
+            block_hashes, request_key
         )
 
+    def _get_request_key(self, msg: EthProtocolMessage) -> bytes:
+        # message type separates headers and bodies requests with equal payloads
+        return bytes([msg.msg_type]) + bytes(msg.rawbytes())
+
     def _get_compressed_block_header_bytes(self, compressed_block_bytes: Union[bytearray, memoryview]) -> Union[
         bytearray, memoryview]:
         block_msg_bytes = compressed_block_bytes if isinstance(compressed_block_bytes, memoryview) else memoryview(compressed_block_bytes)
@@ -1,6 +1,6 @@
 import time
 from collections import defaultdict, deque
-from typing import TYPE_CHECKING, Dict, Set, List, Optional, Iterator, cast, Tuple, NamedTuple, \
+from typing import TYPE_CHECKING, Dict, List, Optional, Iterator, cast, Tuple, NamedTuple, \
     Deque, Callable
 
 from bxcommon import constants
@@ -8,7 +8,6 @@ from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxcommon.utils import memory_utils, crypto
 from bxcommon.utils.alarm_queue import AlarmId
-from bxcommon.utils.expiring_dict import ExpiringDict
 from bxcommon.utils.memory_utils import ObjectSize
 from bxcommon.utils.object_hash import Sha256Hash, NULL_SHA256_HASH
 from bxcommon.utils.stats import hooks
@@ -35,11 +34,15 @@ from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message impor
 )
 from bxgateway.services.abstract_block_queuing_service import AbstractBlockQueuingService, \
     BlockQueueEntry
+from bxgateway.utils.eth.eth_block_cache import EthBlockCache
+from bxgateway.utils.eth.eth_block_response_cache import EthBlockResponseCache
+from bxgateway.utils.eth.eth_block_tree import EthBlockTree
 from bxutils import logging
 
 if TYPE_CHECKING:
     from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
     from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
+    from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 
 logger = logging.get_logger(__name__)
 INITIAL_BLOCK_HEIGHT = -1
@@ -70,6 +73,12 @@ class EthBlockQueuingService(
     """
     Queues, pushes blocks to the Ethereum node, and handles get headers/bodies requests.
 
+    Stored blocks are indexed in a block tree, whose canonical chain follows the best block sent to the
+    Ethereum node. Header requests by height or hash are served from the canonical chain.
+    Block contents are kept in a memory-budgeted block cache, which compresses older blocks.
+    Headers and bodies responses are cached by request, and headers responses are invalidated when the
+    canonical chain reorganizes.
+
     If there are missing blocks in the network this class will not function optimally.
     """
     ordered_block_queue: Deque[OrderedQueuedBlock]
@@ -77,21 +86,17 @@ class EthBlockQueuingService(
     block_checking_alarms: Dict[Sha256Hash, AlarmId]
     block_check_repeat_count: Dict[Sha256Hash, int]
 
-    accepted_block_hash_at_height: ExpiringDict[int, Sha256Hash]
-    sent_block_at_height: ExpiringDict[int, Sha256Hash]
 
     # best block sent to the Ethereum node
     best_sent_block: SentEthBlockInfo
     # best block accepted by Ethereum node
     best_accepted_block: EthBlockInfo
 
-    _block_parts: ExpiringDict[Sha256Hash, NewBlockParts]
-    _block_hashes_by_height: ExpiringDict[int, Set[Sha256Hash]]
-    _height_by_block_hash: ExpiringDict[Sha256Hash, int]
-    _highest_block_number: int = 0
+    _block_cache: EthBlockCache
+    _block_tree: EthBlockTree
+    _response_cache: EthBlockResponseCache
     _recovery_alarms_by_block_hash: Dict[Sha256Hash, AlarmId]
     _next_push_alarm_id: Optional[AlarmId] = None
-    _partial_chainstate: Deque[EthBlockInfo]
 
     def __init__(self, node: "AbstractGatewayNode"):
         super().__init__(node)
@@ -101,50 +106,31 @@ class EthBlockQueuingService(
         self.block_checking_alarms = {}
         self.block_check_repeat_count = defaultdict(int)
 
-        self.accepted_block_hash_at_height = ExpiringDict(
-            node.alarm_queue,
-            gateway_constants.MAX_BLOCK_CACHE_TIME_S,
-            "eth_block_queue_accepted_block_by_height"
-        )
-        self.sent_block_at_height = ExpiringDict(
-            node.alarm_queue,
-            gateway_constants.MAX_BLOCK_CACHE_TIME_S,
-            "eth_block_queue_sent_block_at_height"
-        )
         self.best_sent_block = SentEthBlockInfo(INITIAL_BLOCK_HEIGHT, NULL_SHA256_HASH, 0)
         self.best_accepted_block = EthBlockInfo(INITIAL_BLOCK_HEIGHT, NULL_SHA256_HASH)
 
-        self._block_parts = ExpiringDict(
-            node.alarm_queue,
-            gateway_constants.MAX_BLOCK_CACHE_TIME_S,
-            "eth_block_queue_parts",
-        )
-        self._block_hashes_by_height = ExpiringDict(
-            node.alarm_queue,
+        self._block_cache = EthBlockCache(
+            node,
+            node.opts.eth_block_cache_max_size_mb * 1024 * 1024,
+            node.opts.eth_block_cache_uncompressed_heights,
             gateway_constants.MAX_BLOCK_CACHE_TIME_S,
-            "eth_block_queue_hashes_by_heights",
-        )
-        self._height_by_block_hash = ExpiringDict(
-            node.alarm_queue,
-            gateway_constants.MAX_BLOCK_CACHE_TIME_S,
-            "eth_block_queue_height_by_hash"
+            self._on_cached_block_compressed,
+            self._on_cached_block_evicted
         )
+        self._block_tree = EthBlockTree(node.alarm_queue, gateway_constants.MAX_BLOCK_CACHE_TIME_S)
+        self._response_cache = EthBlockResponseCache(node.opts.eth_block_response_cache_max_size_mb * 1024 * 1024)
         self._recovery_alarms_by_block_hash = {}
-        self._partial_chainstate = deque()
 
     def build_block_header_message(
         self, block_hash: Sha256Hash, block_message: InternalEthBlockInfo
     ) -> BlockHeadersEthProtocolMessage:
-        if block_hash in self._block_parts:
-            block_header_bytes = self._block_parts[
-                block_hash
-            ].block_header_bytes
-        else:
-            block_header_bytes = (
-                block_message.to_new_block_parts().block_header_bytes
-            )
+        block_parts = None
+        if not self._block_cache.is_compressed(block_hash):
+            block_parts = self._block_cache.get_block_parts(block_hash)
+        if block_parts is None:
+            block_parts = block_message.to_new_block_parts()
         return BlockHeadersEthProtocolMessage.from_header_bytes(
-            block_header_bytes
+            block_parts.block_header_bytes
         )
 
     def push(
@@ -253,6 +239,7 @@ class EthBlockQueuingService(
         block_hash: Sha256Hash,
         block_message: Optional[InternalEthBlockInfo],
         block_number: Optional[int] = None,
+        connection: Optional["AbstractGatewayBlockchainConnection"] = None,
     ) -> None:
         """
         Stores information about the block and marks the block heights to
@@ -265,17 +252,17 @@ class EthBlockQueuingService(
         if block_message is not None:
             self.store_block_data(block_hash, block_message)
             block_number = block_message.block_number()
-        if block_number is None and block_hash in self._height_by_block_hash:
-            block_number = self._height_by_block_hash[block_hash]
+        if block_number is None:
+            block_number = self._block_tree.get_block_number(block_hash)
 
         assert block_number is not None
 
-        super().mark_block_seen_by_blockchain_node(block_hash, block_message)
-        self.accepted_block_hash_at_height[block_number] = block_hash
+        super().mark_block_seen_by_blockchain_node(block_hash, block_message, connection=connection)
+        self._block_tree.mark_block_accepted(block_hash, block_number)
         best_height, _ = self.best_accepted_block
         if block_number >= best_height:
             self.best_accepted_block = EthBlockInfo(block_number, block_hash)
-            if block_message or block_hash in self._block_parts:
+            if block_message or block_hash in self._block_cache:
                 self.node.publish_block(
                     block_number, block_hash, block_message, FeedSource.BLOCKCHAIN_SOCKET
                 )
@@ -292,18 +279,18 @@ class EthBlockQueuingService(
 
     def remove(self, block_hash: Sha256Hash) -> int:
         index = super().remove(block_hash)
-        if block_hash in self._block_parts:
-            del self._block_parts[block_hash]
-            height = self._height_by_block_hash.contents.pop(block_hash, None)
-            logger.trace("Removing block {} at height {}", block_hash, height)
-            if height:
-                self._block_hashes_by_height.contents.get(
-                    height, set()
-                ).discard(block_hash)
+        self._block_cache.remove(block_hash)
+        if block_hash in self._block_tree:
+            logger.trace(
+                "Removing block {} at height {}", block_hash, self._block_tree.get_block_number(block_hash)
+            )
+            self._block_tree.remove(block_hash)
         return index
 
     def remove_from_queue(self, block_hash: Sha256Hash) -> int:
         index = super().remove_from_queue(block_hash)
+        if self._block_cache.is_compressed(block_hash):
+            self._on_cached_block_compressed(block_hash)
         for i in range(len(self.ordered_block_queue)):
             if self.ordered_block_queue[i].block_hash == block_hash:
                 del self.ordered_block_queue[i]
@@ -320,7 +307,9 @@ class EthBlockQueuingService(
         best_height, _best_hash, _ = self.best_sent_block
         assert block_number > best_height
 
-        new_block_parts = self._block_parts[block_hash]
+        new_block_parts = self._block_cache.get_block_parts(block_hash)
+        if new_block_parts is None:
+            new_block_parts = block_msg.to_new_block_parts()
 
         if block_msg.has_total_difficulty():
             new_block_msg = block_msg.to_new_block_msg()
@@ -355,73 +344,61 @@ class EthBlockQueuingService(
                 )
 
         self.node.log_blocks_network_content(self.node.network_num, block_msg)
-        self.sent_block_at_height[block_number] = block_hash
+        self._block_tree.mark_block_sent(block_hash, block_number)
         self.best_sent_block = SentEthBlockInfo(block_number, block_hash, time.time())
+        self._set_canonical_head(block_hash)
         self._schedule_confirmation_check(block_hash)
 
         if self.node.opts.filter_txs_factor > 0:
-            self.node.on_transactions_in_block(block_msg.to_new_block_msg().txns())
+            self.node.on_transactions_in_block(block_msg.get_gas_prices())
 
     def partial_chainstate(self, required_length: int) -> Deque[EthBlockInfo]:
         """
-        Builds a current chainstate based on the current head. Attempts to maintain
-        the minimal length required chainstate as required by the length from the
-        head as specified.
+        Builds the current chainstate from the canonical chain of the block tree,
+        which ends at the best block sent to the Ethereum node.
+
+        The chainstate extends back as far as the tree tracks connected blocks, so it
+        may be longer than required, or shorter if earlier blocks are not tracked.
 
-        :param required_length: length to extend partial chainstate to if needed
+        :param required_length: minimal length of chainstate requested
         """
-        best_sent_height, best_sent_hash, _ = self.best_sent_block
-        if best_sent_height == INITIAL_BLOCK_HEIGHT:
-            return deque()
-
-        if len(self._partial_chainstate) == 0:
-            self._partial_chainstate.append(EthBlockInfo(best_sent_height, best_sent_hash))
-
-        chain_head_height, chain_head_hash = self._partial_chainstate[-1]
-        if chain_head_hash != best_sent_hash:
-            height = best_sent_height
-            head_hash = best_sent_hash
-            missing_entries = deque()
-            while height > chain_head_height:
-
-                try:
-                    head = self._blocks[head_hash]
-                    if head is None:
-                        break
-                    missing_entries.appendleft(EthBlockInfo(height, head_hash))
-
-                    head_hash = head.prev_block_hash()
-                    height -= 1
-                except KeyError:
-                    break
+        self._update_canonical_head()
+        chainstate = deque(
+            EthBlockInfo(node.block_number, node.block_hash)
+            for node in self._block_tree.iterate_canonical_chain()
+        )
+        if len(chainstate) < required_length:
+            logger.trace(
+                "Chainstate is shorter than requested length {}: {} blocks.",
+                required_length,
+                len(chainstate)
+            )
+        return chainstate
 
-            # append to partial chain state
-            if head_hash == chain_head_height:
-                self._partial_chainstate.extend(missing_entries)
-            # reorganization is required, rebuild to expected length
-            else:
-                self._partial_chainstate = missing_entries
-
-        tail_height, tail_hash = self._partial_chainstate[0]
-        tail = self._blocks[tail_hash]
-        assert tail is not None
-
-        while len(self._partial_chainstate) < required_length:
-            try:
-                tail_hash = tail.prev_block_hash()
-                tail_height -= 1
-                tail = self._blocks[tail_hash]
-                if tail is None:
-                    break
-                self._partial_chainstate.appendleft(EthBlockInfo(tail_height, tail_hash))
-            except KeyError:
-                break
+    def is_response_cache_enabled(self) -> bool:
+        return self._response_cache.is_enabled()
 
-        return self._partial_chainstate
+    def try_send_cached_response_to_node(self, request_key: bytes) -> bool:
+        """
+        Sends cached headers or bodies response to blockchain connection.
+        :param request_key: encoded request parameters
+        :return: False if the response to the request is not cached
+        """
+        # invalidates headers responses if the best sent block moved
+        self._update_canonical_head()
+        response_msg = self._response_cache.get(request_key)
+        if response_msg is None:
+            return False
 
-    def try_send_bodies_to_node(self, block_hashes: List[Sha256Hash]) -> bool:
+        logger.trace("Sending cached response {} to blockchain node.", response_msg)
+        # TODO: Should only be sent to the node that requested (https://bloxroute.atlassian.net/browse/BX-1922)
+        self.node.broadcast(response_msg, connection_types=[ConnectionType.BLOCKCHAIN_NODE])
+        return True
+
+    def try_send_bodies_to_node(self, block_hashes: List[Sha256Hash], request_key: Optional[bytes] = None) -> bool:
         """
         Creates and sends block bodies to blockchain connection.
+        :param request_key: encoded request parameters to cache the response for, if any
         """
         bodies = []
         for block_hash in block_hashes:
@@ -429,26 +406,19 @@ class EthBlockQueuingService(
                 logger.debug("{} was not found in queue. Aborting.", block_hash)
                 return False
 
-            block_message = self._blocks[block_hash]
-            if block_message is None:
+            block_parts = self._block_cache.get_block_parts(block_hash)
+            if block_parts is None:
                 logger.debug("{} was not ready in the queue. Aborting", block_hash)
                 return False
 
-            if block_hash in self._block_parts:
-                block_body_bytes = self._block_parts[block_hash].block_body_bytes
-            else:
-                block_body_bytes = (
-                    block_message.to_new_block_parts().block_body_bytes
-                )
-
             partial_message = BlockBodiesEthProtocolMessage.from_body_bytes(
-                block_body_bytes
+                block_parts.block_body_bytes
             )
             block_bodies = partial_message.get_blocks()
             assert len(block_bodies) == 1
             bodies.append(block_bodies[0])
 
-            height = self._height_by_block_hash.contents.get(block_hash, None)
+            height = self._block_tree.get_block_number(block_hash)
             logger.debug(
                 "Appending {} body ({}) for sending to blockchain node.",
                 block_hash,
@@ -456,18 +426,25 @@ class EthBlockQueuingService(
             )
 
         full_message = BlockBodiesEthProtocolMessage(None, bodies)
+        if request_key is not None:
+            self._response_cache.add_bodies(request_key, full_message)
 
         # TODO: Should only be sent to the node that requested (https://bloxroute.atlassian.net/browse/BX-1922)
         self.node.broadcast(full_message, connection_types=[ConnectionType.BLOCKCHAIN_NODE])
         return True
 
-    def try_send_headers_to_node(self, block_hashes: List[Sha256Hash]) -> bool:
+    def try_send_headers_to_node(
+        self, block_hashes: List[Sha256Hash], request_key: Optional[bytes] = None, is_complete: bool = True
+    ) -> bool:
         """
         Creates and sends a block headers message to blockchain connection.
 
         In most cases, this method should be called with block hashes that are confirmed to
         exist in the block queuing service, but contains checks for safety for otherwise,
         and aborts the function if any headers are not found.
+
+        :param request_key: encoded request parameters to cache the response for, if any
+        :param is_complete: if the block hashes include all requested headers
         """
         headers = []
         for block_hash in block_hashes:
@@ -475,7 +452,7 @@ class EthBlockQueuingService(
                 logger.debug("{} was not found in queue. Aborting.", block_hash)
                 return False
 
-            block_message = self._blocks[block_hash]
+            block_message = self._get_block_message(block_hash)
             if block_message is None:
                 logger.debug("{} was not ready in the queue. Aborting", block_hash)
                 return False
@@ -487,7 +464,7 @@ class EthBlockQueuingService(
             assert len(block_headers) == 1
             headers.append(block_headers[0])
 
-            height = self._height_by_block_hash.contents.get(block_hash, None)
+            height = self._block_tree.get_block_number(block_hash)
             logger.debug(
                 "Appending {} header ({}) for sending to blockchain node.",
                 block_hash,
@@ -495,11 +472,22 @@ class EthBlockQueuingService(
             )
 
         full_header_message = BlockHeadersEthProtocolMessage(None, headers)
+        if request_key is not None:
+            self._response_cache.add_headers(request_key, full_header_message, block_hashes, is_complete)
 
         # TODO: Should only be sent to the node that requested (https://bloxroute.atlassian.net/browse/BX-1922)
         self.node.broadcast(full_header_message, connection_types=[ConnectionType.BLOCKCHAIN_NODE])
         return True
 
+    def get_accepted_block_hash_at_height(self, block_number: int) -> Optional[Sha256Hash]:
+        return self._block_tree.get_accepted_block_hash_at_height(block_number)
+
+    def get_block_receipts_root(self, block_hash: Sha256Hash) -> Optional[bytes]:
+        block_parts = self._block_cache.get_block_parts(block_hash)
+        if block_parts is None:
+            return None
+        return block_parts.get_receipts_root()
+
     def get_block_hashes_starting_from_hash(
         self, block_hash: Sha256Hash, max_count: int, skip: int, reverse: bool
     ) -> Tuple[bool, List[Sha256Hash]]:
@@ -509,19 +497,21 @@ class EthBlockQueuingService(
 
         Returns (success, [found_hashes])
         """
-        if block_hash not in self._blocks or self._blocks[block_hash] is None:
+        if block_hash not in self._blocks or block_hash not in self._block_cache:
             return False, []
 
         if block_hash in self._blocks_waiting_for_recovery and self._blocks_waiting_for_recovery[block_hash]:
             return False, []
 
-        best_height, _, _ = self.best_sent_block
-        starting_height = self._height_by_block_hash[block_hash]
-        look_back_length = best_height - starting_height + 1
-        partial_chainstate = self.partial_chainstate(look_back_length)
+        starting_height = self._block_tree.get_block_number(block_hash)
+        if starting_height is None:
+            return False, []
 
-        if not any(block_hash == chain_hash for _, chain_hash in partial_chainstate):
-            block_too_far_back = len(partial_chainstate) != look_back_length
+        self._update_canonical_head()
+        if not self._block_tree.is_canonical(block_hash):
+            best_height, _, _ = self.best_sent_block
+            tail_height = self._block_tree.get_canonical_tail_height()
+            block_too_far_back = tail_height is None or not tail_height <= starting_height <= best_height
             logger.trace(
                 "Block {} is not included in the current chainstate. "
                 "Returning empty set. Chainstate missing entries: {}",
@@ -559,58 +549,39 @@ class EthBlockQueuingService(
         block_hashes: List[Sha256Hash] = []
         height = block_height
         if reverse:
-            lowest_requested_height = block_height - (max_count * skip)
             multiplier = -1
         else:
-            lowest_requested_height = block_height
             multiplier = 1
 
-        chain_state: Optional[Set[Sha256Hash]] = None
+        self._update_canonical_head()
 
-        while (
-            len(block_hashes) < max_count
-            and height in self._block_hashes_by_height
-        ):
-            matching_hashes = self._block_hashes_by_height[height]
-
-            # A fork has occurred: give up, and fallback to
-            # remote blockchain sync
-            if len(matching_hashes) > 1:
-                logger.trace(
-                    "Detected fork when searching for {} "
-                    "block hashes starting from height {}.",
-                    max_count,
-                    block_height,
-                )
-                if chain_state is None:
-                    best_height, _, _ = self.best_sent_block
-                    partial_state = self.partial_chainstate(
-                        best_height - lowest_requested_height + 1
-                    )
-                    chain_state = set(block_hash for _, block_hash in partial_state)
+        while len(block_hashes) < max_count:
+            block_hash = self._block_tree.get_canonical_hash_at_height(height)
+            if block_hash is None:
+                matching_hashes = self._block_tree.get_block_hashes_at_height(height)
+                if not matching_hashes:
+                    break
 
-                for candidate_hash in matching_hashes:
-                    if candidate_hash in chain_state:
-                        block_hashes.append(candidate_hash)
-                        break
-                else:
+                # A fork has occurred outside of the canonical chain: give up,
+                # and fallback to remote blockchain sync
+                if len(matching_hashes) > 1:
                     logger.debug(
-                        "Unexpectedly, none of the blocks at height {} were part "
-                        "of the chainstate.",
-                        block_height
+                        "Detected fork outside of canonical chain when searching for {} "
+                        "block hashes starting from height {}.",
+                        max_count,
+                        block_height,
                     )
                     return False, []
-            else:
-                block_hashes.append(
-                    next(iter(matching_hashes))
-                )
+                block_hash = next(iter(matching_hashes))
+
+            block_hashes.append(block_hash)
             height += (1 + skip) * multiplier
 
         # If a block is requested too far in the past, abort and fallback
         # to remote blockchain sync
         if (
-            height < self._highest_block_number
-            and height not in self._block_hashes_by_height
+            height < self._block_tree.highest_block_number
+            and not self._block_tree.get_block_hashes_at_height(height)
             and max_count != len(block_hashes)
         ):
             return False, []
@@ -636,13 +607,7 @@ class EthBlockQueuingService(
         :param max_count: max number of elements to return
         :return: Iterator of block hashes in descending order
         """
-        block_hash_ = block_hash
-        for _ in range(max_count):
-            if block_hash_ and block_hash_ in self._block_parts:
-                yield block_hash_
-                block_hash_ = self._block_parts[block_hash_].get_previous_block_hash()
-            else:
-                break
+        return self._block_tree.iterate_ancestors(block_hash, max_count)
 
     def iterate_recent_block_hashes(
         self,
@@ -652,20 +617,20 @@ class EthBlockQueuingService(
         :param max_count:
         :return: Iterator[Sha256Hash] in descending order (last -> first)
         """
-        if self._highest_block_number not in self._block_hashes_by_height:
+        highest_block_number = self._block_tree.highest_block_number
+        block_hash = self._block_tree.get_heaviest_block_hash_at_height(highest_block_number)
+        if block_hash is None:
             return iter([])
-        block_hashes = self._block_hashes_by_height[self._highest_block_number]
-        block_hash = next(iter(block_hashes))
-        if len(block_hashes) > 1:
+        if len(self._block_tree.get_block_hashes_at_height(highest_block_number)) > 1:
             logger.debug(f"iterating over queued blocks starting for a possible fork {block_hash}")
 
         return self.iterate_block_hashes_starting_from_hash(block_hash, max_count=max_count)
 
     def get_block_parts(self, block_hash: Sha256Hash) -> Optional[NewBlockParts]:
-        if block_hash not in self._block_parts:
+        block_parts = self._block_cache.get_block_parts(block_hash)
+        if block_parts is None:
             logger.debug("requested transaction info for a block not in the queueing service {}", block_hash)
-            return None
-        return self._block_parts[block_hash]
+        return block_parts
 
     def get_block_body_from_message(self, block_hash: Sha256Hash) -> Optional[BlockBodiesEthProtocolMessage]:
         block_parts = self.get_block_parts(block_hash)
@@ -704,11 +669,66 @@ class EthBlockQueuingService(
             size_type=memory_utils.SizeType.ESTIMATE
         )
 
+        block_cache = self._block_cache
+        hooks.add_obj_mem_stats(
+            self.__class__.__name__,
+            self.node.network_num,
+            block_cache,
+            "block_queue_block_cache",
+            ObjectSize(
+                size=block_cache.total_size_bytes,
+                flat_size=0,
+                is_actual_size=False
+            ),
+            object_item_count=len(block_cache),
+            object_type=memory_utils.ObjectType.BASE,
+            size_type=memory_utils.SizeType.ESTIMATE
+        )
+        hooks.add_obj_mem_stats(
+            self.__class__.__name__,
+            self.node.network_num,
+            block_cache,
+            "block_queue_block_cache_compressed",
+            ObjectSize(
+                size=block_cache.compressed_size_bytes,
+                flat_size=0,
+                is_actual_size=False
+            ),
+            object_item_count=block_cache.compressed_count,
+            object_type=memory_utils.ObjectType.BASE,
+            size_type=memory_utils.SizeType.ESTIMATE
+        )
+        response_cache = self._response_cache
+        hooks.add_obj_mem_stats(
+            self.__class__.__name__,
+            self.node.network_num,
+            response_cache,
+            "block_queue_response_cache",
+            ObjectSize(
+                size=response_cache.total_size_bytes,
+                flat_size=0,
+                is_actual_size=False
+            ),
+            object_item_count=len(response_cache),
+            object_type=memory_utils.ObjectType.BASE,
+            size_type=memory_utils.SizeType.ESTIMATE
+        )
+        logger.debug(
+            "Block cache: {} blocks ({} compressed), {} of {} bytes used. Inflated: {}, failed inflations: {}, "
+            "evicted: {}.",
+            len(block_cache),
+            block_cache.compressed_count,
+            block_cache.total_size_bytes,
+            block_cache.max_size_bytes,
+            block_cache.inflated_count,
+            block_cache.inflation_failed_count,
+            block_cache.evicted_count
+        )
+
     def _store_block_parts(
         self, block_hash: Sha256Hash, block_message: InternalEthBlockInfo
     ) -> None:
         new_block_parts = block_message.to_new_block_parts()
-        self._block_parts[block_hash] = new_block_parts
         block_number = block_message.block_number()
         if block_number > 0:
             logger.trace(
@@ -716,17 +736,44 @@ class EthBlockQueuingService(
                 block_hash,
                 block_number,
             )
-            if block_number in self._block_hashes_by_height:
-                self._block_hashes_by_height[block_number].add(block_hash)
-            else:
-                self._block_hashes_by_height.add(block_number, {block_hash})
-            self._height_by_block_hash[block_hash] = block_number
-            if block_number > self._highest_block_number:
-                self._highest_block_number = block_number
+            self._block_tree.add(
+                block_hash,
+                block_number,
+                new_block_parts.get_previous_block_hash(),
+                new_block_parts.get_block_difficulty()
+            )
         else:
             logger.trace(
                 "No block height could be parsed for block: {}", block_hash
             )
+        self._block_cache.add(block_hash, block_message, new_block_parts)
+
+    def _get_block_message(self, block_hash: Sha256Hash) -> Optional[InternalEthBlockInfo]:
+        block_message = self._blocks.contents.get(block_hash)
+        if block_message is None:
+            block_message = self._block_cache.get_block_message(block_hash)
+        return block_message
+
+    def _on_cached_block_compressed(self, block_hash: Sha256Hash) -> None:
+        # release block message of blocks that are no longer queued, it is inflated from block cache on demand
+        if block_hash in self._blocks.contents and block_hash not in self._blocks_waiting_for_recovery:
+            self._blocks.contents[block_hash] = None
+
+    def _on_cached_block_evicted(self, block_hash: Sha256Hash) -> None:
+        if block_hash in self._blocks and block_hash not in self._blocks_waiting_for_recovery:
+            self.remove(block_hash)
+
+    def _update_canonical_head(self) -> None:
+        best_sent_height, best_sent_hash, _ = self.best_sent_block
+        if best_sent_height != INITIAL_BLOCK_HEIGHT:
+            self._set_canonical_head(best_sent_hash)
+
+    def _set_canonical_head(self, block_hash: Sha256Hash) -> None:
+        previous_head = self._block_tree.get_canonical_head()
+        self._block_tree.set_canonical_head(block_hash)
+        if previous_head != self._block_tree.get_canonical_head() and len(self._response_cache) > 0:
+            is_reorg = previous_head is not None and not self._block_tree.is_canonical(previous_head)
+            self._response_cache.on_canonical_head_changed(is_reorg, self._block_tree.is_canonical)
 
     def _schedule_confirmation_check(self, block_hash: Sha256Hash) -> None:
         self.block_checking_alarms[
@@ -785,7 +832,7 @@ class EthBlockQueuingService(
                 self.remove_from_queue(block_hash)
                 continue
 
-            block_msg = self._blocks[block_hash]
+            block_msg = self._get_block_message(block_hash)
             assert block_msg is not None
             self._try_immediate_send(block_hash, block_number, block_msg)
             _best_height, _best_hash, sent_time = self.best_sent_block
@@ -836,7 +883,7 @@ class EthBlockQueuingService(
             self._schedule_alarm_for_next_item()
             return
 
-        block_msg = self._blocks[block_hash]
+        block_msg = self._get_block_message(block_hash)
         self.remove_from_queue(block_hash)
 
         self.send_block_to_nodes(block_hash, block_msg)
@@ -850,7 +897,11 @@ class EthBlockQueuingService(
             block_hash
         )
         self.remove_from_queue(block_hash)
-        if block_hash in self._blocks and self._blocks[block_hash] is None:
+        if (
+            block_hash in self._blocks
+            and self._blocks[block_hash] is None
+            and block_hash not in self._block_cache
+        ):
             self.remove(block_hash)
 
     def _check_for_sent_or_queued_forked_block(self, block_hash: Sha256Hash, block_number: int) -> bool:
@@ -861,11 +912,8 @@ class EthBlockQueuingService(
         is_duplicate = False
         more_info = ""
         for queued_block_hash, timestamp in self._block_queue:
-            if (
-                not self._blocks_waiting_for_recovery[queued_block_hash]
-                and queued_block_hash in self._height_by_block_hash
-            ):
-                if block_number == self._height_by_block_hash[queued_block_hash]:
+            if not self._blocks_waiting_for_recovery[queued_block_hash]:
+                if block_number == self._block_tree.get_block_number(queued_block_hash):
                     logger.info(
                         "Fork detected at height {}. Setting aside block {} in favor of {}.",
                         block_number,
@@ -876,23 +924,24 @@ class EthBlockQueuingService(
                     is_duplicate = True
                     more_info = "already queued"
 
-        if block_number in self.sent_block_at_height:
+        sent_block_hash = self._block_tree.get_sent_block_hash_at_height(block_number)
+        if sent_block_hash is not None:
             logger.info(
                 "Fork detected at height {}. Setting aside block {} in favor of already sent {}.",
                 block_number,
                 block_hash,
-                self.sent_block_at_height[block_number]
+                sent_block_hash
             )
             is_duplicate = True
             more_info = "already sent"
 
-        if block_number in self.accepted_block_hash_at_height:
+        accepted_block_hash = self._block_tree.get_accepted_block_hash_at_height(block_number)
+        if accepted_block_hash is not None:
             logger.info(
                 "Fork detected at height {}. Setting aside block {} in favor of already accepted {}.",
                 block_number,
                 block_hash,
-                self.accepted_block_hash_at_height[block_number]
-
+                accepted_block_hash
             )
             is_duplicate = True
             more_info = "already accepted"
@@ -5,7 +5,7 @@ import task_pool_executor as tpe
 
 from bxcommon.messages.bloxroute.block_confirmation_message import BlockConfirmationMessage
 from bxcommon.services import extension_cleanup_service_helpers
-from bxcommon.services.transaction_service import TransactionService
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.utils.object_hash import Sha256Hash
 from bxcommon.utils.proxy.task_queue_proxy import TaskQueueProxy
 from bxgateway.services.eth.abstract_eth_block_cleanup_service import AbstractEthBlockCleanupService
@@ -36,7 +36,7 @@ class EthExtensionBlockCleanupService(AbstractEthBlockCleanupService):
             self,
             block_hash: Sha256Hash,
             transactions_list: Iterable[Sha256Hash],
-            transaction_service: TransactionService
+            transaction_service: GatewayTransactionService
          ) -> None:
         logger.debug("Processing block for cleanup: {}", block_hash)
         tx_hash_to_contents_len_before_cleanup = transaction_service.get_tx_hash_to_contents_len()
@@ -79,7 +79,7 @@ class EthExtensionBlockCleanupService(AbstractEthBlockCleanupService):
     #  `AbstractBlockCleanupService` inconsistently.
     def contents_cleanup(
             self,
-            transaction_service: TransactionService,
+            transaction_service: GatewayTransactionService,
             block_confirmation_message: BlockConfirmationMessage
      ):
         extension_cleanup_service_helpers.contents_cleanup(
@@ -0,0 +1,39 @@
+import time
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from bxgateway.services.abstract_thread_pool_task_service import AbstractThreadPoolTaskService
+
+
+class HandshakeCryptoTaskResult(NamedTuple):
+    result: Any
+    error: Optional[Exception]
+    queue_duration_s: float
+    crypto_duration_s: float
+
+
+class EthHandshakeCryptoService(AbstractThreadPoolTaskService[HandshakeCryptoTaskResult]):
+    """
+    Runs secp256k1 key agreement, signatures and ECIES of RLPx handshakes on a thread pool, so that handshakes
+    with several Ethereum nodes reconnecting at the same time do not stall the event loop. Each task operates on
+    the cipher of a single connection, and the connection does not touch the cipher until the callback is called.
+    Callbacks are always executed on the event loop thread.
+
+    Errors raised by a task are returned in the task result, so that the connection can be closed.
+    If the pool size is 0, tasks are executed inline and callbacks are called immediately.
+    """
+
+    def __init__(self, thread_count: int):
+        super(EthHandshakeCryptoService, self).__init__(thread_count, "eth_handshake_crypto")
+
+    def submit(self, callback: Callable[[HandshakeCryptoTaskResult], None], fn: Callable, *args) -> None:
+        self._submit(callback, fn, *args)
+
+    def _run_task(self, fn: Callable, args: Tuple, queue_duration_s: float) -> HandshakeCryptoTaskResult:
+        start_time = time.time()
+        try:
+            result = fn(*args)
+            error = None
+        except Exception as e:
+            result = None
+            error = e
+        return HandshakeCryptoTaskResult(result, error, queue_duration_s, time.time() - start_time)
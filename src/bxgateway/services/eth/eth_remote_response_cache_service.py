@@ -0,0 +1,286 @@
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional, Union
+
+from bxcommon.utils.blockchain_utils.eth import eth_common_utils, rlp_utils
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
+from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
+from bxgateway.messages.eth.protocol.get_node_data_eth_protocol_message import GetNodeDataEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_receipts_eth_protocol_message import GetReceiptsEthProtocolMessage
+from bxgateway.messages.eth.protocol.node_data_eth_protocol_message import NodeDataEthProtocolMessage
+from bxgateway.messages.eth.protocol.receipts_eth_protocol_message import ReceiptsEthProtocolMessage
+from bxgateway.utils.eth import eth_utils
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+CachedRequestMessage = Union[GetReceiptsEthProtocolMessage, GetNodeDataEthProtocolMessage]
+CachedResponseMessage = Union[ReceiptsEthProtocolMessage, NodeDataEthProtocolMessage]
+
+_RESPONSE_MSG_TYPES = {
+    EthProtocolMessageType.GET_RECEIPTS: EthProtocolMessageType.RECEIPTS,
+    EthProtocolMessageType.GET_NODE_DATA: EthProtocolMessageType.NODE_DATA,
+}
+
+
+class EthRemoteResponseCacheEntry:
+    """
+    Receipts of a block or a node data item, with the best block number when it was received.
+    """
+
+    __slots__ = ["item_bytes", "block_number"]
+
+    def __init__(self, item_bytes: bytes, block_number: int):
+        self.item_bytes = item_bytes
+        self.block_number = block_number
+
+
+class EthRemoteRequest:
+    """
+    Request proxied to the remote blockchain node, with connections that sent identical requests meanwhile.
+    """
+
+    __slots__ = ["request_key", "item_hashes", "requesting_connections", "request_time"]
+
+    def __init__(self, request_key: bytes, item_hashes: List[Sha256Hash]):
+        self.request_key = request_key
+        self.item_hashes = item_hashes
+        self.requesting_connections: List[AbstractGatewayBlockchainConnection] = []
+        self.request_time = time.time()
+
+
+class EthRemoteResponseCacheService:
+    """
+    Answers GetReceipts and GetNodeData requests of Ethereum nodes from recent responses of the remote
+    blockchain node, and shares one remote request between identical requests in flight.
+
+    Node data items are cached by the hash of their content. Receipts are cached by the hash of the requested
+    block, and are checked against the receipts root of the block header if the block is known. Entries are
+    only dropped once the best block moves `max_heights` past the block number at the time they were received,
+    or to stay within memory budget.
+
+    Ethereum responses carry no request ids, so proxied requests of each type are matched to responses in order.
+    Requests that are not answered within `ETH_REMOTE_REQUEST_COALESCING_TIMEOUT_S` are dropped. Responses are
+    only cached by request and forwarded to coalesced requests if they match the request: receipts responses
+    must have receipts of every requested block, and node data responses must contain requested items only.
+    """
+
+    _entries: "OrderedDict[Sha256Hash, EthRemoteResponseCacheEntry]"
+    _requests_in_flight: Dict[bytes, EthRemoteRequest]
+    _pending_requests_by_type: Dict[int, Deque[EthRemoteRequest]]
+
+    def __init__(
+        self,
+        max_size_bytes: int,
+        max_heights: int,
+        get_best_block_number: Callable[[], int],
+        get_receipts_root: Callable[[Sha256Hash], Optional[bytes]]
+    ):
+        """
+        :param max_size_bytes: memory budget for cached responses, 0 to disable the cache
+        :param max_heights: number of blocks after which cached responses are dropped
+        :param get_best_block_number: returns number of the best block of the blockchain node
+        :param get_receipts_root: returns receipts root of a block header, None if the header is not known
+        """
+        self.max_size_bytes = max_size_bytes
+        self.max_heights = max_heights
+        self.total_size_bytes = 0
+
+        self._get_best_block_number = get_best_block_number
+        self._get_receipts_root = get_receipts_root
+        self._pruned_block_number = 0
+        self._entries = OrderedDict()
+        self._requests_in_flight = {}
+        self._pending_requests_by_type = {
+            response_msg_type: deque() for response_msg_type in _RESPONSE_MSG_TYPES.values()
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_enabled(self) -> bool:
+        return self.max_size_bytes > 0
+
+    def try_process_request(
+        self, msg: CachedRequestMessage, requesting_connection: AbstractGatewayBlockchainConnection
+    ) -> bool:
+        """
+        Answers the request from cache, or attaches it to an identical request in flight.
+        Otherwise tracks the request, which has to be proxied to the remote node by the caller.
+        :return: True if the request does not need to be proxied
+        """
+        if not self.is_enabled():
+            return False
+
+        self._prune_old_entries()
+        response_msg_type = _RESPONSE_MSG_TYPES[msg.msg_type]
+        self._remove_expired_requests(response_msg_type)
+
+        item_hashes = self._get_requested_hashes(msg)
+        cached_items = []
+        for item_hash in item_hashes:
+            entry = self._entries.get(item_hash)
+            if entry is None:
+                break
+            self._entries.move_to_end(item_hash)
+            cached_items.append(entry.item_bytes)
+
+        if item_hashes and len(cached_items) == len(item_hashes):
+            requesting_connection.enqueue_msg(self._build_response(msg.msg_type, cached_items))
+            eth_gateway_stats_service.log_remote_request(cache_hit=True, coalesced=False)
+            return True
+
+        request_key = bytes([msg.msg_type]) + bytes(msg.rawbytes())
+        request = self._requests_in_flight.get(request_key)
+        if request is not None:
+            request.requesting_connections.append(requesting_connection)
+            eth_gateway_stats_service.log_remote_request(cache_hit=False, coalesced=True)
+            return True
+
+        request = EthRemoteRequest(request_key, item_hashes)
+        self._requests_in_flight[request_key] = request
+        self._pending_requests_by_type[response_msg_type].append(request)
+        eth_gateway_stats_service.log_remote_request(cache_hit=False, coalesced=False)
+        return False
+
+    def process_response(self, msg: CachedResponseMessage) -> None:
+        """
+        Caches response of the remote node, and forwards it to connections whose requests were attached
+        to the answered request. The connection that sent the request is answered by the proxy.
+        """
+        if not self.is_enabled():
+            return
+
+        items = [
+            bytes(item_bytes)
+            for item_bytes in rlp_utils.get_first_list_field_items_bytes(memoryview(msg.rawbytes()))
+        ]
+        block_number = self._get_best_block_number()
+        item_hashes = []
+        if msg.msg_type == EthProtocolMessageType.NODE_DATA:
+            for item_bytes in items:
+                item_hash = Sha256Hash(eth_common_utils.keccak_hash(self._get_item_content(item_bytes)))
+                item_hashes.append(item_hash)
+                self._add(item_hash, EthRemoteResponseCacheEntry(item_bytes, block_number))
+
+        self._remove_expired_requests(msg.msg_type)
+        pending_requests = self._pending_requests_by_type[msg.msg_type]
+        if not pending_requests:
+            return
+
+        request = pending_requests.popleft()
+        del self._requests_in_flight[request.request_key]
+
+        if msg.msg_type == EthProtocolMessageType.RECEIPTS:
+            # receipts of unknown blocks are skipped, so only a response with receipts of every block can be
+            # matched to the requested block hashes
+            matches_request = len(items) == len(request.item_hashes) and all(
+                self._receipts_match_block(block_hash, block_receipts_bytes)
+                for block_hash, block_receipts_bytes in zip(request.item_hashes, items)
+            )
+        else:
+            # the node may skip unknown items, but never returns more items or items that were not requested
+            matches_request = len(items) <= len(request.item_hashes) and \
+                set(item_hashes).issubset(request.item_hashes)
+
+        if not matches_request:
+            logger.debug(
+                "Response {} does not match the oldest request in flight. Not forwarding it to {} connections.",
+                msg, len(request.requesting_connections)
+            )
+            return
+
+        if msg.msg_type == EthProtocolMessageType.RECEIPTS:
+            for block_hash, block_receipts_bytes in zip(request.item_hashes, items):
+                self._add(block_hash, EthRemoteResponseCacheEntry(block_receipts_bytes, block_number))
+
+        if request.requesting_connections:
+            logger.trace(
+                "Forwarding {} to {} connections with coalesced requests.", msg, len(request.requesting_connections)
+            )
+        for requesting_connection in request.requesting_connections:
+            if requesting_connection.is_alive():
+                requesting_connection.enqueue_msg(msg)
+
+    def on_remote_connection_closed(self) -> None:
+        """
+        Requests in flight are not answered after the remote connection is closed.
+        """
+        self._requests_in_flight.clear()
+        for pending_requests in self._pending_requests_by_type.values():
+            pending_requests.clear()
+
+    def _add(self, item_hash: Sha256Hash, entry: EthRemoteResponseCacheEntry) -> None:
+        entry_size = len(entry.item_bytes)
+        if entry_size > self.max_size_bytes:
+            return
+
+        previous_entry = self._entries.pop(item_hash, None)
+        if previous_entry is not None:
+            self.total_size_bytes -= len(previous_entry.item_bytes)
+        self._entries[item_hash] = entry
+        self.total_size_bytes += entry_size
+
+        while self.total_size_bytes > self.max_size_bytes:
+            _, evicted_entry = self._entries.popitem(last=False)
+            self.total_size_bytes -= len(evicted_entry.item_bytes)
+
+    def _prune_old_entries(self) -> None:
+        best_block_number = self._get_best_block_number()
+        if best_block_number == self._pruned_block_number:
+            return
+        self._pruned_block_number = best_block_number
+
+        min_block_number = best_block_number - self.max_heights
+        for item_hash, entry in list(self._entries.items()):
+            if entry.block_number < min_block_number:
+                del self._entries[item_hash]
+                self.total_size_bytes -= len(entry.item_bytes)
+
+    def _get_requested_hashes(self, msg: CachedRequestMessage) -> List[Sha256Hash]:
+        return [
+            Sha256Hash(item_hash)
+            for item_hash in rlp_utils.get_first_list_field_items_bytes(
+                memoryview(msg.rawbytes()), remove_items_length_prefix=True
+            )
+        ]
+
+    def _receipts_match_block(self, block_hash: Sha256Hash, block_receipts_bytes: bytes) -> bool:
+        receipts_root = self._get_receipts_root(block_hash)
+        if receipts_root is None:
+            return True
+
+        receipts = [
+            bytes(receipt_bytes)
+            for receipt_bytes in rlp_utils.get_first_list_field_items_bytes(memoryview(block_receipts_bytes))
+        ]
+        return eth_utils.get_ordered_trie_root(receipts) == receipts_root
+
+    def _remove_expired_requests(self, response_msg_type: int) -> None:
+        """
+        Drops requests that were not answered in time, which are the oldest requests of their type
+        """
+        pending_requests = self._pending_requests_by_type[response_msg_type]
+        min_request_time = time.time() - gateway_constants.ETH_REMOTE_REQUEST_COALESCING_TIMEOUT_S
+        while pending_requests and pending_requests[0].request_time < min_request_time:
+            request = pending_requests.popleft()
+            del self._requests_in_flight[request.request_key]
+            logger.debug(
+                "Request to remote node was not answered in {} seconds. Dropping it.",
+                gateway_constants.ETH_REMOTE_REQUEST_COALESCING_TIMEOUT_S
+            )
+
+    def _get_item_content(self, item_bytes: bytes) -> memoryview:
+        item_bytes = memoryview(item_bytes)
+        _, item_length, item_start = rlp_utils.consume_length_prefix(item_bytes, 0)
+        return item_bytes[item_start:item_start + item_length]
+
+    def _build_response(self, request_msg_type: int, items: List[bytes]) -> EthProtocolMessage:
+        response_bytes = eth_utils.get_rlp_list_bytes(items)
+        if request_msg_type == EthProtocolMessageType.GET_RECEIPTS:
+            return ReceiptsEthProtocolMessage(response_bytes)
+        return NodeDataEthProtocolMessage(response_bytes)
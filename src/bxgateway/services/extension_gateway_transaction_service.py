@@ -1,5 +1,5 @@
 import struct
-from typing import List, Set, Union
+from typing import Iterable, List, Set, Union
 
 import task_pool_executor as tpe
 
@@ -14,7 +14,7 @@ from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
 from bxgateway.connections.ont.ont_gateway_node import OntGatewayNode
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService, \
-    ProcessTransactionMessageFromNodeResult, MissingTransactions
+    ProcessTransactionMessageFromNodeResult, MissingTransactions, BlockTransactionsRemovalResult
 
 
 class ExtensionGatewayTransactionService(ExtensionTransactionService, GatewayTransactionService):
@@ -170,3 +170,34 @@ class ExtensionGatewayTransactionService(ExtensionTransactionService, GatewayTra
             missing_transactions.add(MissingTransactions(short_id, transaction_hash))
 
         return missing_transactions
+
+    def remove_block_transactions(
+        self,
+        tx_hashes: Iterable[Sha256Hash],
+        short_ids: Iterable[int] = ()
+    ) -> BlockTransactionsRemovalResult:
+        """
+        Removes transactions of a confirmed block through the per-item transaction service methods,
+        since the transaction maps of the extension are kept in C++.
+        """
+        removed_short_ids: List[int] = []
+        unknown_tx_hashes: List[Sha256Hash] = []
+        tx_hashes_count = 0
+        for tx_hash in tx_hashes:
+            tx_short_ids = self.remove_transaction_by_tx_hash(tx_hash, force=True)
+            if tx_short_ids is None:
+                unknown_tx_hashes.append(tx_hash)
+            else:
+                removed_short_ids.extend(tx_short_ids)
+            tx_hashes_count += 1
+
+        short_ids_count = 0
+        removed_short_ids_set = set(removed_short_ids)
+        for short_id in short_ids:
+            if short_id not in removed_short_ids_set:
+                self.remove_transaction_by_short_id(short_id, remove_related_short_ids=True)
+                removed_short_ids_set.add(short_id)
+                removed_short_ids.append(short_id)
+            short_ids_count += 1
+
+        return BlockTransactionsRemovalResult(removed_short_ids, unknown_tx_hashes, tx_hashes_count, short_ids_count)
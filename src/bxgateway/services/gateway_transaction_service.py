@@ -1,4 +1,4 @@
-from typing import Union, cast, List, NamedTuple, Set, Optional, TYPE_CHECKING
+from typing import Union, cast, List, NamedTuple, Set, Optional, Iterable, TYPE_CHECKING
 
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.bloxroute.txs_message import TxsMessage
@@ -34,6 +34,13 @@ class MissingTransactions(NamedTuple):
     transaction_hash: Sha256Hash
 
 
+class BlockTransactionsRemovalResult(NamedTuple):
+    short_ids: List[int]
+    unknown_tx_hashes: List[Sha256Hash]
+    tx_hashes_count: int
+    short_ids_count: int
+
+
 class GatewayTransactionService(TransactionService):
 
     node: "AbstractGatewayNode"
@@ -144,6 +151,75 @@ class GatewayTransactionService(TransactionService):
 
         return missing_transactions
 
+    def remove_block_transactions(
+        self,
+        tx_hashes: Iterable[Sha256Hash],
+        short_ids: Iterable[int] = ()
+    ) -> BlockTransactionsRemovalResult:
+        """
+        Removes transactions of a confirmed block in one pass over the transaction service maps,
+        and aggregates the results.
+
+        Transactions are removed by hash first, together with all their short ids. Short ids that were not
+        removed with their transaction are removed with the transaction they are assigned to, and its other
+        short ids. Total contents size is updated once for the whole block.
+
+        :param tx_hashes: hashes of block transactions
+        :param short_ids: short ids of block transactions
+        :return: removed short ids, hashes of transactions that were not known and counts of processed items
+        """
+        tx_hash_to_cache_key = self._tx_hash_to_cache_key
+        tx_cache_key_to_short_ids = self._tx_cache_key_to_short_ids
+        tx_cache_key_to_contents = self._tx_cache_key_to_contents
+        short_id_to_tx_cache_key = self._short_id_to_tx_cache_key
+
+        removed_short_ids: List[int] = []
+        unknown_tx_hashes: List[Sha256Hash] = []
+        removed_contents_size = 0
+        tx_hashes_count = 0
+        for tx_hash in tx_hashes:
+            tx_cache_key = tx_hash_to_cache_key(tx_hash)
+            tx_short_ids = tx_cache_key_to_short_ids.pop(tx_cache_key, None)
+            if tx_short_ids is None:
+                unknown_tx_hashes.append(tx_hash)
+            else:
+                removed_short_ids.extend(tx_short_ids)
+            tx_contents = tx_cache_key_to_contents.pop(tx_cache_key, None)
+            if tx_contents is not None:
+                removed_contents_size += len(tx_contents)
+            tx_hashes_count += 1
+
+        for short_id in removed_short_ids:
+            short_id_to_tx_cache_key.pop(short_id, None)
+
+        short_ids_count = 0
+        removed_short_ids_set = set(removed_short_ids)
+        for short_id in short_ids:
+            short_ids_count += 1
+            if short_id in removed_short_ids_set:
+                continue
+            removed_short_ids_set.add(short_id)
+            removed_short_ids.append(short_id)
+
+            tx_cache_key = short_id_to_tx_cache_key.pop(short_id, None)
+            if tx_cache_key is None:
+                continue
+            for related_short_id in tx_cache_key_to_short_ids.pop(tx_cache_key, ()):
+                if related_short_id not in removed_short_ids_set:
+                    short_id_to_tx_cache_key.pop(related_short_id, None)
+                    removed_short_ids_set.add(related_short_id)
+                    removed_short_ids.append(related_short_id)
+            tx_contents = tx_cache_key_to_contents.pop(tx_cache_key, None)
+            if tx_contents is not None:
+                removed_contents_size += len(tx_contents)
+
+        self._total_tx_contents_size -= removed_contents_size
+        tx_assignment_expire_queue = self._tx_assignment_expire_queue
+        for short_id in removed_short_ids:
+            tx_assignment_expire_queue.remove(short_id)
+
+        return BlockTransactionsRemovalResult(removed_short_ids, unknown_tx_hashes, tx_hashes_count, short_ids_count)
+
     def set_transaction_contents_base(
         self,
         transaction_hash: Sha256Hash,
@@ -174,6 +250,7 @@ class GatewayTransactionService(TransactionService):
             transaction_contents,
             transaction_contents_length
         )
+        self.node.on_transaction_contents_added(wrap_sha256(transaction_hash))
         if transaction_contents is not None:
             self.node.log_txs_network_content(self.network_num, wrap_sha256(transaction_hash), transaction_contents)
             if call_set_contents:
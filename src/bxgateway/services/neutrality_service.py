@@ -15,6 +15,7 @@ from bxcommon.utils.stats.stat_block_type import StatBlockType
 from bxgateway import gateway_constants
 from bxgateway.gateway_constants import NeutralityPolicy
 from bxgateway.messages.gateway.block_propagation_request import BlockPropagationRequestMessage
+from bxgateway.services.block_crypto_service import BlockCryptoTaskResult
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -82,7 +83,7 @@ class NeutralityService(object):
         :param connection: connection initiating propagation
         :param block_info: original block hash, only provided if this is the original block
         :param from_peer: true if this message comes from another gateway. That means it is supposed to be encrypted
-        :return: broadcast message
+        :return: broadcast message, or None if the block is being encrypted off the event loop
         """
         if self._node.opts.encrypt_blocks or from_peer:
             broadcast_msg = self._propagate_encrypted_block_to_network(bx_block, connection, block_info)
@@ -100,27 +101,58 @@ class NeutralityService(object):
             requested_by_peer = False
 
         encrypt_start_datetime = datetime.datetime.utcnow()
+        block_crypto_service = self._node.block_crypto_service
+        if block_crypto_service.is_enabled():
+            block_crypto_service.encrypt(
+                bx_block,
+                lambda task_result: self._on_block_encrypted(
+                    task_result, bx_block, connection, block_info, block_hash, requested_by_peer,
+                    encrypt_start_datetime
+                )
+            )
+            return None
+
         encrypt_start_timestamp = time.time()
         encrypted_block, raw_cipher_hash = self._node.in_progress_blocks.encrypt_and_add_payload(bx_block)
-
-        compressed_size = len(bx_block)
-        encrypted_size = len(encrypted_block)
-
         encryption_details = "Encryption: {}; Size change: {}->{}bytes, {}".format(
             stats_format.timespan(encrypt_start_timestamp, time.time()),
-            compressed_size, encrypted_size,
-            stats_format.ratio(encrypted_size, compressed_size))
+            len(bx_block), len(encrypted_block),
+            stats_format.ratio(len(encrypted_block), len(bx_block)))
+
+        return self._broadcast_encrypted_block(
+            bx_block, encrypted_block, Sha256Hash(raw_cipher_hash), connection, block_info, block_hash,
+            requested_by_peer, encrypt_start_datetime, encryption_details
+        )
+
+    def _on_block_encrypted(self, task_result: BlockCryptoTaskResult, bx_block, connection, block_info, block_hash,
+                            requested_by_peer, encrypt_start_datetime):
+        encrypted_block = task_result.result
+        self._node.in_progress_blocks.add_key(encrypted_block.cipher_hash, encrypted_block.key)
+        self._node.in_progress_blocks.add_ciphertext(encrypted_block.cipher_hash, encrypted_block.ciphertext)
+
+        encrypted_size = len(encrypted_block.ciphertext)
+        encryption_details = "Encryption: {} (queued {}); Size change: {}->{}bytes, {}".format(
+            stats_format.duration(task_result.crypto_duration_s * 1000),
+            stats_format.duration(task_result.queue_duration_s * 1000),
+            len(bx_block), encrypted_size,
+            stats_format.ratio(encrypted_size, len(bx_block)))
+
+        self._broadcast_encrypted_block(
+            bx_block, encrypted_block.ciphertext, encrypted_block.cipher_hash, connection, block_info, block_hash,
+            requested_by_peer, encrypt_start_datetime, encryption_details
+        )
 
+    def _broadcast_encrypted_block(self, bx_block, encrypted_block, cipher_hash, connection, block_info, block_hash,
+                                   requested_by_peer, encrypt_start_datetime, encryption_details):
         block_stats.add_block_event_by_block_hash(block_hash,
                                                   BlockStatEventType.BLOCK_ENCRYPTED,
                                                   start_date_time=encrypt_start_datetime,
                                                   end_date_time=datetime.datetime.utcnow(),
                                                   network_num=self._node.network_num,
-                                                  matching_block_hash=convert.bytes_to_hex(raw_cipher_hash),
+                                                  matching_block_hash=convert.bytes_to_hex(cipher_hash.binary),
                                                   matching_block_type=StatBlockType.ENCRYPTED.value,
                                                   more_info=encryption_details)
 
-        cipher_hash = Sha256Hash(raw_cipher_hash)
         broadcast_message = BroadcastMessage(cipher_hash, self._node.network_num, is_encrypted=True,
                                              blob=encrypted_block)
 
@@ -3,7 +3,7 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING
 
 from bxcommon.connections.connection_type import ConnectionType
-from bxcommon.services.transaction_service import TransactionService
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.utils.object_hash import Sha256Hash
 
 from bxgateway.messages.ont.block_ont_message import BlockOntMessage
@@ -37,7 +37,7 @@ class AbstractOntBlockCleanupService(AbstractBlockCleanupService):
     def clean_block_transactions(
             self,
             block_msg: BlockOntMessage,
-            transaction_service: TransactionService
+            transaction_service: GatewayTransactionService
     ) -> None:
         pass
 
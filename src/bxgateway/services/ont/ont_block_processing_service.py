@@ -30,21 +30,24 @@ class OntBlockProcessingService(BlockProcessingService):
 
     def retry_broadcast_recovered_blocks(self, connection):
         if self._node.block_recovery_service.recovered_blocks and self._node.opts.has_fully_updated_tx_service:
-            for msg, recovered_txs_source in self._node.block_recovery_service.recovered_blocks:
+            for recovered_block in self._node.block_recovery_service.recovered_blocks:
+                msg = recovered_block.bx_block
                 is_consensus_msg, = struct.unpack_from("?", msg[8:9])
                 if is_consensus_msg and self._node.opts.is_consensus:
                     self._handle_decrypted_consensus_block(
                         msg,
                         connection,
                         recovered=True,
-                        recovered_txs_source=recovered_txs_source
+                        recovered_txs_source=recovered_block.recovered_txs_source,
+                        recovery_duration_s=recovered_block.recovery_duration_s
                     )
                 else:
                     self._handle_decrypted_block(
                         msg,
                         connection,
                         recovered=True,
-                        recovered_txs_source=recovered_txs_source
+                        recovered_txs_source=recovered_block.recovered_txs_source,
+                        recovery_duration_s=recovered_block.recovery_duration_s
                     )
 
             self._node.block_recovery_service.clean_up_recovered_blocks()
@@ -55,7 +58,8 @@ class OntBlockProcessingService(BlockProcessingService):
         connection: AbstractRelayConnection,
         encrypted_block_hash_hex: Optional[str] = None,
         recovered: bool = False,
-        recovered_txs_source: Optional[RecoveredTxsSource] = None
+        recovered_txs_source: Optional[RecoveredTxsSource] = None,
+        recovery_duration_s: Optional[float] = None
     ):
         is_consensus_msg, = struct.unpack_from("?", bx_block[8:9])
         if is_consensus_msg and self._node.opts.is_consensus:
@@ -64,7 +68,8 @@ class OntBlockProcessingService(BlockProcessingService):
                 connection,
                 encrypted_block_hash_hex,
                 recovered,
-                recovered_txs_source
+                recovered_txs_source,
+                recovery_duration_s
             )
         else:
             return super()._handle_decrypted_block(
@@ -72,7 +77,8 @@ class OntBlockProcessingService(BlockProcessingService):
                 connection,
                 encrypted_block_hash_hex,
                 recovered,
-                recovered_txs_source
+                recovered_txs_source,
+                recovery_duration_s
             )
 
     def _handle_decrypted_consensus_block(
@@ -81,7 +87,8 @@ class OntBlockProcessingService(BlockProcessingService):
         connection: AbstractRelayConnection,
         encrypted_block_hash_hex: Optional[str] = None,
         recovered: bool = False,
-        recovered_txs_source: Optional[RecoveredTxsSource] = None
+        recovered_txs_source: Optional[RecoveredTxsSource] = None,
+        recovery_duration_s: Optional[float] = None
     ):
         transaction_service = self._node.get_tx_service()
 
@@ -122,7 +129,9 @@ class OntBlockProcessingService(BlockProcessingService):
                                                       BlockStatEventType.BLOCK_RECOVERY_COMPLETED,
                                                       network_num=connection.network_num,
                                                       broadcast_type=BroadcastMessageType.CONSENSUS,
-                                                      more_info=str(recovered_txs_source))
+                                                      more_info=self._get_recovery_completed_info(
+                                                          recovered_txs_source, recovery_duration_s
+                                                      ))
 
         if block_hash in self._node.blocks_seen.contents:
             block_stats.add_block_event_by_block_hash(block_hash, BlockStatEventType.BLOCK_DECOMPRESSED_IGNORE_SEEN,
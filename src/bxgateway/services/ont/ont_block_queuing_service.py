@@ -23,6 +23,7 @@ from bxutils import logging
 if TYPE_CHECKING:
     from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
     from bxgateway.connections.ont.ont_gateway_node import OntGatewayNode
+    from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 
 logger = logging.get_logger(__name__)
 
@@ -186,6 +187,7 @@ class OntBlockQueuingService(
         block_hash: Sha256Hash,
         block_message: Optional[Union[BlockOntMessage, OntConsensusMessage]] = None,
         _block_number: Optional[int] = None,
+        _connection: Optional["AbstractGatewayBlockchainConnection"] = None,
     ):
         self._blocks_seen_by_blockchain_node.add(block_hash)
 
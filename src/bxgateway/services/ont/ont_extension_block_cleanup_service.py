@@ -8,7 +8,7 @@ from bxutils.logging.log_record_type import LogRecordType
 
 from bxcommon.services.extension_transaction_service import ExtensionTransactionService
 from bxcommon.messages.bloxroute.block_confirmation_message import BlockConfirmationMessage
-from bxcommon.services.transaction_service import TransactionService
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.utils.proxy.task_queue_proxy import TaskQueueProxy
 from bxcommon.utils.proxy import task_pool_proxy
 from bxcommon.utils import convert
@@ -43,7 +43,7 @@ class OntExtensionBlockCleanupService(AbstractOntBlockCleanupService):
         self.block_confirmation_cleanup_tasks = TaskQueueProxy(create_block_confirmation_cleanup_task)
 
     def clean_block_transactions(
-            self, block_msg: BlockOntMessage, transaction_service: TransactionService
+            self, block_msg: BlockOntMessage, transaction_service: GatewayTransactionService
     ) -> None:
         start_datetime = datetime.utcnow()
         start_time = time.time()
@@ -107,7 +107,7 @@ class OntExtensionBlockCleanupService(AbstractOntBlockCleanupService):
     #  `AbstractBlockCleanupService` inconsistently.
     def contents_cleanup(
         self,
-        transaction_service: TransactionService,
+        transaction_service: GatewayTransactionService,
         block_confirmation_message: BlockConfirmationMessage
     ):
         extension_cleanup_service_helpers.contents_cleanup(
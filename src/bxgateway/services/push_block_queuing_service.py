@@ -1,9 +1,13 @@
 import time
 from abc import abstractmethod, ABCMeta
-from typing import Optional, TYPE_CHECKING, List, Generic, Callable
+from collections import deque
+from typing import Optional, TYPE_CHECKING, List, Generic, Callable, Deque, Dict, NamedTuple
 
 from bxcommon import constants
+from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.messages.abstract_block_message import AbstractBlockMessage
 from bxcommon.utils.alarm_queue import AlarmId
+from bxcommon.utils.expiring_set import ExpiringSet
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import gateway_constants
 from bxgateway.services.abstract_block_queuing_service import (
@@ -15,10 +19,47 @@ from bxutils import logging
 
 if TYPE_CHECKING:
     from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+    from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 
 logger = logging.get_logger(__name__)
 
 
+class NodeBlockQueueEntry(NamedTuple):
+    block_hash: Sha256Hash
+    block_message: AbstractBlockMessage
+    timestamp: float
+
+
+class NodeBlockQueue:
+    """
+    Blocks waiting to be sent to a single blockchain node, with the node's own readiness state.
+    Entries of all node queues reference the same block message, so the block is serialized once.
+    """
+
+    connection: "AbstractGatewayBlockchainConnection"
+    blocks: Deque[NodeBlockQueueEntry]
+    blocks_seen: ExpiringSet[Sha256Hash]
+    blocks_sent: ExpiringSet[Sha256Hash]
+    last_block_sent_time: float
+    alarm_id: Optional[AlarmId]
+
+    def __init__(self, node: "AbstractGatewayNode", connection: "AbstractGatewayBlockchainConnection") -> None:
+        self.connection = connection
+        self.blocks = deque(maxlen=gateway_constants.BLOCK_QUEUE_LENGTH_LIMIT)
+        self.blocks_seen = ExpiringSet(
+            node.alarm_queue,
+            gateway_constants.GATEWAY_BLOCKS_SEEN_EXPIRATION_TIME_S,
+            "node_block_queue_blocks_seen",
+        )
+        self.blocks_sent = ExpiringSet(
+            node.alarm_queue,
+            gateway_constants.GATEWAY_BLOCKS_SEEN_EXPIRATION_TIME_S,
+            "node_block_queue_blocks_sent",
+        )
+        self.last_block_sent_time = 0.0
+        self.alarm_id = None
+
+
 class PushBlockQueuingService(
     AbstractBlockQueuingService[TBlockMessage, THeaderMessage],
     Generic[TBlockMessage, THeaderMessage],
@@ -39,6 +80,11 @@ class PushBlockQueuingService(
     This implementation actively pushes new blocks to the blockchain node
     (as opposed to a "pull-based" approach that sends announcements and lets
     blockchain nodes request them).
+
+    If gateway is connected to multiple blockchain nodes, blocks released from
+    the queue are passed to a queue per node, which applies the rules above
+    to each node independently. Blocks reach nodes that are in sync right away
+    without waiting for lagging nodes.
     """
 
     def __init__(self, node: "AbstractGatewayNode"):
@@ -47,6 +93,13 @@ class PushBlockQueuingService(
 
         self._last_block_sent_time: float = 0.0
         self._last_alarm_id: Optional[AlarmId] = None
+        self._node_queues: Dict["AbstractGatewayBlockchainConnection", NodeBlockQueue] = {}
+        # blocks sent to the blockchain node while the gateway is connected to a single node
+        self._blocks_sent_to_node: ExpiringSet[Sha256Hash] = ExpiringSet(
+            node.alarm_queue,
+            gateway_constants.GATEWAY_BLOCKS_SEEN_EXPIRATION_TIME_S,
+            "push_block_queuing_service_blocks_sent",
+        )
 
     @abstractmethod
     def get_previous_block_hash_from_message(
@@ -105,24 +158,62 @@ class PushBlockQueuingService(
                 self._schedule_alarm_for_next_item()
 
     def mark_blocks_seen_by_blockchain_node(
-        self, block_hashes: List[Sha256Hash]
+        self,
+        block_hashes: List[Sha256Hash],
+        connection: Optional["AbstractGatewayBlockchainConnection"] = None
     ) -> None:
         """
         Marks blocks seen and retries the top block(s).
+
+        :param block_hashes: block hashes
+        :param connection: blockchain node connection that announced the blocks, if known
         """
         for block_hash in block_hashes:
             self.mark_block_seen_by_blockchain_node(block_hash, None)
+        self._mark_blocks_seen_by_node_queue(block_hashes, connection)
+
         self._retry_send()
 
     def mark_block_seen_by_blockchain_node(
         self,
         block_hash: Sha256Hash,
         block_message: Optional[TBlockMessage],
-        block_number: Optional[int] = None
+        block_number: Optional[int] = None,
+        connection: Optional["AbstractGatewayBlockchainConnection"] = None
     ) -> None:
         super().mark_block_seen_by_blockchain_node(block_hash, block_message)
         self._blocks_seen_by_blockchain_node.add(block_hash)
         self.remove_from_queue(block_hash)
+        self._mark_blocks_seen_by_node_queue([block_hash], connection)
+
+    def is_block_sent_to_node(
+        self, block_hash: Sha256Hash, connection: "AbstractGatewayBlockchainConnection"
+    ) -> bool:
+        """
+        Checks if the block was already sent to, or seen by, the blockchain node of the connection
+
+        :param block_hash: block hash
+        :param connection: blockchain node connection
+        """
+        node_queue = self._node_queues.get(connection)
+        if node_queue is not None:
+            return block_hash in node_queue.blocks_sent or block_hash in node_queue.blocks_seen
+        return block_hash in self._blocks_sent_to_node or block_hash in self._blocks_seen_by_blockchain_node
+
+    def mark_block_sent_to_node(
+        self, block_hash: Sha256Hash, connection: "AbstractGatewayBlockchainConnection"
+    ) -> None:
+        """
+        Records a block sent to the blockchain node of the connection outside of the block queue
+
+        :param block_hash: block hash
+        :param connection: blockchain node connection
+        """
+        node_queue = self._node_queues.get(connection)
+        if node_queue is not None:
+            node_queue.blocks_sent.add(block_hash)
+        else:
+            self._blocks_sent_to_node.add(block_hash)
 
     def send_block_to_nodes(
         self, block_hash: Sha256Hash, block_msg: Optional[TBlockMessage] = None
@@ -139,6 +230,93 @@ class PushBlockQueuingService(
         #  bxcommon.messages.abstract_message.AbstractMessage)]]`.
         self.on_block_sent(block_hash, block_msg)
 
+    def _broadcast_block_to_nodes(self, block_hash: Sha256Hash, block_msg: TBlockMessage) -> None:
+        connections = list(self.node.connection_pool.get_by_connection_types([ConnectionType.BLOCKCHAIN_NODE]))
+        if len(connections) <= 1:
+            self._node_queues.clear()
+            if block_hash not in self._blocks_sent_to_node:
+                super(PushBlockQueuingService, self)._broadcast_block_to_nodes(block_hash, block_msg)
+                self._blocks_sent_to_node.add(block_hash)
+            return
+
+        for connection in list(self._node_queues):
+            if connection not in connections:
+                node_queue = self._node_queues.pop(connection)
+                if node_queue.alarm_id is not None:
+                    self.node.alarm_queue.unregister_alarm(node_queue.alarm_id)
+
+        # serialize once, all node queues share the message buffer
+        block_msg.rawbytes()
+        entry = NodeBlockQueueEntry(block_hash, block_msg, time.time())
+        for connection in connections:
+            node_queue = self._node_queues.get(connection)
+            if node_queue is None:
+                node_queue = NodeBlockQueue(self.node, connection)
+                self._node_queues[connection] = node_queue
+            node_queue.blocks.append(entry)
+            self._send_node_queue_blocks(node_queue)
+
+    def _mark_blocks_seen_by_node_queue(
+        self, block_hashes: List[Sha256Hash], connection: Optional["AbstractGatewayBlockchainConnection"]
+    ) -> None:
+        """
+        Marks blocks seen by the blockchain node of the connection, and sends blocks that were waiting for them
+        """
+        node_queue = self._node_queues.get(connection) if connection is not None else None
+        if node_queue is None:
+            return
+
+        for block_hash in block_hashes:
+            node_queue.blocks_seen.add(block_hash)
+        self._send_node_queue_blocks(node_queue)
+
+    def _send_node_queue_blocks(self, node_queue: NodeBlockQueue) -> None:
+        connection = node_queue.connection
+        blocks = node_queue.blocks
+        while blocks:
+            block_hash, block_msg, timestamp = blocks[0]
+            current_time = time.time()
+            if block_hash in node_queue.blocks_seen or block_hash in node_queue.blocks_sent:
+                blocks.popleft()
+                continue
+            if current_time - timestamp >= self.node.opts.blockchain_message_ttl:
+                logger.debug(
+                    "Skipping block {} for {}, since {:.2f}s have passed since queuing the block.",
+                    block_hash, connection, current_time - timestamp
+                )
+                blocks.popleft()
+                continue
+
+            if not self._can_send_block_message_to_node(node_queue, block_msg):
+                if node_queue.alarm_id is None:
+                    timeout = self.node.opts.max_block_interval_s - (
+                        current_time - node_queue.last_block_sent_time
+                    )
+                    node_queue.alarm_id = self.node.alarm_queue.register_alarm(
+                        max(timeout, 0), self._on_node_queue_alarm, node_queue
+                    )
+                return
+
+            blocks.popleft()
+            logger.trace("Sending block {} to {}.", block_hash, connection)
+            connection.enqueue_msg(block_msg)
+            node_queue.blocks_sent.add(block_hash)
+            node_queue.last_block_sent_time = current_time
+
+    def _can_send_block_message_to_node(self, node_queue: NodeBlockQueue, block_message: TBlockMessage) -> bool:
+        if node_queue.last_block_sent_time == 0.0:
+            return True
+        if time.time() - node_queue.last_block_sent_time >= self.node.opts.max_block_interval_s:
+            return True
+        # pyre-fixme[6]: Expected `TBlockMessage` for 1st param but got `AbstractBlockMessage`.
+        return self.get_previous_block_hash_from_message(block_message) in node_queue.blocks_seen
+
+    def _on_node_queue_alarm(self, node_queue: NodeBlockQueue) -> int:
+        node_queue.alarm_id = None
+        if self._node_queues.get(node_queue.connection) is node_queue:
+            self._send_node_queue_blocks(node_queue)
+        return constants.CANCEL_ALARMS
+
     def remove_from_queue(self, block_hash: Sha256Hash) -> int:
         index = super().remove_from_queue(block_hash)
 
@@ -1,9 +1,12 @@
+import asyncio
 from argparse import Namespace
+from typing import Callable
 from unittest.mock import MagicMock
 
 from bxcommon import constants
 from bxcommon.models.node_type import NodeType
 from bxcommon.models.quota_type_model import QuotaType
+from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxcommon.test_utils.helpers import COOKIE_FILE_PATH, get_common_opts, \
     BTC_COMPACT_BLOCK_DECOMPRESS_MIN_TX_COUNT
 from bxgateway import argument_parsers
@@ -157,6 +160,20 @@ def get_gateway_opts(
             "filter_txs_factor": filter_txs_factor,
             "min_peer_relays_count": None,
             "should_restart_on_high_memory": should_restart_on_high_memory,
+            "block_crypto_threads": 0,
+            "eth_block_cache_max_size_mb": 256,
+            "eth_block_cache_uncompressed_heights": 0,
+            "eth_block_response_cache_max_size_mb": 0,
+            "eth_remote_response_cache_max_size_mb": 0,
+            "btc_short_id_index": False,
+            "block_cleanup_time_budget_ms": 0,
+            "btc_headers_first_relay": False,
+            "inventory_request_batch_interval_ms": 0,
+            "eth_frame_size": eth_common_constants.DEFAULT_FRAME_SIZE,
+            "eth_handshake_crypto_threads": 0,
+            "eth_snappy_compression": False,
+            "eth_pooled_tx_announcements": False,
+            "eth_bdn_tx_announcements": False,
         }
     )
 
@@ -221,3 +238,16 @@ def get_gateway_opts(
         "blockchain_block_hold_timeout_s": blockchain_block_hold_timeout_s,
     })
     return gateway_opts
+
+
+def run_event_loop_until(
+    event_loop: asyncio.AbstractEventLoop, condition: Callable[[], bool], timeout_s: float = 5
+) -> None:
+    """
+    Runs the event loop until the condition is met, so that callbacks of tasks run on thread pools are executed.
+    """
+    async def wait_for_condition():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    event_loop.run_until_complete(asyncio.wait_for(wait_for_condition(), timeout_s))
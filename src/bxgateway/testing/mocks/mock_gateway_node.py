@@ -4,7 +4,6 @@ from typing import Optional, List, Union
 from mock import MagicMock
 
 from bxcommon.connections.connection_type import ConnectionType
-from bxcommon.messages.eth.serializers.transaction import Transaction
 from bxcommon.models.node_type import NodeType
 from bxcommon.network.abstract_socket_connection_protocol import AbstractSocketConnectionProtocol
 from bxcommon.services.transaction_service import TransactionService
@@ -21,6 +20,8 @@ from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
 from bxgateway.services.btc.abstract_btc_block_cleanup_service import AbstractBtcBlockCleanupService
 from bxgateway.services.btc.btc_block_queuing_service import BtcBlockQueuingService
+from bxgateway.services.eth.eth_handshake_crypto_service import EthHandshakeCryptoService
+from bxgateway.services.eth.eth_remote_response_cache_service import EthRemoteResponseCacheService
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxgateway.services.push_block_queuing_service import PushBlockQueuingService
 from bxgateway.testing.mocks.mock_blockchain_connection import MockMessageConverter
@@ -67,6 +68,10 @@ class MockGatewayNode(AbstractGatewayNode):
         self.requester = MagicMock()
         self.has_active_blockchain_peer = MagicMock(return_value=True)
         self.min_tx_from_node_gas_price = MagicMock()
+        self.handshake_crypto_service = EthHandshakeCryptoService(0)
+        self.remote_response_cache_service = EthRemoteResponseCacheService(
+            opts.eth_remote_response_cache_max_size_mb * 1024 * 1024, 0, lambda: 0, lambda _block_hash: None
+        )
 
     def broadcast(self, msg, broadcasting_conn=None, prepend_to_queue=False, connection_types=None):
         if connection_types is None:
@@ -112,5 +117,5 @@ class MockGatewayNode(AbstractGatewayNode):
         return _MockCleanupService(self)
 
     # Ethereum only method
-    def on_transactions_in_block(self, transactions: List[Transaction]) -> None:
+    def on_transactions_in_block(self, gas_prices: List[int]) -> None:
         pass
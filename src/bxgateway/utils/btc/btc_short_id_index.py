@@ -0,0 +1,102 @@
+import sys
+from typing import Collection, Dict, Iterable, List, Optional
+
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.utils.btc import btc_short_id_matcher
+from bxgateway.utils.btc.btc_short_id_matcher import TX_HASH_LEN
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+# compact slots once more than this fraction of them are free
+MAX_FREE_SLOTS_RATIO = 0.5
+MIN_SLOTS_TO_COMPACT = 1024
+
+
+class BtcShortIdIndex:
+    """
+    Index of transaction service hashes for matching BIP152 compact block short ids.
+
+    Transaction ids (byte-reversed transaction hashes) are packed into one contiguous buffer as transactions
+    are added, so matching a compact block only computes the keyed SipHash over the buffer instead of
+    iterating and repacking all transaction service hashes.
+    Slots of removed transactions are reused by new ones.
+    """
+
+    _tx_ids: bytearray
+    _tx_hashes: List[Optional[Sha256Hash]]
+    _slots_by_tx_hash: Dict[Sha256Hash, int]
+    _free_slots: List[int]
+
+    def __init__(self):
+        self._tx_ids = bytearray()
+        self._tx_hashes = []
+        self._slots_by_tx_hash = {}
+        self._free_slots = []
+
+    def __contains__(self, tx_hash: Sha256Hash) -> bool:
+        return tx_hash in self._slots_by_tx_hash
+
+    def __len__(self) -> int:
+        return len(self._slots_by_tx_hash)
+
+    def add(self, tx_hash: Sha256Hash) -> None:
+        if tx_hash in self._slots_by_tx_hash:
+            return
+
+        tx_id = btc_short_id_matcher.to_tx_id(tx_hash)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            offset = slot * TX_HASH_LEN
+            self._tx_ids[offset:offset + TX_HASH_LEN] = tx_id
+            self._tx_hashes[slot] = tx_hash
+        else:
+            slot = len(self._tx_hashes)
+            self._tx_ids.extend(tx_id)
+            self._tx_hashes.append(tx_hash)
+        self._slots_by_tx_hash[tx_hash] = slot
+
+    def remove(self, tx_hash: Sha256Hash) -> None:
+        slot = self._slots_by_tx_hash.pop(tx_hash, None)
+        if slot is None:
+            return
+        self._tx_hashes[slot] = None
+        self._free_slots.append(slot)
+
+        slots_count = len(self._tx_hashes)
+        if slots_count >= MIN_SLOTS_TO_COMPACT and len(self._free_slots) > slots_count * MAX_FREE_SLOTS_RATIO:
+            self._compact()
+
+    def rebuild(self, tx_hashes: Iterable[Sha256Hash]) -> None:
+        """
+        Replaces indexed transactions, e.g. to warm up the index from transaction service contents
+        or drop transactions removed from transaction service without going through the index.
+        """
+        self._tx_ids = bytearray()
+        self._tx_hashes = []
+        self._slots_by_tx_hash = {}
+        self._free_slots = []
+        for tx_hash in tx_hashes:
+            self.add(tx_hash)
+
+    def match_short_ids(self, key: bytes, short_ids: Collection[bytes]) -> Dict[bytes, Sha256Hash]:
+        """
+        :param key: 16 bytes SipHash key of the compact block
+        :param short_ids: 6 bytes short ids of the compact block
+        :return: dictionary of matched short id to transaction hash
+        """
+        return btc_short_id_matcher.match_short_ids(key, self._tx_hashes, short_ids, self._tx_ids)
+
+    def get_size_bytes(self) -> int:
+        return (
+            sys.getsizeof(self._tx_ids)
+            + sys.getsizeof(self._tx_hashes)
+            + sys.getsizeof(self._slots_by_tx_hash)
+            + sys.getsizeof(self._free_slots)
+        )
+
+    def _compact(self) -> None:
+        logger.trace(
+            "Compacting short id index. {} transactions in {} slots.", len(self._slots_by_tx_hash), len(self._tx_hashes)
+        )
+        self.rebuild([tx_hash for tx_hash in self._tx_hashes if tx_hash is not None])
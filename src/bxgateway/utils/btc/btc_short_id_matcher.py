@@ -0,0 +1,180 @@
+"""
+Batched BIP152 short id computation for matching compact block short ids against the transaction service.
+
+Short ids are the lower 6 bytes of SipHash-2-4 of the transaction id, keyed with the first 16 bytes of
+sha256(block header + nonce). When NumPy is available, SipHash is computed for all transaction hashes in one
+vectorized pass over uint64 lanes. Otherwise, short ids are computed one by one with csiphash.
+"""
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from csiphash import siphash24
+
+from bxcommon.utils.object_hash import Sha256Hash
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SHORT_ID_MASK = (1 << 48) - 1
+TX_HASH_LEN = 32
+
+_SIPHASH_V0 = 0x736f6d6570736575
+_SIPHASH_V1 = 0x646f72616e646f6d
+_SIPHASH_V2 = 0x6c7967656e657261
+_SIPHASH_V3 = 0x7465646279746573
+# last SipHash block of a 32 bytes message only contains the message length in its highest byte
+_SIPHASH_32_BYTES_LAST_BLOCK = TX_HASH_LEN << 56
+
+
+def is_vectorized() -> bool:
+    return numpy is not None
+
+
+def short_id_to_int(short_id: Union[bytes, bytearray, memoryview]) -> int:
+    return int.from_bytes(short_id, "little")
+
+
+def to_tx_id(tx_hash: Sha256Hash) -> bytes:
+    """
+    Transaction service hashes are byte-reversed transaction ids.
+    """
+    return bytes(tx_hash.binary[::-1])
+
+
+def pack_tx_ids(tx_hashes: Iterable[Sha256Hash]) -> bytes:
+    """
+    Packs transaction ids of the hashes into a contiguous buffer, as expected by `compute_short_ids`.
+    """
+    return b"".join(to_tx_id(tx_hash) for tx_hash in tx_hashes)
+
+
+def compute_short_ids(key: bytes, packed_tx_ids: Union[bytes, bytearray, memoryview]) -> List[int]:
+    """
+    Computes BIP152 short ids of all transaction ids in the buffer.
+
+    :param key: 16 bytes SipHash key
+    :param packed_tx_ids: concatenated transaction ids
+    :return: short ids as integers, in the order of the transaction ids
+    """
+    if numpy is not None:
+        return _compute_short_ids_vectorized(key, packed_tx_ids).tolist()
+
+    buf = memoryview(packed_tx_ids)
+    short_ids = []
+    for offset in range(0, len(buf) - len(buf) % TX_HASH_LEN, TX_HASH_LEN):
+        tx_id = bytes(buf[offset:offset + TX_HASH_LEN])
+        short_ids.append(int.from_bytes(siphash24(key, tx_id)[0:6], "little"))
+    return short_ids
+
+
+def match_short_ids(
+    key: bytes,
+    tx_hashes: Sequence[Optional[Sha256Hash]],
+    short_ids: Collection[bytes],
+    packed_tx_ids: Union[None, bytes, bytearray, memoryview] = None
+) -> Dict[bytes, Sha256Hash]:
+    """
+    Finds transactions matching compact block short ids.
+
+    :param key: 16 bytes SipHash key of the compact block
+    :param tx_hashes: candidate transaction hashes. None entries are skipped.
+    :param short_ids: 6 bytes short ids of the compact block
+    :param packed_tx_ids: transaction ids of the candidates, in the same order, if already packed
+    :return: dictionary of matched short id to transaction hash
+    """
+    if not short_ids or not tx_hashes:
+        return {}
+
+    short_ids_by_value: Dict[int, bytes] = {
+        short_id_to_int(short_id): short_id for short_id in short_ids
+    }
+    if packed_tx_ids is None:
+        packed_tx_ids = pack_tx_ids(tx_hashes)
+
+    matches = {}
+    for index, short_id_value in _iter_matching_indices(key, packed_tx_ids, short_ids_by_value):
+        short_id = short_ids_by_value[short_id_value]
+        tx_hash = tx_hashes[index]
+        if tx_hash is not None and short_id not in matches:
+            matches[short_id] = tx_hash
+    return matches
+
+
+def _iter_matching_indices(
+    key: bytes, packed_tx_ids: Union[bytes, bytearray, memoryview], short_ids_by_value: Dict[int, bytes]
+) -> Iterable[Tuple[int, int]]:
+    if numpy is None:
+        for index, short_id_value in enumerate(compute_short_ids(key, packed_tx_ids)):
+            if short_id_value in short_ids_by_value:
+                yield index, short_id_value
+        return
+
+    computed_short_ids = _compute_short_ids_vectorized(key, packed_tx_ids)
+    block_short_ids = numpy.fromiter(short_ids_by_value.keys(), dtype=numpy.uint64, count=len(short_ids_by_value))
+    for index in numpy.flatnonzero(numpy.isin(computed_short_ids, block_short_ids)).tolist():
+        yield index, int(computed_short_ids[index])
+
+
+def _compute_short_ids_vectorized(key: bytes, packed_tx_ids: Union[bytes, bytearray, memoryview]):
+    tx_count = len(packed_tx_ids) // TX_HASH_LEN
+    words_per_tx_id = TX_HASH_LEN // 8
+    message_words = numpy.frombuffer(
+        packed_tx_ids, dtype="<u8", count=tx_count * words_per_tx_id
+    ).reshape(tx_count, words_per_tx_id)
+
+    k0 = int.from_bytes(key[0:8], "little")
+    k1 = int.from_bytes(key[8:16], "little")
+    v0 = numpy.full(tx_count, k0 ^ _SIPHASH_V0, dtype=numpy.uint64)
+    v1 = numpy.full(tx_count, k1 ^ _SIPHASH_V1, dtype=numpy.uint64)
+    v2 = numpy.full(tx_count, k0 ^ _SIPHASH_V2, dtype=numpy.uint64)
+    v3 = numpy.full(tx_count, k1 ^ _SIPHASH_V3, dtype=numpy.uint64)
+    state = (v0, v1, v2, v3)
+    scratch = numpy.empty(tx_count, dtype=numpy.uint64)
+
+    for word_index in range(words_per_tx_id):
+        message_word = message_words[:, word_index]
+        v3 ^= message_word
+        _sip_round(state, scratch)
+        _sip_round(state, scratch)
+        v0 ^= message_word
+
+    last_block = numpy.uint64(_SIPHASH_32_BYTES_LAST_BLOCK)
+    v3 ^= last_block
+    _sip_round(state, scratch)
+    _sip_round(state, scratch)
+    v0 ^= last_block
+
+    v2 ^= numpy.uint64(0xff)
+    for _ in range(4):
+        _sip_round(state, scratch)
+
+    v0 ^= v1
+    v0 ^= v2
+    v0 ^= v3
+    v0 &= numpy.uint64(SHORT_ID_MASK)
+    return v0
+
+
+def _rotate_left(value, bits: int, scratch) -> None:
+    numpy.right_shift(value, numpy.uint64(64 - bits), out=scratch)
+    numpy.left_shift(value, numpy.uint64(bits), out=value)
+    value |= scratch
+
+
+def _sip_round(state, scratch) -> None:
+    v0, v1, v2, v3 = state
+    v0 += v1
+    _rotate_left(v1, 13, scratch)
+    v1 ^= v0
+    _rotate_left(v0, 32, scratch)
+    v2 += v3
+    _rotate_left(v3, 16, scratch)
+    v3 ^= v2
+    v0 += v3
+    _rotate_left(v3, 21, scratch)
+    v3 ^= v0
+    v2 += v1
+    _rotate_left(v1, 17, scratch)
+    v1 ^= v2
+    _rotate_left(v2, 32, scratch)
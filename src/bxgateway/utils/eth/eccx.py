@@ -1,11 +1,19 @@
 import hashlib
+import threading
+from collections import OrderedDict
+from typing import Tuple
 
 import bitcoin
 import pyelliptic
 
+from bxgateway import gateway_constants
 from bxgateway.eth_exceptions import DecryptionError
 from bxcommon.utils.blockchain_utils.eth import crypto_utils, rlp_utils, eth_common_constants
 
+# static ECDH shared secrets keyed by (raw private key, raw public key), shared by handshake threads
+_static_ecdh_keys: "OrderedDict[Tuple[bytes, bytes], bytes]" = OrderedDict()
+_static_ecdh_keys_lock = threading.Lock()
+
 
 class ECCx(pyelliptic.ECC):
     """
@@ -55,6 +63,30 @@ class ECCx(pyelliptic.ECC):
         assert len(key) == eth_common_constants.SHARED_KEY_LEN
         return key
 
+    def get_static_ecdh_key(self, raw_public_key):
+        """
+        Returns ECDH key of the local static private key and other party static public key.
+        Static keys do not change between connections, so the key is computed once per pair of keys
+        and reused on reconnects.
+        :param raw_public_key: other parties raw public key
+        :return shared key
+        """
+
+        cache_key = (bytes(self.get_raw_private_key()), bytes(raw_public_key))
+        with _static_ecdh_keys_lock:
+            key = _static_ecdh_keys.get(cache_key)
+            if key is not None:
+                _static_ecdh_keys.move_to_end(cache_key)
+                return key
+
+        key = self.get_ecdh_key(raw_public_key)
+
+        with _static_ecdh_keys_lock:
+            _static_ecdh_keys[cache_key] = key
+            while len(_static_ecdh_keys) > gateway_constants.ETH_STATIC_ECDH_KEY_CACHE_SIZE:
+                _static_ecdh_keys.popitem(last=False)
+        return key
+
     def is_valid_key(self, raw_public_key, raw_private_key=None):
         """
         Validates raw public key
@@ -264,3 +296,19 @@ class ECCx(pyelliptic.ECC):
         pubkey_x = raw_pubkey[:eth_common_constants.PUBLIC_KEY_X_Y_LEN]
         pubkey_y = raw_pubkey[eth_common_constants.PUBLIC_KEY_X_Y_LEN:]
         return eth_common_constants.ECIES_CURVE, pubkey_x, pubkey_y, eth_common_constants.PUBLIC_KEY_LEN
+
+
+def precompute_static_ecdh_key(raw_private_key, raw_public_key):
+    """
+    Computes and caches ECDH key of static keys ahead of the handshake
+    :param raw_private_key: local raw private key
+    :param raw_public_key: other parties raw public key
+    :return shared key
+    """
+
+    return ECCx(raw_private_key=raw_private_key).get_static_ecdh_key(raw_public_key)
+
+
+def clear_static_ecdh_keys():
+    with _static_ecdh_keys_lock:
+        _static_ecdh_keys.clear()
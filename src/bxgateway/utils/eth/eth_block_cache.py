@@ -0,0 +1,241 @@
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Optional
+
+from bxcommon.utils.expiration_queue import ExpirationQueue
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.messages.eth.new_block_parts import NewBlockParts
+from bxgateway.services.block_crypto_service import BlockCryptoTaskResult
+from bxutils import logging
+
+if TYPE_CHECKING:
+    from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+
+logger = logging.get_logger(__name__)
+
+
+class EthBlockCacheEntry:
+    """
+    Cached block, either uncompressed (block message and parts) or zlib-compressed.
+    """
+
+    __slots__ = ["block_number", "block_message", "block_parts", "compressed_block", "compressing", "size"]
+
+    def __init__(self, block_number: int, block_message: InternalEthBlockInfo, block_parts: NewBlockParts):
+        self.block_number = block_number
+        self.block_message: Optional[InternalEthBlockInfo] = block_message
+        self.block_parts: Optional[NewBlockParts] = block_parts
+        self.compressed_block: Optional[bytes] = None
+        self.compressing = False
+        self.size = len(block_message.rawbytes())
+
+    def is_compressed(self) -> bool:
+        return self.compressed_block is not None
+
+
+class EthBlockCache:
+    """
+    Memory-budgeted cache of recent Ethereum blocks.
+
+    Blocks within `uncompressed_heights` of the highest cached block are kept as block messages.
+    Older blocks are kept only in their zlib-compressed form and are inflated on demand. Compressed blocks
+    do not depend on transaction service, so they can still be inflated after their transactions are
+    cleaned up. Blocks are compressed on the block crypto thread pool, away from the event loop.
+    Least recently used blocks are evicted when the total size exceeds the budget.
+    """
+
+    _entries: "OrderedDict[Sha256Hash, EthBlockCacheEntry]"
+    _expiration_queue: ExpirationQueue
+
+    def __init__(
+        self,
+        node: "AbstractGatewayNode",
+        max_size_bytes: int,
+        uncompressed_heights: int,
+        block_ttl_s: int,
+        compression_callback: Callable[[Sha256Hash], None],
+        eviction_callback: Callable[[Sha256Hash], None]
+    ):
+        """
+        :param node: gateway node, for its block crypto service thread pool
+        :param max_size_bytes: memory budget for cached blocks
+        :param uncompressed_heights: number of most recent heights kept uncompressed, 0 to never compress blocks
+        :param block_ttl_s: time to keep blocks for
+        :param compression_callback: called with block hash when a block is compressed
+        :param eviction_callback: called with block hash when a block is evicted, either to stay within memory
+                                  budget or because it could not be inflated
+        """
+        self.node = node
+        self.max_size_bytes = max_size_bytes
+        self.uncompressed_heights = uncompressed_heights
+
+        self.total_size_bytes = 0
+        self.compressed_size_bytes = 0
+        self.compressed_count = 0
+        self.highest_block_number = 0
+
+        self.inflated_count = 0
+        self.inflation_failed_count = 0
+        self.evicted_count = 0
+
+        self._entries = OrderedDict()
+        self._expiration_queue = ExpirationQueue(block_ttl_s)
+        self._compression_callback = compression_callback
+        self._eviction_callback = eviction_callback
+
+    def __contains__(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        block_hash: Sha256Hash,
+        block_message: InternalEthBlockInfo,
+        block_parts: Optional[NewBlockParts] = None
+    ) -> None:
+        self._expiration_queue.remove_expired(remove_callback=self._remove_entry)
+
+        if block_hash in self._entries:
+            self._entries.move_to_end(block_hash)
+            entry = self._entries[block_hash]
+            if not entry.is_compressed():
+                return
+            self._remove_entry(block_hash)
+        else:
+            self._expiration_queue.add(block_hash)
+
+        if block_parts is None:
+            block_parts = block_message.to_new_block_parts()
+        block_number = block_message.block_number()
+        entry = EthBlockCacheEntry(block_number, block_message, block_parts)
+        self._entries[block_hash] = entry
+        self.total_size_bytes += entry.size
+
+        if block_number > self.highest_block_number:
+            self.highest_block_number = block_number
+            self._compress_old_blocks()
+        elif self._should_compress(entry):
+            self._compress(block_hash, entry)
+
+        self._evict_to_budget()
+
+    def remove(self, block_hash: Sha256Hash) -> None:
+        if block_hash not in self._entries:
+            return
+        self._expiration_queue.remove(block_hash)
+        self._remove_entry(block_hash)
+
+    def is_compressed(self, block_hash: Sha256Hash) -> bool:
+        entry = self._entries.get(block_hash)
+        return entry is not None and entry.is_compressed()
+
+    def get_block_message(self, block_hash: Sha256Hash) -> Optional[InternalEthBlockInfo]:
+        entry = self._entries.get(block_hash)
+        if entry is None:
+            return None
+        self._entries.move_to_end(block_hash)
+
+        block_message = entry.block_message
+        if block_message is not None:
+            return block_message
+        return self._inflate(block_hash, entry)
+
+    def get_block_parts(self, block_hash: Sha256Hash) -> Optional[NewBlockParts]:
+        entry = self._entries.get(block_hash)
+        if entry is None:
+            return None
+        self._entries.move_to_end(block_hash)
+
+        block_parts = entry.block_parts
+        if block_parts is not None:
+            return block_parts
+
+        block_message = self._inflate(block_hash, entry)
+        if block_message is None:
+            return None
+        return block_message.to_new_block_parts()
+
+    def _should_compress(self, entry: EthBlockCacheEntry) -> bool:
+        return (
+            self.uncompressed_heights > 0
+            and not entry.is_compressed()
+            and entry.block_number <= self.highest_block_number - self.uncompressed_heights
+        )
+
+    def _compress_old_blocks(self) -> None:
+        if self.uncompressed_heights <= 0:
+            return
+        for block_hash, entry in list(self._entries.items()):
+            if self._should_compress(entry):
+                self._compress(block_hash, entry)
+
+    def _compress(self, block_hash: Sha256Hash, entry: EthBlockCacheEntry) -> None:
+        block_message = entry.block_message
+        if block_message is None or entry.compressing:
+            return
+
+        entry.compressing = True
+        self.node.block_crypto_service.compress(
+            block_message.rawbytes(),
+            gateway_constants.ETH_BLOCK_CACHE_COMPRESSION_LEVEL,
+            lambda task_result: self._on_block_compressed(block_hash, entry, task_result)
+        )
+
+    def _on_block_compressed(
+        self, block_hash: Sha256Hash, entry: EthBlockCacheEntry, task_result: BlockCryptoTaskResult
+    ) -> None:
+        entry.compressing = False
+        if self._entries.get(block_hash) is not entry or entry.block_message is None:
+            # block was removed from cache while being compressed
+            return
+
+        compressed_block = task_result.result
+        compressed_block_size = len(compressed_block)
+        self.total_size_bytes += compressed_block_size - entry.size
+        self.compressed_size_bytes += compressed_block_size
+        self.compressed_count += 1
+
+        entry.block_message = None
+        entry.block_parts = None
+        entry.compressed_block = compressed_block
+        entry.size = compressed_block_size
+        logger.trace("Compressed cached block {} in {:.3f}s.", block_hash, task_result.crypto_duration_s)
+        self._compression_callback(block_hash)
+        self._evict_to_budget()
+
+    def _inflate(self, block_hash: Sha256Hash, entry: EthBlockCacheEntry) -> Optional[InternalEthBlockInfo]:
+        compressed_block = entry.compressed_block
+        assert compressed_block is not None
+
+        try:
+            block_message = InternalEthBlockInfo(bytearray(zlib.decompress(compressed_block)))
+        except zlib.error as e:
+            logger.debug("Failed to inflate cached block {}: {}", block_hash, e)
+            self.inflation_failed_count += 1
+            self.remove(block_hash)
+            self._eviction_callback(block_hash)
+            return None
+
+        self.inflated_count += 1
+        return block_message
+
+    def _evict_to_budget(self) -> None:
+        while self.total_size_bytes > self.max_size_bytes and len(self._entries) > 1:
+            block_hash = next(iter(self._entries))
+            logger.trace("Evicting block {} from block cache to stay within memory budget.", block_hash)
+            self.evicted_count += 1
+            self.remove(block_hash)
+            self._eviction_callback(block_hash)
+
+    def _remove_entry(self, block_hash: Sha256Hash) -> None:
+        entry = self._entries.pop(block_hash, None)
+        if entry is None:
+            return
+        self.total_size_bytes -= entry.size
+        if entry.is_compressed():
+            self.compressed_size_bytes -= entry.size
+            self.compressed_count -= 1
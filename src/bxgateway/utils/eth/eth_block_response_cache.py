@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
+
+
+class EthBlockResponseCacheEntry:
+    """
+    Cached response message, with block hashes it contains if it is a headers response.
+    """
+
+    __slots__ = ["response_msg", "block_hashes", "is_complete", "size"]
+
+    def __init__(self, response_msg: EthProtocolMessage, block_hashes: List[Sha256Hash], is_complete: bool):
+        self.response_msg = response_msg
+        self.block_hashes = block_hashes
+        self.is_complete = is_complete
+        self.size = len(response_msg.rawbytes())
+
+
+class EthBlockResponseCache:
+    """
+    Memory-budgeted cache of BlockHeaders and BlockBodies responses to recent requests of the Ethereum node,
+    keyed by encoded request parameters. Cached messages are already RLP serialized, and keep their compressed
+    payload once sent over a snappy compressed connection.
+
+    Bodies responses depend only on requested block hashes and never become stale. Headers responses are
+    built from the canonical chain: responses with fewer headers than requested end at the canonical head and
+    are removed when it moves, and responses that contain blocks that are no longer canonical are removed on reorg.
+    Least recently used responses are evicted when the total size exceeds the budget.
+    """
+
+    _entries: "OrderedDict[bytes, EthBlockResponseCacheEntry]"
+
+    def __init__(self, max_size_bytes: int):
+        """
+        :param max_size_bytes: memory budget for cached responses, 0 to disable the cache
+        """
+        self.max_size_bytes = max_size_bytes
+        self.total_size_bytes = 0
+        self._entries = OrderedDict()
+
+    def __contains__(self, request_key: bytes) -> bool:
+        return request_key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_enabled(self) -> bool:
+        return self.max_size_bytes > 0
+
+    def get(self, request_key: bytes) -> Optional[EthProtocolMessage]:
+        entry = self._entries.get(request_key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(request_key)
+        return entry.response_msg
+
+    def add_headers(
+        self, request_key: bytes, response_msg: EthProtocolMessage, block_hashes: List[Sha256Hash], is_complete: bool
+    ) -> None:
+        """
+        :param request_key: encoded request parameters
+        :param response_msg: headers response
+        :param block_hashes: hashes of blocks in the response
+        :param is_complete: if the response contains all requested headers
+        """
+        self._add(request_key, EthBlockResponseCacheEntry(response_msg, block_hashes, is_complete))
+
+    def add_bodies(self, request_key: bytes, response_msg: EthProtocolMessage) -> None:
+        self._add(request_key, EthBlockResponseCacheEntry(response_msg, [], True))
+
+    def on_canonical_head_changed(self, is_reorg: bool, is_canonical: Callable[[Sha256Hash], bool]) -> None:
+        """
+        Removes headers responses that are no longer valid after the canonical head moved
+        :param is_reorg: if the previous head is no longer on the canonical chain
+        :param is_canonical: checks if block is on the current canonical chain
+        """
+        for request_key, entry in list(self._entries.items()):
+            if not entry.is_complete or (
+                is_reorg and not all(is_canonical(block_hash) for block_hash in entry.block_hashes)
+            ):
+                self._remove_entry(request_key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.total_size_bytes = 0
+
+    def _add(self, request_key: bytes, entry: EthBlockResponseCacheEntry) -> None:
+        if not self.is_enabled() or entry.size > self.max_size_bytes:
+            return
+
+        if request_key in self._entries:
+            self._remove_entry(request_key)
+        self._entries[request_key] = entry
+        self.total_size_bytes += entry.size
+
+        while self.total_size_bytes > self.max_size_bytes:
+            self._remove_entry(next(iter(self._entries)))
+
+    def _remove_entry(self, request_key: bytes) -> None:
+        entry = self._entries.pop(request_key)
+        self.total_size_bytes -= entry.size
@@ -0,0 +1,309 @@
+from typing import Dict, Set, Optional, Iterator, List
+
+from bxcommon.utils.alarm_queue import AlarmQueue
+from bxcommon.utils.expiration_queue import ExpirationQueue
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+
+class EthBlockTreeNode:
+    """
+    Block entry in the block tree.
+
+    Attributes
+    ----------
+    block_hash: hash of the block
+    block_number: height of the block
+    parent_hash: hash of the previous block, which may not be tracked by the tree
+    difficulty: difficulty of the block
+    cumulative_difficulty: sum of difficulties from the oldest tracked ancestor of the block up to the block
+    """
+
+    __slots__ = ["block_hash", "block_number", "parent_hash", "difficulty", "cumulative_difficulty"]
+
+    def __init__(self, block_hash: Sha256Hash, block_number: int, parent_hash: Sha256Hash, difficulty: int):
+        self.block_hash = block_hash
+        self.block_number = block_number
+        self.parent_hash = parent_hash
+        self.difficulty = difficulty
+        self.cumulative_difficulty = difficulty
+
+
+class EthBlockTree:
+    """
+    In-memory tree of recent Ethereum blocks, linked by parent hashes.
+
+    Keeps an index of the canonical chain, which ends at the canonical head (the best block sent to the
+    Ethereum node) and extends back through tracked parents, so height lookups on the canonical chain are O(1).
+    Changes of the canonical head are applied incrementally: only the blocks between the new head and the
+    common ancestor with the current canonical chain are visited.
+
+    Also tracks the last block hash sent to and accepted by the Ethereum node at each height, which may
+    refer to blocks that are not in the tree. Expired blocks and heights are removed on an alarm.
+    """
+
+    _nodes: Dict[Sha256Hash, EthBlockTreeNode]
+    _block_hashes_by_height: Dict[int, Set[Sha256Hash]]
+    _children_by_parent_hash: Dict[Sha256Hash, Set[Sha256Hash]]
+    _canonical_hash_by_height: Dict[int, Sha256Hash]
+    _canonical_head: Optional[EthBlockTreeNode]
+    _canonical_tail_height: Optional[int]
+    _sent_block_hash_by_height: Dict[int, Sha256Hash]
+    _accepted_block_hash_by_height: Dict[int, Sha256Hash]
+    _expiration_queue: ExpirationQueue
+    _height_expiration_queue: ExpirationQueue
+
+    def __init__(self, alarm_queue: AlarmQueue, block_ttl_s: int):
+        self.highest_block_number = 0
+
+        self._nodes = {}
+        self._block_hashes_by_height = {}
+        self._children_by_parent_hash = {}
+        self._canonical_hash_by_height = {}
+        self._canonical_head = None
+        self._canonical_tail_height = None
+        self._sent_block_hash_by_height = {}
+        self._accepted_block_hash_by_height = {}
+        self._expiration_queue = ExpirationQueue(block_ttl_s)
+        self._height_expiration_queue = ExpirationQueue(block_ttl_s)
+
+        alarm_queue.register_alarm(gateway_constants.ETH_BLOCK_TREE_CLEANUP_INTERVAL_S, self._cleanup_expired)
+
+    def __contains__(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add(self, block_hash: Sha256Hash, block_number: int, parent_hash: Sha256Hash, difficulty: int) -> None:
+        if block_hash in self._nodes:
+            return
+
+        node = EthBlockTreeNode(block_hash, block_number, parent_hash, difficulty)
+        self._nodes[block_hash] = node
+        self._expiration_queue.add(block_hash)
+
+        if block_number in self._block_hashes_by_height:
+            self._block_hashes_by_height[block_number].add(block_hash)
+        else:
+            self._block_hashes_by_height[block_number] = {block_hash}
+        if block_number > self.highest_block_number:
+            self.highest_block_number = block_number
+
+        if parent_hash in self._children_by_parent_hash:
+            self._children_by_parent_hash[parent_hash].add(block_hash)
+        else:
+            self._children_by_parent_hash[parent_hash] = {block_hash}
+
+        parent = self._nodes.get(parent_hash)
+        if parent is not None:
+            node.cumulative_difficulty = parent.cumulative_difficulty + difficulty
+        if block_hash in self._children_by_parent_hash:
+            self._update_descendants_cumulative_difficulty(node)
+
+        tail_height = self._canonical_tail_height
+        if (
+            tail_height is not None
+            and block_number == tail_height - 1
+            and self._nodes[self._canonical_hash_by_height[tail_height]].parent_hash == block_hash
+        ):
+            self._extend_canonical_tail()
+
+    def remove(self, block_hash: Sha256Hash) -> None:
+        if block_hash not in self._nodes:
+            return
+        self._expiration_queue.remove(block_hash)
+        self._remove_node(block_hash)
+
+    def mark_block_sent(self, block_hash: Sha256Hash, block_number: int) -> None:
+        self._sent_block_hash_by_height[block_number] = block_hash
+        self._height_expiration_queue.add(block_number)
+
+    def mark_block_accepted(self, block_hash: Sha256Hash, block_number: int) -> None:
+        self._accepted_block_hash_by_height[block_number] = block_hash
+        self._height_expiration_queue.add(block_number)
+
+    def get_sent_block_hash_at_height(self, block_number: int) -> Optional[Sha256Hash]:
+        return self._sent_block_hash_by_height.get(block_number)
+
+    def get_accepted_block_hash_at_height(self, block_number: int) -> Optional[Sha256Hash]:
+        return self._accepted_block_hash_by_height.get(block_number)
+
+    def get_block_number(self, block_hash: Sha256Hash) -> Optional[int]:
+        node = self._nodes.get(block_hash)
+        if node is None:
+            return None
+        return node.block_number
+
+    def get_cumulative_difficulty(self, block_hash: Sha256Hash) -> Optional[int]:
+        node = self._nodes.get(block_hash)
+        if node is None:
+            return None
+        return node.cumulative_difficulty
+
+    def get_block_hashes_at_height(self, block_number: int) -> Set[Sha256Hash]:
+        return self._block_hashes_by_height.get(block_number, set())
+
+    def get_heaviest_block_hash_at_height(self, block_number: int) -> Optional[Sha256Hash]:
+        block_hashes = self._block_hashes_by_height.get(block_number)
+        if not block_hashes:
+            return None
+        return max(block_hashes, key=lambda block_hash: self._nodes[block_hash].cumulative_difficulty)
+
+    def get_children(self, block_hash: Sha256Hash) -> Set[Sha256Hash]:
+        return self._children_by_parent_hash.get(block_hash, set())
+
+    def get_canonical_head(self) -> Optional[Sha256Hash]:
+        head = self._canonical_head
+        if head is None:
+            return None
+        return head.block_hash
+
+    def get_canonical_tail_height(self) -> Optional[int]:
+        return self._canonical_tail_height
+
+    def get_canonical_hash_at_height(self, block_number: int) -> Optional[Sha256Hash]:
+        return self._canonical_hash_by_height.get(block_number)
+
+    def is_canonical(self, block_hash: Sha256Hash) -> bool:
+        node = self._nodes.get(block_hash)
+        if node is None:
+            return False
+        return self._canonical_hash_by_height.get(node.block_number) == block_hash
+
+    def set_canonical_head(self, block_hash: Sha256Hash) -> None:
+        """
+        Moves the canonical head, reorganizing the canonical chain index if needed.
+        :param block_hash: new canonical head
+        """
+        current_head = self._canonical_head
+        if current_head is not None and current_head.block_hash == block_hash:
+            return
+
+        new_head = self._nodes.get(block_hash)
+        if new_head is None:
+            self._truncate_canonical_chain_below(None)
+            return
+
+        if current_head is not None:
+            for height in range(new_head.block_number + 1, current_head.block_number + 1):
+                self._canonical_hash_by_height.pop(height, None)
+        self._canonical_head = new_head
+
+        node = new_head
+        updated_count = 0
+        while True:
+            if self._canonical_hash_by_height.get(node.block_number) == node.block_hash:
+                # reached common ancestor with previous canonical chain
+                break
+            self._canonical_hash_by_height[node.block_number] = node.block_hash
+            updated_count += 1
+
+            parent = self._nodes.get(node.parent_hash)
+            if parent is None or parent.block_number != node.block_number - 1:
+                # chain is disconnected below this block
+                self._truncate_canonical_chain_below(node.block_number)
+                break
+            node = parent
+
+        if current_head is not None and updated_count > 1:
+            logger.trace(
+                "Moved canonical head from {} to {}. Updated {} canonical chain entries.",
+                current_head.block_hash,
+                block_hash,
+                updated_count
+            )
+
+    def iterate_canonical_chain(self) -> Iterator[EthBlockTreeNode]:
+        """
+        :return: Iterator of canonical chain blocks in ascending order
+        """
+        head = self._canonical_head
+        tail_height = self._canonical_tail_height
+        if head is None or tail_height is None:
+            return
+        for height in range(tail_height, head.block_number + 1):
+            yield self._nodes[self._canonical_hash_by_height[height]]
+
+    def iterate_ancestors(self, block_hash: Sha256Hash, max_count: int) -> Iterator[Sha256Hash]:
+        """
+        :param block_hash: starting block hash
+        :param max_count: max number of elements to return
+        :return: Iterator of block hashes starting from the block, following parent links in descending order
+        """
+        node = self._nodes.get(block_hash)
+        count = 0
+        while node is not None and count < max_count:
+            yield node.block_hash
+            count += 1
+            node = self._nodes.get(node.parent_hash)
+
+    def _cleanup_expired(self) -> float:
+        self._expiration_queue.remove_expired(remove_callback=self._remove_node)
+        self._height_expiration_queue.remove_expired(remove_callback=self._remove_height)
+        return gateway_constants.ETH_BLOCK_TREE_CLEANUP_INTERVAL_S
+
+    def _remove_height(self, block_number: int) -> None:
+        self._sent_block_hash_by_height.pop(block_number, None)
+        self._accepted_block_hash_by_height.pop(block_number, None)
+
+    def _remove_node(self, block_hash: Sha256Hash) -> None:
+        node = self._nodes.pop(block_hash, None)
+        if node is None:
+            return
+
+        block_hashes = self._block_hashes_by_height.get(node.block_number)
+        if block_hashes is not None:
+            block_hashes.discard(block_hash)
+            if not block_hashes:
+                del self._block_hashes_by_height[node.block_number]
+
+        siblings = self._children_by_parent_hash.get(node.parent_hash)
+        if siblings is not None:
+            siblings.discard(block_hash)
+            if not siblings:
+                del self._children_by_parent_hash[node.parent_hash]
+
+        if self._canonical_hash_by_height.get(node.block_number) == block_hash:
+            # canonical chain below the removed block is no longer connected to the head
+            self._truncate_canonical_chain_below(node.block_number + 1)
+
+    def _extend_canonical_tail(self) -> None:
+        tail_height = self._canonical_tail_height
+        assert tail_height is not None
+        node = self._nodes[self._canonical_hash_by_height[tail_height]]
+        parent = self._nodes.get(node.parent_hash)
+        while parent is not None and parent.block_number == node.block_number - 1:
+            self._canonical_hash_by_height[parent.block_number] = parent.block_hash
+            node = parent
+            parent = self._nodes.get(node.parent_hash)
+        self._canonical_tail_height = node.block_number
+
+    def _truncate_canonical_chain_below(self, block_number: Optional[int]) -> None:
+        """
+        Removes canonical chain index entries below the provided height, or the whole chain if None.
+        """
+        tail_height = self._canonical_tail_height
+        if block_number is None or self._canonical_head is None or block_number > self._canonical_head.block_number:
+            self._canonical_hash_by_height.clear()
+            self._canonical_head = None
+            self._canonical_tail_height = None
+            return
+
+        if tail_height is not None:
+            for height in range(tail_height, block_number):
+                self._canonical_hash_by_height.pop(height, None)
+        self._canonical_tail_height = block_number
+
+    def _update_descendants_cumulative_difficulty(self, node: EthBlockTreeNode) -> None:
+        nodes_to_update: List[EthBlockTreeNode] = [node]
+        while nodes_to_update:
+            parent = nodes_to_update.pop()
+            for child_hash in self._children_by_parent_hash.get(parent.block_hash, set()):
+                child = self._nodes.get(child_hash)
+                if child is not None:
+                    child.cumulative_difficulty = parent.cumulative_difficulty + child.difficulty
+                    nodes_to_update.append(child)
@@ -1,7 +1,12 @@
-from bxcommon.utils.blockchain_utils.eth import rlp_utils
+from typing import List, Sequence, Tuple, Union
+
+import rlp
+
+from bxcommon.utils.blockchain_utils.eth import eth_common_utils, rlp_utils
 
 # pylint: disable=invalid-name
 from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
+from bxgateway.utils.eth import raw_tx_utils
 
 
 def parse_transaction_bytes(tx_bytes: memoryview) -> TransactionsEthProtocolMessage:
@@ -15,3 +20,111 @@ def parse_transaction_bytes(tx_bytes: memoryview) -> TransactionsEthProtocolMess
     buf[0:len(txs_prefix)] = txs_prefix
     buf[len(txs_prefix):] = tx_bytes
     return TransactionsEthProtocolMessage(buf)
+
+
+def get_rlp_list_bytes(items_bytes: List[Union[bytearray, bytes, memoryview]]) -> bytearray:
+    """
+    Encodes RLP list of already encoded items
+    """
+    size = sum(len(item_bytes) for item_bytes in items_bytes)
+
+    list_prefix = rlp_utils.get_length_prefix_list(size)
+    buf = bytearray(len(list_prefix) + size)
+    buf[0:len(list_prefix)] = list_prefix
+
+    offset = len(list_prefix)
+    for item_bytes in items_bytes:
+        buf[offset:offset + len(item_bytes)] = item_bytes
+        offset += len(item_bytes)
+    return buf
+
+
+def get_transactions_list_bytes(txs_bytes: List[Union[bytearray, memoryview]]) -> bytearray:
+    """
+    Encodes RLP list of raw transactions, which is the payload of Transactions and PooledTransactions messages
+    """
+    return get_rlp_list_bytes(txs_bytes)
+
+
+def split_transactions_bytes(msg_bytes: Union[bytearray, memoryview]) -> List[memoryview]:
+    """
+    Splits RLP list of raw transactions into the bytes of each transaction, without copies
+    """
+    msg_bytes = memoryview(msg_bytes)
+    return [
+        msg_bytes[tx_offset:tx_offset + tx_length]
+        for tx_offset, tx_length in raw_tx_utils.iter_transactions(msg_bytes)
+    ]
+
+
+def get_ordered_trie_root(items_bytes: Sequence[Union[bytearray, bytes, memoryview]]) -> bytes:
+    """
+    Computes root hash of the Merkle Patricia trie of encoded items keyed by RLP encoded item index,
+    which is how transactions and receipts roots of Ethereum block headers are built
+    """
+    trie_items = [
+        (_to_nibbles(rlp.encode(index)), bytes(item_bytes)) for index, item_bytes in enumerate(items_bytes)
+    ]
+    return eth_common_utils.keccak_hash(rlp.encode(_build_trie_node(trie_items, 0)))
+
+
+def _build_trie_node(trie_items: List[Tuple[List[int], bytes]], depth: int):
+    if not trie_items:
+        return b""
+
+    if len(trie_items) == 1:
+        key, value = trie_items[0]
+        return [_encode_hex_prefix(key[depth:], True), value]
+
+    prefix_length = _get_common_prefix_length(trie_items, depth)
+    if prefix_length:
+        return [
+            _encode_hex_prefix(trie_items[0][0][depth:depth + prefix_length], False),
+            _get_node_reference(_build_trie_node(trie_items, depth + prefix_length))
+        ]
+
+    branch = [b""] * 17
+    child_items = [[] for _ in range(16)]
+    for key, value in trie_items:
+        if len(key) == depth:
+            branch[16] = value
+        else:
+            child_items[key[depth]].append((key, value))
+    for nibble, nibble_items in enumerate(child_items):
+        if nibble_items:
+            branch[nibble] = _get_node_reference(_build_trie_node(nibble_items, depth + 1))
+    return branch
+
+
+def _get_common_prefix_length(trie_items: List[Tuple[List[int], bytes]], depth: int) -> int:
+    first_key = trie_items[0][0]
+    prefix_length = 0
+    while all(
+        len(key) > depth + prefix_length and key[depth + prefix_length] == first_key[depth + prefix_length]
+        for key, _ in trie_items
+    ):
+        prefix_length += 1
+    return prefix_length
+
+
+def _get_node_reference(node):
+    """
+    Nodes shorter than a hash are embedded in their parent node, other nodes are referenced by hash
+    """
+    node_bytes = rlp.encode(node)
+    if len(node_bytes) < 32:
+        return node
+    return eth_common_utils.keccak_hash(node_bytes)
+
+
+def _encode_hex_prefix(nibbles: List[int], is_leaf: bool) -> bytes:
+    flag = 2 if is_leaf else 0
+    if len(nibbles) % 2:
+        nibbles = [flag + 1] + nibbles
+    else:
+        nibbles = [flag, 0] + nibbles
+    return bytes(nibbles[i] << 4 | nibbles[i + 1] for i in range(0, len(nibbles), 2))
+
+
+def _to_nibbles(key: bytes) -> List[int]:
+    return [nibble for byte in key for nibble in (byte >> 4, byte & 0x0f)]
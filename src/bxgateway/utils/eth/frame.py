@@ -171,9 +171,27 @@ class Frame(object):
         :return: frame body bytes
         """
 
+        body = bytearray(self.get_body_size(padded=True))
+        self.write_body(body, 0)
+        return body
+
+    def write_body(self, buf, offset):
+        """
+        Writes frame body into a preallocated buffer without building intermediate bytes.
+        The buffer is expected to be zero filled, so that the padding is left in place.
+        :param buf: output buffer
+        :param offset: offset of the frame body in the buffer
+        :return: padded frame body length
+        """
+
         encoded_msg_type = self.get_encoded_msg_type()  # packet-type
         assert isinstance(self._payload, memoryview)
-        return crypto_utils.right_0_pad_16(encoded_msg_type + self._payload.tobytes())
+        msg_type_len = len(encoded_msg_type)
+        payload_len = len(self._payload)
+        buf[offset:offset + msg_type_len] = encoded_msg_type
+        payload_offset = offset + msg_type_len
+        buf[payload_offset:payload_offset + payload_len] = self._payload
+        return crypto_utils.get_padded_len_16(msg_type_len + payload_len)
 
     def get_msg_type(self):
         """
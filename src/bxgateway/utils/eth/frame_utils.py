@@ -7,6 +7,11 @@ from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxcommon.utils.blockchain_utils.eth.crypto_utils import get_padded_len_16
 from bxgateway.utils.eth.frame import Frame
 
+# first byte of RLP-encoded strings of 0-55 bytes, and the encoding of 0
+RLP_SHORT_STRING_PREFIX = 0x80
+# message types are encoded as RLP big endian integers of at most this many bytes
+MAX_MSG_TYPE_INT_LEN = 8
+
 
 def get_frames(msg_type, payload_bytes, protocol_id=eth_common_constants.DEFAULT_FRAME_PROTOCOL_ID,
                window_size=eth_common_constants.DEFAULT_FRAME_SIZE):
@@ -105,6 +110,22 @@ def parse_frame_header(header_bytes):
     return body_size, protocol_id, sequence_id, total_payload_size
 
 
+def get_msg_type_len(first_byte):
+    """
+    Returns length of RLP-encoded message type from its first byte
+    :param first_byte: first byte of frame body
+    :return: length of message type
+    """
+
+    if first_byte <= RLP_SHORT_STRING_PREFIX:
+        return 1
+
+    if first_byte > RLP_SHORT_STRING_PREFIX + MAX_MSG_TYPE_INT_LEN:
+        raise ParseError("Invalid rlp message type prefix in frame body: {}".format(first_byte))
+
+    return 1 + first_byte - RLP_SHORT_STRING_PREFIX
+
+
 def parse_frame_body(body_bytes, has_msg_type):
     """
     Parses frame body
@@ -1,7 +1,7 @@
 from bxcommon.exceptions import ParseError
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxgateway.utils.eth import frame_utils
-from bxcommon.utils.blockchain_utils.eth import rlp_utils, eth_common_constants
+from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
 
 
@@ -17,7 +17,11 @@ class FramedInputBuffer(object):
                             .format(type(rlpx_cipher)))
 
         self._rlpx_cipher = rlpx_cipher
-        self._payload_buffer = InputBuffer()
+
+        # payload of the message being received, preallocated once the size of the message is known
+        self._payload_buffer = None
+        self._payload_buffer_view = None
+        self._payload_len_received = 0
 
         self._receiving_frame = False
         self._chunked_frames_in_progress = False
@@ -34,6 +38,8 @@ class FramedInputBuffer(object):
 
         self._full_message_received = False
 
+        self.frames_decoded = 0
+
     def peek_message(self, input_buffer):
         """
         Peeks message from input frame
@@ -47,6 +53,36 @@ class FramedInputBuffer(object):
         if self._full_message_received:
             raise ValueError("Get full message before trying to peek another one")
 
+        self._process_frame(input_buffer)
+        return self._full_message_received, self._current_msg_type
+
+    def drain_messages(self, input_buffer):
+        """
+        Decodes every complete frame in input buffer in one pass
+        :param input_buffer: input buffer
+        :return: list of tuples (message type, message payload) of all messages completed by the frames
+        """
+
+        if not isinstance(input_buffer, InputBuffer):
+            raise ValueError("Expected type InputBuffer")
+
+        if self._full_message_received:
+            raise ValueError("Get full message before trying to peek another one")
+
+        messages = []
+        while self._process_frame(input_buffer):
+            if self._full_message_received:
+                message, msg_type = self.get_full_message()
+                messages.append((msg_type, message))
+        return messages
+
+    def _process_frame(self, input_buffer):
+        """
+        Reads frame header and frame body, if enough bytes are available
+        :param input_buffer: input buffer
+        :return: if a frame body was processed
+        """
+
         if not self._receiving_frame and input_buffer.length >= eth_common_constants.FRAME_HDR_TOTAL_LEN:
             enc_header_bytes = input_buffer.remove_bytes(eth_common_constants.FRAME_HDR_TOTAL_LEN)
             header_bytes = self._rlpx_cipher.decrypt_frame_header(enc_header_bytes)
@@ -64,35 +100,31 @@ class FramedInputBuffer(object):
 
             self._receiving_frame = True
 
-        if self._receiving_frame and input_buffer.length >= self._current_frame_enc_body_size:
-            frame_enc_body_bytes = input_buffer.remove_bytes(self._current_frame_enc_body_size)
-
-            body = self._rlpx_cipher.decrypt_frame_body(frame_enc_body_bytes, self._current_frame_body_size)
+        if not self._receiving_frame or input_buffer.length < self._current_frame_enc_body_size:
+            return False
 
-            msg_type_is_expected = not self._chunked_frames_in_progress or self._current_frame_sequence_id == 0
-            payload, msg_type = frame_utils.parse_frame_body(body, msg_type_is_expected)
+        frame_enc_body_bytes = input_buffer.remove_bytes(self._current_frame_enc_body_size)
+        body_size = self._current_frame_body_size
 
-            if msg_type_is_expected:
-                self._current_msg_type = msg_type
+        if self._chunked_frames_in_progress:
+            self._chunked_frames_body_size_received += body_size
 
-            self._payload_buffer.add_bytes(bytearray(rlp_utils.str_to_bytes(payload)))
-
-            if not self._chunked_frames_in_progress:
-                self._full_message_received = True
-            else:
-                self._chunked_frames_body_size_received += len(body)
+            if self._chunked_frames_body_size_received > self._chunked_frames_total_body_size:
+                raise ParseError("Expected total body length for frame message is {0} but received {1}"
+                                 .format(self._chunked_frames_total_body_size,
+                                         self._chunked_frames_body_size_received))
 
-                if self._chunked_frames_body_size_received > self._chunked_frames_total_body_size:
-                    raise ParseError("Expected total body length for frame message is {0} but received {1}"
-                                     .format(self._chunked_frames_total_body_size,
-                                             self._chunked_frames_body_size_received))
+        frame_cipher_text = self._rlpx_cipher.verify_frame_body_mac(frame_enc_body_bytes, body_size)
+        msg_type_is_expected = not self._chunked_frames_in_progress or self._current_frame_sequence_id == 0
+        self._decrypt_frame_body(frame_cipher_text, body_size, msg_type_is_expected)
 
-                if self._chunked_frames_body_size_received == self._chunked_frames_total_body_size:
-                    self._full_message_received = True
+        if not self._chunked_frames_in_progress or \
+                self._chunked_frames_body_size_received == self._chunked_frames_total_body_size:
+            self._full_message_received = True
 
-            self._receiving_frame = False
-
-        return self._full_message_received, self._current_msg_type
+        self._receiving_frame = False
+        self.frames_decoded += 1
+        return True
 
     def get_full_message(self):
         """
@@ -102,12 +134,18 @@ class FramedInputBuffer(object):
 
         assert self._full_message_received
 
-        message_length = self._payload_buffer.length
-        message = self._payload_buffer.remove_bytes(message_length)
+        message = self._payload_buffer
+        if message is None:
+            message = bytearray(0)
+        assert len(message) == self._payload_len_received
         msg_type = self._current_msg_type
 
         self._full_message_received = False
 
+        self._payload_buffer = None
+        self._payload_buffer_view = None
+        self._payload_len_received = 0
+
         self._receiving_frame = False
         self._chunked_frames_in_progress = False
         self._chunked_frames_total_body_size = False
@@ -121,3 +159,48 @@ class FramedInputBuffer(object):
         self._current_frame_sequence_id = None
 
         return message, msg_type
+
+    def _decrypt_frame_body(self, frame_cipher_text, body_size, msg_type_is_expected):
+        """
+        Decrypts frame body straight into the message payload buffer.
+        Only the message type and the padding are decrypted into separate buffers.
+        """
+
+        rlpx_cipher = self._rlpx_cipher
+        body_cipher_text = frame_cipher_text[:body_size]
+        payload_start = 0
+
+        if msg_type_is_expected:
+            if body_size == 0:
+                raise ParseError("Frame body is expected to start with message type")
+
+            encoded_msg_type = bytearray(rlpx_cipher.aes_decode(body_cipher_text[:1]))
+            payload_start = frame_utils.get_msg_type_len(encoded_msg_type[0])
+            if payload_start > body_size:
+                raise ParseError("Message type of {0} bytes does not fit into frame body of {1} bytes"
+                                 .format(payload_start, body_size))
+            encoded_msg_type += rlpx_cipher.aes_decode(body_cipher_text[1:payload_start])
+            _, self._current_msg_type = frame_utils.parse_frame_body(encoded_msg_type, True)
+
+            if self._chunked_frames_in_progress:
+                payload_len = self._chunked_frames_total_body_size - payload_start
+            else:
+                payload_len = body_size - payload_start
+            self._payload_buffer = bytearray(payload_len)
+            self._payload_buffer_view = memoryview(self._payload_buffer)
+            self._payload_len_received = 0
+        elif self._payload_buffer_view is None:
+            raise ParseError("Received chunked frame {0} before the first frame of the message"
+                             .format(self._current_frame_sequence_id))
+
+        frame_payload_len = body_size - payload_start
+        if frame_payload_len > 0:
+            payload_offset = self._payload_len_received
+            rlpx_cipher.aes_decode_into(
+                body_cipher_text[payload_start:],
+                self._payload_buffer_view[payload_offset:payload_offset + frame_payload_len]
+            )
+            self._payload_len_received += frame_payload_len
+
+        # padding keeps the cipher stream in line with the sender
+        rlpx_cipher.aes_decode(frame_cipher_text[body_size:])
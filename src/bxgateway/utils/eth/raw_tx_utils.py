@@ -0,0 +1,73 @@
+"""
+Reads fields of RLP encoded Ethereum transactions in place, without decoding them into `Transaction` objects.
+
+Transactions are addressed by the offset of their RLP item (including the item prefix) in a buffer, the same way as
+in `eth_common_utils.raw_tx_gas_price`. Transaction fields are [nonce, gas price, gas, to, value, data, v, r, s].
+"""
+from typing import Iterator, List, Optional, Tuple, Union
+
+from bxcommon.utils.blockchain_utils.eth import eth_common_utils, rlp_utils
+
+Buffer = Union[bytearray, bytes, memoryview]
+
+_NONCE_FIELD_INDEX = 0
+_TO_FIELD_INDEX = 3
+_VALUE_FIELD_INDEX = 4
+
+
+def iter_transactions(buf: Buffer, txs_list_offset: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    Iterates over RLP list of transactions that starts at `txs_list_offset`
+    :return: offset and length of each transaction item, including its RLP prefix
+    """
+    buf = memoryview(buf)
+    _, txs_list_length, txs_list_start = rlp_utils.consume_length_prefix(buf, txs_list_offset)
+    txs_list_end = txs_list_start + txs_list_length
+
+    tx_offset = txs_list_start
+    while tx_offset < txs_list_end:
+        _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(buf, tx_offset)
+        tx_end = tx_item_start + tx_item_length
+        yield tx_offset, tx_end - tx_offset
+        tx_offset = tx_end
+
+
+def get_gas_prices(buf: Buffer, txs_list_offset: int = 0) -> List[int]:
+    """
+    Reads gas prices of all transactions in RLP list of transactions that starts at `txs_list_offset`
+    """
+    buf = memoryview(buf)
+    return [
+        eth_common_utils.raw_tx_gas_price(buf, tx_offset) for tx_offset, _ in iter_transactions(buf, txs_list_offset)
+    ]
+
+
+def raw_tx_nonce(buf: Buffer, tx_offset: int) -> int:
+    nonce, _ = rlp_utils.decode_int(buf, _get_field_offset(buf, tx_offset, _NONCE_FIELD_INDEX))
+    return nonce
+
+
+def raw_tx_to(buf: Buffer, tx_offset: int) -> Optional[memoryview]:
+    """
+    :return: recipient address, or None for contract creation transactions
+    """
+    buf = memoryview(buf)
+    _, to_length, to_start = rlp_utils.consume_length_prefix(
+        buf, _get_field_offset(buf, tx_offset, _TO_FIELD_INDEX)
+    )
+    if to_length == 0:
+        return None
+    return buf[to_start:to_start + to_length]
+
+
+def raw_tx_value(buf: Buffer, tx_offset: int) -> int:
+    value, _ = rlp_utils.decode_int(buf, _get_field_offset(buf, tx_offset, _VALUE_FIELD_INDEX))
+    return value
+
+
+def _get_field_offset(buf: Buffer, tx_offset: int, field_index: int) -> int:
+    _, _, offset = rlp_utils.consume_length_prefix(buf, tx_offset)
+    for _ in range(field_index):
+        _, field_length, field_start = rlp_utils.consume_length_prefix(buf, offset)
+        offset = field_start + field_length
+    return offset
@@ -2,7 +2,6 @@ import os
 import random
 import struct
 import sys
-import pyelliptic
 import rlp
 from Crypto.Cipher import AES
 from rlp import sedes
@@ -89,7 +88,7 @@ class RLPxCipher(object):
 
         assert self._is_initiator
 
-        ecdh_shared_secret = self._ecc.get_ecdh_key(self._remote_pubkey)
+        ecdh_shared_secret = self._ecc.get_static_ecdh_key(self._remote_pubkey)
         token = ecdh_shared_secret
         flag = 0x0
         self._initiator_nonce = eth_common_utils.keccak_hash(rlp_utils.int_to_big_endian(random.randint(0, sys.maxsize)))
@@ -171,7 +170,7 @@ class RLPxCipher(object):
         else:
             (signature, pubkey, nonce, version) = self.parse_plain_auth_message(message)
 
-        token = self._ecc.get_ecdh_key(pubkey)
+        token = self._ecc.get_static_ecdh_key(pubkey)
         remote_ephemeral_pubkey = crypto_utils.recover_public_key(crypto_utils.string_xor(token, nonce),
                                                                   signature)
         if not self._ecc.is_valid_key(remote_ephemeral_pubkey):
@@ -342,11 +341,9 @@ class RLPxCipher(object):
         else:
             self._egress_mac, self._ingress_mac = mac2, mac1
 
-        iv = "\x00" * eth_common_constants.IV_LEN
-        self._aes_enc = pyelliptic.Cipher(self._aes_secret, iv, eth_common_constants.CIPHER_ENCRYPT_DO,
-                                          ciphername=eth_common_constants.RLPX_CIPHER_NAME)
-        self._aes_dec = pyelliptic.Cipher(self._aes_secret, iv, eth_common_constants.CIPHER_DECRYPT_DO,
-                                          ciphername=eth_common_constants.RLPX_CIPHER_NAME)
+        # AES-256-CTR with zero IV, which encrypts and decrypts directly into memoryviews of message buffers
+        self._aes_enc = AES.new(self._aes_secret, AES.MODE_CTR, nonce=b"", initial_value=0)
+        self._aes_dec = AES.new(self._aes_secret, AES.MODE_CTR, nonce=b"", initial_value=0)
         self._mac_enc = AES.new(self.mac_secret, AES.MODE_ECB).encrypt
 
         self._is_ready = True
@@ -358,34 +355,67 @@ class RLPxCipher(object):
         :return: encrypted frame
         """
 
+        return self.encrypt_frames([frame])
+
+    def encrypt_frames(self, frames):
+        """
+        Encrypts frames into a single buffer, preallocated for all frames of a message
+        :param frames: list of frames
+        :return: encrypted frames
+        """
+
+        buf = bytearray(sum(frame.get_frame_size() for frame in frames))
+        offset = 0
+        for frame in frames:
+            offset += self.encrypt_frame_into(frame, buf, offset)
+        assert offset == len(buf)
+        return buf
+
+    def encrypt_frame_into(self, frame, buf, offset):
+        """
+        Writes encrypted frame into a preallocated zero filled buffer.
+        Header and body are encrypted in place, so the frame payload is copied only once.
+        :param frame: frame data
+        :param buf: output buffer
+        :param offset: offset of the frame in the buffer
+        :return: number of bytes written
+        """
+
         if not isinstance(frame, Frame):
             raise TypeError("frame must be of type Frame but was {0}".format(type(frame)))
 
         if not self._is_ready:
             raise CipherNotInitializedError(f"failed to encrypt frame {frame}, the cipher was never initialized!")
 
-        header = frame.get_header()
-        body = frame.get_body()
+        mac_len = eth_common_constants.FRAME_MAC_LEN
+        buf_view = memoryview(buf)
 
         # header
-        header_ciphertext = self.aes_encode(header)
+        header_end = offset + eth_common_constants.FRAME_HDR_DATA_LEN
+        header_ciphertext = self.aes_encode(frame.get_header())
+        buf_view[offset:header_end] = header_ciphertext
 
         # egress-mac.update(aes(mac-secret,egress-mac) ^ header-ciphertext).digest
         header_mac = self.mac_egress(
-            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:eth_common_constants.FRAME_MAC_LEN]),
-                                    header_ciphertext))[:eth_common_constants.FRAME_MAC_LEN]
+            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:mac_len]), header_ciphertext))[:mac_len]
+        buf_view[header_end:header_end + mac_len] = header_mac
 
         # frame
-        frame_ciphertext = self.aes_encode(body)
-        assert len(frame_ciphertext) == len(body)
+        body_start = header_end + mac_len
+        body_len = frame.write_body(buf, body_start)
+        body_end = body_start + body_len
+        frame_view = buf_view[body_start:body_end]
+        self._aes_enc.encrypt(frame_view, output=frame_view)
+
         # egress-mac.update(aes(mac-secret,egress-mac) ^
         # left128(egress-mac.update(frame-ciphertext).digest))
-        fmac_seed = self.mac_egress(frame_ciphertext)
+        self._egress_mac.update(frame_view)
+        fmac_seed = self._egress_mac.digest()
         frame_mac = self.mac_egress(
-            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:eth_common_constants.FRAME_MAC_LEN]),
-                                    fmac_seed[:eth_common_constants.FRAME_MAC_LEN]))[:eth_common_constants.FRAME_MAC_LEN]
+            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:mac_len]), fmac_seed[:mac_len]))[:mac_len]
+        buf_view[body_end:body_end + mac_len] = frame_mac
 
-        return bytearray(header_ciphertext + header_mac + frame_ciphertext + frame_mac)
+        return body_end + mac_len - offset
 
     def decrypt_frame_header(self, data):
         """
@@ -425,10 +455,21 @@ class RLPxCipher(object):
         :return: decrypted frame body
         """
 
+        frame_cipher_text = self.verify_frame_body_mac(data, body_size)
+        return self.aes_decode(frame_cipher_text)[:body_size]
+
+    def verify_frame_body_mac(self, data, body_size):
+        """
+        Checks frame body mac without copying the frame body.
+        Frame body needs to be decrypted after this call, so that ingress mac and cipher stay in order.
+        :param data: frame data
+        :param body_size: body size
+        :return: memoryview of padded frame body cipher text
+        """
+
         if not self._is_ready:
             raise CipherNotInitializedError("failed to decrypt frame body, the cipher was never initialized!")
 
-
         # frame-size: 3-byte integer size of frame, big endian encoded (excludes padding)
         # frame relates to body w/o padding w/o mac
 
@@ -437,12 +478,14 @@ class RLPxCipher(object):
         if not len(data) >= read_size + eth_common_constants.FRAME_MAC_LEN:
             raise ParseError("Insufficient body length")
 
+        data = memoryview(data)
         frame_cipher_text = data[:read_size]
         frame_mac = data[read_size:read_size + eth_common_constants.FRAME_MAC_LEN]
 
         # ingres-mac.update(aes(mac-secret,ingres-mac) ^
         # left128(ingres-mac.update(frame-ciphertext).digest))
-        frame_mac_seed = self.mac_ingress(frame_cipher_text)
+        self._ingress_mac.update(frame_cipher_text)
+        frame_mac_seed = self._ingress_mac.digest()
         expected_frame_mac = self.mac_ingress(
             crypto_utils.string_xor(self._mac_enc(self.mac_ingress()[:eth_common_constants.FRAME_MAC_LEN]),
                                     frame_mac_seed[:eth_common_constants.FRAME_MAC_LEN]))[:eth_common_constants.FRAME_MAC_LEN]
@@ -450,27 +493,22 @@ class RLPxCipher(object):
         if not frame_mac == expected_frame_mac:
             raise AuthenticationError("Invalid frame mac")
 
-        return self.aes_decode(frame_cipher_text)[:body_size]
+        return frame_cipher_text
 
-    def aes_encode(self, data=""):
-        if isinstance(data, bytearray):
-            bytes_to_encode = bytes(data)
-        elif isinstance(data, memoryview):
-            bytes_to_encode = data.tobytes()
-        else:
-            bytes_to_encode = data
+    def aes_encode(self, data=b""):
+        return self._aes_enc.encrypt(data)
 
-        return self._aes_enc.update(bytes_to_encode)
+    def aes_decode(self, data=b""):
+        return self._aes_dec.decrypt(data)
 
-    def aes_decode(self, data=""):
-        if isinstance(data, bytearray):
-            bytes_to_decode = bytes(data)
-        elif isinstance(data, memoryview):
-            bytes_to_decode = data.tobytes()
-        else:
-            bytes_to_decode = data
+    def aes_decode_into(self, data, output):
+        """
+        Decrypts data into a writable buffer of the same length
+        :param data: cipher text
+        :param output: output buffer
+        """
 
-        return self._aes_dec.update(bytes_to_decode)
+        self._aes_dec.decrypt(data, output=output)
 
     def mac_egress(self, data=b""):
         data = rlp_utils.str_to_bytes(data)
@@ -0,0 +1,58 @@
+"""
+Snappy compression of devp2p message payloads.
+
+Peers that both announce p2p protocol version 5 or higher in their Hello messages compress the payload of every
+message sent after Hello with the snappy block format. Message type is not compressed. Compression is only
+negotiated if python-snappy is available.
+"""
+from typing import Union
+
+from bxcommon.exceptions import ParseError
+from bxgateway import gateway_constants
+
+try:
+    import snappy
+except ImportError:
+    snappy = None
+
+Payload = Union[bytearray, bytes, memoryview]
+
+
+def is_available() -> bool:
+    return snappy is not None
+
+
+def compress(payload: Payload) -> bytes:
+    assert snappy is not None
+    return snappy.compress(bytes(payload))
+
+
+def decompress(payload: Payload) -> bytearray:
+    """
+    Decompresses message payload, rejecting payloads that decompress to more than
+    `ETH_MAX_DECOMPRESSED_MESSAGE_SIZE` bytes before allocating memory for them
+    """
+    assert snappy is not None
+    uncompressed_len = get_uncompressed_len(payload)
+    if uncompressed_len > gateway_constants.ETH_MAX_DECOMPRESSED_MESSAGE_SIZE:
+        raise ParseError(
+            f"Snappy compressed message decompresses to {uncompressed_len} bytes, more than the limit of "
+            f"{gateway_constants.ETH_MAX_DECOMPRESSED_MESSAGE_SIZE} bytes"
+        )
+
+    try:
+        return bytearray(snappy.decompress(bytes(payload)))
+    except snappy.UncompressError as e:
+        raise ParseError(f"Invalid snappy compressed message: {e}")
+
+
+def get_uncompressed_len(payload: Payload) -> int:
+    """
+    Reads uncompressed length, which prefixes snappy blocks as an unsigned little endian varint
+    """
+    uncompressed_len = 0
+    for i, byte in enumerate(memoryview(payload)[:5]):
+        uncompressed_len |= (byte & 0x7f) << (7 * i)
+        if byte < 0x80:
+            return uncompressed_len
+    raise ParseError("Invalid uncompressed length of snappy compressed message")
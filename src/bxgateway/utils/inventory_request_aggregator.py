@@ -0,0 +1,141 @@
+from typing import Callable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from prometheus_client import Counter
+
+from bxcommon import constants
+from bxcommon.utils.alarm_queue import AlarmId
+from bxcommon.utils.expiring_set import ExpiringSet
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxutils import logging
+
+if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+
+logger = logging.get_logger(__name__)
+
+InventoryItem = Tuple[int, Sha256Hash]
+
+inventory_items_requested = Counter(
+    "inventory_items_requested", "Number of transactions requested from blockchain nodes"
+)
+inventory_requests_sent = Counter(
+    "inventory_requests_sent", "Number of batched transaction requests sent to blockchain nodes"
+)
+inventory_duplicates_suppressed = Counter(
+    "inventory_duplicates_suppressed",
+    "Number of transaction announcements not requested, since the transaction was already requested"
+)
+inventory_known_transactions_suppressed = Counter(
+    "inventory_known_transactions_suppressed",
+    "Number of transaction announcements not requested, since the transaction is in transaction service"
+)
+
+
+class InventoryRequestAggregator:
+    """
+    Aggregates transaction announcements of a blockchain node into batched data requests.
+
+    Announced transactions that are in transaction service, pending a request or were requested recently
+    are suppressed. The rest are requested in batches of up to `INVENTORY_REQUEST_MAX_BATCH_SIZE` items
+    once per `--inventory-request-batch-interval-ms`.
+    """
+
+    node: "AbstractGatewayNode"
+
+    def __init__(self, node: "AbstractGatewayNode", request_items: Callable[[List[InventoryItem]], None]) -> None:
+        """
+        :param node: gateway node
+        :param request_items: sends a data request for a batch of inventory items to the blockchain node
+        """
+        self.node = node
+        self._request_items = request_items
+        self._pending_items: List[InventoryItem] = []
+        self._pending_item_hashes: Set[Sha256Hash] = set()
+        self._requested_item_hashes: ExpiringSet[Sha256Hash] = ExpiringSet(
+            node.alarm_queue, gateway_constants.INVENTORY_REQUEST_EXPIRATION_TIME_S, "inventory_requested_items"
+        )
+        self._alarm_id: Optional[AlarmId] = None
+
+    def __len__(self) -> int:
+        return len(self._pending_items)
+
+    def add(self, inventory_type: int, item_hash: Sha256Hash) -> bool:
+        """
+        Queues an announced transaction for the next data request.
+        :return: if the transaction was queued
+        """
+        if item_hash in self._pending_item_hashes or item_hash in self._requested_item_hashes.contents:
+            inventory_duplicates_suppressed.inc()
+            return False
+        if self.node.get_tx_service().has_transaction_contents(item_hash):
+            inventory_known_transactions_suppressed.inc()
+            return False
+
+        self._pending_items.append((inventory_type, item_hash))
+        self._pending_item_hashes.add(item_hash)
+        return True
+
+    def is_batching(self) -> bool:
+        return self._get_batch_interval_s() > 0
+
+    def take_pending(self, max_items: Optional[int] = None) -> List[InventoryItem]:
+        """
+        Removes up to `max_items` pending items to be requested by the caller, e.g. along with blocks.
+        """
+        if max_items is None:
+            max_items = gateway_constants.INVENTORY_REQUEST_MAX_BATCH_SIZE
+        items = self._pending_items[:max_items]
+        del self._pending_items[:max_items]
+        self._on_items_requested(items)
+        if not self._pending_items:
+            self._cancel_alarm()
+        return items
+
+    def schedule_request(self) -> None:
+        """
+        Requests pending items once the batch interval passes, or right away if a full batch is pending
+        or batching is disabled.
+        """
+        if not self._pending_items:
+            return
+
+        if (
+            not self.is_batching()
+            or len(self._pending_items) >= gateway_constants.INVENTORY_REQUEST_MAX_BATCH_SIZE
+        ):
+            self.request_pending()
+        elif self._alarm_id is None:
+            self._alarm_id = self.node.alarm_queue.register_alarm(
+                self._get_batch_interval_s(), self._request_pending_alarm
+            )
+
+    def request_pending(self) -> None:
+        self._cancel_alarm()
+        while self._pending_items:
+            items = self.take_pending()
+            logger.trace("Requesting {} announced transactions from blockchain node.", len(items))
+            self._request_items(items)
+            inventory_requests_sent.inc()
+
+    def _request_pending_alarm(self) -> int:
+        self._alarm_id = None
+        self.request_pending()
+        return constants.CANCEL_ALARMS
+
+    def _on_items_requested(self, items: List[InventoryItem]) -> None:
+        for _, item_hash in items:
+            self._pending_item_hashes.discard(item_hash)
+            self._requested_item_hashes.add(item_hash)
+        inventory_items_requested.inc(len(items))
+
+    def _cancel_alarm(self) -> None:
+        alarm_id = self._alarm_id
+        if alarm_id is not None:
+            self.node.alarm_queue.unregister_alarm(alarm_id)
+            self._alarm_id = None
+
+    def _get_batch_interval_s(self) -> float:
+        return self.node.opts.inventory_request_batch_interval_ms / 1000
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Type, Dict, Any, TYPE_CHECKING
 
 from bxcommon.utils.stats import stats_format
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
 class EthGatewayStatInterval(StatsIntervalData):
     total_encryption_time: float = 0
     total_encrypted_msgs_count: int = 0
+    total_encrypted_frames_count: int = 0
     max_encryption_time: float = 0
     total_decryption_time: float = 0
     total_decrypted_msgs_count: int = 0
@@ -24,6 +26,40 @@ class EthGatewayStatInterval(StatsIntervalData):
     total_serialization_time: float = 0
     total_serialized_msgs_count: int = 0
     max_serialization_time: float = 0
+    total_input_reads: int = 0
+    total_input_read_msgs_count: int = 0
+    total_input_read_frames_count: int = 0
+    total_handshakes_count: int = 0
+    total_handshake_time: float = 0
+    max_handshake_time: float = 0
+    total_handshake_crypto_time: float = 0
+    max_handshake_crypto_time: float = 0
+    total_compressed_msgs_count: int = 0
+    total_compressed_msgs_cache_hits: int = 0
+    total_compression_time: float = 0
+    total_compression_input_bytes: int = 0
+    total_compression_output_bytes: int = 0
+    total_decompressed_msgs_count: int = 0
+    total_decompression_time: float = 0
+    total_decompression_input_bytes: int = 0
+    total_decompression_output_bytes: int = 0
+    total_announced_txs_count: int = 0
+    total_announced_tx_bytes: int = 0
+    total_announcement_msgs_bytes: int = 0
+    total_known_txs_skipped_count: int = 0
+    total_known_tx_bytes_skipped: int = 0
+    total_pooled_txs_requested_count: int = 0
+    total_pooled_txs_served_count: int = 0
+    total_pooled_tx_bytes_served: int = 0
+    total_pooled_txs_fetched_count: int = 0
+    total_pooled_tx_fetches_in_flight_count: int = 0
+    total_headers_requests_count: int = 0
+    total_headers_response_cache_hits: int = 0
+    total_bodies_requests_count: int = 0
+    total_bodies_response_cache_hits: int = 0
+    total_remote_requests_count: int = 0
+    total_remote_response_cache_hits: int = 0
+    total_remote_requests_coalesced: int = 0
 
 
 class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "AbstractGatewayNode"]):
@@ -43,9 +79,10 @@ class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "Abstrac
     def get_interval_data_class(self) -> Type[EthGatewayStatInterval]:
         return EthGatewayStatInterval
 
-    def log_encrypted_message(self, time: float) -> None:
+    def log_encrypted_message(self, time: float, frames_count: int = 1) -> None:
         self.interval_data.total_encryption_time += time
         self.interval_data.total_encrypted_msgs_count += 1
+        self.interval_data.total_encrypted_frames_count += frames_count
         self.interval_data.max_encryption_time = max(self.interval_data.max_encryption_time, time)
 
     def log_decrypted_message(self, time: float) -> None:
@@ -54,6 +91,106 @@ class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "Abstrac
         self.interval_data.total_decrypted_msgs_count += 1
         self.interval_data.max_decryption_time = max(self.interval_data.max_decryption_time, time)
 
+    def log_input_read(self, msgs_count: int, frames_count: int) -> None:
+        """
+        Logs messages and frames decoded from input buffer in one pass after a socket read
+        """
+        self.interval_data.total_input_reads += 1
+        self.interval_data.total_input_read_msgs_count += msgs_count
+        self.interval_data.total_input_read_frames_count += frames_count
+
+    def log_handshake(self, handshake_time: float, crypto_time: float) -> None:
+        """
+        Logs RLPx handshake completed with Ethereum node
+        :param handshake_time: time from connection setup until the cipher is ready
+        :param crypto_time: time spent in handshake cryptography, excluding time queued in executor
+        """
+        self.interval_data.total_handshakes_count += 1
+        self.interval_data.total_handshake_time += handshake_time
+        self.interval_data.max_handshake_time = max(self.interval_data.max_handshake_time, handshake_time)
+        self.interval_data.total_handshake_crypto_time += crypto_time
+        self.interval_data.max_handshake_crypto_time = max(
+            self.interval_data.max_handshake_crypto_time, crypto_time
+        )
+
+    def log_compressed_message(self, time: float, msg_size: int, compressed_size: int, cache_hit: bool) -> None:
+        """
+        Logs snappy compressed message sent to Ethereum node
+        """
+        self.interval_data.total_compressed_msgs_count += 1
+        if cache_hit:
+            self.interval_data.total_compressed_msgs_cache_hits += 1
+        self.interval_data.total_compression_time += time
+        self.interval_data.total_compression_input_bytes += msg_size
+        self.interval_data.total_compression_output_bytes += compressed_size
+
+    def log_decompressed_message(self, time: float, compressed_size: int, msg_size: int) -> None:
+        """
+        Logs snappy compressed message received from Ethereum node
+        """
+        self.interval_data.total_decompressed_msgs_count += 1
+        self.interval_data.total_decompression_time += time
+        self.interval_data.total_decompression_input_bytes += compressed_size
+        self.interval_data.total_decompression_output_bytes += msg_size
+
+    def log_tx_announcement(self, txs_count: int, tx_bytes: int, announcement_msg_bytes: int) -> None:
+        """
+        Logs hashes of transactions announced to Ethereum node instead of transaction bodies
+        """
+        self.interval_data.total_announced_txs_count += txs_count
+        self.interval_data.total_announced_tx_bytes += tx_bytes
+        self.interval_data.total_announcement_msgs_bytes += announcement_msg_bytes
+
+    def log_known_txs_skipped(self, txs_count: int, tx_bytes: int) -> None:
+        """
+        Logs transactions not sent to Ethereum node, since the node already has them
+        """
+        self.interval_data.total_known_txs_skipped_count += txs_count
+        self.interval_data.total_known_tx_bytes_skipped += tx_bytes
+
+    def log_pooled_txs_request(self, requested_count: int, served_count: int, served_bytes: int) -> None:
+        """
+        Logs transaction bodies requested by Ethereum node
+        """
+        self.interval_data.total_pooled_txs_requested_count += requested_count
+        self.interval_data.total_pooled_txs_served_count += served_count
+        self.interval_data.total_pooled_tx_bytes_served += served_bytes
+
+    def log_pooled_txs_fetch(self, fetched_count: int, in_flight_count: int) -> None:
+        """
+        Logs transactions announced by Ethereum node that are requested from it, and announced transactions
+        that are not requested again since a request for them is in flight
+        """
+        self.interval_data.total_pooled_txs_fetched_count += fetched_count
+        self.interval_data.total_pooled_tx_fetches_in_flight_count += in_flight_count
+
+    def log_headers_request(self, cache_hit: bool) -> None:
+        """
+        Logs GetBlockHeaders request of Ethereum node looked up in block response cache
+        """
+        self.interval_data.total_headers_requests_count += 1
+        if cache_hit:
+            self.interval_data.total_headers_response_cache_hits += 1
+
+    def log_bodies_request(self, cache_hit: bool) -> None:
+        """
+        Logs GetBlockBodies request of Ethereum node looked up in block response cache
+        """
+        self.interval_data.total_bodies_requests_count += 1
+        if cache_hit:
+            self.interval_data.total_bodies_response_cache_hits += 1
+
+    def log_remote_request(self, cache_hit: bool, coalesced: bool) -> None:
+        """
+        Logs GetReceipts or GetNodeData request of Ethereum node, which is answered from remote response cache,
+        shares a request in flight to the remote blockchain node, or is proxied to it
+        """
+        self.interval_data.total_remote_requests_count += 1
+        if cache_hit:
+            self.interval_data.total_remote_response_cache_hits += 1
+        if coalesced:
+            self.interval_data.total_remote_requests_coalesced += 1
+
     def log_serialized_message(self, time: float) -> None:
         self.interval_data.total_serialization_time += time
         self.interval_data.total_serialized_msgs_count += 1
@@ -86,12 +223,80 @@ class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "Abstrac
         else:
             average_serialization_time = 0
 
+        if self.interval_data.total_input_reads > 0:
+            average_msgs_per_read = (
+                self.interval_data.total_input_read_msgs_count / self.interval_data.total_input_reads
+            )
+        else:
+            average_msgs_per_read = 0
+
+        if self.interval_data.total_handshakes_count > 0:
+            average_handshake_time = (
+                self.interval_data.total_handshake_time / self.interval_data.total_handshakes_count
+            )
+            average_handshake_crypto_time = (
+                self.interval_data.total_handshake_crypto_time / self.interval_data.total_handshakes_count
+            )
+        else:
+            average_handshake_time = 0
+            average_handshake_crypto_time = 0
+
+        interval_data = self.interval_data
+        compression_bytes_saved = (
+            interval_data.total_compression_input_bytes - interval_data.total_compression_output_bytes
+        )
+        decompression_bytes_saved = (
+            interval_data.total_decompression_output_bytes - interval_data.total_decompression_input_bytes
+        )
+        uncompressed_bytes = (
+            interval_data.total_compression_input_bytes + interval_data.total_decompression_output_bytes
+        )
+        if uncompressed_bytes > 0:
+            compression_savings = (compression_bytes_saved + decompression_bytes_saved) / uncompressed_bytes
+        else:
+            compression_savings = 0
+
+        pooled_tx_bytes_avoided = (
+            interval_data.total_announced_tx_bytes
+            + interval_data.total_known_tx_bytes_skipped
+            - interval_data.total_announcement_msgs_bytes
+            - interval_data.total_pooled_tx_bytes_served
+        )
+
+        if interval_data.total_headers_requests_count > 0:
+            headers_response_cache_hit_rate = (
+                interval_data.total_headers_response_cache_hits / interval_data.total_headers_requests_count
+            )
+        else:
+            headers_response_cache_hit_rate = 0
+
+        if interval_data.total_bodies_requests_count > 0:
+            bodies_response_cache_hit_rate = (
+                interval_data.total_bodies_response_cache_hits / interval_data.total_bodies_requests_count
+            )
+        else:
+            bodies_response_cache_hit_rate = 0
+
+        if interval_data.total_remote_requests_count > 0:
+            remote_response_cache_hit_rate = (
+                interval_data.total_remote_response_cache_hits / interval_data.total_remote_requests_count
+            )
+        else:
+            remote_response_cache_hit_rate = 0
+
+        interval_duration = (datetime.utcnow() - self.interval_data.start_time).total_seconds()
+        if interval_duration > 0:
+            frames_per_second = self.interval_data.total_input_read_frames_count / interval_duration
+        else:
+            frames_per_second = 0
+
         return {
             "total_encrypted_msgs_count": self.interval_data.total_encrypted_msgs_count,
             "average_encryption_time": stats_format.duration(average_encryption_time * 1000),
             "max_encryption_time": stats_format.duration(
                 self.interval_data.max_encryption_time * 1000
             ),
+            "total_encrypted_frames_count": self.interval_data.total_encrypted_frames_count,
             "total_decrypted_msgs_count": self.interval_data.total_decrypted_msgs_count,
             "average_decryption_time": stats_format.duration(average_decryption_time * 1000),
             "max_decryption_time": stats_format.duration(
@@ -102,6 +307,39 @@ class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "Abstrac
             "max_serialization_time": stats_format.duration(
                 self.interval_data.max_serialization_time * 1000
             ),
+            "total_input_reads": self.interval_data.total_input_reads,
+            "average_msgs_per_read": round(average_msgs_per_read, 2),
+            "frames_per_second": round(frames_per_second, 2),
+            "total_handshakes_count": self.interval_data.total_handshakes_count,
+            "average_handshake_time": stats_format.duration(average_handshake_time * 1000),
+            "max_handshake_time": stats_format.duration(self.interval_data.max_handshake_time * 1000),
+            "average_handshake_crypto_time": stats_format.duration(average_handshake_crypto_time * 1000),
+            "max_handshake_crypto_time": stats_format.duration(
+                self.interval_data.max_handshake_crypto_time * 1000
+            ),
+            "total_compressed_msgs_count": interval_data.total_compressed_msgs_count,
+            "total_compressed_msgs_cache_hits": interval_data.total_compressed_msgs_cache_hits,
+            "total_compression_time": stats_format.duration(interval_data.total_compression_time * 1000),
+            "total_decompressed_msgs_count": interval_data.total_decompressed_msgs_count,
+            "total_decompression_time": stats_format.duration(interval_data.total_decompression_time * 1000),
+            "compression_bytes_saved_sent": compression_bytes_saved,
+            "compression_bytes_saved_received": decompression_bytes_saved,
+            "compression_savings": round(compression_savings, 4),
+            "total_announced_txs_count": interval_data.total_announced_txs_count,
+            "total_known_txs_skipped_count": interval_data.total_known_txs_skipped_count,
+            "total_known_tx_bytes_skipped": interval_data.total_known_tx_bytes_skipped,
+            "total_pooled_txs_requested_count": interval_data.total_pooled_txs_requested_count,
+            "total_pooled_txs_served_count": interval_data.total_pooled_txs_served_count,
+            "total_pooled_txs_fetched_count": interval_data.total_pooled_txs_fetched_count,
+            "total_pooled_tx_fetches_in_flight_count": interval_data.total_pooled_tx_fetches_in_flight_count,
+            "pooled_tx_bytes_avoided": pooled_tx_bytes_avoided,
+            "total_headers_requests_count": interval_data.total_headers_requests_count,
+            "headers_response_cache_hit_rate": round(headers_response_cache_hit_rate, 4),
+            "total_bodies_requests_count": interval_data.total_bodies_requests_count,
+            "bodies_response_cache_hit_rate": round(bodies_response_cache_hit_rate, 4),
+            "total_remote_requests_count": interval_data.total_remote_requests_count,
+            "remote_response_cache_hit_rate": round(remote_response_cache_hit_rate, 4),
+            "total_remote_requests_coalesced": interval_data.total_remote_requests_coalesced,
         }
 
 
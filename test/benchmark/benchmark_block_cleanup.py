@@ -0,0 +1,95 @@
+"""
+Compares the per-transaction removal loop of a confirmed block's transactions with bulk removal through
+`GatewayTransactionService.remove_block_transactions`, which removes them in one pass over the transaction maps.
+
+Run from the test directory:
+    PYTHONPATH=../../bxcommon/src:../src python -m benchmark.benchmark_block_cleanup
+"""
+import time
+from typing import Callable, List, Tuple
+
+from bxcommon.test_utils import helpers
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+
+BLOCK_TX_COUNTS = [1000, 5000]
+MEMPOOL_TX_COUNT = 20000
+TX_SIZE = 250
+RUNS = 5
+
+
+def _create_transaction_service(block_tx_count: int) -> Tuple[GatewayTransactionService, List[Sha256Hash]]:
+    node = MockGatewayNode(gateway_helpers.get_gateway_opts(8000))
+    transaction_service = GatewayTransactionService(node, 0)
+    tx_hashes = []
+    for short_id in range(1, MEMPOOL_TX_COUNT + 1):
+        tx_hash = helpers.generate_object_hash()
+        transaction_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(TX_SIZE))
+        transaction_service.assign_short_id(tx_hash, short_id)
+        tx_hashes.append(tx_hash)
+    return transaction_service, tx_hashes[:block_tx_count]
+
+
+def _remove_loop(transaction_service: GatewayTransactionService, block_tx_hashes: List[Sha256Hash]) -> int:
+    short_ids = []
+    unknown_tx_hashes = []
+    for tx_hash in block_tx_hashes:
+        tx_short_ids = transaction_service.remove_transaction_by_tx_hash(tx_hash, force=True)
+        if tx_short_ids is None:
+            unknown_tx_hashes.append(tx_hash)
+        else:
+            short_ids.extend(tx_short_ids)
+    return len(short_ids)
+
+
+def _remove_confirmation_loop(
+    transaction_service: GatewayTransactionService, block_tx_hashes: List[Sha256Hash]
+) -> int:
+    # block confirmations carry both short ids and hashes of block transactions
+    for short_id in range(1, len(block_tx_hashes) + 1):
+        transaction_service.remove_transaction_by_short_id(short_id, remove_related_short_ids=True)
+    for tx_hash in block_tx_hashes:
+        transaction_service.remove_transaction_by_tx_hash(tx_hash, force=True)
+    return len(block_tx_hashes)
+
+
+def _remove_confirmation_bulk(
+    transaction_service: GatewayTransactionService, block_tx_hashes: List[Sha256Hash]
+) -> int:
+    transaction_service.remove_block_transactions(block_tx_hashes, range(1, len(block_tx_hashes) + 1))
+    return len(block_tx_hashes)
+
+
+def _remove_bulk(transaction_service: GatewayTransactionService, block_tx_hashes: List[Sha256Hash]) -> int:
+    return len(transaction_service.remove_block_transactions(block_tx_hashes).short_ids)
+
+
+def _measure(block_tx_count: int, remove: Callable[[GatewayTransactionService, List[Sha256Hash]], int]) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        transaction_service, block_tx_hashes = _create_transaction_service(block_tx_count)
+        start = time.perf_counter()
+        assert remove(transaction_service, block_tx_hashes) == block_tx_count
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_benchmark(block_tx_count: int) -> None:
+    loop_ms = _measure(block_tx_count, _remove_loop)
+    bulk_ms = _measure(block_tx_count, _remove_bulk)
+    confirmation_loop_ms = _measure(block_tx_count, _remove_confirmation_loop)
+    confirmation_bulk_ms = _measure(block_tx_count, _remove_confirmation_bulk)
+    print(
+        f"block: {block_tx_count:>5} txs | per-transaction removal: {loop_ms:8.2f} ms | "
+        f"bulk removal: {bulk_ms:8.2f} ms ({loop_ms / bulk_ms:5.2f}x) | "
+        f"confirmation per-transaction removal: {confirmation_loop_ms:8.2f} ms | "
+        f"confirmation bulk removal: {confirmation_bulk_ms:8.2f} ms "
+        f"({confirmation_loop_ms / confirmation_bulk_ms:5.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    for count in BLOCK_TX_COUNTS:
+        run_benchmark(count)
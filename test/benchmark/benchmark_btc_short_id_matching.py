@@ -0,0 +1,77 @@
+"""
+Compares per-transaction BIP152 short id matching with batched matching of compact block short ids.
+
+Run from the test directory:
+    PYTHONPATH=../../bxcommon/src:../src python -m benchmark.benchmark_btc_short_id_matching
+"""
+import os
+import random
+import time
+from typing import Callable, Dict, List
+
+from csiphash import siphash24
+
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.utils.btc import btc_short_id_matcher
+from bxgateway.utils.btc.btc_short_id_index import BtcShortIdIndex
+
+MEMPOOL_SIZES = [50000, 200000]
+BLOCK_TX_COUNT = 2500
+RUNS = 5
+
+
+def _match_short_ids_loop(key: bytes, tx_hashes: List[Sha256Hash], short_ids: Dict[bytes, int]) -> int:
+    matches = {}
+    for tx_hash in tx_hashes:
+        tx_short_id = siphash24(key, bytes(tx_hash.binary[::-1]))[0:6]
+        if tx_short_id in short_ids:
+            matches[tx_short_id] = tx_hash
+        if len(matches) == len(short_ids):
+            break
+    return len(matches)
+
+
+def _match_short_ids_batched(key: bytes, tx_hashes: List[Sha256Hash], short_ids: Dict[bytes, int]) -> int:
+    return len(btc_short_id_matcher.match_short_ids(key, tx_hashes, short_ids))
+
+
+def _measure(func: Callable[[], int]) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_benchmark(mempool_size: int) -> None:
+    key = os.urandom(16)
+    tx_hashes = [Sha256Hash(os.urandom(32)) for _ in range(mempool_size)]
+    block_tx_hashes = random.sample(tx_hashes, BLOCK_TX_COUNT)
+    short_ids = {
+        siphash24(key, bytes(tx_hash.binary[::-1]))[0:6]: index for index, tx_hash in enumerate(block_tx_hashes)
+    }
+    packed_tx_ids = btc_short_id_matcher.pack_tx_ids(tx_hashes)
+    short_id_index = BtcShortIdIndex()
+    short_id_index.rebuild(tx_hashes)
+
+    loop_ms = _measure(lambda: _match_short_ids_loop(key, tx_hashes, short_ids))
+    batched_ms = _measure(lambda: _match_short_ids_batched(key, tx_hashes, short_ids))
+    prepacked_ms = _measure(
+        lambda: len(btc_short_id_matcher.match_short_ids(key, tx_hashes, short_ids, packed_tx_ids))
+    )
+    index_ms = _measure(lambda: len(short_id_index.match_short_ids(key, short_ids)))
+    assert _match_short_ids_loop(key, tx_hashes, short_ids) == _match_short_ids_batched(key, tx_hashes, short_ids)
+
+    print(
+        f"mempool: {mempool_size:>7} txs, block: {BLOCK_TX_COUNT} short ids | "
+        f"loop: {loop_ms:8.2f} ms | batched: {batched_ms:8.2f} ms ({loop_ms / batched_ms:5.1f}x) | "
+        f"batched, pre-packed tx ids: {prepacked_ms:8.2f} ms ({loop_ms / prepacked_ms:5.1f}x) | "
+        f"short id index: {index_ms:8.2f} ms ({loop_ms / index_ms:5.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    print(f"vectorized: {btc_short_id_matcher.is_vectorized()}")
+    for size in MEMPOOL_SIZES:
+        run_benchmark(size)
@@ -0,0 +1,89 @@
+"""
+Compares RLPx frame window sizes for propagating a block to the local Ethereum node: framing and encryption
+on the gateway side, and decryption of all frames on the node side.
+Also estimates the fixed per-frame cost (header encryption and MAC updates) from encrypting empty frames.
+
+Run from the test directory:
+    PYTHONPATH=../../bxcommon/src:../src python -m benchmark.benchmark_eth_frame_size
+"""
+import os
+import time
+from typing import Callable, Tuple
+
+from bxcommon.utils.blockchain_utils.eth import crypto_utils, eth_common_constants
+from bxcommon.utils.buffers.input_buffer import InputBuffer
+from bxgateway import gateway_constants
+from bxgateway.messages.eth.protocol.eth_protocol_message_type import EthProtocolMessageType
+from bxgateway.utils.eth import frame_utils
+from bxgateway.utils.eth.framed_input_buffer import FramedInputBuffer
+from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
+
+BLOCK_SIZES = [100 * 1024, 1024 * 1024]
+FRAME_SIZES = [
+    eth_common_constants.DEFAULT_FRAME_SIZE,
+    64 * 1024,
+    256 * 1024,
+    1024 * 1024,
+    gateway_constants.ETH_MAX_FRAME_SIZE,
+]
+EMPTY_FRAMES_COUNT = 10000
+RUNS = 10
+
+
+def _create_ciphers() -> Tuple[RLPxCipher, RLPxCipher]:
+    private_key1 = crypto_utils.make_private_key(os.urandom(111))
+    private_key2 = crypto_utils.make_private_key(os.urandom(111))
+    cipher1 = RLPxCipher(True, private_key1, crypto_utils.private_to_public_key(private_key2))
+    cipher2 = RLPxCipher(False, private_key2, crypto_utils.private_to_public_key(private_key1))
+
+    decrypted_auth_msg, _ = cipher2.decrypt_auth_message(
+        cipher1.encrypt_auth_message(cipher1.create_auth_message())
+    )
+    cipher2.parse_auth_message(decrypted_auth_msg)
+    cipher1.decrypt_auth_ack_message(cipher2.encrypt_auth_ack_message(cipher2.create_auth_ack_message()))
+    cipher1.setup_cipher()
+    cipher2.setup_cipher()
+    return cipher1, cipher2
+
+
+def _measure(func: Callable[[], None]) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure_frame_cost() -> float:
+    cipher, _ = _create_ciphers()
+    frame = frame_utils.get_frames(EthProtocolMessageType.PING, bytearray(0))[0]
+    elapsed_ms = _measure(lambda: [cipher.encrypt_frame(frame) for _ in range(EMPTY_FRAMES_COUNT)])
+    return elapsed_ms * 1000 / EMPTY_FRAMES_COUNT
+
+
+def run_benchmark(block_size: int, frame_size: int) -> None:
+    gateway_cipher, node_cipher = _create_ciphers()
+    framed_input_buffer = FramedInputBuffer(node_cipher)
+    input_buffer = InputBuffer()
+    block = bytearray(os.urandom(block_size))
+    frames_count = len(frame_utils.get_frames(EthProtocolMessageType.NEW_BLOCK, block, 0, frame_size))
+
+    def _send_block() -> None:
+        frames = frame_utils.get_frames(EthProtocolMessageType.NEW_BLOCK, block, 0, frame_size)
+        input_buffer.add_bytes(gateway_cipher.encrypt_frames(frames))
+        messages = framed_input_buffer.drain_messages(input_buffer)
+        assert len(messages) == 1 and len(messages[0][1]) == block_size
+
+    elapsed_ms = _measure(_send_block)
+    print(
+        f"block: {block_size:>8} bytes | frame size: {frame_size:>8} | frames: {frames_count:>4} | "
+        f"encrypt + decrypt: {elapsed_ms:7.3f} ms | {block_size * 1000 / elapsed_ms / (1024 * 1024):8.1f} MB/s"
+    )
+
+
+if __name__ == "__main__":
+    print(f"fixed cost per frame: {measure_frame_cost():.2f} us")
+    for size in BLOCK_SIZES:
+        for window in FRAME_SIZES:
+            run_benchmark(size, window)
@@ -0,0 +1,115 @@
+"""
+Measures compression and decompression of the sample Ontology block and consensus message with the normal
+and extension message converters.
+
+Run from the test directory:
+    PYTHONPATH=../../bxcommon/src:../src python -m benchmark.benchmark_ont_message_conversion
+"""
+import os
+import time
+from argparse import Namespace
+from typing import Callable, Type, Union
+
+from bxcommon.constants import DEFAULT_TX_MEM_POOL_BUCKET_SIZE
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils import convert
+from bxgateway.messages.ont import ont_consensus_message_converter_factory, ont_message_converter_factory
+from bxgateway.messages.ont.abstract_ont_message_converter import AbstractOntMessageConverter
+from bxgateway.messages.ont.block_ont_message import BlockOntMessage
+from bxgateway.messages.ont.consensus_ont_message import OntConsensusMessage
+from bxgateway.testing import gateway_helpers
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "unit", "samples")
+MAGIC = 123
+RUNS = 200
+
+OntBlockMessage = Union[BlockOntMessage, OntConsensusMessage]
+
+
+def _load_sample(file_name: str) -> bytearray:
+    with open(os.path.join(SAMPLES_DIR, file_name)) as sample_file:
+        return bytearray(convert.hex_to_bytes(sample_file.read().strip("\n")))
+
+
+def _create_transaction_service(use_extensions: bool) -> TransactionService:
+    node = MockNode(gateway_helpers.get_gateway_opts(8999))
+    if use_extensions:
+        from bxcommon.services.extension_transaction_service import ExtensionTransactionService
+        helpers.set_extensions_parallelism()
+        return ExtensionTransactionService(node, 0)
+    return TransactionService(node, 0)
+
+
+def _create_converter(
+    factory: Callable[[int, Namespace], AbstractOntMessageConverter], use_extensions: bool
+) -> AbstractOntMessageConverter:
+    opts = Namespace()
+    opts.use_extensions = use_extensions
+    opts.import_extensions = use_extensions
+    opts.tx_mem_pool_bucket_size = DEFAULT_TX_MEM_POOL_BUCKET_SIZE
+    return factory(MAGIC, opts)
+
+
+def _measure(func: Callable[[], None]) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_benchmark(
+    name: str,
+    block_bytes: bytearray,
+    message_cls: Type[OntBlockMessage],
+    factory: Callable[[int, Namespace], AbstractOntMessageConverter],
+    use_extensions: bool,
+    compressed: bool
+) -> None:
+    converter = _create_converter(factory, use_extensions)
+    tx_service = _create_transaction_service(use_extensions)
+    block_msg = message_cls(buf=bytearray(block_bytes))
+    if compressed:
+        for short_id, (tx, tx_hash) in enumerate(zip(block_msg.txns(), block_msg.tx_hashes()), 1):
+            tx_service.assign_short_id(tx_hash, short_id)
+            tx_service.set_transaction_contents(tx_hash, tx)
+
+    # messages are parsed from fresh buffers, since parsing is part of compressing a block received from the node
+    compress_ms = _measure(
+        lambda: converter.block_to_bx_block(message_cls(buf=bytearray(block_bytes)), tx_service, True, 0)
+    )
+    bx_block, block_info = converter.block_to_bx_block(block_msg, tx_service, True, 0)
+    decompress_ms = _measure(lambda: converter.bx_block_to_block(bx_block, tx_service))
+
+    decompressed_block = converter.bx_block_to_block(bx_block, tx_service).block_msg
+    assert decompressed_block is not None
+    assert decompressed_block.rawbytes().tobytes() == block_msg.rawbytes().tobytes()
+
+    print(
+        f"{name:<9} | {'extension' if use_extensions else 'normal':<9} | "
+        f"{len(block_info.short_ids):>3}/{block_info.txn_count:<3} short ids | "
+        f"{len(block_bytes):>7} bytes -> {len(bx_block):>7} bytes | "
+        f"compress: {compress_ms:7.3f} ms | decompress: {decompress_ms:7.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    samples = [
+        ("block", _load_sample("ont_sample_block.txt"), BlockOntMessage,
+         ont_message_converter_factory.create_ont_message_converter),
+        ("consensus", _load_sample("ont_consensus_sample_block.txt"), OntConsensusMessage,
+         ont_consensus_message_converter_factory.create_ont_consensus_message_converter),
+    ]
+    for extensions in [False, True]:
+        if extensions:
+            try:
+                import task_pool_executor  # pylint: disable=unused-import,import-outside-toplevel
+            except ImportError:
+                print("Extensions are not available. Skipping extension converters.")
+                break
+        for sample_name, sample_bytes, sample_cls, sample_factory in samples:
+            for compressed_block in [False, True]:
+                run_benchmark(sample_name, sample_bytes, sample_cls, sample_factory, extensions, compressed_block)
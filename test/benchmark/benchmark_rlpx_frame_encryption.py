@@ -0,0 +1,116 @@
+"""
+Measures RLPx frame encryption throughput of outbound Ethereum messages, comparing the previous egress path,
+which built each frame from several intermediate copies, with encryption into a single preallocated buffer.
+
+Run from the test directory:
+    PYTHONPATH=../../bxcommon/src:../src python -m benchmark.benchmark_rlpx_frame_encryption
+"""
+import os
+import time
+from typing import Callable, List, Tuple
+
+from bxcommon.utils.blockchain_utils.eth import crypto_utils, eth_common_constants
+from bxgateway.utils.eth import frame_utils
+from bxgateway.utils.eth.frame import Frame
+from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
+
+MESSAGE_SIZES = [1024, 100 * 1024, 2 * 1024 * 1024]
+MIN_BYTES_PER_RUN = 20 * 1024 * 1024
+RUNS = 5
+
+
+def _create_ciphers() -> Tuple[RLPxCipher, RLPxCipher]:
+    private_key1 = crypto_utils.make_private_key(os.urandom(111))
+    private_key2 = crypto_utils.make_private_key(os.urandom(111))
+    cipher1 = RLPxCipher(True, private_key1, crypto_utils.private_to_public_key(private_key2))
+    cipher2 = RLPxCipher(False, private_key2, crypto_utils.private_to_public_key(private_key1))
+
+    decrypted_auth_msg, _ = cipher2.decrypt_auth_message(
+        cipher1.encrypt_auth_message(cipher1.create_auth_message())
+    )
+    cipher2.parse_auth_message(decrypted_auth_msg)
+    cipher1.decrypt_auth_ack_message(cipher2.encrypt_auth_ack_message(cipher2.create_auth_ack_message()))
+    cipher1.setup_cipher()
+    cipher2.setup_cipher()
+    return cipher1, cipher2
+
+
+def _encrypt_frame_with_copies(cipher: RLPxCipher, frame: Frame) -> bytearray:
+    # egress path before frames were encrypted into a preallocated buffer
+    mac_len = eth_common_constants.FRAME_MAC_LEN
+    header_ciphertext = cipher.aes_encode(bytes(frame.get_header()))
+    header_mac = cipher.mac_egress(
+        crypto_utils.string_xor(cipher._mac_enc(cipher.mac_egress()[:mac_len]), header_ciphertext)
+    )[:mac_len]
+
+    body = crypto_utils.right_0_pad_16(frame.get_encoded_msg_type() + frame.get_payload())
+    frame_ciphertext = cipher.aes_encode(bytes(body))
+    fmac_seed = cipher.mac_egress(frame_ciphertext)
+    frame_mac = cipher.mac_egress(
+        crypto_utils.string_xor(cipher._mac_enc(cipher.mac_egress()[:mac_len]), fmac_seed[:mac_len])
+    )[:mac_len]
+    return bytearray(header_ciphertext + header_mac + frame_ciphertext + frame_mac)
+
+
+def _encrypt_with_copies(cipher: RLPxCipher, frames: List[Frame]) -> bytearray:
+    message_bytes = bytearray()
+    for frame in frames:
+        message_bytes.extend(_encrypt_frame_with_copies(cipher, frame))
+    return message_bytes
+
+
+def _encrypt_preallocated(cipher: RLPxCipher, frames: List[Frame]) -> bytearray:
+    return cipher.encrypt_frames(frames)
+
+
+def _measure(message_size: int, encrypt: Callable[[RLPxCipher, List[Frame]], bytearray]) -> float:
+    cipher, _ = _create_ciphers()
+    payload = bytearray(os.urandom(message_size))
+    messages_per_run = max(1, MIN_BYTES_PER_RUN // message_size)
+
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        for _ in range(messages_per_run):
+            frames = frame_utils.get_frames(
+                1, payload, eth_common_constants.DEFAULT_FRAME_PROTOCOL_ID, eth_common_constants.DEFAULT_FRAME_SIZE
+            )
+            encrypt(cipher, frames)
+        best = min(best, time.perf_counter() - start)
+    return messages_per_run * message_size / best / (1024 * 1024)
+
+
+def _verify(message_size: int) -> None:
+    cipher1, cipher2 = _create_ciphers()
+    payload = bytearray(os.urandom(message_size))
+    frames = frame_utils.get_frames(
+        1, payload, eth_common_constants.DEFAULT_FRAME_PROTOCOL_ID, eth_common_constants.DEFAULT_FRAME_SIZE
+    )
+    encrypted = memoryview(cipher1.encrypt_frames(frames))
+
+    received_payload = bytearray()
+    offset = 0
+    for frame in frames:
+        header_end = offset + eth_common_constants.FRAME_HDR_TOTAL_LEN
+        header = cipher2.decrypt_frame_header(encrypted[offset:header_end].tobytes())
+        body_size, _, sequence_id, _ = frame_utils.parse_frame_header(header)
+        offset += frame.get_frame_size()
+        body = cipher2.decrypt_frame_body(encrypted[header_end:offset].tobytes(), body_size)
+        frame_payload, _ = frame_utils.parse_frame_body(body, not sequence_id)
+        received_payload.extend(frame_payload)
+    assert received_payload == payload
+
+
+def run_benchmark(message_size: int) -> None:
+    _verify(message_size)
+    copies_mbps = _measure(message_size, _encrypt_with_copies)
+    preallocated_mbps = _measure(message_size, _encrypt_preallocated)
+    print(
+        f"message: {message_size:>8} bytes | intermediate copies: {copies_mbps:8.1f} MB/s | "
+        f"preallocated buffer: {preallocated_mbps:8.1f} MB/s ({preallocated_mbps / copies_mbps:5.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    for size in MESSAGE_SIZES:
+        run_benchmark(size)
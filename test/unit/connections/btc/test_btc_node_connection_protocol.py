@@ -1,15 +1,21 @@
+import time
+
 from mock import MagicMock
 
 from bxgateway.testing import gateway_helpers
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.constants import LOCALHOST
 from bxcommon.test_utils import helpers
+from bxcommon.test_utils.mocks.mock_connection import MockConnection
 from bxcommon.test_utils.mocks.mock_socket_connection import MockSocketConnection
 from bxcommon.utils.blockchain_utils.btc.btc_object_hash import BtcObjectHash
 
 from bxgateway.btc_constants import NODE_WITNESS_SERVICE_FLAG, BTC_SHA_HASH_LEN
 from bxgateway.connections.btc.btc_node_connection import BtcNodeConnection
 from bxgateway.connections.btc.btc_node_connection_protocol import BtcNodeConnectionProtocol
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMessage
 from bxgateway.messages.btc.inventory_btc_message import InvBtcMessage, InventoryType, GetDataBtcMessage
 from bxgateway.messages.btc.version_btc_message import VersionBtcMessage
 from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
@@ -94,6 +100,58 @@ class BtcNodeConnectionProtocolTest(AbstractTestCase):
 
             item_index += 1
 
+    def test_get_data_announced_block_not_proxied(self):
+        self.node.block_processing_service = MagicMock()
+        self.node.block_processing_service.try_send_announced_block = MagicMock(
+            side_effect=lambda block_hash, _connection: block_hash == self.block_hash
+        )
+        self.sut.msg_proxy_request = MagicMock()
+
+        self.sut.msg_get_data(GetDataBtcMessage(magic=123, inv_vects=[(InventoryType.MSG_BLOCK, self.block_hash)]))
+        self.sut.msg_proxy_request.assert_not_called()
+
+        get_data_msg = GetDataBtcMessage(
+            magic=123, inv_vects=[(InventoryType.MSG_TX, self.tx_hash), (InventoryType.MSG_BLOCK, self.block_hash)]
+        )
+        self.sut.msg_get_data(get_data_msg)
+        self.sut.msg_proxy_request.assert_called_once()
+        proxied_msg = self.sut.msg_proxy_request.call_args[0][0]
+        self.assertEqual([(InventoryType.MSG_TX, self.tx_hash)], list(proxied_msg))
+
+    def test_compact_block_confirms_block_for_node_queue(self):
+        self.node.connection_pool.add(1, LOCALHOST, 123, self.connection)
+        self.connection.enqueue_msg = MagicMock()
+        slow_node_connection = MockConnection(
+            MockSocketConnection(2, self.node, ip_address=LOCALHOST, port=124), self.node
+        )
+        slow_node_connection.CONNECTION_TYPE = ConnectionType.BLOCKCHAIN_NODE
+        slow_node_connection.enqueue_msg = MagicMock()
+        self.node.connection_pool.add(2, LOCALHOST, 124, slow_node_connection)
+
+        block_timestamp = int(time.time())
+        block_msg_1 = BlockBtcMessage(123, 234, self.block_hash, self.tx_hash, block_timestamp, 0, 1, [])
+        block_hash_1 = block_msg_1.block_hash()
+        block_msg_2 = BlockBtcMessage(123, 234, block_hash_1, self.tx_hash, block_timestamp, 0, 2, [])
+        block_hash_2 = block_msg_2.block_hash()
+
+        block_queuing_service = self.node.block_queuing_service
+        block_queuing_service.push(block_hash_1, block_msg_1)
+        self.connection.enqueue_msg.assert_called_once_with(block_msg_1)
+        slow_node_connection.enqueue_msg.assert_called_once_with(block_msg_1)
+
+        # node announces the block received from the gateway as a high bandwidth compact block
+        self.node.blocks_seen.add(block_hash_1)
+        compact_block_msg = CompactBlockBtcMessage(
+            123, 234, self.block_hash, self.tx_hash, block_timestamp, 0, 1, 0, [], []
+        )
+        self.assertEqual(block_hash_1, compact_block_msg.block_hash())
+        self.sut.msg_compact_block(compact_block_msg)
+
+        block_queuing_service.push(block_hash_2, block_msg_2)
+        self.assertEqual(2, self.connection.enqueue_msg.call_count)
+        self.connection.enqueue_msg.assert_called_with(block_msg_2)
+        slow_node_connection.enqueue_msg.assert_called_once_with(block_msg_1)
+
     def _create_version_msg(self, service):
         return VersionBtcMessage(magic=123, version=234, dst_ip=LOCALHOST, dst_port=12345, src_ip=LOCALHOST,
                                  src_port=12345, nonce=1, start_height=0, user_agent=b"dummy_user_agent",
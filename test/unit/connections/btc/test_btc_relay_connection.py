@@ -1,3 +1,4 @@
+import asyncio
 from typing import cast
 
 from bxgateway.messages.gateway.block_received_message import BlockReceivedMessage
@@ -32,6 +33,7 @@ from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 import bxgateway.messages.btc.btc_message_converter_factory as converter_factory
 from bxgateway.messages.btc.inventory_btc_message import InvBtcMessage, InventoryType
 from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
+from bxgateway.services.block_crypto_service import BlockCryptoService
 from bxgateway.utils.stats.gateway_transaction_stats_service import gateway_transaction_stats_service
 
 
@@ -205,6 +207,79 @@ class BtcRelayConnectionTest(AbstractTestCase):
 
         self._assert_block_sent(btc_block)
 
+    def test_msg_broadcast_wait_for_key_block_crypto_threads(self):
+        self._enable_block_crypto_threads()
+        btc_block = self.btc_block()
+        bx_block = self.bx_block(btc_block)
+
+        key, ciphertext = symmetric_encrypt(bx_block)
+        block_hash = crypto.double_sha256(ciphertext)
+        broadcast_message = BroadcastMessage(Sha256Hash(block_hash), self.TEST_NETWORK_NUM, "",
+                                             BroadcastMessageType.BLOCK, True, ciphertext)
+
+        self.sut.msg_broadcast(broadcast_message)
+        # block is stored only once its hash is verified on the thread pool
+        self.assertEqual(0, len(self.gateway_node.in_progress_blocks))
+        gateway_helpers.run_event_loop_until(
+            self.event_loop, lambda: len(self.gateway_node.in_progress_blocks) == 1
+        )
+        ((block_received_msg,), _) = self.gateway_node.broadcast.call_args
+        self.assertIsInstance(block_received_msg, BlockReceivedMessage)
+        self.gateway_node.broadcast.reset_mock()
+
+        key_message = KeyMessage(Sha256Hash(block_hash), self.TEST_NETWORK_NUM, "", key)
+        self.sut.msg_key(key_message)
+        gateway_helpers.run_event_loop_until(
+            self.event_loop, lambda: self._get_blockchain_node_broadcast_count() == 2
+        )
+
+        self._assert_block_sent(btc_block)
+
+    def test_msg_key_wait_for_broadcast_block_crypto_threads(self):
+        self._enable_block_crypto_threads()
+        btc_block = self.btc_block()
+        bx_block = self.bx_block(btc_block)
+
+        key, ciphertext = symmetric_encrypt(bx_block)
+        block_hash = crypto.double_sha256(ciphertext)
+
+        key_message = KeyMessage(Sha256Hash(block_hash), self.TEST_NETWORK_NUM, "", key)
+        self.sut.msg_key(key_message)
+
+        broadcast_message = BroadcastMessage(Sha256Hash(block_hash), self.TEST_NETWORK_NUM, "",
+                                             BroadcastMessageType.BLOCK, True, ciphertext)
+        self.sut.msg_broadcast(broadcast_message)
+        self.assertEqual(0, self._get_blockchain_node_broadcast_count())
+        gateway_helpers.run_event_loop_until(
+            self.event_loop, lambda: self._get_blockchain_node_broadcast_count() == 2
+        )
+
+        self._assert_block_sent(btc_block)
+
+    def test_msg_broadcast_hash_mismatch_block_crypto_threads(self):
+        self._enable_block_crypto_threads()
+        key, ciphertext = symmetric_encrypt(self.bx_block())
+        broadcast_message = BroadcastMessage(
+            Sha256Hash(helpers.generate_bytearray(SHA256_HASH_LEN)), self.TEST_NETWORK_NUM, "",
+            BroadcastMessageType.BLOCK, True, ciphertext
+        )
+
+        verification_results = []
+        block_processing_service = self.gateway_node.block_processing_service
+        on_block_broadcast_verified = block_processing_service._on_block_broadcast_verified
+
+        def _on_block_broadcast_verified(task_result, *args):
+            verification_results.append(task_result.result)
+            on_block_broadcast_verified(task_result, *args)
+
+        block_processing_service._on_block_broadcast_verified = _on_block_broadcast_verified
+        self.sut.msg_broadcast(broadcast_message)
+        gateway_helpers.run_event_loop_until(self.event_loop, lambda: len(verification_results) == 1)
+
+        self.assertFalse(verification_results[0].hash_matches)
+        self.assertEqual(0, len(self.gateway_node.in_progress_blocks))
+        self.gateway_node.broadcast.assert_not_called()
+
     def test_msg_tx(self):
         transactions = self.bx_transactions(assign_short_ids=True)
         for transaction in transactions:
@@ -349,6 +424,23 @@ class BtcRelayConnectionTest(AbstractTestCase):
             self.assertEqual(transaction_hash, stored_hash)
             self.assertEqual(tx_info.contents, stored_content)
 
+    def _enable_block_crypto_threads(self):
+        self.event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.event_loop)
+        self.gateway_node.block_crypto_service = BlockCryptoService(2)
+        self.addCleanup(self._disable_block_crypto_threads)
+
+    def _disable_block_crypto_threads(self):
+        self.gateway_node.block_crypto_service.close()
+        self.event_loop.close()
+        asyncio.set_event_loop(asyncio.new_event_loop())
+
+    def _get_blockchain_node_broadcast_count(self):
+        return len([
+            call for call in self.gateway_node.broadcast.call_args_list
+            if call[1]["connection_types"][0] == ConnectionType.BLOCKCHAIN_NODE
+        ])
+
     def _assert_block_sent(self, btc_block):
         self.gateway_node.broadcast.assert_called()
         calls = self.gateway_node.broadcast.call_args_list
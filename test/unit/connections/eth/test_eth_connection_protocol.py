@@ -1,4 +1,5 @@
 import time
+from unittest import skipUnless
 
 from mock import MagicMock
 
@@ -11,7 +12,10 @@ from bxgateway.connections.eth.eth_node_connection_protocol import EthNodeConnec
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.testing.mocks import mock_eth_messages
 from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
-from bxcommon.utils.blockchain_utils.eth import crypto_utils
+from bxcommon.utils.blockchain_utils.eth import crypto_utils, eth_common_constants
+from bxgateway import gateway_constants
+from bxgateway.messages.eth.protocol.hello_eth_protocol_message import HelloEthProtocolMessage
+from bxgateway.utils.eth import frame_utils, snappy_compression
 
 
 def _block_with_timestamp(timestamp):
@@ -76,3 +80,40 @@ class EthConnectionProtocolTest(AbstractTestCase):
         )
         self.sut.msg_block(message)
         self.node.block_processing_service.queue_block_for_processing.assert_not_called()
+
+    def test_frame_size(self):
+        self.assertEqual(eth_common_constants.DEFAULT_FRAME_SIZE, self.sut.frame_size)
+
+        self.node.opts.eth_frame_size = 0
+        dummy_private_key = crypto_utils.make_private_key(helpers.generate_bytearray(111))
+        dummy_public_key = crypto_utils.private_to_public_key(dummy_private_key)
+        protocol = EthNodeConnectionProtocol(self.connection, True, dummy_private_key, dummy_public_key)
+        self.assertEqual(gateway_constants.ETH_MAX_FRAME_SIZE, protocol.frame_size)
+
+        # message larger than default frame size is sent in a single frame
+        payload = bytearray(eth_common_constants.DEFAULT_FRAME_SIZE * 4)
+        frames = frame_utils.get_frames(1, payload, 0, protocol.frame_size)
+        self.assertEqual(1, len(frames))
+        self.assertTrue(frames[0].get_body_size() < eth_common_constants.FRAME_MAX_BODY_SIZE)
+
+    def test_msg_hello_snappy_compression_disabled(self):
+        self.sut.msg_hello(self._get_hello_message(gateway_constants.ETH_SNAPPY_P2P_PROTOCOL_VERSION))
+        self.assertFalse(self.sut._snappy_enabled)
+
+    @skipUnless(snappy_compression.is_available(), "python-snappy is not installed")
+    def test_msg_hello_snappy_compression(self):
+        self.node.opts.eth_snappy_compression = True
+        dummy_private_key = crypto_utils.make_private_key(helpers.generate_bytearray(111))
+        dummy_public_key = crypto_utils.private_to_public_key(dummy_private_key)
+        protocol = EthNodeConnectionProtocol(self.connection, True, dummy_private_key, dummy_public_key)
+
+        protocol.msg_hello(self._get_hello_message(gateway_constants.ETH_SNAPPY_P2P_PROTOCOL_VERSION - 1))
+        self.assertFalse(protocol._snappy_enabled)
+        protocol.msg_hello(self._get_hello_message(gateway_constants.ETH_SNAPPY_P2P_PROTOCOL_VERSION))
+        self.assertTrue(protocol._snappy_enabled)
+
+    def _get_hello_message(self, version):
+        hello_msg = HelloEthProtocolMessage(None, version, "geth", eth_common_constants.CAPABILITIES, 30303,
+                                            helpers.generate_bytearray(eth_common_constants.PUBLIC_KEY_LEN))
+        return HelloEthProtocolMessage(hello_msg.rawbytes())
+
@@ -1,23 +1,31 @@
 import struct
 
-from mock import MagicMock, call
+from mock import MagicMock, call, patch
 
 from bxcommon.connections.connection_type import ConnectionType
 from bxcommon.models.blockchain_protocol import BlockchainProtocol
 from bxcommon.models.tx_validation_status import TxValidationStatus
 from bxcommon.test_utils.mocks.mock_node_ssl_service import MockNodeSSLService
 from bxcommon.utils.blockchain_utils import transaction_validation
+from bxcommon.utils.blockchain_utils.eth import eth_common_utils
 from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
 from bxgateway.connections.eth.eth_node_connection import EthNodeConnection
 from bxgateway.feed.eth.eth_new_transaction_feed import EthNewTransactionFeed
 from bxgateway.feed.eth.eth_pending_transaction_feed import EthPendingTransactionFeed
 from bxgateway.feed.eth.eth_raw_transaction import EthRawTransaction
 from bxgateway.feed.new_transaction_feed import FeedSource
+from bxgateway.messages.eth.protocol.get_pooled_transactions_eth_protocol_message import \
+    GetPooledTransactionsEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message import \
     NewBlockHashesEthProtocolMessage
+from bxgateway.messages.eth.protocol.new_pooled_transaction_hashes_eth_protocol_message import \
+    NewPooledTransactionHashesEthProtocolMessage
+from bxgateway.messages.eth.protocol.pooled_transactions_eth_protocol_message import \
+    PooledTransactionsEthProtocolMessage
 from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import \
     TransactionsEthProtocolMessage
 from bxgateway.messages.eth.serializers.transient_block_body import TransientBlockBody
+from bxgateway import gateway_constants
 from bxgateway.testing import gateway_helpers
 from bxcommon.test_utils import helpers
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
@@ -472,6 +480,101 @@ class EthNodeConnectionProtocolTest(AbstractTestCase):
         self.assertEqual(1, len(self.broadcast_messages))
         self.assertEqual(1, len(self.broadcast_to_nodes_messages))
 
+    def test_filter_known_transactions(self):
+        transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 4)]
+        msg = TransactionsEthProtocolMessage(None, transactions[:2])
+        self.assertIs(msg, self.sut.filter_known_transactions(msg))
+
+        self.sut.eth_version = gateway_constants.ETH_POOLED_TX_PROTOCOL_VERSION
+        msg = TransactionsEthProtocolMessage(None, transactions[:2])
+        self.assertIs(msg, self.sut.filter_known_transactions(msg))
+
+        # transactions already sent to the node are removed, and the rest are sent in full
+        filtered_msg = self.sut.filter_known_transactions(TransactionsEthProtocolMessage(None, transactions))
+        self.assertIsInstance(filtered_msg, TransactionsEthProtocolMessage)
+        filtered_transactions = TransactionsEthProtocolMessage(filtered_msg.rawbytes()).get_transactions()
+        self.assertEqual([transactions[2].hash()], [transaction.hash() for transaction in filtered_transactions])
+
+        self.assertIsNone(self.sut.filter_known_transactions(TransactionsEthProtocolMessage(None, transactions)))
+
+    def test_filter_known_transactions_uses_known_tx_hashes(self):
+        transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 3)]
+        self.sut.eth_version = gateway_constants.ETH_POOLED_TX_PROTOCOL_VERSION
+        self.sut.filter_known_transactions(TransactionsEthProtocolMessage(None, transactions[:1]))
+
+        msg = TransactionsEthProtocolMessage(None, transactions)
+        msg.set_tx_hashes([transaction.hash() for transaction in transactions])
+        with patch.object(eth_common_utils, "keccak_hash", wraps=eth_common_utils.keccak_hash) as keccak_hash:
+            filtered_msg = self.sut.filter_known_transactions(msg)
+        keccak_hash.assert_not_called()
+        self.assertEqual([transactions[1].hash()], filtered_msg.tx_hashes())
+
+    def test_filter_known_transactions_announce_bdn_txs(self):
+        self.node.opts.eth_bdn_tx_announcements = True
+        transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 4)]
+        msg = TransactionsEthProtocolMessage(None, transactions[:2])
+        self.assertIs(msg, self.sut.filter_known_transactions(msg))
+
+        self.sut.eth_version = gateway_constants.ETH_POOLED_TX_PROTOCOL_VERSION
+        self.assertIsNone(self.sut.filter_known_transactions(TransactionsEthProtocolMessage(None, transactions[:2])))
+        self.assertIsNone(self.sut.filter_known_transactions(TransactionsEthProtocolMessage(None, transactions[1:])))
+        self.assertEqual(0, len(self.enqueued_messages))
+
+        self.node.alarm_queue.fire_alarms()
+        self.assertEqual(1, len(self.enqueued_messages))
+        announcement_msg = self.enqueued_messages[0]
+        self.assertIsInstance(announcement_msg, NewPooledTransactionHashesEthProtocolMessage)
+        self.assertEqual(
+            [transaction.hash() for transaction in transactions],
+            NewPooledTransactionHashesEthProtocolMessage(announcement_msg.rawbytes()).get_transaction_hashes()
+        )
+
+        # transactions already announced to the node are skipped
+        self.assertIsNone(self.sut.filter_known_transactions(TransactionsEthProtocolMessage(None, transactions)))
+        self.node.alarm_queue.fire_alarms()
+        self.assertEqual(1, len(self.enqueued_messages))
+
+    def test_msg_get_pooled_transactions(self):
+        transaction = mock_eth_messages.get_dummy_transaction(1)
+        tx_service = self.node.get_tx_service()
+        tx_service.set_transaction_contents(transaction.hash(), transaction.contents())
+
+        missing_tx_hash = mock_eth_messages.get_dummy_transaction(2).hash()
+        request_msg = GetPooledTransactionsEthProtocolMessage(
+            None, [bytes(transaction.hash().binary), bytes(missing_tx_hash.binary)]
+        )
+        self.sut.msg_get_pooled_transactions(GetPooledTransactionsEthProtocolMessage(request_msg.rawbytes()))
+
+        self.assertEqual(1, len(self.enqueued_messages))
+        response_msg = self.enqueued_messages[0]
+        self.assertIsInstance(response_msg, PooledTransactionsEthProtocolMessage)
+        response_transactions = response_msg.get_transactions()
+        self.assertEqual(1, len(response_transactions))
+        self.assertEqual(transaction.hash(), response_transactions[0].hash())
+
+    def test_msg_new_pooled_transaction_hashes(self):
+        known_transaction = mock_eth_messages.get_dummy_transaction(1)
+        self.node.get_tx_service().set_transaction_contents(known_transaction.hash(), known_transaction.contents())
+        unknown_transaction = mock_eth_messages.get_dummy_transaction(2)
+
+        announcement_msg = NewPooledTransactionHashesEthProtocolMessage(
+            None, [bytes(known_transaction.hash().binary), bytes(unknown_transaction.hash().binary)]
+        )
+        self.sut.msg_new_pooled_transaction_hashes(
+            NewPooledTransactionHashesEthProtocolMessage(announcement_msg.rawbytes())
+        )
+
+        self.assertEqual(1, len(self.enqueued_messages))
+        request_msg = self.enqueued_messages[0]
+        self.assertIsInstance(request_msg, GetPooledTransactionsEthProtocolMessage)
+        self.assertEqual([unknown_transaction.hash()], request_msg.get_transaction_hashes())
+
+        # transactions requested from the node are not requested again while the request is in flight
+        self.sut.msg_new_pooled_transaction_hashes(
+            NewPooledTransactionHashesEthProtocolMessage(announcement_msg.rawbytes())
+        )
+        self.assertEqual(1, len(self.enqueued_messages))
+
     def test_handle_tx_with_an_invalid_signature(self):
         tx_bytes = \
             b"\xf8k" \
@@ -62,7 +62,7 @@ class EthRelayConnectionTest(AbstractTestCase):
         transactions = [
             mock_eth_messages.get_dummy_transaction(i, 10) for i in range(100)
         ]
-        self.node.on_transactions_in_block(transactions)
+        self.node.on_transactions_in_block([transaction.gas_price for transaction in transactions])
 
         cheap_tx = self._convert_to_bx_message(
             TransactionsEthProtocolMessage(None, [mock_eth_messages.get_dummy_transaction(1, 5)])
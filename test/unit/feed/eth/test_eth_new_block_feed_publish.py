@@ -73,7 +73,7 @@ class EthNewBlockFeedPublishTest(AbstractTestCase):
             self.assertIsNone(block)
 
         # returns block
-        self.node.block_queuing_service._block_parts[block_hash] = block_msg.to_new_block_parts()
+        self.node.block_queuing_service._block_cache.add(block_hash, block_msg)
         lazy_block = self.node._get_block_message_lazy(None, block_hash)
         block = next(lazy_block)
         self.assertEqual(block.block_hash(), block_hash)
@@ -180,13 +180,13 @@ class EthNewBlockFeedPublishTest(AbstractTestCase):
         self.sut.publish_blocks_from_queue(10, 20)
         # no blocks in queueing service
         self.sut.publish.assert_not_called()
-        self.node.block_queuing_service.accepted_block_hash_at_height[11] = "11"
+        self.node.block_queuing_service._block_tree.mark_block_accepted("11", 11)
         self.sut.publish_blocks_from_queue(10, 20)
         # only one block in queueing service
         self.sut.publish.assert_called_once()
         self.sut.publish = MagicMock()
         for i in range(10, 20):
-            self.node.block_queuing_service.accepted_block_hash_at_height[i] = str(i)
+            self.node.block_queuing_service._block_tree.mark_block_accepted(str(i), i)
         self.sut.publish_blocks_from_queue(10, 20)
         # only one block in queueing service
         call_args = self.sut.publish.call_args_list
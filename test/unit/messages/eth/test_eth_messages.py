@@ -19,14 +19,21 @@ from bxgateway.messages.eth.protocol.disconnect_eth_protocol_message import Disc
 from bxgateway.messages.eth.protocol.get_block_bodies_eth_protocol_message import GetBlockBodiesEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_block_headers_eth_protocol_message import GetBlockHeadersEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_node_data_eth_protocol_message import GetNodeDataEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_pooled_transactions_eth_protocol_message import \
+    GetPooledTransactionsEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_receipts_eth_protocol_message import GetReceiptsEthProtocolMessage
 from bxgateway.messages.eth.protocol.hello_eth_protocol_message import HelloEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message import NewBlockHashesEthProtocolMessage
+from bxgateway.messages.eth.protocol.new_pooled_transaction_hashes_eth_protocol_message import \
+    NewPooledTransactionHashesEthProtocolMessage
 from bxgateway.messages.eth.protocol.node_data_eth_protocol_message import NodeDataEthProtocolMessage
 from bxgateway.messages.eth.protocol.ping_eth_protocol_message import PingEthProtocolMessage
+from bxgateway.messages.eth.protocol.pooled_transactions_eth_protocol_message import \
+    PooledTransactionsEthProtocolMessage
 from bxgateway.messages.eth.protocol.receipts_eth_protocol_message import ReceiptsEthProtocolMessage
 from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
+from bxgateway.messages.eth.protocol.status_v64_eth_protocol_message import StatusV64EthProtocolMessage
 from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
 from bxcommon.messages.eth.serializers.block import Block
 from bxgateway.messages.eth.serializers.block_hash import BlockHash
@@ -86,6 +93,19 @@ class EthMessagesTests(AbstractTestCase):
                                      dummy_chain_head_hash,
                                      dummy_genesis_hash)
 
+    def test_status_v64_eth_message(self):
+        dummy_chain_head_hash = convert.hex_to_bytes("f973c5d3763c40e2b5080f35a9003e64e7d9f9d429ddecd7c559cbd4061094cd")
+        dummy_genesis_hash = convert.hex_to_bytes("aec175735fb6b74722d54455b638f6340bb9fdd5fa8101c8c0869d10cdccb000")
+
+        self._test_msg_serialization(StatusV64EthProtocolMessage,
+                                     False,
+                                     65,
+                                     111,
+                                     11111,
+                                     dummy_chain_head_hash,
+                                     dummy_genesis_hash,
+                                     [convert.hex_to_bytes("fc64ec04"), 1150000])
+
     def test_disconnect_message(self):
         dummy_disconnect_reason = 3
         self._test_msg_serialization(DisconnectEthProtocolMessage, False, [dummy_disconnect_reason])
@@ -146,6 +166,16 @@ class EthMessagesTests(AbstractTestCase):
                                          mock_eth_messages.get_dummy_transaction(3)
                                      ])
 
+    def test_pooled_transactions_eth_messages(self):
+        transactions = [
+            mock_eth_messages.get_dummy_transaction(1),
+            mock_eth_messages.get_dummy_transaction(2),
+        ]
+        tx_hashes = [bytes(transaction.hash().binary) for transaction in transactions]
+        self._test_msg_serialization(NewPooledTransactionHashesEthProtocolMessage, False, tx_hashes)
+        self._test_msg_serialization(GetPooledTransactionsEthProtocolMessage, False, tx_hashes)
+        self._test_msg_serialization(PooledTransactionsEthProtocolMessage, False, transactions)
+
     def test_new_block_eth_message(self):
         self._test_msg_serialization(NewBlockEthProtocolMessage,
                                      False,
@@ -46,3 +46,4 @@ class EthMessagesTests(AbstractTestCase):
         self.assertIsInstance(new_block_parts.get_block_hash(), Sha256Hash)
         self.assertIsInstance(new_block_parts.get_previous_block_hash(), Sha256Hash)
         self.assertEqual(1, new_block_parts.get_block_difficulty())
+        self.assertEqual(rlp.decode(block_header_bytes.tobytes())[5], new_block_parts.get_receipts_root())
@@ -3,6 +3,8 @@ import os
 import random
 from argparse import Namespace
 
+from mock import patch
+
 from bxgateway.testing import gateway_helpers
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.constants import DEFAULT_TX_MEM_POOL_BUCKET_SIZE
@@ -283,6 +285,35 @@ class BtcMessageConverterTests(AbstractTestCase):
         )
         self.assertEqual(recovered_block.rawbytes().tobytes(), ref_block.rawbytes().tobytes())
 
+    def test_compact_block_compression_uses_known_transaction_hashes(self):
+        self.tx_service, self.btc_message_converter = self.init(False)
+        compact_block = get_sample_compact_block()
+        recovered_block = get_recovered_compact_block()
+        for short_id, txn in enumerate(recovered_block.txns()):
+            tx_hash = btc_common_utils.get_txid(txn)
+            self.tx_service.set_transaction_contents(tx_hash, txn)
+            self.tx_service.assign_short_id(tx_hash, short_id + 1)
+
+        with patch.object(btc_common_utils, "get_txid", wraps=btc_common_utils.get_txid) as get_txid:
+            result = self.btc_message_converter.compact_block_to_bx_block(
+                compact_block, self.tx_service
+            )
+        self.assertTrue(result.success)
+        # only pre-filled transactions are hashed
+        self.assertEqual(len(compact_block.pre_filled_transactions()), get_txid.call_count)
+
+        block_info = result.block_info
+        self.assertEqual(recovered_block.block_hash(), block_info.block_hash)
+        self.assertEqual(recovered_block.txn_count(), block_info.txn_count)
+        self.assertEqual(recovered_block.txn_count(), len(block_info.short_ids))
+        self.assertEqual(len(recovered_block.rawbytes()), block_info.original_size)
+        self.assertEqual(len(result.bx_block), block_info.compressed_size)
+
+        ref_block, _, _, _ = self.btc_message_converter.bx_block_to_block(
+            result.bx_block, self.tx_service
+        )
+        self.assertEqual(recovered_block.rawbytes().tobytes(), ref_block.rawbytes().tobytes())
+
     @multi_setup()
     def test_compact_block_partial_compression(self):
         compact_block = get_sample_compact_block()
@@ -58,6 +58,12 @@ class OntMessageConverterTests(AbstractTestCase):
         self.magic = 12345
         self.version = 23456
 
+    def test_tx_hashes(self):
+        parsed_block = get_sample_block()
+        tx_hashes = parsed_block.tx_hashes()
+        self.assertEqual(self.SAMPLE_BLOCK_TX_COUNT, len(tx_hashes))
+        self.assertEqual([ont_messages_util.get_txid(tx)[0] for tx in parsed_block.txns()], tx_hashes)
+
     @multi_setup()
     def test_plain_compression(self):
         parsed_block = get_sample_block()
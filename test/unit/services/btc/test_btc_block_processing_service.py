@@ -0,0 +1,98 @@
+from mock import MagicMock
+
+from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.mocks.mock_node_ssl_service import MockNodeSSLService
+from bxcommon.utils import crypto
+from bxcommon.utils.blockchain_utils.btc.btc_object_hash import BtcObjectHash
+from bxcommon.utils.crypto import SHA256_HASH_LEN
+
+from bxgateway.btc_constants import BTC_HDR_COMMON_OFF
+from bxgateway.connections.btc.btc_gateway_node import BtcGatewayNode
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.headers_btc_message import BlockHeader, HeadersBtcMessage
+from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
+from bxgateway.testing import gateway_helpers
+
+
+class BtcBlockProcessingServiceTest(AbstractTestCase):
+    BTC_HASH = BtcObjectHash(crypto.double_sha256(b"123"), length=SHA256_HASH_LEN)
+
+    MAGIC = 12345
+    VERSION = 23456
+
+    def setUp(self):
+        opts = gateway_helpers.get_gateway_opts(8000, include_default_btc_args=True, btc_headers_first_relay=True)
+        if opts.use_extensions:
+            helpers.set_extensions_parallelism(opts.thread_pool_parallelism_degree)
+        node_ssl_service = MockNodeSSLService(BtcGatewayNode.NODE_TYPE, MagicMock())
+        self.node = BtcGatewayNode(opts, node_ssl_service)
+        self.node.broadcast = MagicMock()
+        self.node.has_active_blockchain_peer = MagicMock(return_value=True)
+        self.node.block_cleanup_service = MagicMock()
+        self.sut = self.node.block_processing_service
+
+        txns = [TxBtcMessage(self.MAGIC, self.VERSION, [], [], i).rawbytes()[BTC_HDR_COMMON_OFF:] for i in range(10)]
+        self.block = BlockBtcMessage(self.MAGIC, self.VERSION, self.BTC_HASH, self.BTC_HASH, 0, 0, 0, txns)
+        self.bx_block = self.node.message_converter.block_to_bx_block(
+            self.block, self.node.get_tx_service(), True, self.node.network.min_tx_age_seconds
+        )[0]
+
+    def test_header_announced_ahead_of_block(self):
+        self.sut._on_block_header_validated(memoryview(self.bx_block))
+
+        self.node.broadcast.assert_called_once()
+        ((headers_msg,), kwargs) = self.node.broadcast.call_args
+        self.assertEqual([ConnectionType.BLOCKCHAIN_NODE], kwargs["connection_types"])
+        self.assertIsInstance(headers_msg, HeadersBtcMessage)
+        headers_msg = HeadersBtcMessage(buf=bytearray(headers_msg.rawbytes()))
+        self.assertEqual(1, headers_msg.hash_count())
+        headers = list(headers_msg)
+        self.assertEqual(self.block.block_hash(), BlockHeader(headers[0]).block_hash())
+        self.assertTrue(self.sut.is_block_header_announced(self.block.block_hash()))
+
+        # header of each block is announced once
+        self.sut._on_block_header_validated(memoryview(self.bx_block))
+        self.node.broadcast.assert_called_once()
+
+    def test_header_not_announced_for_seen_block(self):
+        self.node.blocks_seen.add(self.block.block_hash())
+
+        self.sut._on_block_header_validated(memoryview(self.bx_block))
+
+        self.node.broadcast.assert_not_called()
+
+    def test_header_not_announced_if_disabled(self):
+        self.node.opts.btc_headers_first_relay = False
+
+        self.sut._on_block_header_validated(memoryview(self.bx_block))
+
+        self.node.broadcast.assert_not_called()
+
+    def test_try_send_announced_block(self):
+        connection = MagicMock()
+        block_hash = self.block.block_hash()
+        self.assertFalse(self.sut.try_send_announced_block(block_hash, connection))
+
+        # block is not decompressed yet, or failed decompression
+        self.sut._on_block_header_validated(memoryview(self.bx_block))
+        self.assertFalse(self.sut.try_send_announced_block(block_hash, connection))
+
+        self.node.block_queuing_service.store_block_data(block_hash, self.block)
+        self.assertTrue(self.sut.try_send_announced_block(block_hash, connection))
+        connection.enqueue_msg.assert_called_once_with(self.block)
+
+        # repeated requests are not answered with another copy of the block
+        self.assertTrue(self.sut.try_send_announced_block(block_hash, connection))
+        connection.enqueue_msg.assert_called_once_with(self.block)
+
+    def test_try_send_announced_block_already_sent(self):
+        connection = MagicMock()
+        block_hash = self.block.block_hash()
+        self.sut._on_block_header_validated(memoryview(self.bx_block))
+        self.node.block_queuing_service.push(block_hash, self.block)
+        self.node.broadcast.assert_any_call(self.block, connection_types=[ConnectionType.BLOCKCHAIN_NODE])
+
+        self.assertTrue(self.sut.try_send_announced_block(block_hash, connection))
+        connection.enqueue_msg.assert_not_called()
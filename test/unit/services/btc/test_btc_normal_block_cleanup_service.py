@@ -1,4 +1,8 @@
+from unittest.mock import patch
+
 from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxgateway.services.btc.abstract_btc_block_cleanup_service import AbstractBtcBlockCleanupService
 from bxgateway.services.btc.btc_normal_block_cleanup_service import BtcNormalBlockCleanupService
 from bxgateway.testing.abstract_btc_block_cleanup_service_test import AbstractBtcBlockCleanupServiceTest
@@ -15,8 +19,36 @@ class BtcNormalBlockCleanupServiceTest(AbstractBtcBlockCleanupServiceTest):
     def test_block_confirmation_cleanup(self):
         self._test_block_confirmation_cleanup()
 
+    def test_block_cleanup_reuses_compressed_block_tx_hashes(self):
+        compressed_block_msg = self._get_sample_block(self._get_file_path())
+        tx_hashes = compressed_block_msg.tx_hashes()
+        self.cleanup_service.on_block_compressed(compressed_block_msg)
+        self.transaction_service.set_transaction_contents(tx_hashes[1], compressed_block_msg.txns()[1])
+
+        block_msg = self._get_sample_block(self._get_file_path())
+        with patch.object(btc_common_utils, "get_txid", wraps=btc_common_utils.get_txid) as get_txid:
+            self.cleanup_service.clean_block_transactions(block_msg, self.transaction_service)
+        get_txid.assert_not_called()
+        self.assertFalse(block_msg.has_tx_hashes())
+        self.assertFalse(self.transaction_service.has_transaction_contents(tx_hashes[1]))
+        self.assertNotIn(block_msg.block_hash(), self.cleanup_service._compressed_block_tx_hashes.contents)
+
+    def test_block_cleanup_computes_tx_hashes_lazily(self):
+        block_msg = self._get_sample_block(self._get_file_path())
+        tx_hashes = self._get_sample_block(self._get_file_path()).tx_hashes()
+        self.transaction_service.set_transaction_contents(tx_hashes[-1], block_msg.txns()[-1])
+
+        tx_hashes_iter = self.cleanup_service._iter_block_tx_hashes(block_msg)
+        with patch.object(btc_common_utils, "get_txid", wraps=btc_common_utils.get_txid) as get_txid:
+            self.assertEqual(tx_hashes[0], next(tx_hashes_iter))
+            get_txid.assert_called_once()
+        self.assertFalse(block_msg.has_tx_hashes())
+
+        self.cleanup_service.clean_block_transactions(block_msg, self.transaction_service)
+        self.assertFalse(self.transaction_service.has_transaction_contents(tx_hashes[-1]))
+
     def _get_transaction_service(self) -> TransactionService:
-        return TransactionService(self.node, 1)
+        return GatewayTransactionService(self.node, 1)
 
     def _get_cleanup_service(self) -> AbstractBtcBlockCleanupService:
         return BtcNormalBlockCleanupService(self.node, 1)
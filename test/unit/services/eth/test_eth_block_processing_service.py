@@ -1,3 +1,6 @@
+import struct
+import time
+
 from mock import Mock, MagicMock
 
 from bxcommon.connections.connection_type import ConnectionType
@@ -11,6 +14,8 @@ from bxgateway.messages.eth.protocol.block_headers_eth_protocol_message import \
     BlockHeadersEthProtocolMessage
 from bxgateway.messages.eth.protocol.get_block_bodies_eth_protocol_message import \
     GetBlockBodiesEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_block_headers_eth_protocol_message import \
+    GetBlockHeadersEthProtocolMessage
 from bxgateway.services.eth.eth_block_processing_service import EthBlockProcessingService
 from bxgateway.services.eth.eth_block_queuing_service import EthBlockQueuingService
 from bxgateway.testing.mocks import mock_eth_messages
@@ -24,6 +29,7 @@ class EthBlockProcessingServiceTest(AbstractTestCase):
         )
 
         self.node.broadcast = MagicMock()
+        self.node.opts.eth_block_response_cache_max_size_mb = 1
 
         self.block_queuing_service = EthBlockQueuingService(self.node)
         self.node.block_queuing_service = self.block_queuing_service
@@ -88,3 +94,75 @@ class EthBlockProcessingServiceTest(AbstractTestCase):
         )
         self.assertFalse(success)
         self.node.broadcast.assert_not_called()
+
+    def test_try_process_get_block_bodies_request_cached(self):
+        get_bodies_msg = GetBlockBodiesEthProtocolMessage(
+            None,
+            [block_hash.binary for block_hash in self.block_hashes[:2]]
+        )
+        self.assertTrue(self.block_processing_service.try_process_get_block_bodies_request(get_bodies_msg))
+        response_msg = self.node.broadcast.call_args[0][0]
+
+        self.node.broadcast.reset_mock()
+        self.block_queuing_service.try_send_bodies_to_node = MagicMock()
+        self.assertTrue(
+            self.block_processing_service.try_process_get_block_bodies_request(
+                GetBlockBodiesEthProtocolMessage(get_bodies_msg.rawbytes())
+            )
+        )
+        self.block_queuing_service.try_send_bodies_to_node.assert_not_called()
+        self.node.broadcast.assert_called_once_with(
+            response_msg, connection_types=[ConnectionType.BLOCKCHAIN_NODE]
+        )
+
+    def test_try_process_get_block_headers_request_cached_until_reorg(self):
+        self.block_queuing_service.best_sent_block = (1019, self.block_hashes[-1], time.time())
+        get_headers_msg = GetBlockHeadersEthProtocolMessage(None, struct.pack(">I", 1016), 4, 0, 0)
+        self.assertTrue(self.block_processing_service.try_process_get_block_headers_request(get_headers_msg))
+        self._assert_headers_sent(self.block_hashes[16:20])
+
+        self.block_queuing_service.try_send_headers_to_node = MagicMock(
+            wraps=self.block_queuing_service.try_send_headers_to_node
+        )
+        self.assertTrue(self.block_processing_service.try_process_get_block_headers_request(get_headers_msg))
+        self._assert_headers_sent(self.block_hashes[16:20])
+        self.block_queuing_service.try_send_headers_to_node.assert_not_called()
+
+        # reorg at block 1019
+        fork_block_message = InternalEthBlockInfo.from_new_block_msg(
+            mock_eth_messages.new_block_eth_protocol_message(21, 1019, prev_block_hash=self.block_hashes[18])
+        )
+        fork_block_hash = fork_block_message.block_hash()
+        self.block_queuing_service.push(fork_block_hash, fork_block_message)
+        self.block_queuing_service.best_sent_block = (1019, fork_block_hash, time.time())
+        self.node.broadcast.reset_mock()
+
+        self.assertTrue(self.block_processing_service.try_process_get_block_headers_request(get_headers_msg))
+        self._assert_headers_sent(self.block_hashes[16:19] + [fork_block_hash])
+        self.block_queuing_service.try_send_headers_to_node.assert_called_once()
+
+    def test_try_process_get_block_headers_request_incomplete_invalidated_by_new_block(self):
+        self.block_queuing_service.best_sent_block = (1019, self.block_hashes[19], time.time())
+        get_headers_msg = GetBlockHeadersEthProtocolMessage(None, struct.pack(">I", 1018), 4, 0, 0)
+        self.assertTrue(self.block_processing_service.try_process_get_block_headers_request(get_headers_msg))
+        self._assert_headers_sent(self.block_hashes[18:20])
+
+        block_message = InternalEthBlockInfo.from_new_block_msg(
+            mock_eth_messages.new_block_eth_protocol_message(20, 1020, prev_block_hash=self.block_hashes[19])
+        )
+        block_hash = block_message.block_hash()
+        self.block_queuing_service.push(block_hash, block_message)
+        self.block_queuing_service.best_sent_block = (1020, block_hash, time.time())
+        self.node.broadcast.reset_mock()
+
+        self.assertTrue(self.block_processing_service.try_process_get_block_headers_request(get_headers_msg))
+        self._assert_headers_sent(self.block_hashes[18:20] + [block_hash])
+
+    def _assert_headers_sent(self, block_hashes):
+        headers_msg = self.node.broadcast.call_args[0][0]
+        self.assertIsInstance(headers_msg, BlockHeadersEthProtocolMessage)
+        self.assertEqual(
+            block_hashes,
+            [block_header.hash_object() for block_header in headers_msg.get_block_headers()]
+        )
+        self.node.broadcast.reset_mock()
@@ -178,13 +178,13 @@ class EthBlockQueuingServiceFetchingTest(AbstractTestCase):
     def test_iterate_recent_block_hashes(self):
         top_blocks = list(self.block_queuing_service.iterate_recent_block_hashes(max_count=10))
         block_hash = top_blocks[0]
-        self.assertEqual(self.block_queuing_service._height_by_block_hash[block_hash],
-                         self.block_queuing_service._highest_block_number)
+        self.assertEqual(self.block_queuing_service._block_tree.get_block_number(block_hash),
+                         self.block_queuing_service._block_tree.highest_block_number)
         self.assertEqual(10, len(top_blocks))
 
     def test_get_transactions_hashes_from_message(self):
-        last_block_hash = list(self.block_queuing_service._block_hashes_by_height[
-            self.block_queuing_service._highest_block_number])[0]
+        last_block_hash = list(self.block_queuing_service._block_tree.get_block_hashes_at_height(
+            self.block_queuing_service._block_tree.highest_block_number))[0]
         self.assertIsNotNone(self.block_queuing_service.get_block_body_from_message(last_block_hash))
         self.assertIsNone(self.block_queuing_service.get_block_body_from_message(bytes(64)))
 
@@ -0,0 +1,27 @@
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.services.eth.eth_handshake_crypto_service import EthHandshakeCryptoService
+
+
+class EthHandshakeCryptoServiceTest(AbstractTestCase):
+
+    def setUp(self):
+        self.handshake_crypto_service = EthHandshakeCryptoService(0)
+        self.results = []
+
+    def test_submit_inline(self):
+        self.assertFalse(self.handshake_crypto_service.is_enabled())
+
+        self.handshake_crypto_service.submit(self.results.append, lambda a, b: a + b, 1, 2)
+        self.assertEqual(1, len(self.results))
+        self.assertEqual(3, self.results[0].result)
+        self.assertIsNone(self.results[0].error)
+
+    def test_submit_error(self):
+        def _fail():
+            raise ValueError("invalid auth message")
+
+        self.handshake_crypto_service.submit(self.results.append, _fail)
+        self.assertEqual(1, len(self.results))
+        self.assertIsNone(self.results[0].result)
+        self.assertIsInstance(self.results[0].error, ValueError)
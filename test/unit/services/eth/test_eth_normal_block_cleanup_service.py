@@ -3,6 +3,7 @@ import os
 from mock import MagicMock
 
 from bxcommon.services.transaction_service import TransactionService
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.test_utils import helpers
 from bxcommon.utils import convert
 from bxcommon.utils.object_hash import Sha256Hash, SHA256_HASH_LEN
@@ -94,7 +95,7 @@ class EthBlockCleanupServiceTests(AbstractBlockCleanupServiceTest):
         self._test_block_confirmation_cleanup()
 
     def _get_transaction_service(self) -> TransactionService:
-        return TransactionService(self.node, 1)
+        return GatewayTransactionService(self.node, 1)
 
     def _get_cleanup_service(self) -> AbstractEthBlockCleanupService:
         return EthNormalBlockCleanupService(self.node, 1)
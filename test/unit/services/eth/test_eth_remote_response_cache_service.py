@@ -0,0 +1,230 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import rlp
+
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.blockchain_utils.eth import eth_common_utils
+from bxgateway import gateway_constants
+from bxgateway.messages.eth.protocol.get_node_data_eth_protocol_message import GetNodeDataEthProtocolMessage
+from bxgateway.messages.eth.protocol.get_receipts_eth_protocol_message import GetReceiptsEthProtocolMessage
+from bxgateway.messages.eth.protocol.node_data_eth_protocol_message import NodeDataEthProtocolMessage
+from bxgateway.messages.eth.protocol.receipts_eth_protocol_message import ReceiptsEthProtocolMessage
+from bxgateway.services.eth.eth_remote_response_cache_service import EthRemoteResponseCacheService
+from bxgateway.utils.eth import eth_utils
+
+
+class EthRemoteResponseCacheServiceTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.best_block_number = 100
+        self.receipts_roots = {}
+        self.cache_service = EthRemoteResponseCacheService(
+            10 * 1024, 10, lambda: self.best_block_number, self.receipts_roots.get
+        )
+
+        self.block_hashes = [helpers.generate_object_hash().binary for _ in range(2)]
+        self.receipts = [rlp.encode([[b"receipt", i]]) for i in range(2)]
+        self.get_receipts_msg = GetReceiptsEthProtocolMessage(None, self.block_hashes)
+        self.receipts_msg = ReceiptsEthProtocolMessage(eth_utils.get_rlp_list_bytes(self.receipts))
+
+        self.nodes_data = [b"node data 1", b"node data 2"]
+        self.get_node_data_msg = GetNodeDataEthProtocolMessage(
+            None, [eth_common_utils.keccak_hash(node_data) for node_data in self.nodes_data]
+        )
+        self.node_data_msg = NodeDataEthProtocolMessage(
+            eth_utils.get_rlp_list_bytes([rlp.encode(node_data) for node_data in self.nodes_data])
+        )
+
+        self.connection = self._create_connection()
+
+    def test_receipts_cache_hit(self):
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.cache_service.process_response(self.receipts_msg)
+        self.assertEqual(2, len(self.cache_service))
+
+        self.assertTrue(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.connection.enqueue_msg.assert_called_once()
+        response_msg = self.connection.enqueue_msg.call_args[0][0]
+        self.assertIsInstance(response_msg, ReceiptsEthProtocolMessage)
+        self.assertEqual(self.receipts_msg.rawbytes(), response_msg.rawbytes())
+
+        partial_request_msg = GetReceiptsEthProtocolMessage(None, self.block_hashes[1:])
+        self.assertTrue(self.cache_service.try_process_request(partial_request_msg, self.connection))
+        response_msg = self.connection.enqueue_msg.call_args[0][0]
+        self.assertEqual(eth_utils.get_rlp_list_bytes(self.receipts[1:]), response_msg.rawbytes())
+
+    def test_receipts_count_mismatch_not_cached(self):
+        other_connection = self._create_connection()
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.assertTrue(self.cache_service.try_process_request(self.get_receipts_msg, other_connection))
+
+        self.cache_service.process_response(
+            ReceiptsEthProtocolMessage(eth_utils.get_rlp_list_bytes(self.receipts[1:]))
+        )
+        self.assertEqual(0, len(self.cache_service))
+        other_connection.enqueue_msg.assert_not_called()
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+
+    def test_receipts_checked_against_receipts_root(self):
+        other_connection = self._create_connection()
+        self.receipts_roots[self.block_hashes[0]] = eth_utils.get_ordered_trie_root(
+            [rlp.encode([b"receipt", 0])]
+        )
+        self.receipts_roots[self.block_hashes[1]] = eth_utils.get_ordered_trie_root(
+            [rlp.encode([b"other receipt", 1])]
+        )
+
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.assertTrue(self.cache_service.try_process_request(self.get_receipts_msg, other_connection))
+        self.cache_service.process_response(self.receipts_msg)
+        self.assertEqual(0, len(self.cache_service))
+        other_connection.enqueue_msg.assert_not_called()
+
+        self.receipts_roots[self.block_hashes[1]] = eth_utils.get_ordered_trie_root(
+            [rlp.encode([b"receipt", 1])]
+        )
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.assertTrue(self.cache_service.try_process_request(self.get_receipts_msg, other_connection))
+        self.cache_service.process_response(self.receipts_msg)
+        self.assertEqual(2, len(self.cache_service))
+        other_connection.enqueue_msg.assert_called_once_with(self.receipts_msg)
+
+    def test_node_data_cache_hit(self):
+        self.assertFalse(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+        self.cache_service.process_response(self.node_data_msg)
+        self.assertEqual(2, len(self.cache_service))
+
+        self.assertTrue(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+        response_msg = self.connection.enqueue_msg.call_args[0][0]
+        self.assertIsInstance(response_msg, NodeDataEthProtocolMessage)
+        self.assertEqual(self.node_data_msg.rawbytes(), response_msg.rawbytes())
+
+    def test_coalesce_request_in_flight(self):
+        other_connection = self._create_connection()
+        closed_connection = self._create_connection()
+        closed_connection.is_alive.return_value = False
+
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.assertTrue(self.cache_service.try_process_request(self.get_receipts_msg, other_connection))
+        self.assertTrue(self.cache_service.try_process_request(self.get_receipts_msg, closed_connection))
+
+        self.cache_service.process_response(self.receipts_msg)
+        self.connection.enqueue_msg.assert_not_called()
+        other_connection.enqueue_msg.assert_called_once_with(self.receipts_msg)
+        closed_connection.enqueue_msg.assert_not_called()
+
+    def test_responses_matched_in_order(self):
+        other_get_receipts_msg = GetReceiptsEthProtocolMessage(None, [helpers.generate_object_hash().binary])
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.assertFalse(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+        self.assertFalse(self.cache_service.try_process_request(other_get_receipts_msg, self.connection))
+
+        other_connection = self._create_connection()
+        self.assertTrue(self.cache_service.try_process_request(other_get_receipts_msg, other_connection))
+
+        self.cache_service.process_response(self.receipts_msg)
+        self.cache_service.process_response(self.node_data_msg)
+        self.assertEqual(4, len(self.cache_service))
+        other_connection.enqueue_msg.assert_not_called()
+
+        other_receipts_msg = ReceiptsEthProtocolMessage(eth_utils.get_rlp_list_bytes(self.receipts[:1]))
+        self.cache_service.process_response(other_receipts_msg)
+        other_connection.enqueue_msg.assert_called_once_with(other_receipts_msg)
+        self.assertTrue(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+
+    def test_prune_old_entries(self):
+        self.cache_service.try_process_request(self.get_node_data_msg, self.connection)
+        self.cache_service.process_response(self.node_data_msg)
+
+        self.best_block_number += 10
+        self.assertTrue(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+
+        self.best_block_number += 1
+        self.assertFalse(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+        self.assertEqual(0, len(self.cache_service))
+        self.assertEqual(0, self.cache_service.total_size_bytes)
+
+    def test_on_remote_connection_closed(self):
+        other_connection = self._create_connection()
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.cache_service.on_remote_connection_closed()
+
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, other_connection))
+        self.assertTrue(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.cache_service.process_response(self.receipts_msg)
+        self.connection.enqueue_msg.assert_called_once_with(self.receipts_msg)
+        other_connection.enqueue_msg.assert_not_called()
+
+    def test_disabled(self):
+        cache_service = EthRemoteResponseCacheService(0, 10, lambda: self.best_block_number, self.receipts_roots.get)
+        self.assertFalse(cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        self.assertFalse(cache_service.try_process_request(self.get_receipts_msg, self.connection))
+        cache_service.process_response(self.node_data_msg)
+        self.assertEqual(0, len(cache_service))
+
+    def test_missing_response(self):
+        other_connection = self._create_connection()
+        other_block_hash = helpers.generate_object_hash().binary
+        unanswered_request_msg = GetReceiptsEthProtocolMessage(None, [other_block_hash])
+        self.assertFalse(self.cache_service.try_process_request(unanswered_request_msg, self.connection))
+
+        request_time = time.time() + gateway_constants.ETH_REMOTE_REQUEST_COALESCING_TIMEOUT_S + 1
+        with patch("time.time", return_value=request_time):
+            get_receipts_msg = GetReceiptsEthProtocolMessage(None, self.block_hashes[:1])
+            self.assertFalse(self.cache_service.try_process_request(get_receipts_msg, self.connection))
+            self.assertTrue(self.cache_service.try_process_request(get_receipts_msg, other_connection))
+
+            # the unanswered request was dropped, so an identical request is proxied again
+            self.assertFalse(self.cache_service.try_process_request(unanswered_request_msg, self.connection))
+            self.assertTrue(self.cache_service.try_process_request(unanswered_request_msg, self.connection))
+
+            receipts_msg = ReceiptsEthProtocolMessage(eth_utils.get_rlp_list_bytes(self.receipts[:1]))
+            self.cache_service.process_response(receipts_msg)
+            other_connection.enqueue_msg.assert_called_once_with(receipts_msg)
+            self.connection.enqueue_msg.assert_not_called()
+
+    def test_late_receipts_response(self):
+        other_connection = self._create_connection()
+        self.assertFalse(self.cache_service.try_process_request(self.get_receipts_msg, self.connection))
+
+        request_time = time.time() + gateway_constants.ETH_REMOTE_REQUEST_COALESCING_TIMEOUT_S + 1
+        with patch("time.time", return_value=request_time):
+            other_get_receipts_msg = GetReceiptsEthProtocolMessage(None, [helpers.generate_object_hash().binary])
+            self.assertFalse(self.cache_service.try_process_request(other_get_receipts_msg, self.connection))
+            self.assertTrue(self.cache_service.try_process_request(other_get_receipts_msg, other_connection))
+
+            # late response to the dropped request is matched to the next request, which asked for one block
+            self.cache_service.process_response(self.receipts_msg)
+            other_connection.enqueue_msg.assert_not_called()
+            self.assertEqual(0, len(self.cache_service))
+
+    def test_missing_node_data_response(self):
+        other_connection = self._create_connection()
+        unanswered_request_msg = GetNodeDataEthProtocolMessage(None, [helpers.generate_object_hash().binary])
+        self.assertFalse(self.cache_service.try_process_request(unanswered_request_msg, self.connection))
+        self.assertTrue(self.cache_service.try_process_request(unanswered_request_msg, other_connection))
+
+        request_time = time.time() + gateway_constants.ETH_REMOTE_REQUEST_COALESCING_TIMEOUT_S + 1
+        with patch("time.time", return_value=request_time):
+            self.assertFalse(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+            self.cache_service.process_response(self.node_data_msg)
+            other_connection.enqueue_msg.assert_not_called()
+            self.assertEqual(2, len(self.cache_service))
+
+    def test_mismatched_node_data_response(self):
+        other_connection = self._create_connection()
+        unanswered_request_msg = GetNodeDataEthProtocolMessage(None, [helpers.generate_object_hash().binary])
+        self.assertFalse(self.cache_service.try_process_request(unanswered_request_msg, self.connection))
+        self.assertTrue(self.cache_service.try_process_request(unanswered_request_msg, other_connection))
+
+        self.cache_service.process_response(self.node_data_msg)
+        other_connection.enqueue_msg.assert_not_called()
+        self.assertEqual(2, len(self.cache_service))
+        self.assertTrue(self.cache_service.try_process_request(self.get_node_data_msg, self.connection))
+
+    def _create_connection(self) -> MagicMock:
+        connection = MagicMock()
+        connection.is_alive.return_value = True
+        return connection
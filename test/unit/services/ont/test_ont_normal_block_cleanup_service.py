@@ -1,6 +1,7 @@
 from unittest import skip
 
 from bxcommon.services.transaction_service import TransactionService
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxgateway.services.ont.abstract_ont_block_cleanup_service import AbstractOntBlockCleanupService
 from bxgateway.services.ont.ont_normal_block_cleanup_service import OntNormalBlockCleanupService
 from bxgateway.testing.abstract_ont_block_cleanup_service_test import AbstractOntBlockCleanupServiceTest
@@ -19,7 +20,7 @@ class OntNormalBlockCleanupServiceTest(AbstractOntBlockCleanupServiceTest):
         self._test_block_confirmation_cleanup()
 
     def _get_transaction_service(self) -> TransactionService:
-        return TransactionService(self.node, 1)
+        return GatewayTransactionService(self.node, 1)
 
     def _get_cleanup_service(self) -> AbstractOntBlockCleanupService:
         return OntNormalBlockCleanupService(self.node, 1)
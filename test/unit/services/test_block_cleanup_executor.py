@@ -0,0 +1,80 @@
+from mock import MagicMock, patch
+
+from bxcommon import constants
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway import gateway_constants
+from bxgateway.services.block_cleanup_executor import BlockCleanupExecutor, BlockCleanupTask
+from bxgateway.services.gateway_transaction_service import BlockTransactionsRemovalResult
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+
+
+class BlockCleanupExecutorTest(AbstractTestCase):
+
+    def setUp(self):
+        self.node = MockGatewayNode(gateway_helpers.get_gateway_opts(8000, block_cleanup_time_budget_ms=0))
+        self.executor = BlockCleanupExecutor(self.node)
+
+        self.tx_hashes = [helpers.generate_object_hash() for _ in range(5)]
+        self.unknown_tx_hash = self.tx_hashes[2]
+        self.transaction_service = MagicMock()
+        self.transaction_service.remove_block_transactions = MagicMock(side_effect=self._remove_block_transactions)
+        self.completed_tasks = []
+
+    def _remove_block_transactions(self, tx_hashes) -> BlockTransactionsRemovalResult:
+        tx_hashes = list(tx_hashes)
+        unknown_tx_hashes = [tx_hash for tx_hash in tx_hashes if tx_hash == self.unknown_tx_hash]
+        return BlockTransactionsRemovalResult(
+            [1] * (len(tx_hashes) - len(unknown_tx_hashes)), unknown_tx_hashes, len(tx_hashes), 0
+        )
+
+    def _create_task(self, block_hash: Sha256Hash) -> BlockCleanupTask:
+        return BlockCleanupTask(block_hash, self.tx_hashes, self.transaction_service, self.completed_tasks.append)
+
+    def test_cleanup_without_time_budget(self):
+        self.executor.submit(self._create_task(helpers.generate_object_hash()))
+
+        self.assertEqual(1, len(self.completed_tasks))
+        task = self.completed_tasks[0]
+        self.assertEqual(5, task.transactions_processed)
+        self.assertEqual([1, 1, 1, 1], task.short_ids)
+        self.assertEqual([self.unknown_tx_hash], task.unknown_tx_hashes)
+        self.assertEqual(0, len(self.executor))
+
+    @patch("bxgateway.gateway_constants.BLOCK_CLEANUP_CHUNK_SIZE", 2)
+    def test_time_sliced_cleanup(self):
+        # budget is used up by the first chunk of each slice
+        self.node.opts.block_cleanup_time_budget_ms = 0.000001
+        block_hash = helpers.generate_object_hash()
+
+        self.executor.submit(self._create_task(block_hash))
+        self.executor.submit(self._create_task(block_hash))
+        self.assertEqual(1, len(self.executor))
+        self.assertTrue(self.executor.is_queued(block_hash))
+
+        self.assertEqual(gateway_constants.BLOCK_CLEANUP_SLICE_INTERVAL_S, self.executor._process_tasks())
+        self.assertEqual(1, self.transaction_service.remove_block_transactions.call_count)
+        self.assertEqual(gateway_constants.BLOCK_CLEANUP_SLICE_INTERVAL_S, self.executor._process_tasks())
+        self.assertEqual(0, len(self.completed_tasks))
+
+        self.assertEqual(constants.CANCEL_ALARMS, self.executor._process_tasks())
+        self.assertEqual(1, len(self.completed_tasks))
+        task = self.completed_tasks[0]
+        self.assertEqual(5, task.transactions_processed)
+        self.assertEqual(3, task.chunks)
+        self.assertEqual([self.unknown_tx_hash], task.unknown_tx_hashes)
+        self.assertFalse(self.executor.is_queued(block_hash))
+        self.assertIsNone(self.executor._alarm_id)
+
+    def test_cleanup_within_time_budget(self):
+        self.node.opts.block_cleanup_time_budget_ms = 1000
+
+        self.executor.submit(self._create_task(helpers.generate_object_hash()))
+        self.executor.submit(self._create_task(helpers.generate_object_hash()))
+        self.assertEqual(0, len(self.completed_tasks))
+
+        self.assertEqual(constants.CANCEL_ALARMS, self.executor._process_tasks())
+        self.assertEqual(2, len(self.completed_tasks))
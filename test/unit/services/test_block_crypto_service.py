@@ -0,0 +1,57 @@
+import os
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+from bxcommon.test_utils import helpers
+
+from bxgateway.services.block_crypto_service import BlockCryptoService
+
+
+class BlockCryptoServiceTest(AbstractTestCase):
+
+    def setUp(self):
+        self.block_crypto_service = BlockCryptoService(0)
+        self.results = []
+
+    def test_encrypt_and_decrypt_inline(self):
+        self.assertFalse(self.block_crypto_service.is_enabled())
+        payload = bytearray(os.urandom(1000))
+
+        self.block_crypto_service.encrypt(payload, self.results.append)
+        self.assertEqual(1, len(self.results))
+        encrypted_block = self.results[0].result
+        self.assertEqual(Sha256Hash(crypto.double_sha256(encrypted_block.ciphertext)), encrypted_block.cipher_hash)
+
+        self.block_crypto_service.verify_and_decrypt(
+            encrypted_block.cipher_hash, encrypted_block.ciphertext, encrypted_block.key, self.results.append
+        )
+        self.assertEqual(2, len(self.results))
+        decrypted_block = self.results[1].result
+        self.assertTrue(decrypted_block.hash_matches)
+        self.assertEqual(payload, decrypted_block.block.tobytes())
+
+    def test_verify_without_key(self):
+        self.block_crypto_service.encrypt(bytearray(os.urandom(1000)), self.results.append)
+        encrypted_block = self.results[0].result
+
+        self.block_crypto_service.verify_and_decrypt(
+            encrypted_block.cipher_hash, encrypted_block.ciphertext, None, self.results.append
+        )
+        decrypted_block = self.results[1].result
+        self.assertTrue(decrypted_block.hash_matches)
+        self.assertIsNone(decrypted_block.block)
+
+    def test_verify_hash_mismatch(self):
+        self.block_crypto_service.encrypt(bytearray(os.urandom(1000)), self.results.append)
+        encrypted_block = self.results[0].result
+
+        self.block_crypto_service.verify_and_decrypt(
+            Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)),
+            encrypted_block.ciphertext,
+            encrypted_block.key,
+            self.results.append
+        )
+        decrypted_block = self.results[1].result
+        self.assertFalse(decrypted_block.hash_matches)
+        self.assertIsNone(decrypted_block.block)
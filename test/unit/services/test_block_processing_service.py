@@ -6,12 +6,14 @@ from bxgateway.testing import gateway_helpers
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.constants import LOCALHOST
 from bxcommon.messages.bloxroute.block_holding_message import BlockHoldingMessage
+from bxcommon.messages.bloxroute.get_txs_message import GetTxsMessage
 from bxcommon.test_utils import helpers
 from bxcommon.test_utils.mocks.mock_connection import MockConnection
 from bxcommon.test_utils.mocks.mock_socket_connection import MockSocketConnection
 from bxcommon.utils import crypto
 from bxcommon.utils.object_hash import Sha256Hash
 
+from bxgateway import gateway_constants
 from bxgateway.services.block_processing_service import BlockProcessingService
 from bxgateway.services.push_block_queuing_service import PushBlockQueuingService
 from bxgateway.services.block_recovery_service import BlockRecoveryService
@@ -143,5 +145,90 @@ class BlockHoldingServiceTest(AbstractTestCase):
 
         self.assertEqual(0, len(self.sut._holds.contents))
 
+    def test_compute_hold_timeout_from_hold_durations(self):
+        block_message = MockBlockMessage(Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN)))
+        max_timeout = self.node.opts.blockchain_block_hold_timeout_s
+
+        self.sut.place_hold(block_message.block_hash(), self.dummy_connection)
+        self.assertEqual(max_timeout, self.sut._compute_hold_timeout(block_message))
+
+        for _ in range(gateway_constants.BLOCK_HOLD_TIMEOUT_MIN_SAMPLES):
+            self.sut._record_hold_duration(self.dummy_connection, 0.5)
+        self.assertAlmostEqual(
+            0.5 * gateway_constants.BLOCK_HOLD_TIMEOUT_MARGIN_MULTIPLIER,
+            self.sut._compute_hold_timeout(block_message)
+        )
+
+        for _ in range(gateway_constants.BLOCK_HOLD_DURATION_SAMPLES_PER_PEER):
+            self.sut._record_hold_duration(self.dummy_connection, max_timeout * 10)
+        self.assertEqual(max_timeout, self.sut._compute_hold_timeout(block_message))
+
+    def test_queue_block_hold_adaptive_timeout(self):
+        block_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        block_message = MockBlockMessage(block_hash)
+        connection = MockBlockchainConnection(
+            MockSocketConnection(node=self.node, ip_address=LOCALHOST, port=8000), self.node
+        )
+        for _ in range(gateway_constants.BLOCK_HOLD_TIMEOUT_MIN_SAMPLES):
+            self.sut._record_hold_duration(self.dummy_connection, 0.5)
+
+        self.sut.place_hold(block_hash, self.dummy_connection)
+        self.sut.queue_block_for_processing(block_message, connection)
+        self.node.neutrality_service.propagate_block_to_network.assert_not_called()
+
+        time.time = MagicMock(return_value=time.time() + 0.5 * gateway_constants.BLOCK_HOLD_TIMEOUT_MARGIN_MULTIPLIER)
+        self.node.alarm_queue.fire_alarms()
+
+        self._assert_block_propagated(block_hash)
+
+        # timed out hold is recorded as a lower bound on the BDN arrival time
+        hold_durations = self.sut._hold_durations_by_peer[self.dummy_connection.peer_desc]
+        self.assertEqual(gateway_constants.BLOCK_HOLD_TIMEOUT_MIN_SAMPLES + 1, len(hold_durations))
+        self.assertAlmostEqual(
+            0.5 * gateway_constants.BLOCK_HOLD_TIMEOUT_MARGIN_MULTIPLIER, hold_durations[-1], delta=0.1
+        )
+
+    def test_cancel_hold_records_hold_duration(self):
+        block_hash = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        block_message = MockBlockMessage(block_hash)
+        connection = MockBlockchainConnection(
+            MockSocketConnection(node=self.node, ip_address=LOCALHOST, port=8000), self.node
+        )
+
+        self.sut.place_hold(block_hash, self.dummy_connection)
+        self.sut.queue_block_for_processing(block_message, connection)
+        time.time = MagicMock(return_value=time.time() + 1)
+        self.sut.cancel_hold_timeout(block_hash, self.dummy_connection)
+
+        hold_durations = self.sut._hold_durations_by_peer[self.dummy_connection.peer_desc]
+        self.assertEqual(1, len(hold_durations))
+        self.assertAlmostEqual(1, hold_durations[0], delta=0.1)
+
+    def test_recovery_retries_merged_into_single_request(self):
+        self.node.block_recovery_service = BlockRecoveryService(self.node.alarm_queue)
+        block_recovery_service = self.node.block_recovery_service
+
+        block_hash_1 = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        block_hash_2 = Sha256Hash(helpers.generate_bytearray(crypto.SHA256_HASH_LEN))
+        block_recovery_service.add_block(helpers.generate_bytearray(100), block_hash_1, [1, 2, 3], [])
+        block_recovery_service.add_block(helpers.generate_bytearray(100), block_hash_2, [2, 3, 4], [])
+
+        for block_awaiting_recovery in block_recovery_service.get_blocks_awaiting_recovery():
+            self.sut.schedule_recovery_retry(block_awaiting_recovery)
+        self.assertEqual(0, len(self.node.broadcast_messages))
+
+        time.time = MagicMock(
+            return_value=time.time() + gateway_constants.BLOCK_RECOVERY_RECOVERY_INTERVAL_S[0]
+        )
+        self.node.alarm_queue.fire_alarms()
+
+        self.assertEqual(1, len(self.node.broadcast_messages))
+        get_txs_message = self.node.broadcast_messages[0][0]
+        self.assertIsInstance(get_txs_message, GetTxsMessage)
+        self.assertEqual({1, 2, 3, 4}, set(get_txs_message.get_short_ids()))
+        self.assertEqual(4, len(get_txs_message.get_short_ids()))
+        self.assertEqual(1, block_recovery_service.recovery_attempts_by_block[block_hash_1])
+        self.assertEqual(1, block_recovery_service.recovery_attempts_by_block[block_hash_2])
+
     def _assert_block_propagated(self, block_hash):
         self.node.neutrality_service.propagate_block_to_network.assert_called_once()
@@ -162,6 +162,61 @@ class BlockRecoveryManagerTest(AbstractTestCase):
         self.assertIn(self.bx_block_hashes[1], self.block_recovery_service._bx_block_hash_to_block)
         self.assertTrue(self.block_recovery_service._cleanup_scheduled)
 
+    def test_get_blocks_awaiting_recovery__most_recent_first(self):
+        self._add_block()
+        time.time = MagicMock(return_value=time.time() + 1)
+        self._add_block(1)
+
+        blocks_awaiting_recovery = self.block_recovery_service.get_blocks_awaiting_recovery()
+        self.assertEqual(2, len(blocks_awaiting_recovery))
+        self.assertEqual(self.block_hashes[1], blocks_awaiting_recovery[0].block_hash)
+        self.assertEqual(self.block_hashes[0], blocks_awaiting_recovery[1].block_hash)
+        self.assertEqual(set(self.unknown_tx_sids[1]), blocks_awaiting_recovery[0].unknown_short_ids)
+        self.assertTrue(blocks_awaiting_recovery[0].recovery_start_time > blocks_awaiting_recovery[1].recovery_start_time)
+
+    def test_get_recovery_retry_delay__adapts_to_round_trip_time(self):
+        self.assertEqual(
+            gateway_constants.BLOCK_RECOVERY_RECOVERY_INTERVAL_S[0],
+            self.block_recovery_service.get_recovery_retry_delay(0)
+        )
+        self.assertIsNone(self.block_recovery_service.get_relay_round_trip_time())
+
+        self.block_recovery_service.on_short_ids_requested([1, 2])
+        time.time = MagicMock(return_value=time.time() + 1)
+        self.block_recovery_service.on_short_ids_received([1, 2, 3])
+
+        self.assertEqual(1, self.block_recovery_service.get_relay_round_trip_time())
+        self.assertEqual(
+            gateway_constants.BLOCK_RECOVERY_RTT_TIMEOUT_MULTIPLIER,
+            self.block_recovery_service.get_recovery_retry_delay(0)
+        )
+        self.assertEqual(
+            gateway_constants.BLOCK_RECOVERY_MAX_RETRY_DELAY_S,
+            self.block_recovery_service.get_recovery_retry_delay(100)
+        )
+
+    def test_filter_short_ids_awaiting_response(self):
+        self.block_recovery_service.on_short_ids_requested([1, 2])
+        self.assertEqual([3], self.block_recovery_service.filter_short_ids_awaiting_response([1, 2, 3]))
+
+        time.time = MagicMock(return_value=time.time() + gateway_constants.BLOCK_RECOVERY_RECOVERY_INTERVAL_S[0])
+        self.assertEqual([1, 2, 3], self.block_recovery_service.filter_short_ids_awaiting_response([1, 2, 3]))
+
+    def test_recovered_blocks__recovery_duration(self):
+        self._add_block()
+        time.time = MagicMock(return_value=time.time() + 2)
+
+        for sid in self.unknown_tx_sids[0]:
+            self.block_recovery_service.check_missing_sid(sid, RecoveredTxsSource.TXS_RECOVERED)
+        for tx_hash in self.unknown_tx_hashes[0]:
+            self.block_recovery_service.check_missing_tx_hash(tx_hash, RecoveredTxsSource.TXS_RECOVERED)
+
+        self.assertEqual(1, len(self.block_recovery_service.recovered_blocks))
+        recovered_block = self.block_recovery_service.recovered_blocks[0]
+        self.assertEqual(RecoveredTxsSource.TXS_RECOVERED, recovered_block.recovered_txs_source)
+        self.assertAlmostEqual(2, recovered_block.recovery_duration_s, delta=0.5)
+        self.assertNotIn(self.block_hashes[0], self.block_recovery_service._block_hash_to_recovery_start_time)
+
     def _add_block(self, existing_block_count=0):
         bx_block = _create_block()
         self.blocks.append(bx_block)
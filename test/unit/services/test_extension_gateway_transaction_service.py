@@ -15,6 +15,7 @@ class ExtensionGatewayTransactionServiceTest(AbstractTransactionServiceTestCase)
         super(ExtensionGatewayTransactionServiceTest, self).setUp()
         self.mock_node.log_txs_network_content = MagicMock()
         self.mock_node.block_recovery_service = MagicMock()
+        self.mock_node.on_transaction_contents_added = MagicMock()
 
     def test_get_missing_transactions(self):
         self._test_get_missing_transactions()
@@ -105,5 +106,22 @@ class ExtensionGatewayTransactionServiceTest(AbstractTransactionServiceTestCase)
     def test_get_transactions(self):
         self._test_get_transactions()
 
+    def test_remove_block_transactions(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(4)]
+        for short_id, tx_hash in enumerate(tx_hashes, 1):
+            self.transaction_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(250))
+            self.transaction_service.assign_short_id(tx_hash, short_id)
+        unknown_tx_hash = helpers.generate_object_hash()
+
+        result = self.transaction_service.remove_block_transactions(
+            [tx_hashes[0], tx_hashes[1], unknown_tx_hash], [1, 3, 4]
+        )
+
+        self.assertEqual([1, 2, 3, 4], sorted(result.short_ids))
+        self.assertEqual([unknown_tx_hash], result.unknown_tx_hashes)
+        for short_id, tx_hash in enumerate(tx_hashes, 1):
+            self.assertFalse(self.transaction_service.has_transaction_contents(tx_hash))
+            self.assertFalse(self.transaction_service.has_short_id(short_id))
+
     def _get_transaction_service(self) -> ExtensionGatewayTransactionService:
         return ExtensionGatewayTransactionService(self.mock_node, 0)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from mock import MagicMock
 
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService
+from bxcommon.test_utils import helpers
 from bxcommon.test_utils.abstract_transaction_service_test_case import AbstractTransactionServiceTestCase
 
 
@@ -9,6 +10,7 @@ class GatewayTransactionServiceTest(AbstractTransactionServiceTestCase):
         super(GatewayTransactionServiceTest, self).setUp()
         self.mock_node.log_txs_network_content = MagicMock()
         self.mock_node.block_recovery_service = MagicMock()
+        self.mock_node.on_transaction_contents_added = MagicMock()
 
 
     def test_get_missing_transactions(self):
@@ -65,5 +67,45 @@ class GatewayTransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_get_transactions(self):
         self._test_get_transactions()
 
+    def test_remove_block_transactions(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(4)]
+        for short_id, tx_hash in enumerate(tx_hashes, 1):
+            self.transaction_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(250))
+            self.transaction_service.assign_short_id(tx_hash, short_id)
+        unknown_tx_hash = helpers.generate_object_hash()
+
+        result = self.transaction_service.remove_block_transactions(
+            [tx_hashes[0], tx_hashes[1], unknown_tx_hash], [1, 3, 4]
+        )
+
+        self.assertEqual([1, 2, 3, 4], sorted(result.short_ids))
+        self.assertEqual([unknown_tx_hash], result.unknown_tx_hashes)
+        self.assertEqual(3, result.tx_hashes_count)
+        self.assertEqual(3, result.short_ids_count)
+        for short_id, tx_hash in enumerate(tx_hashes, 1):
+            self.assertFalse(self.transaction_service.has_transaction_contents(tx_hash))
+            self.assertFalse(self.transaction_service.has_short_id(short_id))
+        self.assertEqual(0, self.transaction_service._total_tx_contents_size)
+        self.assertEqual(0, len(self.transaction_service._tx_assignment_expire_queue.queue))
+
+    def test_remove_block_transactions_related_short_ids(self):
+        tx_hash = helpers.generate_object_hash()
+        other_tx_hash = helpers.generate_object_hash()
+        self.transaction_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(250))
+        self.transaction_service.assign_short_id(tx_hash, 1)
+        self.transaction_service.assign_short_id(tx_hash, 2)
+        self.transaction_service.set_transaction_contents(other_tx_hash, helpers.generate_bytearray(100))
+        self.transaction_service.assign_short_id(other_tx_hash, 3)
+
+        result = self.transaction_service.remove_block_transactions([], [1])
+
+        self.assertEqual([1, 2], sorted(result.short_ids))
+        self.assertEqual(0, result.tx_hashes_count)
+        self.assertEqual(1, result.short_ids_count)
+        self.assertFalse(self.transaction_service.has_transaction_contents(tx_hash))
+        self.assertFalse(self.transaction_service.has_short_id(2))
+        self.assertTrue(self.transaction_service.has_short_id(3))
+        self.assertEqual(100, self.transaction_service._total_tx_contents_size)
+
     def _get_transaction_service(self) -> GatewayTransactionService:
         return GatewayTransactionService(self.mock_node, 0)
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import time
 
@@ -17,6 +18,7 @@ from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import gateway_constants
 from bxgateway.gateway_constants import NeutralityPolicy
 from bxgateway.messages.gateway.gateway_message_type import GatewayMessageType
+from bxgateway.services.block_crypto_service import BlockCryptoService
 from bxgateway.services.neutrality_service import NeutralityService
 from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
 from bxgateway.utils.block_info import BlockInfo
@@ -139,6 +141,30 @@ class NeutralityServiceTest(AbstractTestCase):
                          crypto.symmetric_decrypt(cache_item.key, broadcast_message.blob().tobytes()))
         self.assertIn(broadcast_message.block_hash(), self.neutrality_service._receipt_tracker)
 
+    def test_propagate_block_to_network_encrypted_block_crypto_threads(self):
+        self.node.opts.encrypt_blocks = True
+        event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(event_loop)
+        self.node.block_crypto_service = BlockCryptoService(2)
+        self.addCleanup(self._close_block_crypto_service, event_loop)
+
+        block_message = helpers.generate_bytearray(50)
+        connection = MockConnection(
+            MockSocketConnection(1, self.node, ip_address=LOCALHOST, port=9000), self.node
+        )
+        self.assertIsNone(self.neutrality_service.propagate_block_to_network(block_message, connection))
+        self.assertEqual(0, len(self.node.broadcast_messages))
+
+        gateway_helpers.run_event_loop_until(event_loop, lambda: len(self.node.broadcast_messages) == 1)
+        broadcast_message, connection_types = self.node.broadcast_messages[0]
+        self.assertTrue(ConnectionType.RELAY_BLOCK in connection_types[0])
+
+        raw_block_hash = bytes(broadcast_message.block_hash().binary)
+        cache_item = self.node.in_progress_blocks._cache.get(raw_block_hash)
+        self.assertEqual(cache_item.payload,
+                         crypto.symmetric_decrypt(cache_item.key, broadcast_message.blob().tobytes()))
+        self.assertIn(broadcast_message.block_hash(), self.neutrality_service._receipt_tracker)
+
     def test_propagate_block_to_network_unencrypted_block(self):
         self.node.opts.encrypt_blocks = False
 
@@ -168,6 +194,11 @@ class NeutralityServiceTest(AbstractTestCase):
             self.node.connection_pool.add(i, LOCALHOST, 8000 + i,
                                           mock_connection(connection_type=ConnectionType.EXTERNAL_GATEWAY))
 
+    def _close_block_crypto_service(self, event_loop):
+        self.node.block_crypto_service.close()
+        event_loop.close()
+        asyncio.set_event_loop(asyncio.new_event_loop())
+
     def _assert_broadcast_key(self):
         key_messages = list(filter(lambda broadcasted: broadcasted[0].msg_type() == BloxrouteMessageType.KEY,
                                    self.node.broadcast_messages))
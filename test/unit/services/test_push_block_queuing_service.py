@@ -3,6 +3,8 @@ from typing import List, Optional
 
 from mock import MagicMock, Mock
 
+from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.constants import LOCALHOST
 from bxcommon.test_utils.mocks.mock_connection import MockConnection
 from bxcommon.test_utils.mocks.mock_socket_connection import MockSocketConnection
 from bxgateway.testing import gateway_helpers
@@ -609,3 +611,39 @@ class BlockQueuingServiceTest(AbstractTestCase):
 
         self.assertEqual(1, len(self.node.broadcast_to_nodes_messages))
         self.assertEqual(block_msg_2, self.node.broadcast_to_nodes_messages[0])
+
+    def test_sending_blocks_to_multiple_nodes(self):
+        node_connections = []
+        for i in range(2):
+            node_connection = MockConnection(
+                MockSocketConnection(i + 1, self.node, ip_address=LOCALHOST, port=8001 + i), self.node
+            )
+            node_connection.CONNECTION_TYPE = ConnectionType.BLOCKCHAIN_NODE
+            node_connection.enqueue_msg = MagicMock()
+            self.node.connection_pool.add(i + 1, LOCALHOST, 8001 + i, node_connection)
+            node_connections.append(node_connection)
+        fast_node_connection, slow_node_connection = node_connections
+
+        block_hash_1 = helpers.generate_object_hash()
+        block_msg_1 = create_block_message(block_hash_1)
+        block_hash_2 = helpers.generate_object_hash()
+        block_msg_2 = create_block_message(block_hash_2, block_hash_1)
+
+        # first block gets sent to both nodes immediately
+        self.block_queuing_service.push(block_hash_1, block_msg_1)
+        fast_node_connection.enqueue_msg.assert_called_once_with(block_msg_1)
+        slow_node_connection.enqueue_msg.assert_called_once_with(block_msg_1)
+        self.assertEqual(0, len(self.node.broadcast_to_nodes_messages))
+
+        # second block is sent to the node that confirmed the first one
+        self.block_queuing_service.mark_blocks_seen_by_blockchain_node([block_hash_1], fast_node_connection)
+        self.block_queuing_service.push(block_hash_2, block_msg_2)
+        self.assertEqual(2, fast_node_connection.enqueue_msg.call_count)
+        fast_node_connection.enqueue_msg.assert_called_with(block_msg_2)
+        slow_node_connection.enqueue_msg.assert_called_once_with(block_msg_1)
+        self.assertEqual(0, len(self.block_queuing_service))
+
+        # and to the lagging node once it catches up
+        self.block_queuing_service.mark_blocks_seen_by_blockchain_node([block_hash_1], slow_node_connection)
+        self.assertEqual(2, slow_node_connection.enqueue_msg.call_count)
+        slow_node_connection.enqueue_msg.assert_called_with(block_msg_2)
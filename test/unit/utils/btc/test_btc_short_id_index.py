@@ -0,0 +1,79 @@
+import os
+
+from csiphash import siphash24
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.blockchain_utils.btc.btc_object_hash import BtcObjectHash
+from bxgateway import btc_constants
+from bxgateway.utils.btc import btc_short_id_index
+from bxgateway.utils.btc.btc_short_id_index import BtcShortIdIndex
+
+
+def _compute_short_id(key: bytes, tx_hash: BtcObjectHash) -> bytes:
+    return siphash24(key, bytes(tx_hash.binary[::-1]))[0:6]
+
+
+def _generate_tx_hash() -> BtcObjectHash:
+    return BtcObjectHash(buf=os.urandom(btc_constants.BTC_SHA_HASH_LEN), length=btc_constants.BTC_SHA_HASH_LEN)
+
+
+class BtcShortIdIndexTest(AbstractTestCase):
+
+    def setUp(self):
+        self.key = os.urandom(16)
+        self.tx_hashes = [_generate_tx_hash() for _ in range(100)]
+        self.index = BtcShortIdIndex()
+        for tx_hash in self.tx_hashes:
+            self.index.add(tx_hash)
+
+    def test_match_short_ids(self):
+        block_tx_hashes = self.tx_hashes[::5]
+        short_ids = [_compute_short_id(self.key, tx_hash) for tx_hash in block_tx_hashes]
+        short_ids.append(os.urandom(6))
+
+        self.assertEqual(100, len(self.index))
+        self.assertEqual(dict(zip(short_ids, block_tx_hashes)), self.index.match_short_ids(self.key, short_ids))
+
+    def test_add_duplicate(self):
+        self.index.add(self.tx_hashes[0])
+        self.assertEqual(100, len(self.index))
+
+    def test_remove_and_reuse_slot(self):
+        removed_tx_hash = self.tx_hashes[10]
+        self.index.remove(removed_tx_hash)
+
+        self.assertNotIn(removed_tx_hash, self.index)
+        self.assertEqual({}, self.index.match_short_ids(self.key, [_compute_short_id(self.key, removed_tx_hash)]))
+
+        tx_ids_len = len(self.index._tx_ids)
+        new_tx_hash = _generate_tx_hash()
+        self.index.add(new_tx_hash)
+        new_short_id = _compute_short_id(self.key, new_tx_hash)
+
+        self.assertIn(new_tx_hash, self.index)
+        self.assertEqual(tx_ids_len, len(self.index._tx_ids))
+        self.assertEqual({new_short_id: new_tx_hash}, self.index.match_short_ids(self.key, [new_short_id]))
+
+    def test_rebuild(self):
+        remaining_tx_hashes = self.tx_hashes[:50]
+        self.index.rebuild(remaining_tx_hashes)
+
+        self.assertEqual(50, len(self.index))
+        self.assertNotIn(self.tx_hashes[60], self.index)
+        short_ids = [_compute_short_id(self.key, tx_hash) for tx_hash in self.tx_hashes]
+        self.assertEqual(
+            dict(zip(short_ids[:50], remaining_tx_hashes)), self.index.match_short_ids(self.key, short_ids)
+        )
+
+    def test_compact_after_removals(self):
+        tx_hashes = [_generate_tx_hash() for _ in range(btc_short_id_index.MIN_SLOTS_TO_COMPACT)]
+        self.index.rebuild(tx_hashes)
+        for tx_hash in tx_hashes[:btc_short_id_index.MIN_SLOTS_TO_COMPACT // 2 + 1]:
+            self.index.remove(tx_hash)
+
+        remaining_tx_hashes = tx_hashes[btc_short_id_index.MIN_SLOTS_TO_COMPACT // 2 + 1:]
+        self.assertEqual(len(remaining_tx_hashes), len(self.index))
+        self.assertEqual(len(remaining_tx_hashes) * 32, len(self.index._tx_ids))
+
+        short_ids = [_compute_short_id(self.key, tx_hash) for tx_hash in remaining_tx_hashes]
+        self.assertEqual(dict(zip(short_ids, remaining_tx_hashes)), self.index.match_short_ids(self.key, short_ids))
@@ -0,0 +1,52 @@
+import os
+
+from csiphash import siphash24
+from mock import patch
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.blockchain_utils.btc.btc_object_hash import BtcObjectHash
+from bxgateway import btc_constants
+from bxgateway.utils.btc import btc_short_id_matcher
+
+
+def _compute_short_id(key: bytes, tx_hash: BtcObjectHash) -> bytes:
+    return siphash24(key, bytes(tx_hash.binary[::-1]))[0:6]
+
+
+class BtcShortIdMatcherTest(AbstractTestCase):
+
+    def setUp(self):
+        self.key = os.urandom(16)
+        self.tx_hashes = [
+            BtcObjectHash(buf=os.urandom(btc_constants.BTC_SHA_HASH_LEN), length=btc_constants.BTC_SHA_HASH_LEN)
+            for _ in range(500)
+        ]
+
+    def test_compute_short_ids(self):
+        expected_short_ids = [
+            btc_short_id_matcher.short_id_to_int(_compute_short_id(self.key, tx_hash)) for tx_hash in self.tx_hashes
+        ]
+        packed_tx_ids = btc_short_id_matcher.pack_tx_ids(self.tx_hashes)
+
+        self.assertEqual(expected_short_ids, btc_short_id_matcher.compute_short_ids(self.key, packed_tx_ids))
+        with patch.object(btc_short_id_matcher, "numpy", None):
+            self.assertEqual(expected_short_ids, btc_short_id_matcher.compute_short_ids(self.key, packed_tx_ids))
+
+    def test_match_short_ids(self):
+        block_tx_hashes = self.tx_hashes[::10]
+        unknown_short_id = os.urandom(6)
+        short_ids = [_compute_short_id(self.key, tx_hash) for tx_hash in block_tx_hashes]
+        short_ids.append(unknown_short_id)
+
+        expected_matches = dict(zip(short_ids, block_tx_hashes))
+        self.assertEqual(
+            expected_matches, btc_short_id_matcher.match_short_ids(self.key, self.tx_hashes, short_ids)
+        )
+        with patch.object(btc_short_id_matcher, "numpy", None):
+            self.assertEqual(
+                expected_matches, btc_short_id_matcher.match_short_ids(self.key, self.tx_hashes, short_ids)
+            )
+
+    def test_match_short_ids_empty(self):
+        self.assertEqual({}, btc_short_id_matcher.match_short_ids(self.key, [], [os.urandom(6)]))
+        self.assertEqual({}, btc_short_id_matcher.match_short_ids(self.key, self.tx_hashes, []))
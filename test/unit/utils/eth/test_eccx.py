@@ -2,6 +2,7 @@ from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxcommon.test_utils import helpers
 
 from bxcommon.utils.blockchain_utils.eth import crypto_utils, eth_common_utils, eth_common_constants
+from bxgateway.utils.eth import eccx
 from bxgateway.utils.eth.eccx import ECCx
 
 
@@ -68,6 +69,23 @@ class ECCxTests(AbstractTestCase):
         self.assertEqual(key1, key2)
         self.assertNotEqual(key1, key3)
 
+    def test_get_static_ecdh_key(self):
+        eccx.clear_static_ecdh_keys()
+        private_key = crypto_utils.make_private_key(helpers.generate_bytearray(222))
+        public_key = crypto_utils.private_to_public_key(private_key)
+        expected_key = self._eccx.get_ecdh_key(public_key)
+
+        precomputed_key = eccx.precompute_static_ecdh_key(self._private_key, public_key)
+        self.assertEqual(expected_key, precomputed_key)
+        self.assertEqual(1, len(eccx._static_ecdh_keys))
+
+        self.assertEqual(expected_key, self._eccx.get_static_ecdh_key(public_key))
+        self.assertEqual(1, len(eccx._static_ecdh_keys))
+
+        other_eccx = self._get_test_eccx(333)
+        self.assertEqual(other_eccx.get_ecdh_key(public_key), other_eccx.get_static_ecdh_key(public_key))
+        self.assertEqual(2, len(eccx._static_ecdh_keys))
+
     def test_is_valid_key(self):
         for i in range(10):
             eccx = self._get_test_eccx(i + 1)
@@ -0,0 +1,146 @@
+from typing import List
+from unittest.mock import MagicMock
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.services import block_crypto_service
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+from bxgateway.utils.eth.eth_block_cache import EthBlockCache
+
+
+class EthBlockCacheTest(AbstractTestCase):
+
+    def setUp(self):
+        self.node = MockGatewayNode(gateway_helpers.get_gateway_opts(8000))
+        self.compressed_block_hashes: List[Sha256Hash] = []
+        self.evicted_block_hashes: List[Sha256Hash] = []
+        self.block_cache = self._create_block_cache(1024 * 1024, 2)
+
+    def test_compresses_old_blocks(self):
+        blocks = self._generate_blocks(5)
+        for block in blocks:
+            self.block_cache.add(block.block_hash(), block)
+
+        self.assertEqual(5, len(self.block_cache))
+        self.assertEqual(3, self.block_cache.compressed_count)
+        for block in blocks[:3]:
+            self.assertTrue(self.block_cache.is_compressed(block.block_hash()))
+        for block in blocks[3:]:
+            self.assertFalse(self.block_cache.is_compressed(block.block_hash()))
+        self.assertEqual(
+            [block.block_hash() for block in blocks[:3]], self.compressed_block_hashes
+        )
+
+    def test_inflates_compressed_block(self):
+        blocks = self._generate_blocks(3)
+        for block in blocks:
+            self.block_cache.add(block.block_hash(), block)
+
+        block_hash = blocks[0].block_hash()
+        self.assertTrue(self.block_cache.is_compressed(block_hash))
+
+        block_message = self.block_cache.get_block_message(block_hash)
+        self.assertIsNotNone(block_message)
+        self.assertEqual(blocks[0].rawbytes().tobytes(), block_message.rawbytes().tobytes())
+        self.assertEqual(
+            blocks[0].to_new_block_parts().block_body_bytes,
+            self.block_cache.get_block_parts(block_hash).block_body_bytes
+        )
+        self.assertEqual(2, self.block_cache.inflated_count)
+
+    def test_compresses_off_event_loop(self):
+        compression_callbacks = []
+        self.node.block_crypto_service = MagicMock()
+        self.node.block_crypto_service.compress.side_effect = (
+            lambda payload, level, callback: compression_callbacks.append((payload, level, callback))
+        )
+        blocks = self._generate_blocks(4)
+        for block in blocks:
+            self.block_cache.add(block.block_hash(), block)
+
+        # compression of the first two blocks is pending, so they stay uncompressed
+        self.assertEqual(2, len(compression_callbacks))
+        self.assertEqual(0, self.block_cache.compressed_count)
+        self.assertFalse(self.block_cache.is_compressed(blocks[0].block_hash()))
+        self.assertIsNotNone(self.block_cache.get_block_parts(blocks[0].block_hash()))
+
+        # block removed while being compressed is not re-added
+        self.block_cache.remove(blocks[1].block_hash())
+        for payload, level, callback in compression_callbacks:
+            callback(MagicMock(result=block_crypto_service.compress_block(payload, level), crypto_duration_s=0))
+
+        self.assertEqual(1, self.block_cache.compressed_count)
+        self.assertEqual([blocks[0].block_hash()], self.compressed_block_hashes)
+        self.assertNotIn(blocks[1].block_hash(), self.block_cache)
+        self.assertEqual(
+            blocks[0].rawbytes().tobytes(),
+            self.block_cache.get_block_message(blocks[0].block_hash()).rawbytes().tobytes()
+        )
+
+    def test_inflation_does_not_depend_on_transaction_service(self):
+        blocks = self._generate_blocks(3)
+        for block in blocks:
+            self.block_cache.add(block.block_hash(), block)
+        block_hash = blocks[0].block_hash()
+        self.assertTrue(self.block_cache.is_compressed(block_hash))
+        self.assertLess(self.block_cache.compressed_size_bytes, len(blocks[0].rawbytes()))
+
+        self.node.get_tx_service().clear()
+
+        block_message = self.block_cache.get_block_message(block_hash)
+        self.assertIsNotNone(block_message)
+        self.assertEqual(blocks[0].rawbytes().tobytes(), block_message.rawbytes().tobytes())
+        self.assertEqual(0, self.block_cache.inflation_failed_count)
+
+    def test_evicts_least_recently_used_blocks(self):
+        blocks = self._generate_blocks(4)
+        block_size = len(blocks[0].rawbytes())
+        self.block_cache = self._create_block_cache(block_size * 3 + block_size // 2, 0)
+
+        for block in blocks[:3]:
+            self.block_cache.add(block.block_hash(), block)
+        self.block_cache.get_block_message(blocks[0].block_hash())
+        self.block_cache.add(blocks[3].block_hash(), blocks[3])
+
+        self.assertEqual(3, len(self.block_cache))
+        self.assertNotIn(blocks[1].block_hash(), self.block_cache)
+        self.assertIn(blocks[0].block_hash(), self.block_cache)
+        self.assertEqual([blocks[1].block_hash()], self.evicted_block_hashes)
+        self.assertEqual(1, self.block_cache.evicted_count)
+
+    def test_never_compresses_without_uncompressed_heights(self):
+        self.block_cache = self._create_block_cache(1024 * 1024, 0)
+        blocks = self._generate_blocks(5)
+        for block in blocks:
+            self.block_cache.add(block.block_hash(), block)
+
+        self.assertEqual(0, self.block_cache.compressed_count)
+        self.assertEqual(sum(len(block.rawbytes()) for block in blocks), self.block_cache.total_size_bytes)
+
+        self.block_cache.remove(blocks[0].block_hash())
+        self.assertEqual(4, len(self.block_cache))
+        self.assertEqual(sum(len(block.rawbytes()) for block in blocks[1:]), self.block_cache.total_size_bytes)
+
+    def _create_block_cache(self, max_size_bytes: int, uncompressed_heights: int) -> EthBlockCache:
+        return EthBlockCache(
+            self.node,
+            max_size_bytes,
+            uncompressed_heights,
+            60,
+            self.compressed_block_hashes.append,
+            self.evicted_block_hashes.append
+        )
+
+    def _generate_blocks(self, count: int) -> List[InternalEthBlockInfo]:
+        blocks = []
+        prev_block_hash = None
+        for i in range(count):
+            block = InternalEthBlockInfo.from_new_block_msg(
+                mock_eth_messages.new_block_eth_protocol_message(i + 1, 100 + i, prev_block_hash)
+            )
+            prev_block_hash = block.block_hash()
+            blocks.append(block)
+        return blocks
@@ -0,0 +1,63 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.messages.eth.protocol.block_headers_eth_protocol_message import BlockHeadersEthProtocolMessage
+from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.utils.eth.eth_block_response_cache import EthBlockResponseCache
+
+
+class EthBlockResponseCacheTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.headers_msgs = [
+            BlockHeadersEthProtocolMessage(None, [mock_eth_messages.get_dummy_block_header(i + 1)]) for i in range(3)
+        ]
+        self.block_hashes = [helpers.generate_object_hash() for _ in range(3)]
+        self.cache = EthBlockResponseCache(10 * 1024)
+
+    def test_get(self):
+        self.cache.add_headers(b"headers", self.headers_msgs[0], self.block_hashes[:1], True)
+        self.cache.add_bodies(b"bodies", self.headers_msgs[1])
+
+        self.assertEqual(self.headers_msgs[0], self.cache.get(b"headers"))
+        self.assertEqual(self.headers_msgs[1], self.cache.get(b"bodies"))
+        self.assertIsNone(self.cache.get(b"unknown"))
+        self.assertEqual(
+            len(self.headers_msgs[0].rawbytes()) + len(self.headers_msgs[1].rawbytes()), self.cache.total_size_bytes
+        )
+
+    def test_disabled(self):
+        cache = EthBlockResponseCache(0)
+        cache.add_headers(b"headers", self.headers_msgs[0], self.block_hashes[:1], True)
+        self.assertFalse(cache.is_enabled())
+        self.assertEqual(0, len(cache))
+
+    def test_evicts_least_recently_used(self):
+        cache = EthBlockResponseCache(
+            len(self.headers_msgs[0].rawbytes()) + len(self.headers_msgs[1].rawbytes())
+        )
+        cache.add_bodies(b"1", self.headers_msgs[0])
+        cache.add_bodies(b"2", self.headers_msgs[1])
+        cache.get(b"1")
+        cache.add_bodies(b"3", self.headers_msgs[0])
+
+        self.assertIn(b"1", cache)
+        self.assertNotIn(b"2", cache)
+        self.assertIn(b"3", cache)
+        self.assertTrue(cache.total_size_bytes <= cache.max_size_bytes)
+
+    def test_on_canonical_head_changed(self):
+        self.cache.add_headers(b"complete", self.headers_msgs[0], self.block_hashes[:2], True)
+        self.cache.add_headers(b"incomplete", self.headers_msgs[1], self.block_hashes[:1], False)
+        self.cache.add_headers(b"forked", self.headers_msgs[2], self.block_hashes[1:], True)
+        self.cache.add_bodies(b"bodies", self.headers_msgs[0])
+
+        canonical_hashes = set(self.block_hashes[:2])
+        self.cache.on_canonical_head_changed(False, lambda block_hash: block_hash in canonical_hashes)
+        self.assertIn(b"complete", self.cache)
+        self.assertNotIn(b"incomplete", self.cache)
+        self.assertIn(b"forked", self.cache)
+
+        self.cache.on_canonical_head_changed(True, lambda block_hash: block_hash in canonical_hashes)
+        self.assertIn(b"complete", self.cache)
+        self.assertNotIn(b"forked", self.cache)
+        self.assertIn(b"bodies", self.cache)
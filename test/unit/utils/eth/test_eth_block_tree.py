@@ -0,0 +1,117 @@
+import time
+from unittest.mock import patch
+
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.alarm_queue import AlarmQueue
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.utils.eth.eth_block_tree import EthBlockTree
+
+
+def _generate_block_hash() -> Sha256Hash:
+    return Sha256Hash(helpers.generate_hash())
+
+
+class EthBlockTreeTest(AbstractTestCase):
+
+    def setUp(self):
+        self.alarm_queue = AlarmQueue()
+        self.block_tree = EthBlockTree(self.alarm_queue, 60)
+        self.block_hashes = [_generate_block_hash() for _ in range(10)]
+        # chain: 100 -> 109
+        self.block_tree.add(self.block_hashes[0], 100, _generate_block_hash(), 10)
+        for i in range(1, 10):
+            self.block_tree.add(self.block_hashes[i], 100 + i, self.block_hashes[i - 1], 10)
+
+    def test_canonical_chain(self):
+        self.block_tree.set_canonical_head(self.block_hashes[9])
+
+        self.assertEqual(self.block_hashes[9], self.block_tree.get_canonical_head())
+        self.assertEqual(100, self.block_tree.get_canonical_tail_height())
+        for i in range(10):
+            self.assertEqual(self.block_hashes[i], self.block_tree.get_canonical_hash_at_height(100 + i))
+            self.assertTrue(self.block_tree.is_canonical(self.block_hashes[i]))
+        self.assertIsNone(self.block_tree.get_canonical_hash_at_height(110))
+        self.assertEqual(
+            self.block_hashes, [node.block_hash for node in self.block_tree.iterate_canonical_chain()]
+        )
+        self.assertEqual(100, self.block_tree.get_cumulative_difficulty(self.block_hashes[9]))
+
+    def test_reorganization(self):
+        self.block_tree.set_canonical_head(self.block_hashes[9])
+
+        # fork from block 107
+        fork_hash_1 = _generate_block_hash()
+        fork_hash_2 = _generate_block_hash()
+        self.block_tree.add(fork_hash_1, 108, self.block_hashes[7], 20)
+        self.block_tree.add(fork_hash_2, 109, fork_hash_1, 20)
+        self.assertFalse(self.block_tree.is_canonical(fork_hash_1))
+        self.assertEqual(fork_hash_2, self.block_tree.get_heaviest_block_hash_at_height(109))
+        self.assertEqual({self.block_hashes[9], fork_hash_2}, self.block_tree.get_block_hashes_at_height(109))
+
+        self.block_tree.set_canonical_head(fork_hash_2)
+        self.assertTrue(self.block_tree.is_canonical(fork_hash_1))
+        self.assertTrue(self.block_tree.is_canonical(fork_hash_2))
+        self.assertFalse(self.block_tree.is_canonical(self.block_hashes[8]))
+        self.assertFalse(self.block_tree.is_canonical(self.block_hashes[9]))
+        self.assertEqual(self.block_hashes[7], self.block_tree.get_canonical_hash_at_height(107))
+        self.assertEqual(100, self.block_tree.get_canonical_tail_height())
+
+        # reorganize back to shorter chain
+        self.block_tree.set_canonical_head(self.block_hashes[8])
+        self.assertEqual(self.block_hashes[8], self.block_tree.get_canonical_hash_at_height(108))
+        self.assertIsNone(self.block_tree.get_canonical_hash_at_height(109))
+
+    def test_disconnected_head(self):
+        self.block_tree.set_canonical_head(self.block_hashes[9])
+
+        missing_parent_hash = _generate_block_hash()
+        block_hash = _generate_block_hash()
+        self.block_tree.add(block_hash, 111, missing_parent_hash, 10)
+        self.block_tree.set_canonical_head(block_hash)
+        self.assertEqual(111, self.block_tree.get_canonical_tail_height())
+        self.assertEqual([block_hash], [node.block_hash for node in self.block_tree.iterate_canonical_chain()])
+
+        # missing parent arrives and reconnects canonical chain
+        self.block_tree.add(missing_parent_hash, 110, self.block_hashes[9], 10)
+        self.assertEqual(100, self.block_tree.get_canonical_tail_height())
+        self.assertEqual(missing_parent_hash, self.block_tree.get_canonical_hash_at_height(110))
+        self.assertEqual(120, self.block_tree.get_cumulative_difficulty(block_hash))
+
+    def test_remove(self):
+        self.block_tree.set_canonical_head(self.block_hashes[9])
+
+        self.block_tree.remove(self.block_hashes[4])
+        self.assertNotIn(self.block_hashes[4], self.block_tree)
+        self.assertEqual(105, self.block_tree.get_canonical_tail_height())
+        self.assertIsNone(self.block_tree.get_canonical_hash_at_height(103))
+        self.assertFalse(self.block_tree.get_block_hashes_at_height(104))
+
+        self.block_tree.remove(self.block_hashes[9])
+        self.assertIsNone(self.block_tree.get_canonical_head())
+        self.assertEqual([], list(self.block_tree.iterate_canonical_chain()))
+
+    def test_iterate_ancestors(self):
+        self.assertEqual(
+            list(reversed(self.block_hashes[5:])),
+            list(self.block_tree.iterate_ancestors(self.block_hashes[9], 5))
+        )
+        self.assertEqual(
+            list(reversed(self.block_hashes)),
+            list(self.block_tree.iterate_ancestors(self.block_hashes[9], 20))
+        )
+
+    def test_expiration(self):
+        self.block_tree.set_canonical_head(self.block_hashes[9])
+        self.block_tree.mark_block_sent(self.block_hashes[9], 109)
+        self.block_tree.mark_block_accepted(self.block_hashes[9], 109)
+        self.assertEqual(self.block_hashes[9], self.block_tree.get_sent_block_hash_at_height(109))
+        self.assertEqual(self.block_hashes[9], self.block_tree.get_accepted_block_hash_at_height(109))
+
+        with patch("time.time", return_value=time.time() + 61):
+            self.alarm_queue.fire_alarms()
+
+        self.assertEqual(0, len(self.block_tree))
+        self.assertIsNone(self.block_tree.get_canonical_head())
+        self.assertIsNone(self.block_tree.get_sent_block_hash_at_height(109))
+        self.assertIsNone(self.block_tree.get_accepted_block_hash_at_height(109))
@@ -0,0 +1,21 @@
+import rlp
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils import convert
+from bxgateway.utils.eth import eth_utils
+
+
+class EthUtilsTest(AbstractTestCase):
+
+    def test_get_ordered_trie_root_empty(self):
+        self.assertEqual(
+            convert.hex_to_bytes("56e81f171bcc55a6ff8345e692c0f86e5b48e01b996cadc001622fb5e363b421"),
+            eth_utils.get_ordered_trie_root([])
+        )
+
+    def test_get_ordered_trie_root(self):
+        receipts = [rlp.encode([b"receipt", i, bytes(40)]) for i in range(20)]
+        self.assertEqual(
+            convert.hex_to_bytes("81b82f060bbcc6735fbd2c5b7880ec0a4a788c0151c37ba6ef3c7b67bd97243a"),
+            eth_utils.get_ordered_trie_root(receipts)
+        )
@@ -112,6 +112,40 @@ class FrameUtilsTests(AbstractRLPxCipherTest):
             decrypted_frame = self._decrypt_frame(encrypted_frame, cipher2)
             self._assert_frames_equal(decrypted_frame, frame)
 
+    def test_encrypt_frames__single_buffer(self):
+        cipher1, cipher2 = self.setup_ciphers()
+
+        msg_type = 1
+        dummy_payload = memoryview(helpers.generate_bytearray(self.TEST_FRAME_SIZE * 2 + 7))
+        dummy_protocol_id = 0
+
+        frames = frame_utils.get_frames(msg_type, dummy_payload, dummy_protocol_id,
+                                        window_size=self.TEST_FRAME_SIZE)
+        self.assertEqual(len(frames), 3)
+
+        encrypted_frames = memoryview(cipher1.encrypt_frames(frames))
+        self.assertEqual(sum(frame.get_frame_size() for frame in frames), len(encrypted_frames))
+
+        offset = 0
+        for frame in frames:
+            frame_size = frame.get_frame_size()
+            decrypted_frame = self._decrypt_frame(encrypted_frames[offset:offset + frame_size], cipher2)
+            self._assert_frames_equal(decrypted_frame, frame)
+            offset += frame_size
+
+    def test_write_body(self):
+        dummy_payload = helpers.generate_bytearray(123)
+        frame = frame_utils.get_frames(1, memoryview(dummy_payload), 0, window_size=self.TEST_FRAME_SIZE)[0]
+
+        body = bytearray(frame.get_body_size(padded=True) + 2)
+        body_len = frame.write_body(body, 2)
+
+        self.assertEqual(frame.get_body_size(padded=True), body_len)
+        self.assertEqual(frame.get_body(), body[2:])
+        expected_body = frame.get_encoded_msg_type() + dummy_payload
+        self.assertEqual(expected_body, body[2:2 + len(expected_body)])
+        self.assertFalse(any(body[2 + len(expected_body):]))
+
     def _decrypt_frame(self, frame, cipher):
         encrypted_frame = memoryview(frame)
         self.assertTrue(encrypted_frame)
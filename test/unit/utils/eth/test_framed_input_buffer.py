@@ -82,3 +82,58 @@ class FramedInputBufferTests(AbstractRLPxCipherTest):
 
         self.assertTrue(is_full)
         self.assertEqual(msg_type, dummy_msg_type)
+
+    def test_chunked_frames_payload(self):
+        cipher1, cipher2 = self.setup_ciphers()
+
+        dummy_msg_type = 0x17
+        dummy_payload = helpers.generate_bytearray(self.TEST_FRAME_SIZE * 3 + 5)
+        frames = frame_utils.get_frames(dummy_msg_type, memoryview(dummy_payload), 0, self.TEST_FRAME_SIZE)
+        self.assertEqual(len(frames), 4)
+
+        input_buffer = InputBuffer()
+        input_buffer.add_bytes(cipher1.encrypt_frames(frames))
+        framed_input_buffer = FramedInputBuffer(cipher2)
+
+        is_full = False
+        while not is_full:
+            is_full, msg_type = framed_input_buffer.peek_message(input_buffer)
+
+        self.assertEqual(dummy_msg_type, msg_type)
+        self.assertEqual(0, input_buffer.length)
+
+        message, full_msg_type = framed_input_buffer.get_full_message()
+        self.assertIsInstance(message, bytearray)
+        self.assertEqual(dummy_payload, message)
+        self.assertEqual(dummy_msg_type, full_msg_type)
+
+        # cipher streams stay in sync for the next message
+        next_payload = helpers.generate_bytearray(50)
+        input_buffer.add_bytes(cipher1.encrypt_frames(frame_utils.get_frames(1, memoryview(next_payload), 0)))
+        self.assertEqual((True, 1), framed_input_buffer.peek_message(input_buffer))
+        self.assertEqual((next_payload, 1), framed_input_buffer.get_full_message())
+
+    def test_drain_messages(self):
+        cipher1, cipher2 = self.setup_ciphers()
+
+        payloads = [helpers.generate_bytearray(100 + i) for i in range(10)]
+        chunked_payload = helpers.generate_bytearray(self.TEST_FRAME_SIZE * 2)
+
+        input_buffer = InputBuffer()
+        for msg_type, payload in enumerate(payloads):
+            input_buffer.add_bytes(cipher1.encrypt_frames(frame_utils.get_frames(msg_type, memoryview(payload), 0)))
+        chunked_frames = frame_utils.get_frames(20, memoryview(chunked_payload), 0, self.TEST_FRAME_SIZE)
+        chunked_frames_bytes = cipher1.encrypt_frames(chunked_frames)
+        # last chunked frame is not fully received yet
+        input_buffer.add_bytes(chunked_frames_bytes[:-1])
+
+        framed_input_buffer = FramedInputBuffer(cipher2)
+        messages = framed_input_buffer.drain_messages(input_buffer)
+
+        self.assertEqual(list(enumerate(payloads)), messages)
+        self.assertEqual(len(payloads) + len(chunked_frames) - 1, framed_input_buffer.frames_decoded)
+        self.assertEqual([], framed_input_buffer.drain_messages(input_buffer))
+
+        input_buffer.add_bytes(chunked_frames_bytes[-1:])
+        self.assertEqual([(20, chunked_payload)], framed_input_buffer.drain_messages(input_buffer))
+        self.assertEqual(0, input_buffer.length)
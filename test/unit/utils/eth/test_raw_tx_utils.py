@@ -0,0 +1,59 @@
+import rlp
+
+from bxcommon.messages.eth.serializers.transaction import Transaction
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
+from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.utils.eth import raw_tx_utils
+
+
+class RawTxUtilsTest(AbstractTestCase):
+
+    def setUp(self):
+        self.transactions = [
+            mock_eth_messages.get_dummy_transaction(0, 5),
+            mock_eth_messages.get_dummy_transaction(1, 300),
+            mock_eth_messages.get_dummy_transaction(100, 2 ** 70, to_address_str=""),
+        ]
+        self.msg = TransactionsEthProtocolMessage(None, self.transactions)
+        self.msg_bytes = memoryview(self.msg.rawbytes())
+
+    def test_iter_transactions(self):
+        raw_transactions = list(raw_tx_utils.iter_transactions(self.msg_bytes))
+        self.assertEqual(len(self.transactions), len(raw_transactions))
+
+        for transaction, (tx_offset, tx_length) in zip(self.transactions, raw_transactions):
+            tx_bytes = self.msg_bytes[tx_offset:tx_offset + tx_length]
+            self.assertEqual(rlp.encode(transaction), tx_bytes.tobytes())
+            self.assertEqual(transaction, rlp.decode(tx_bytes.tobytes(), Transaction))
+
+        self.assertEqual(len(self.msg_bytes), raw_transactions[-1][0] + raw_transactions[-1][1])
+
+    def test_iter_transactions_empty_list(self):
+        msg = TransactionsEthProtocolMessage(None, [])
+        self.assertEqual([], list(raw_tx_utils.iter_transactions(msg.rawbytes())))
+
+    def test_field_extractors(self):
+        for transaction, (tx_offset, _) in zip(self.transactions, raw_tx_utils.iter_transactions(self.msg_bytes)):
+            self.assertEqual(transaction.nonce, raw_tx_utils.raw_tx_nonce(self.msg_bytes, tx_offset))
+            self.assertEqual(transaction.value, raw_tx_utils.raw_tx_value(self.msg_bytes, tx_offset))
+
+            to_address = raw_tx_utils.raw_tx_to(self.msg_bytes, tx_offset)
+            if transaction.to:
+                self.assertEqual(transaction.to, to_address.tobytes())
+            else:
+                self.assertIsNone(to_address)
+
+    def test_get_gas_prices(self):
+        expected_gas_prices = [transaction.gas_price for transaction in self.transactions]
+        self.assertEqual(expected_gas_prices, raw_tx_utils.get_gas_prices(self.msg_bytes))
+        self.assertEqual(expected_gas_prices, self.msg.get_gas_prices())
+
+    def test_block_gas_prices(self):
+        new_block_msg = mock_eth_messages.new_block_eth_protocol_message(11)
+        expected_gas_prices = [transaction.gas_price for transaction in new_block_msg.txns()]
+        self.assertTrue(expected_gas_prices)
+
+        self.assertEqual(expected_gas_prices, new_block_msg.get_gas_prices())
+        self.assertEqual(expected_gas_prices, InternalEthBlockInfo.from_new_block_msg(new_block_msg).get_gas_prices())
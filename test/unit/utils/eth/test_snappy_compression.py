@@ -0,0 +1,39 @@
+import os
+from unittest import skipUnless
+
+from bxcommon.exceptions import ParseError
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway import gateway_constants
+from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
+from bxgateway.utils.eth import snappy_compression
+
+
+@skipUnless(snappy_compression.is_available(), "python-snappy is not installed")
+class SnappyCompressionTest(AbstractTestCase):
+
+    def test_compress_decompress(self):
+        payload = bytearray(os.urandom(1000)) + bytearray(10000)
+        compressed_payload = snappy_compression.compress(memoryview(payload))
+        self.assertTrue(len(compressed_payload) < len(payload))
+        self.assertEqual(len(payload), snappy_compression.get_uncompressed_len(compressed_payload))
+        self.assertEqual(payload, snappy_compression.decompress(compressed_payload))
+
+    def test_decompress_too_large(self):
+        payload = bytes(gateway_constants.ETH_MAX_DECOMPRESSED_MESSAGE_SIZE + 1)
+        with self.assertRaises(ParseError):
+            snappy_compression.decompress(snappy_compression.compress(payload))
+
+    def test_decompress_invalid(self):
+        with self.assertRaises(ParseError):
+            snappy_compression.decompress(b"\xff\xff\xff\xff\xff\xff")
+        with self.assertRaises(ParseError):
+            snappy_compression.decompress(b"\x10\x00\x01")
+
+    def test_message_compressed_bytes_cached(self):
+        msg = TransactionsEthProtocolMessage(bytearray(b"\xc0"))
+        self.assertFalse(msg.has_compressed_rawbytes())
+
+        compressed_bytes = msg.compressed_rawbytes()
+        self.assertTrue(msg.has_compressed_rawbytes())
+        self.assertIs(compressed_bytes, msg.compressed_rawbytes())
+        self.assertEqual(msg.rawbytes(), snappy_compression.decompress(compressed_bytes))
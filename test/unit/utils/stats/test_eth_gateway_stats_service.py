@@ -0,0 +1,26 @@
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
+
+
+class EthGatewayStatsServiceTest(AbstractTestCase):
+
+    def setUp(self):
+        self.node = MockGatewayNode(gateway_helpers.get_gateway_opts(8000, include_default_eth_args=True))
+        eth_gateway_stats_service.set_node(self.node)
+
+    def test_get_info(self):
+        eth_gateway_stats_service.log_input_read(3, 4)
+        for _ in range(3):
+            eth_gateway_stats_service.log_decrypted_message(0.001)
+        eth_gateway_stats_service.log_remote_request(cache_hit=True, coalesced=False)
+        eth_gateway_stats_service.log_remote_request(cache_hit=False, coalesced=True)
+
+        info = eth_gateway_stats_service.get_info()
+        self.assertEqual(3, info["total_decrypted_msgs_count"])
+        self.assertEqual(1, info["total_input_reads"])
+        self.assertEqual(3, info["average_msgs_per_read"])
+        self.assertTrue(info["frames_per_second"] >= 0)
+        self.assertEqual(2, info["total_remote_requests_count"])
+        self.assertEqual(1, info["total_remote_requests_coalesced"])
@@ -0,0 +1,73 @@
+import time
+
+from mock import MagicMock, patch
+
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+from bxgateway.utils.inventory_request_aggregator import InventoryRequestAggregator
+
+MSG_TX = 1
+
+
+class InventoryRequestAggregatorTest(AbstractTestCase):
+
+    def setUp(self):
+        self.node = MockGatewayNode(gateway_helpers.get_gateway_opts(8000, inventory_request_batch_interval_ms=20))
+        self.request_items = MagicMock()
+        self.aggregator = InventoryRequestAggregator(self.node, self.request_items)
+
+    def test_duplicates_and_known_transactions_suppressed(self):
+        known_tx_hash = helpers.generate_object_hash()
+        self.node.get_tx_service().set_transaction_contents(known_tx_hash, helpers.generate_bytearray(250))
+        tx_hash = helpers.generate_object_hash()
+
+        self.assertTrue(self.aggregator.add(MSG_TX, tx_hash))
+        self.assertFalse(self.aggregator.add(MSG_TX, tx_hash))
+        self.assertFalse(self.aggregator.add(MSG_TX, known_tx_hash))
+        self.assertEqual(1, len(self.aggregator))
+
+        self.aggregator.request_pending()
+        self.request_items.assert_called_once_with([(MSG_TX, tx_hash)])
+
+        # requested transactions are not requested again
+        self.assertFalse(self.aggregator.add(MSG_TX, tx_hash))
+        self.assertEqual(0, len(self.aggregator))
+
+    def test_batched_request(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(3)]
+        for tx_hash in tx_hashes[:2]:
+            self.aggregator.add(MSG_TX, tx_hash)
+            self.aggregator.schedule_request()
+        self.aggregator.add(MSG_TX, tx_hashes[2])
+        self.aggregator.schedule_request()
+        self.request_items.assert_not_called()
+
+        time.time = MagicMock(return_value=time.time() + 0.02)
+        self.node.alarm_queue.fire_alarms()
+
+        self.request_items.assert_called_once_with([(MSG_TX, tx_hash) for tx_hash in tx_hashes])
+        self.assertEqual(0, len(self.aggregator))
+
+    @patch("bxgateway.gateway_constants.INVENTORY_REQUEST_MAX_BATCH_SIZE", 2)
+    def test_full_batch_requested_immediately(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(3)]
+        for tx_hash in tx_hashes:
+            self.aggregator.add(MSG_TX, tx_hash)
+        self.aggregator.schedule_request()
+
+        self.assertEqual(2, self.request_items.call_count)
+        self.assertEqual([(MSG_TX, tx_hash) for tx_hash in tx_hashes[:2]], self.request_items.call_args_list[0][0][0])
+        self.assertEqual([(MSG_TX, tx_hashes[2])], self.request_items.call_args_list[1][0][0])
+
+    def test_take_pending(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(3)]
+        for tx_hash in tx_hashes:
+            self.aggregator.add(MSG_TX, tx_hash)
+        self.aggregator.schedule_request()
+
+        self.assertEqual([(MSG_TX, tx_hash) for tx_hash in tx_hashes[:2]], self.aggregator.take_pending(2))
+        self.assertEqual(1, len(self.aggregator))
+        self.assertFalse(self.aggregator.add(MSG_TX, tx_hashes[0]))